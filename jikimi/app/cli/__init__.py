@@ -0,0 +1,2 @@
+"""Command-line tool modules."""
+
@@ -0,0 +1,182 @@
+"""Backtest CLI: replay history through the prediction pipeline.
+
+Usage:
+    python -m app.cli.backtest --companies 005930,030200 \\
+        --start 2025-01-01 --end 2025-10-01 --predictor momentum --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.deps import close_engine, get_session, init_engine
+from app.repositories.base import BaseRepository
+from app.repositories.dart_repo import get_dart_repo
+from app.repositories.news_repo import get_news_repo
+from app.repositories.prices_repo import get_prices_repo
+from app.repositories.social_repo import get_social_repo
+from app.services.backtest import (
+    INTEL_LOOKBACK_DAYS,
+    PRICE_LOOKBACK_DAYS,
+    CompanyHistory,
+    LLMPredictor,
+    MomentumPredictor,
+    Predictor,
+    ReplayPredictor,
+    run_backtest,
+    write_recording,
+)
+
+ALL_FEATURES = {"prices": True, "news": True, "blind": True, "naver_forum": True, "filings": True}
+
+
+async def _drain(fetch: Any, **kwargs: Any) -> list[Any]:
+    """Follow pagination cursors until a repository fetch is exhausted."""
+    items: list[Any] = []
+    cursor: str | None = None
+    while True:
+        page, cursor = await fetch(limit=settings.max_page_size, cursor=cursor, **kwargs)
+        items.extend(page)
+        if not cursor:
+            return items
+
+
+async def load_history(
+    session: AsyncSession,
+    company_id: str,
+    start: datetime,
+    end: datetime,
+) -> CompanyHistory:
+    """Load everything a backtest over ``[start, end)`` can see for one company.
+
+    Args:
+        session: Database session
+        company_id: Company identifier
+        start: First snapshot time
+        end: Last snapshot time plus horizon
+
+    Returns:
+        CompanyHistory covering the lookback windows and the horizon
+    """
+    price_start = start - timedelta(days=PRICE_LOOKBACK_DAYS)
+    intel_start = start - timedelta(days=INTEL_LOOKBACK_DAYS)
+
+    prices = await (await get_prices_repo(session)).fetch_prices(
+        company_id=company_id, start=price_start, end=end, interval="1d", adjust="split"
+    )
+    news_repo = await get_news_repo(session)
+    social_repo = await get_social_repo(session)
+    dart_repo = await get_dart_repo(session)
+
+    return CompanyHistory(
+        company_id=company_id,
+        ticker=prices.company.ticker,
+        prices=prices,
+        news=await _drain(news_repo.fetch_news, company_id=company_id, start=intel_start, end=end),
+        blind=await _drain(
+            social_repo.fetch_social,
+            company_id=company_id, platform="blind", start=intel_start, end=end,
+        ),
+        naver_forum=await _drain(
+            social_repo.fetch_social,
+            company_id=company_id, platform="naver_forum", start=intel_start, end=end,
+        ),
+        filings=await _drain(
+            dart_repo.fetch_filings, company_id=company_id, start=intel_start, end=end
+        ),
+    )
+
+
+async def _load_all(company_ids: list[str], start: datetime, end: datetime) -> list[CompanyHistory]:
+    """Load histories for all companies on a single session."""
+    if BaseRepository.is_memory_mode():
+        # Memory-mode repositories never touch the session
+        return [await load_history(None, cid, start, end) for cid in company_ids]  # type: ignore[arg-type]
+
+    init_engine()
+    try:
+        async for session in get_session():
+            return [await load_history(session, cid, start, end) for cid in company_ids]
+        return []
+    finally:
+        await close_engine()
+
+
+def _parse_date(value: str) -> datetime:
+    return datetime.fromisoformat(value).replace(tzinfo=UTC)
+
+
+def _build_predictor(args: argparse.Namespace) -> Predictor:
+    if args.predictor == "llm":
+        return LLMPredictor(include_features=ALL_FEATURES)
+    if args.predictor == "replay":
+        if not args.replay_file:
+            raise SystemExit("--replay-file is required for --predictor replay")
+        return ReplayPredictor(args.replay_file)
+    return MomentumPredictor()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the backtest CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Backtest the price prediction pipeline")
+    parser.add_argument("--companies", required=True, help="Comma-separated company IDs")
+    parser.add_argument("--start", required=True, help="First snapshot date (YYYY-MM-DD, UTC)")
+    parser.add_argument("--end", required=True, help="Last snapshot date (YYYY-MM-DD, UTC)")
+    parser.add_argument("--step-days", type=int, default=1, help="Days between snapshots")
+    parser.add_argument("--horizon", type=int, default=7, help="Prediction horizon in days")
+    parser.add_argument("--predictor", choices=["momentum", "llm", "replay"], default="momentum")
+    parser.add_argument("--replay-file", help="JSONL recording for --predictor replay")
+    parser.add_argument("--record", help="Write predictions as JSONL for later replay")
+    parser.add_argument("--workers", type=int, default=1, help="Process pool size")
+    parser.add_argument("--json", action="store_true", help="Print summary as JSON")
+    args = parser.parse_args(argv)
+
+    company_ids = [c.strip() for c in args.companies.split(",") if c.strip()]
+    start, end = _parse_date(args.start), _parse_date(args.end)
+    as_of_dates = []
+    current = start
+    while current <= end:
+        as_of_dates.append(current)
+        current += timedelta(days=args.step_days)
+
+    histories = asyncio.run(_load_all(company_ids, start, end + timedelta(days=args.horizon + 1)))
+    report = run_backtest(
+        histories,
+        as_of_dates,
+        _build_predictor(args),
+        horizon_days=args.horizon,
+        include=ALL_FEATURES,
+        workers=args.workers,
+    )
+
+    if args.record:
+        write_recording(report, args.record)
+
+    summary = report.summary()
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        for key, value in summary.items():
+            print(f"{key:>22}: {value:.6f}" if isinstance(value, float) else f"{key:>22}: {value}")
+        if summary["throughput_per_sec"]:
+            year_steps = 365 * len(company_ids)
+            print(f"{'projected_1y_seconds':>22}: {year_steps / summary['throughput_per_sec']:.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""Feature benchmark CLI: per-request CPU cost of ``_assemble_features``.
+
+Usage:
+    python -m app.cli.bench_features --sizes 100,10000 --repeat 200
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from app.schemas.common import Sentiment
+from app.schemas.intelligence import Article, Filing, SocialPost
+from app.schemas.market import CompanyRef, PriceCandle, PriceSeries
+from app.services.prediction import _assemble_features
+
+ALL_FEATURES = {"prices": True, "news": True, "blind": True, "naver_forum": True, "filings": True}
+NOW = datetime(2025, 11, 3, 9, 0, tzinfo=UTC)
+
+
+def _synthetic_inputs(
+    size: int, seed: int = 0
+) -> tuple[PriceSeries, list[Article], list[SocialPost], list[SocialPost], list[Filing]]:
+    """Build one request's worth of inputs with ``size`` items per intelligence source."""
+    rng = random.Random(seed)
+
+    def sentiment() -> Sentiment | None:
+        if rng.random() < 0.1:
+            return None
+        label = rng.choice(["positive", "neutral", "negative"])
+        return Sentiment(label=label, score=rng.uniform(-1, 1), confidence=rng.random())
+
+    def ts() -> datetime:
+        return NOW - timedelta(seconds=rng.randint(0, 30 * 86400))
+
+    candles = [
+        PriceCandle(
+            t=NOW - timedelta(days=90 - i),
+            o=70_000.0, h=71_000.0, l=69_000.0,
+            c=rng.uniform(65_000, 75_000),
+            v=rng.randint(5_000_000, 20_000_000),
+        )
+        for i in range(90)
+    ]
+    news = [
+        Article(
+            id=f"a{i}", title="뉴스", source="연합뉴스", published_at=ts(),
+            sentiment=sentiment(), company_id="005930",
+        )
+        for i in range(size)
+    ]
+    blind, forum = (
+        [
+            SocialPost(
+                id=f"{platform}{i}", platform=platform, content="글", posted_at=ts(),
+                sentiment=sentiment(), company_id="005930",
+                reply_count=rng.randint(0, 50), like_count=rng.randint(0, 500),
+            )
+            for i in range(size)
+        ]
+        for platform in ("blind", "naver_forum")
+    )
+    filings = [
+        Filing(
+            id=f"f{i}",
+            title="공시",
+            filing_type="주요사항보고서",
+            filed_at=ts(),
+            company_id="005930",
+        )
+        for i in range(max(1, size // 10))
+    ]
+    prices = PriceSeries(company=CompanyRef(id="005930"), candles=candles)
+    return prices, news, blind, forum, filings
+
+
+def bench(size: int, repeat: int) -> dict[str, Any]:
+    """Measure mean per-request CPU time for one input size.
+
+    Args:
+        size: Items per intelligence source (news, 블라인드, 종토방)
+        repeat: Number of timed calls
+
+    Returns:
+        Result row with CPU and wall milliseconds per request
+    """
+    inputs = _synthetic_inputs(size)
+    _assemble_features(*inputs, ALL_FEATURES, as_of=NOW)  # warm-up
+
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    for _ in range(repeat):
+        _assemble_features(*inputs, ALL_FEATURES, as_of=NOW)
+    cpu, wall = time.process_time() - cpu0, time.perf_counter() - wall0
+
+    return {
+        "size": size,
+        "repeat": repeat,
+        "cpu_ms_per_request": 1000 * cpu / repeat,
+        "wall_ms_per_request": 1000 * wall / repeat,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the feature benchmark CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Benchmark prediction feature computation")
+    parser.add_argument("--sizes", default="100,10000", help="Comma-separated items per source")
+    parser.add_argument("--repeat", type=int, default=100, help="Timed calls per size")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = [bench(int(s), args.repeat) for s in args.sizes.split(",") if s.strip()]
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for row in results:
+            print(
+                f"size={row['size']:>6}  cpu={row['cpu_ms_per_request']:.3f} ms/request"
+                f"  wall={row['wall_ms_per_request']:.3f} ms/request"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
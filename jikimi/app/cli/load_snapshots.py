@@ -0,0 +1,156 @@
+"""Snapshot loader CLI: bulk-load ``data/YYYY-MM-DD/*.txt`` into PostgreSQL.
+
+Usage:
+    python -m app.cli.load_snapshots --data-dir ../data --company 030200
+    python -m app.cli.load_snapshots --company 030200 --since 2025-10-20 --force
+    python -m app.cli.load_snapshots --company 030200 --watch   # keep ingesting changes
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from app.config import settings
+from app.deps import close_engine, get_session_factory, init_engine
+from app.repositories.base import BaseRepository
+from app.repositories.companies_repo import get_companies_repo
+from app.services.llm_gateway import close_gateway, init_gateway
+from app.services.sentiment_worker import close_sentiment_worker, init_sentiment_worker
+from app.services.snapshot_loader import load_snapshots
+from app.services.snapshot_watcher import SnapshotWatcher
+from app.services.story_index import warm_story_index
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    init_engine()
+    session_factory = get_session_factory()
+    try:
+        async with session_factory() as session:
+            company = await (await get_companies_repo(session)).get_company(args.company)
+        if company is None:
+            raise SystemExit(f"Unknown company: {args.company}")
+
+        await warm_story_index(session_factory)
+        started = time.perf_counter()
+        results = await load_snapshots(
+            session_factory,
+            Path(args.data_dir),
+            company,
+            since=args.since,
+            until=args.until,
+            concurrency=args.concurrency,
+            force=args.force,
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        await close_engine()
+
+    inserted: dict[str, int] = {}
+    for result in results:
+        for table, rows in result.inserted.items():
+            inserted[table] = inserted.get(table, 0) + rows
+    return {
+        "directories": len(results),
+        "files_loaded": sum(len(r.loaded_files) for r in results),
+        "files_appended": sum(len(r.appended_files) for r in results),
+        "files_unchanged": sum(len(r.unchanged_files) for r in results),
+        "records": sum(r.records for r in results),
+        "skipped_lines": sum(r.skipped_lines for r in results),
+        "inserted": inserted,
+        "elapsed_seconds": round(elapsed, 3),
+    }
+
+
+async def _watch(args: argparse.Namespace) -> None:
+    """Run the snapshot watcher (with a sentiment worker for unscored rows) until interrupted."""
+    init_engine()
+    init_gateway()
+    session_factory = get_session_factory()
+    init_sentiment_worker(
+        session_factory,
+        batch_size=settings.sentiment_worker_batch_size,
+        max_wait_seconds=settings.sentiment_worker_max_wait_seconds,
+    )
+    await warm_story_index(session_factory)
+    watcher = SnapshotWatcher(
+        session_factory,
+        Path(args.data_dir),
+        args.company,
+        debounce_seconds=args.debounce,
+        force_polling=args.poll,
+    )
+    watcher.start()
+    print(f"Watching {args.data_dir} ({watcher.mode}); Ctrl-C to stop", file=sys.stderr)
+    try:
+        while True:
+            await asyncio.sleep(args.progress_interval)
+            print(json.dumps(watcher.stats()), file=sys.stderr)
+    finally:
+        await watcher.stop()
+        await close_sentiment_worker()
+        await close_gateway()
+        await close_engine()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the snapshot loader CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(
+        description="Bulk-load daily snapshot directories (news, forum, DART, market)"
+    )
+    parser.add_argument(
+        "--data-dir", default="../data", help="Directory holding YYYY-MM-DD snapshot folders"
+    )
+    parser.add_argument(
+        "--company", required=True, help="Company ID the snapshots belong to (e.g. 030200)"
+    )
+    parser.add_argument("--since", type=date.fromisoformat, help="First day to load (YYYY-MM-DD)")
+    parser.add_argument("--until", type=date.fromisoformat, help="Last day to load (YYYY-MM-DD)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Directories loaded at once")
+    parser.add_argument("--force", action="store_true", help="Reload files already in the manifest")
+    parser.add_argument("--json", action="store_true", help="Print summary as JSON")
+    parser.add_argument(
+        "--watch", action="store_true", help="Keep running and ingest files as they change"
+    )
+    parser.add_argument("--poll", action="store_true", help="Watch by polling instead of inotify")
+    parser.add_argument(
+        "--debounce", type=float, default=1.0, help="Seconds of quiet before loading changes"
+    )
+    parser.add_argument(
+        "--progress-interval", type=float, default=30.0, help="Seconds between watch stats lines"
+    )
+    args = parser.parse_args(argv)
+
+    if not Path(args.data_dir).is_dir():
+        raise SystemExit(f"Data directory not found: {args.data_dir}")
+    if BaseRepository.is_memory_mode():
+        raise SystemExit("Snapshot loading needs PostgreSQL (DB_DSN is memory://)")
+
+    if args.watch:
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(_watch(args))
+        return 0
+
+    summary = asyncio.run(_run(args))
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        for key, value in summary.items():
+            print(f"{key:>16}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""Re-scoring CLI: rewrite stored sentiment after a prompt or model change.
+
+Usage:
+    python -m app.cli.rescore --tables news,social,filing --concurrency 4
+    python -m app.cli.rescore --only-missing          # backfill null sentiment
+    python -m app.cli.rescore --restart               # ignore the checkpoint
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Any
+
+from app.deps import close_engine, get_session_factory, init_engine
+from app.repositories.base import BaseRepository
+from app.services.llm_gateway import close_gateway, init_gateway
+from app.services.rescore import Checkpoint, RescoreProgress, count_rows, rescore_table
+from app.services.sentiment_worker import TargetTable
+
+ALL_TABLES: list[TargetTable] = ["news", "social", "filing"]
+
+
+async def _report(progress: RescoreProgress, interval: float) -> None:
+    """Print throughput and ETA to stderr every ``interval`` seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        snap = progress.snapshot()
+        eta = f"{snap['eta_seconds']:.0f}s" if snap["eta_seconds"] is not None else "?"
+        print(
+            f"{snap['done']}/{snap['total']} rows  {snap['rows_per_second']:.1f} rows/s  eta {eta}",
+            file=sys.stderr,
+        )
+
+
+async def _run(args: argparse.Namespace, tables: list[TargetTable]) -> dict[str, Any]:
+    checkpoint = Checkpoint(args.checkpoint)
+    if args.restart:
+        checkpoint.state = {}
+    pending = [t for t in tables if not checkpoint.is_complete(t)]
+
+    init_engine()
+    init_gateway()
+    session_factory = get_session_factory()
+    reporter: asyncio.Task[None] | None = None
+    written: dict[str, int] = {}
+    try:
+        total = 0
+        async with session_factory() as session:
+            for table in pending:
+                total += await count_rows(
+                    session, table, checkpoint.after_id(table), args.only_missing
+                )
+
+        progress = RescoreProgress(total=total)
+        reporter = asyncio.create_task(_report(progress, args.progress_interval))
+        for table in pending:
+            written[table] = await rescore_table(
+                session_factory,
+                table,
+                checkpoint,
+                progress,
+                page_size=args.page_size,
+                concurrency=args.concurrency,
+                only_missing=args.only_missing,
+            )
+    finally:
+        if reporter is not None:
+            reporter.cancel()
+        await close_gateway()
+        await close_engine()
+
+    return {
+        "tables": written,
+        "skipped_complete": [t for t in tables if t not in pending],
+        **progress.snapshot(),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the re-scoring CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(
+        description="Re-score stored sentiment in news, social posts and filings"
+    )
+    parser.add_argument(
+        "--tables", default=",".join(ALL_TABLES), help="Comma-separated: news,social,filing"
+    )
+    parser.add_argument("--page-size", type=int, default=200, help="Rows per page (and per UPDATE)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Pages scored at once")
+    parser.add_argument(
+        "--only-missing", action="store_true", help="Only rows with null sentiment (uses the cache)"
+    )
+    parser.add_argument(
+        "--checkpoint", default=".rescore-checkpoint.json", help="Resume state file"
+    )
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+    parser.add_argument(
+        "--progress-interval", type=float, default=5.0, help="Seconds between progress lines"
+    )
+    parser.add_argument("--json", action="store_true", help="Print summary as JSON")
+    args = parser.parse_args(argv)
+
+    tables = [t.strip() for t in args.tables.split(",") if t.strip()]
+    unknown = set(tables) - set(ALL_TABLES)
+    if unknown:
+        raise SystemExit(f"Unknown tables: {', '.join(sorted(unknown))}")
+    if BaseRepository.is_memory_mode():
+        raise SystemExit("Re-scoring needs PostgreSQL (DB_DSN is memory://)")
+
+    try:
+        summary = asyncio.run(_run(args, tables))
+    except Exception as e:
+        print(
+            f"Re-scoring stopped: {e}. "
+            f"Run the same command again to resume from {args.checkpoint}.",
+            file=sys.stderr,
+        )
+        return 1
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        for key, value in summary.items():
+            print(f"{key:>18}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
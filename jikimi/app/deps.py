@@ -1,13 +1,14 @@
 """Dependency injection for database and other shared resources."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Query
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
+from app.schemas.common import SentimentFilter, SentimentLabel
 
 # Global engine instance (initialized in lifespan)
 _engine: AsyncEngine | None = None
@@ -19,7 +20,7 @@ def get_engine() -> AsyncEngine:
     
     Returns:
         SQLAlchemy async engine
-        
+
     Raises:
         RuntimeError: If engine is not initialized
     """
@@ -61,6 +62,20 @@ async def close_engine() -> None:
         _session_factory = None
 
 
+def get_session_factory() -> Callable[[], AsyncSession]:
+    """Get the session factory for work outside a request (background tasks).
+
+    Returns:
+        SQLAlchemy async session factory
+
+    Raises:
+        RuntimeError: If the session factory is not initialized
+    """
+    if _session_factory is None:
+        raise RuntimeError("Database session factory not initialized")
+    return _session_factory
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Get a database session.
     
@@ -77,3 +92,29 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
 # Type aliases for dependency injection
 DbSession = Annotated[AsyncSession, Depends(get_session)]
 
+
+def get_sentiment_filter(
+    label: Annotated[
+        SentimentLabel | None, Query(description="Only items with this sentiment label")
+    ] = None,
+    min_score: Annotated[
+        float | None, Query(ge=-1.0, le=1.0, description="Minimum sentiment score")
+    ] = None,
+    min_confidence: Annotated[
+        float | None, Query(ge=0.0, le=1.0, description="Minimum sentiment confidence")
+    ] = None,
+) -> SentimentFilter:
+    """Collect the sentiment query parameters shared by the list endpoints.
+
+    Args:
+        label: Sentiment label
+        min_score: Minimum score (inclusive)
+        min_confidence: Minimum confidence (inclusive)
+
+    Returns:
+        Sentiment filter (empty when no parameter is given)
+    """
+    return SentimentFilter(label=label, min_score=min_score, min_confidence=min_confidence)
+
+
+SentimentFilterParams = Annotated[SentimentFilter, Depends(get_sentiment_filter)]
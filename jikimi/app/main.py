@@ -4,14 +4,49 @@ import logging
 import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
 
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 
 from app.config import settings
-from app.deps import close_engine, init_engine
+from app.deps import close_engine, get_session_factory, init_engine
 from app.errors import AppError
-from app.routers import companies, holdings, intelligence, market, prediction
+from app.routers import (
+    batch,
+    companies,
+    holdings,
+    intelligence,
+    market,
+    prediction,
+    search,
+    trending,
+)
+from app.services.company_directory import (
+    close_company_directory,
+    get_company_directory,
+    init_company_directory,
+)
+from app.services.http_cache import get_response_cache
+from app.services.llm_gateway import close_gateway, get_gateway, init_gateway
+from app.services.sentiment_cache import get_sentiment_cache
+from app.services.sentiment_worker import (
+    close_sentiment_worker,
+    get_sentiment_worker,
+    init_sentiment_worker,
+)
+from app.services.snapshot_watcher import (
+    close_snapshot_watcher,
+    get_snapshot_watcher,
+    init_snapshot_watcher,
+)
+from app.services.story_index import get_story_index, warm_story_index
+from app.services.trending import (
+    close_trending_snapshots,
+    get_trending_counter,
+    init_trending_snapshots,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -26,8 +61,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager.
     
     Handles startup and shutdown:
-    - Initialize database engine on startup
-    - Close database engine on shutdown
+    - Initialize database engine, shared LLM gateway, sentiment worker,
+      company directory, story index, trending counters and (if configured)
+      snapshot watcher on startup
+    - Stop the watcher and directory refresh, save the trending counters,
+      drain the sentiment worker, then close LLM gateway and database engine
+      on shutdown
     """
     # Startup
     logger.info("Starting application...")
@@ -45,12 +84,62 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         init_engine()
         logger.info("Running in memory mode with fake data")
     
+    # One pooled OpenAI client for every request
+    init_gateway()
+
+    # Background scorer for rows created with defer_sentiment=true
+    init_sentiment_worker(
+        get_session_factory(),
+        batch_size=settings.sentiment_worker_batch_size,
+        max_wait_seconds=settings.sentiment_worker_max_wait_seconds,
+    )
+
+    # Company lookups and typeahead from memory (the repository is used if this fails)
+    if not settings.db_dsn.startswith("memory://"):
+        try:
+            await init_company_directory(
+                get_session_factory(), settings.company_directory_refresh_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Company directory unavailable, using the database: {e}")
+
+    # Near-duplicate story index over the articles still inside the story window
+    if not settings.db_dsn.startswith("memory://"):
+        try:
+            await warm_story_index(get_session_factory())
+        except Exception as e:
+            logger.warning(f"Story index starts empty: {e}")
+
+    # Trending counters: restore the last snapshot and keep saving them
+    if not settings.db_dsn.startswith("memory://"):
+        try:
+            await init_trending_snapshots(get_session_factory(), settings.trending_snapshot_seconds)
+        except Exception as e:
+            logger.warning(f"Trending counters start empty: {e}")
+
+    # Ingest data/YYYY-MM-DD/*.txt as the crawler writes them
+    if settings.snapshot_watch_dir and not settings.db_dsn.startswith("memory://"):
+        watcher = init_snapshot_watcher(
+            get_session_factory(),
+            Path(settings.snapshot_watch_dir),
+            settings.snapshot_watch_company_id,
+            debounce_seconds=settings.snapshot_watch_debounce_seconds,
+            poll_interval_seconds=settings.snapshot_watch_poll_seconds,
+            force_polling=settings.snapshot_watch_force_polling,
+        )
+        logger.info(f"Watching {settings.snapshot_watch_dir} for snapshots ({watcher.mode})")
+
     logger.info("Application started successfully")
     
     yield
     
     # Shutdown
     logger.info("Shutting down application...")
+    await close_snapshot_watcher()
+    await close_company_directory()
+    await close_trending_snapshots()
+    await close_sentiment_worker()
+    await close_gateway()
     await close_engine()
     logger.info("Application shutdown complete")
 
@@ -74,6 +163,9 @@ def create_app() -> FastAPI:
     app.include_router(market.router, prefix=settings.api_prefix)
     app.include_router(prediction.router, prefix=settings.api_prefix)
     app.include_router(holdings.router, prefix=settings.api_prefix)
+    app.include_router(search.router, prefix=settings.api_prefix)
+    app.include_router(trending.router, prefix=settings.api_prefix)
+    app.include_router(batch.router, prefix=settings.api_prefix)
     
     # Exception handlers
     @app.exception_handler(AppError)
@@ -129,6 +221,85 @@ def create_app() -> FastAPI:
         """
         return {"status": "ok"}
     
+    @app.get("/metrics/llm", tags=["health"])
+    async def llm_metrics() -> dict[str, Any]:
+        """LLM gateway metrics per endpoint.
+
+        Returns:
+            Call, retry and error counts, latency percentiles and token usage
+        """
+        return get_gateway().metrics()
+
+    @app.get("/metrics/sentiment-cache", tags=["health"])
+    async def sentiment_cache_metrics() -> dict[str, Any]:
+        """Sentiment cache hit rate.
+
+        Returns:
+            Hits per tier (memory, database, coalesced in-flight), misses and hit rate
+        """
+        return get_sentiment_cache().stats()
+
+    @app.get("/metrics/company-directory", tags=["health"])
+    async def company_directory_metrics() -> dict[str, Any]:
+        """Company directory size and usage.
+
+        Returns:
+            Companies loaded, reload count, lookup/search counts and mean search time
+        """
+        return get_company_directory().stats()
+
+    @app.get("/metrics/story-index", tags=["health"])
+    async def story_index_metrics() -> dict[str, Any]:
+        """Near-duplicate story index.
+
+        Returns:
+            Indexed articles and stories, share of articles joining an
+            existing story, and mean assignment time in microseconds
+        """
+        return get_story_index().stats()
+
+    @app.get("/metrics/trending", tags=["health"])
+    async def trending_metrics() -> dict[str, Any]:
+        """Trending counters.
+
+        Returns:
+            Companies tracked, mentions recorded and dropped as too old,
+            mean ranking time in microseconds and snapshot progress
+        """
+        return get_trending_counter().stats()
+
+    @app.get("/metrics/http-cache", tags=["health"])
+    async def http_cache_metrics() -> dict[str, Any]:
+        """HTTP response cache hit rate.
+
+        Returns:
+            Responses cached, fresh hits, revalidations, 304s answered
+            without a body, misses and hit rate
+        """
+        return get_response_cache().stats()
+
+    @app.get("/metrics/sentiment-worker", tags=["health"])
+    async def sentiment_worker_metrics() -> dict[str, Any]:
+        """Deferred sentiment worker progress.
+
+        Returns:
+            Queue depth, batches processed, rows scored and rows given up on
+        """
+        return get_sentiment_worker().stats()
+
+    @app.get("/metrics/snapshot-watcher", tags=["health"])
+    async def snapshot_watcher_metrics() -> dict[str, Any]:
+        """Snapshot watcher progress.
+
+        Returns:
+            Change source, pending changes, files and rows loaded, and the
+            delay from the first change of the last batch to its commit
+        """
+        try:
+            return get_snapshot_watcher().stats()
+        except RuntimeError:
+            return {"mode": "disabled"}
+
     return app
 
 
@@ -1,9 +1,21 @@
 """SQLAlchemy models for database tables."""
 
-from datetime import datetime
+from datetime import date, datetime
+from typing import Any
 
-from sqlalchemy import TIMESTAMP, BigInteger, CheckConstraint, Integer, Numeric, Text, UniqueConstraint
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (
+    TIMESTAMP,
+    BigInteger,
+    CheckConstraint,
+    Computed,
+    Date,
+    Double,
+    Integer,
+    Numeric,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -40,6 +52,22 @@ class NewsArticleModel(Base):
     summary: Mapped[str | None] = mapped_column(Text)
     content: Mapped[str | None] = mapped_column(Text)
     sentiment: Mapped[dict | None] = mapped_column(JSONB)
+    sentiment_label: Mapped[str | None] = mapped_column(
+        Computed("sentiment->>'label'", persisted=True)
+    )
+    sentiment_score: Mapped[float | None] = mapped_column(
+        Double, Computed("(sentiment->>'score')::double precision", persisted=True)
+    )
+    sentiment_confidence: Mapped[float | None] = mapped_column(
+        Double, Computed("(sentiment->>'confidence')::double precision", persisted=True)
+    )
+    dedupe_hash: Mapped[str | None] = mapped_column()
+    story_id: Mapped[str | None] = mapped_column()
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("korean_bigrams(title || ' ' || coalesce(summary, ''))", persisted=True),
+        deferred=True,
+    )
     created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=datetime.utcnow)
 
@@ -58,8 +86,23 @@ class SocialPostModel(Base):
     dept: Mapped[str | None] = mapped_column()
     posted_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True))
     sentiment: Mapped[dict | None] = mapped_column(JSONB)
+    sentiment_label: Mapped[str | None] = mapped_column(
+        Computed("sentiment->>'label'", persisted=True)
+    )
+    sentiment_score: Mapped[float | None] = mapped_column(
+        Double, Computed("(sentiment->>'score')::double precision", persisted=True)
+    )
+    sentiment_confidence: Mapped[float | None] = mapped_column(
+        Double, Computed("(sentiment->>'confidence')::double precision", persisted=True)
+    )
     reply_count: Mapped[int] = mapped_column(Integer, default=0)
     like_count: Mapped[int] = mapped_column(Integer, default=0)
+    dedupe_hash: Mapped[str | None] = mapped_column()
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("korean_bigrams(coalesce(title, '') || ' ' || content)", persisted=True),
+        deferred=True,
+    )
     created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=datetime.utcnow)
     
@@ -82,6 +125,22 @@ class DartFilingModel(Base):
     summary: Mapped[str | None] = mapped_column(Text)
     content: Mapped[str | None] = mapped_column(Text)
     sentiment: Mapped[dict | None] = mapped_column(JSONB)
+    sentiment_label: Mapped[str | None] = mapped_column(
+        Computed("sentiment->>'label'", persisted=True)
+    )
+    sentiment_score: Mapped[float | None] = mapped_column(
+        Double, Computed("(sentiment->>'score')::double precision", persisted=True)
+    )
+    sentiment_confidence: Mapped[float | None] = mapped_column(
+        Double, Computed("(sentiment->>'confidence')::double precision", persisted=True)
+    )
+    rcept_no: Mapped[str | None] = mapped_column()
+    dedupe_hash: Mapped[str | None] = mapped_column()
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("korean_bigrams(title || ' ' || coalesce(summary, ''))", persisted=True),
+        deferred=True,
+    )
     created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=datetime.utcnow)
 
@@ -111,6 +170,109 @@ class PriceCandleModel(Base):
     )
 
 
+class CompanyDailyFeaturesModel(Base):
+    """Per-company, per-day feature rows maintained by triggers on the intelligence tables."""
+
+    __tablename__ = "company_daily_features"
+
+    company_id: Mapped[str] = mapped_column(primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    news_count: Mapped[int] = mapped_column(Integer, default=0)
+    news_positive: Mapped[int] = mapped_column(Integer, default=0)
+    news_negative: Mapped[int] = mapped_column(Integer, default=0)
+    news_neutral: Mapped[int] = mapped_column(Integer, default=0)
+    news_scored: Mapped[int] = mapped_column(Integer, default=0)
+    news_score_sum: Mapped[float] = mapped_column(Double, default=0.0)
+    news_score_hours_sum: Mapped[float] = mapped_column(Double, default=0.0)
+    news_hours_sum: Mapped[float] = mapped_column(Double, default=0.0)
+    blind_count: Mapped[int] = mapped_column(Integer, default=0)
+    blind_engagement: Mapped[int] = mapped_column(BigInteger, default=0)
+    blind_positive: Mapped[int] = mapped_column(Integer, default=0)
+    naver_forum_count: Mapped[int] = mapped_column(Integer, default=0)
+    naver_forum_engagement: Mapped[int] = mapped_column(BigInteger, default=0)
+    filings_count: Mapped[int] = mapped_column(Integer, default=0)
+    last_filed_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True))
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+
+
+class SentimentRollupModel(Base):
+    """Per-company, per-source, per-bucket sentiment sums maintained by triggers."""
+
+    __tablename__ = "sentiment_rollups"
+
+    company_id: Mapped[str] = mapped_column(primary_key=True)
+    bucket: Mapped[str] = mapped_column(primary_key=True)
+    source: Mapped[str] = mapped_column(primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), primary_key=True)
+    item_count: Mapped[int] = mapped_column(Integer, default=0)
+    scored: Mapped[int] = mapped_column(Integer, default=0)
+    positive: Mapped[int] = mapped_column(Integer, default=0)
+    negative: Mapped[int] = mapped_column(Integer, default=0)
+    neutral: Mapped[int] = mapped_column(Integer, default=0)
+    score_sum: Mapped[float] = mapped_column(Double, default=0.0)
+    score_hours_sum: Mapped[float] = mapped_column(Double, default=0.0)
+    hours_sum: Mapped[float] = mapped_column(Double, default=0.0)
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+
+
+class BlindDeptDailyModel(Base):
+    """Per-company, per-department, per-day 블라인드 stats maintained by a trigger."""
+
+    __tablename__ = "blind_dept_daily"
+
+    company_id: Mapped[str] = mapped_column(primary_key=True)
+    dept: Mapped[str] = mapped_column(primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    post_count: Mapped[int] = mapped_column(Integer, default=0)
+    reply_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    like_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    scored: Mapped[int] = mapped_column(Integer, default=0)
+    positive: Mapped[int] = mapped_column(Integer, default=0)
+    negative: Mapped[int] = mapped_column(Integer, default=0)
+    neutral: Mapped[int] = mapped_column(Integer, default=0)
+    score_sum: Mapped[float] = mapped_column(Double, default=0.0)
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+
+
+class TrendingCounterModel(Base):
+    """Snapshot of one slot of the in-memory trending ring buffers."""
+
+    __tablename__ = "trending_counters"
+
+    company_id: Mapped[str] = mapped_column(primary_key=True)
+    resolution: Mapped[str] = mapped_column(primary_key=True)
+    slot_start: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), primary_key=True)
+    mentions: Mapped[int] = mapped_column(Integer, default=0)
+    engagement: Mapped[int] = mapped_column(BigInteger, default=0)
+    scored: Mapped[int] = mapped_column(Integer, default=0)
+    score_sum: Mapped[float] = mapped_column(Double, default=0.0)
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+
+
+class SentimentCacheModel(Base):
+    """Content-addressed sentiment results (second cache tier)."""
+
+    __tablename__ = "sentiment_cache"
+
+    content_hash: Mapped[str] = mapped_column(primary_key=True)
+    content_type: Mapped[str] = mapped_column()
+    sentiment: Mapped[dict[str, Any]] = mapped_column(JSONB)
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+
+
+class SnapshotFileModel(Base):
+    """Snapshot files already loaded by the bulk loader."""
+
+    __tablename__ = "snapshot_files"
+
+    company_id: Mapped[str] = mapped_column(primary_key=True)
+    path: Mapped[str] = mapped_column(Text, primary_key=True)
+    content_hash: Mapped[str] = mapped_column()
+    byte_offset: Mapped[int] = mapped_column(BigInteger, default=0)
+    records: Mapped[int] = mapped_column(Integer, default=0)
+    loaded_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), default=datetime.utcnow)
+
+
 class EsppHoldingModel(Base):
     """Employee stock purchase plan holdings."""
     
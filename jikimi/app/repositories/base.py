@@ -1,8 +1,14 @@
 """Base repository functionality."""
 
+from typing import Any
+
+from sqlalchemy import Select, String, bindparam, column, func, select, true, update, values
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.config import settings
+from app.schemas.common import Sentiment, SentimentFilter
 
 
 class BaseRepository:
@@ -25,3 +31,99 @@ class BaseRepository:
         """
         return settings.db_dsn.startswith("memory://")
 
+    @staticmethod
+    def _sentiment_clauses(model: Any, sentiment_filter: SentimentFilter | None) -> list[Any]:
+        """WHERE clauses for ``sentiment_filter`` on the generated sentiment columns.
+
+        ``sentiment_label``, ``sentiment_score`` and ``sentiment_confidence``
+        are stored columns extracted from the JSONB, so these conditions use
+        the per-table label and score indexes instead of decoding JSONB.
+
+        Args:
+            model: ORM model with the generated sentiment columns
+            sentiment_filter: Conditions to apply (None for none)
+
+        Returns:
+            Clauses to AND into the query
+        """
+        if sentiment_filter is None:
+            return []
+        clauses = []
+        if sentiment_filter.label is not None:
+            clauses.append(model.sentiment_label == sentiment_filter.label)
+        if sentiment_filter.min_score is not None:
+            clauses.append(model.sentiment_score >= sentiment_filter.min_score)
+        if sentiment_filter.min_confidence is not None:
+            clauses.append(model.sentiment_confidence >= sentiment_filter.min_confidence)
+        return clauses
+
+    @staticmethod
+    def _latest_per_company(
+        model: Any,
+        time_column: Any,
+        company_ids: list[str],
+        limit: int,
+        filters: list[Any],
+    ) -> Select[Any]:
+        """Query for the newest ``limit`` rows of each company in one statement.
+
+        Renders ``unnest(:company_ids) AS ids CROSS JOIN LATERAL (SELECT ...
+        WHERE company_id = ids.company_id ... ORDER BY time DESC, id ASC
+        LIMIT n)``, so each company is a short scan of the table's
+        ``(company_id, time DESC, id ASC)`` index. The ids are bound as one
+        array, so the batch is one round trip and one statement whatever
+        its size.
+
+        Args:
+            model: ORM model with ``id`` and ``company_id`` columns
+            time_column: Column the rows are ordered by (newest first)
+            company_ids: Companies to read
+            limit: Rows per company
+            filters: Extra WHERE clauses on ``model``
+
+        Returns:
+            Select of ``model`` rows, grouped by company in input order
+        """
+        ids = (
+            func.unnest(bindparam("company_ids", company_ids, type_=ARRAY(String)))
+            .table_valued("company_id", with_ordinality="ord")
+            .render_derived(name="ids")
+        )
+        latest = (
+            select(model)
+            .where(model.company_id == ids.c.company_id, *filters)
+            .order_by(time_column.desc(), model.id.asc())
+            .limit(limit)
+            .lateral("latest")
+        )
+        row = aliased(model, latest)
+        return (
+            select(row)
+            .select_from(ids)
+            .join(latest, true())
+            .order_by(ids.c.ord, getattr(row, time_column.key).desc(), row.id.asc())
+        )
+
+    async def _update_sentiments(self, model: Any, sentiments: dict[str, Sentiment]) -> int:
+        """Set ``sentiment`` on many rows of ``model`` in one statement.
+
+        Renders ``UPDATE ... SET sentiment = v.sentiment FROM (VALUES ...) AS v``
+        joined on the primary key, so a batch costs one round trip.
+
+        Args:
+            model: ORM model with ``id`` and ``sentiment`` columns
+            sentiments: Mapping of row ID to sentiment
+
+        Returns:
+            Number of rows updated
+        """
+        if not sentiments or self.is_memory_mode():
+            return 0
+
+        rows = values(column("id", String), column("sentiment", JSONB), name="v").data(
+            [(row_id, sentiment.model_dump()) for row_id, sentiment in sentiments.items()]
+        )
+        stmt = update(model).where(model.id == rows.c.id).values(sentiment=rows.c.sentiment)
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+        return int(result.rowcount)  # type: ignore[attr-defined]
@@ -0,0 +1,119 @@
+"""블라인드 department rollups repository (per-company, per-department, per-day stats).
+
+``aggregate_dept_days`` is the Python mirror of the department trigger (used
+in memory mode and to check parity).
+"""
+
+from datetime import UTC, date, datetime, time, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import BlindDeptDailyModel
+from app.repositories.base import BaseRepository
+from app.schemas.blind_depts import BlindDeptDay
+from app.schemas.intelligence import SocialPost
+
+
+def aggregate_dept_days(posts: list[SocialPost]) -> list[BlindDeptDay]:
+    """Aggregate 블라인드 posts into department day rows, as the trigger does.
+
+    Posts from other platforms or without a department are skipped.
+
+    Args:
+        posts: Social posts
+
+    Returns:
+        Rows ordered by department, then day
+    """
+    rows: dict[tuple[str, date], BlindDeptDay] = {}
+    for post in posts:
+        if post.platform != "blind" or post.dept is None:
+            continue
+        day = post.posted_at.astimezone(UTC).date()
+        row = rows.setdefault((post.dept, day), BlindDeptDay(dept=post.dept, day=day))
+        row.post_count += 1
+        row.reply_count += post.reply_count
+        row.like_count += post.like_count
+        if post.sentiment is None:
+            continue
+        row.scored += 1
+        row.positive += post.sentiment.label == "positive"
+        row.negative += post.sentiment.label == "negative"
+        row.neutral += post.sentiment.label == "neutral"
+        row.score_sum += post.sentiment.score
+    return [rows[key] for key in sorted(rows)]
+
+
+class BlindDeptsRepository(BaseRepository):
+    """Repository for department day rows maintained by a database trigger."""
+
+    async def fetch_dept_days(
+        self, company_id: str, start_day: date, end_day: date
+    ) -> list[BlindDeptDay]:
+        """Fetch every department's rows for days in ``[start_day, end_day]``.
+
+        Served by ``idx_blind_dept_daily_company_day``; no posts are read.
+
+        Args:
+            company_id: Company identifier
+            start_day: First day (inclusive)
+            end_day: Last day (inclusive)
+
+        Returns:
+            Rows ordered by department, then day
+        """
+        if self.is_memory_mode():
+            return await self._fetch_dept_days_memory(company_id, start_day, end_day)
+
+        query = (
+            select(BlindDeptDailyModel)
+            .where(
+                BlindDeptDailyModel.company_id == company_id,
+                BlindDeptDailyModel.day >= start_day,
+                BlindDeptDailyModel.day <= end_day,
+            )
+            .order_by(BlindDeptDailyModel.dept.asc(), BlindDeptDailyModel.day.asc())
+        )
+        result = await self.session.execute(query)
+
+        return [
+            BlindDeptDay(
+                dept=row.dept,
+                day=row.day,
+                post_count=row.post_count,
+                reply_count=row.reply_count,
+                like_count=row.like_count,
+                scored=row.scored,
+                positive=row.positive,
+                negative=row.negative,
+                neutral=row.neutral,
+                score_sum=row.score_sum,
+            )
+            for row in result.scalars().all()
+        ]
+
+    async def _fetch_dept_days_memory(
+        self, company_id: str, start_day: date, end_day: date
+    ) -> list[BlindDeptDay]:
+        """In-memory implementation of fetch_dept_days."""
+        from app.repositories.social_repo import SocialRepository
+
+        start = datetime.combine(start_day, time.min, tzinfo=UTC)
+        end = datetime.combine(end_day + timedelta(days=1), time.min, tzinfo=UTC)
+        posts, _ = await SocialRepository(self.session).fetch_social(
+            company_id, "blind", start, end, 1000
+        )
+        return aggregate_dept_days(posts)
+
+
+async def get_blind_depts_repo(session: AsyncSession) -> BlindDeptsRepository:
+    """Factory function for BlindDeptsRepository.
+
+    Args:
+        session: SQLAlchemy async session
+
+    Returns:
+        BlindDeptsRepository instance
+    """
+    return BlindDeptsRepository(session)
@@ -1,12 +1,34 @@
 """Company repository."""
 
-from sqlalchemy import or_, select
+from sqlalchemy import and_, case, func, literal, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import CompanyModel
 from app.repositories.base import BaseRepository
 from app.schemas.company import Company
 from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.text_search import trigram_similarity
+from app.utils.time import to_rfc3339
+
+# Added to the trigram similarity (0-1) so prefix matches, then exact ones, rank first
+PREFIX_BOOST = 1.0
+EXACT_BOOST = 1.0
+
+
+def search_rank(company: Company, q: str) -> float:
+    """Rank of a company for a lowercased query, as computed in SQL.
+
+    Best trigram similarity of name or ticker, plus ``PREFIX_BOOST`` when the
+    name, ticker or ID starts with the query and ``EXACT_BOOST`` when one
+    equals it.
+    """
+    fields = (company.name.lower(), (company.ticker or "").lower(), company.id)
+    rank = max(trigram_similarity(fields[0], q), trigram_similarity(fields[1], q))
+    if any(f.startswith(q) for f in fields):
+        rank += PREFIX_BOOST
+    if q in fields:
+        rank += EXACT_BOOST
+    return rank
 
 
 class CompaniesRepository(BaseRepository):
@@ -20,42 +42,61 @@ class CompaniesRepository(BaseRepository):
     ) -> tuple[list[Company], str | None]:
         """Search for companies.
         
+        With ``q``, companies whose name, ticker or ID contains it, or whose
+        name is trigram-similar to it (``pg_trgm``'s ``%``, so typos still
+        match), are ranked by ``search_rank`` and paged with a keyset cursor
+        on ``(rank DESC, id ASC)``. Without ``q`` all companies are listed by
+        ID.
+
         Args:
             q: Search query string
             limit: Maximum number of results
             cursor: Pagination cursor
-            
+
         Returns:
             Tuple of (companies, next_cursor)
         """
         if self.is_memory_mode():
             return await self._search_companies_memory(q, limit, cursor)
         
-        # Build query
-        query = select(CompanyModel)
+        q = (q or "").strip().lower()
+        after = decode_cursor(cursor) or {}
+        name = func.lower(CompanyModel.name)
+        ticker = func.lower(CompanyModel.ticker)
         
-        # Apply search filter
         if q:
-            search_term = f"%{q}%"
-            query = query.where(
-                or_(
-                    CompanyModel.name.ilike(search_term),
-                    CompanyModel.ticker.ilike(search_term),
-                    CompanyModel.id.ilike(search_term),
-                )
+            exact = or_(name == q, ticker == q, CompanyModel.id == q)
+            prefix = or_(
+                name.startswith(q, autoescape=True),
+                ticker.startswith(q, autoescape=True),
+                CompanyModel.id.startswith(q, autoescape=True),
             )
-        
-        # Apply cursor for pagination (simple offset for companies since they don't have timestamps)
-        cursor_dict = decode_cursor(cursor)
-        offset = cursor_dict.get("offset", 0) if cursor_dict else 0
-        
-        # Order by ID for consistency
-        query = query.order_by(CompanyModel.id)
+            rank = (
+                func.greatest(func.similarity(name, q), func.similarity(ticker, q))
+                + case((prefix, PREFIX_BOOST), else_=0.0)
+                + case((exact, EXACT_BOOST), else_=0.0)
+            ).label("rank")
+            query = select(CompanyModel, rank).where(or_(
+                name.contains(q, autoescape=True),
+                ticker.contains(q, autoescape=True),
+                CompanyModel.id.contains(q, autoescape=True),
+                name.op("%")(q),
+            ))
+            if isinstance(after.get("rank"), (int, float)) and after.get("id"):
+                query = query.where(or_(
+                    rank < after["rank"],
+                    and_(rank == after["rank"], CompanyModel.id > after["id"]),
+                ))
+            query = query.order_by(rank.desc(), CompanyModel.id.asc())
+        else:
+            query = select(CompanyModel, literal(0.0).label("rank"))
+            if after.get("id"):
+                query = query.where(CompanyModel.id > after["id"])
+            query = query.order_by(CompanyModel.id.asc())
         
         # Fetch limit + 1 to check for more results
-        query = query.offset(offset).limit(limit + 1)
-        result = await self.session.execute(query)
-        rows = list(result.scalars().all())
+        result = await self.session.execute(query.limit(limit + 1))
+        rows = list(result.all())
         
         # Check if there are more results
         has_more = len(rows) > limit
@@ -71,13 +112,15 @@ class CompaniesRepository(BaseRepository):
                 sector=row.sector,
                 market=row.market,
             )
-            for row in rows
+            for row, _ in rows
         ]
         
-        # Generate next cursor
+        # Generate next cursor from the last row's sort key
         next_cursor = None
         if has_more:
-            next_cursor = encode_cursor({"offset": offset + limit})
+            last_row, last_rank = rows[-1]
+            position = {"rank": last_rank, "id": last_row.id} if q else {"id": last_row.id}
+            next_cursor = encode_cursor(position)
         
         return companies, next_cursor
     
@@ -86,7 +129,7 @@ class CompaniesRepository(BaseRepository):
         
         Args:
             company_id: Company identifier
-            
+
         Returns:
             Company or None if not found
         """
@@ -109,6 +152,39 @@ class CompaniesRepository(BaseRepository):
             market=row.market,
         )
     
+    async def list_companies(self) -> list[Company]:
+        """Get every company (the master list is small).
+
+        Returns:
+            Companies ordered by ID
+        """
+        if self.is_memory_mode():
+            companies, _ = await self._search_companies_memory(None, 1000, None)
+            return companies
+
+        result = await self.session.execute(select(CompanyModel).order_by(CompanyModel.id))
+        return [
+            Company(
+                id=row.id, ticker=row.ticker, name=row.name, sector=row.sector, market=row.market
+            )
+            for row in result.scalars()
+        ]
+
+    async def fingerprint(self) -> tuple[int, str | None]:
+        """Row count and latest ``updated_at``, which change whenever companies do.
+
+        Returns:
+            Tuple of (count, latest update as RFC3339 or None)
+        """
+        if self.is_memory_mode():
+            return len(await self.list_companies()), None
+
+        result = await self.session.execute(
+            select(func.count(), func.max(CompanyModel.updated_at)).select_from(CompanyModel)
+        )
+        count, updated_at = result.one()
+        return count, to_rfc3339(updated_at) if updated_at else None
+
     async def _search_companies_memory(
         self,
         q: str | None,
@@ -125,27 +201,33 @@ class CompaniesRepository(BaseRepository):
             Company(id="006400", ticker="006400.KS", name="삼성SDI", sector="Technology", market="KOSPI"),
         ]
         
-        # Filter by query
+        # Filter and rank by query (similarity threshold as pg_trgm's default 0.3)
+        q = (q or "").strip().lower()
+        ranked = [(0.0, c) for c in sorted(all_companies, key=lambda c: c.id)]
         if q:
-            q_lower = q.lower()
-            all_companies = [
-                c for c in all_companies
-                if q_lower in c.name.lower() or q_lower in c.id or (c.ticker and q_lower in c.ticker.lower())
-            ]
-        
-        # Simple offset-based pagination for in-memory mode
-        cursor_dict = decode_cursor(cursor)
-        offset = cursor_dict.get("offset", 0) if cursor_dict else 0
+            ranked = sorted(
+                (
+                    (search_rank(c, q), c) for c in all_companies
+                    if q in c.name.lower() or q in c.id or (c.ticker and q in c.ticker.lower())
+                    or trigram_similarity(c.name.lower(), q) >= 0.3
+                ),
+                key=lambda item: (-item[0], item[1].id),
+            )
         
-        # Get page
-        page = all_companies[offset : offset + limit]
+        # Keyset pagination on (rank DESC, id ASC)
+        after = decode_cursor(cursor) or {}
+        if after.get("id"):
+            bound = (-after.get("rank", 0.0), after["id"])
+            ranked = [item for item in ranked if (-item[0], item[1].id) > bound]
         
-        # Generate next cursor
+        page = ranked[:limit]
         next_cursor = None
-        if offset + limit < len(all_companies):
-            next_cursor = encode_cursor({"offset": offset + limit})
+        if len(ranked) > limit:
+            last_rank, last = page[-1]
+            position = {"rank": last_rank, "id": last.id} if q else {"id": last.id}
+            next_cursor = encode_cursor(position)
         
-        return page, next_cursor
+        return [c for _, c in page], next_cursor
     
     async def _get_company_memory(self, company_id: str) -> Company | None:
         """In-memory implementation of get_company."""
@@ -164,7 +246,7 @@ async def get_companies_repo(session: AsyncSession) -> CompaniesRepository:
     
     Args:
         session: SQLAlchemy async session
-        
+
     Returns:
         CompaniesRepository instance
     """
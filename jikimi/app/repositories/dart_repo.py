@@ -2,14 +2,18 @@
 
 import uuid
 from datetime import datetime, timedelta
+from typing import Any
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.errors import NotFoundError
 from app.models import DartFilingModel
 from app.repositories.base import BaseRepository
-from app.schemas.common import Sentiment
+from app.schemas.common import Sentiment, SentimentFilter
 from app.schemas.intelligence import Filing
+from app.utils.hashing import dart_rcept_no, filing_key
 from app.utils.pagination import decode_cursor, encode_cursor
 from app.utils.time import now_utc
 
@@ -17,6 +21,9 @@ from app.utils.time import now_utc
 class DartRepository(BaseRepository):
     """Repository for DART regulatory filings."""
     
+    # Columns identifying the same filing across crawler runs (unique per company)
+    natural_key: tuple[str, ...] = ("dedupe_hash",)
+
     async def fetch_filings(
         self,
         company_id: str,
@@ -25,6 +32,7 @@ class DartRepository(BaseRepository):
         limit: int = 50,
         cursor: str | None = None,
         typ: str | None = None,
+        sentiment_filter: SentimentFilter | None = None,
     ) -> tuple[list[Filing], str | None]:
         """Fetch DART filings for a company.
         
@@ -35,12 +43,15 @@ class DartRepository(BaseRepository):
             limit: Maximum number of results
             cursor: Pagination cursor
             typ: Filing type filter
-            
+            sentiment_filter: Sentiment label/score/confidence conditions
+
         Returns:
             Tuple of (filings, next_cursor)
         """
         if self.is_memory_mode():
-            return await self._fetch_filings_memory(company_id, start, end, limit, cursor, typ)
+            return await self._fetch_filings_memory(
+                company_id, start, end, limit, cursor, typ, sentiment_filter
+            )
         
         # Build query
         query = select(DartFilingModel).where(DartFilingModel.company_id == company_id)
@@ -55,6 +66,9 @@ class DartRepository(BaseRepository):
         if typ:
             query = query.where(DartFilingModel.filing_type == typ)
         
+        # Apply sentiment filters
+        query = query.where(*self._sentiment_clauses(DartFilingModel, sentiment_filter))
+
         # Apply keyset pagination
         cursor_dict = decode_cursor(cursor)
         if cursor_dict:
@@ -99,6 +113,7 @@ class DartRepository(BaseRepository):
                 summary=row.summary,
                 sentiment=Sentiment(**row.sentiment) if row.sentiment else None,
                 company_id=row.company_id,
+                rcept_no=row.rcept_no,
             )
             for row in rows
         ]
@@ -123,6 +138,7 @@ class DartRepository(BaseRepository):
         limit: int,
         cursor: str | None,
         typ: str | None,
+        sentiment_filter: SentimentFilter | None = None,
     ) -> tuple[list[Filing], str | None]:
         """In-memory implementation of fetch_filings."""
         base_time = now_utc()
@@ -154,6 +170,10 @@ class DartRepository(BaseRepository):
         if typ:
             all_filings = [f for f in all_filings if f.filing_type == typ]
         
+        # Filter by sentiment
+        if sentiment_filter:
+            all_filings = [f for f in all_filings if sentiment_filter.matches(f.sentiment)]
+
         # Simple offset-based pagination
         cursor_dict = decode_cursor(cursor)
         offset = cursor_dict.get("offset", 0) if cursor_dict else 0
@@ -166,6 +186,60 @@ class DartRepository(BaseRepository):
         
         return page, next_cursor
     
+    async def fetch_latest_filings(
+        self,
+        company_ids: list[str],
+        limit: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        sentiment_filter: SentimentFilter | None = None,
+    ) -> dict[str, list[Filing]]:
+        """Fetch the newest filings of many companies with one LATERAL query.
+
+        Args:
+            company_ids: Company identifiers
+            limit: Maximum filings per company
+            start: Start timestamp (inclusive)
+            end: End timestamp (exclusive)
+            sentiment_filter: Sentiment label/score/confidence conditions
+
+        Returns:
+            Filings per company (newest first), every requested company present
+        """
+        latest: dict[str, list[Filing]] = {company_id: [] for company_id in company_ids}
+        if not company_ids:
+            return latest
+        if self.is_memory_mode():
+            for company_id in latest:
+                latest[company_id], _ = await self._fetch_filings_memory(
+                    company_id, start, end, limit, None, None, sentiment_filter
+                )
+            return latest
+
+        filters = self._sentiment_clauses(DartFilingModel, sentiment_filter)
+        if start:
+            filters.append(DartFilingModel.filed_at >= start)
+        if end:
+            filters.append(DartFilingModel.filed_at < end)
+        query = self._latest_per_company(
+            DartFilingModel, DartFilingModel.filed_at, company_ids, limit, filters
+        )
+        result = await self.session.execute(query)
+
+        for row in result.scalars().all():
+            latest[row.company_id].append(Filing(
+                id=row.id,
+                title=row.title,
+                filing_type=row.filing_type,
+                filed_at=row.filed_at,
+                url=row.url,
+                summary=row.summary,
+                sentiment=Sentiment(**row.sentiment) if row.sentiment else None,
+                company_id=row.company_id,
+                rcept_no=row.rcept_no,
+            ))
+        return latest
+
     async def create_filing(
         self,
         title: str,
@@ -175,8 +249,10 @@ class DartRepository(BaseRepository):
         url: str | None = None,
         summary: str | None = None,
         sentiment: Sentiment | None = None,
+        rcept_no: str | None = None,
+        dedupe_hash: str | None = None,
     ) -> Filing:
-        """Create a new DART filing.
+        """Create a new DART filing, or return the stored one with the same dedupe key.
         
         Args:
             title: Filing title
@@ -186,32 +262,70 @@ class DartRepository(BaseRepository):
             url: DART filing URL
             summary: Filing summary
             sentiment: Pre-analyzed sentiment
-            
+            rcept_no: DART receipt number (read from ``url`` if omitted)
+            dedupe_hash: Natural key (computed with ``filing_key`` if omitted)
+
         Returns:
-            Created filing
+            Created (or already stored) filing
+
+        Raises:
+            NotFoundError: If the conflicting stored filing cannot be read back
         """
-        filing_id = f"filing_{uuid.uuid4().hex[:12]}"
-        
-        # Convert sentiment to dict
-        sentiment_dict = sentiment.model_dump() if sentiment else None
-        
-        # Create model
-        model = DartFilingModel(
-            id=filing_id,
-            title=title,
-            filing_type=filing_type,
-            filed_at=filed_at,
-            url=url,
-            summary=summary,
-            sentiment=sentiment_dict,
-            company_id=company_id,
+        rcept_no = rcept_no or dart_rcept_no(url)
+        dedupe_hash = dedupe_hash or filing_key(rcept_no, title, filing_type, filed_at)
+        (filing_id,) = await self.insert_many([{
+            "title": title,
+            "filing_type": filing_type,
+            "filed_at": filed_at,
+            "url": url,
+            "summary": summary,
+            "sentiment": sentiment,
+            "company_id": company_id,
+            "rcept_no": rcept_no,
+            "dedupe_hash": dedupe_hash,
+        }])
+        if filing_id is not None:
+            return Filing(
+                id=filing_id,
+                title=title,
+                filing_type=filing_type,
+                filed_at=filed_at,
+                url=url,
+                summary=summary,
+                sentiment=sentiment,
+                company_id=company_id,
+                rcept_no=rcept_no,
+            )
+
+        # Lost a race with an identical insert
+        filing_id = (await self.find_existing(company_id, [(dedupe_hash,)]))[(dedupe_hash,)]
+        stored = await self.get_filing(company_id, filing_id)
+        if stored is None:
+            raise NotFoundError(f"Filing {filing_id} not found")
+        return stored
+
+    async def get_filing(self, company_id: str, filing_id: str) -> Filing | None:
+        """Fetch a single DART filing by ID.
+
+        Args:
+            company_id: Company identifier
+            filing_id: DART filing ID
+
+        Returns:
+            Filing, or None if not found
+        """
+        if self.is_memory_mode():
+            filings, _ = await self._fetch_filings_memory(company_id, None, None, 1000, None, None)
+            return next((f for f in filings if f.id == filing_id), None)
+
+        query = select(DartFilingModel).where(
+            DartFilingModel.id == filing_id,
+            DartFilingModel.company_id == company_id,
         )
-        
-        self.session.add(model)
-        await self.session.commit()
-        await self.session.refresh(model)
-        
-        # Convert to schema
+        model = (await self.session.execute(query)).scalar_one_or_none()
+        if model is None:
+            return None
+
         return Filing(
             id=model.id,
             title=model.title,
@@ -221,7 +335,72 @@ class DartRepository(BaseRepository):
             summary=model.summary,
             sentiment=Sentiment(**model.sentiment) if model.sentiment else None,
             company_id=model.company_id,
+            rcept_no=model.rcept_no,
+        )
+
+    async def update_sentiments(self, sentiments: dict[str, Sentiment]) -> int:
+        """Set sentiment on many rows with one ``UPDATE ... FROM (VALUES ...)``.
+
+        Args:
+            sentiments: Mapping of row ID to sentiment
+
+        Returns:
+            Number of rows updated
+        """
+        return await self._update_sentiments(DartFilingModel, sentiments)
+
+    async def find_existing(
+        self, company_id: str, keys: list[tuple[Any, ...]]
+    ) -> dict[tuple[Any, ...], str]:
+        """Look up stored filings by ``natural_key`` in one query.
+
+        Args:
+            company_id: Company identifier
+            keys: ``natural_key`` value tuples
+
+        Returns:
+            Mapping of key to existing filing ID for the keys already stored
+        """
+        if not keys or self.is_memory_mode():
+            return {}
+
+        columns = [getattr(DartFilingModel, name) for name in self.natural_key]
+        query = select(DartFilingModel.id, *columns).where(
+            DartFilingModel.company_id == company_id,
+            tuple_(*columns).in_(keys),
+        )
+        result = await self.session.execute(query)
+        return {tuple(row[1:]): row[0] for row in result}
+
+    async def insert_many(self, rows: list[dict[str, Any]]) -> list[str | None]:
+        """Insert many filings with one multi-row ``INSERT ... ON CONFLICT DO NOTHING``.
+
+        Args:
+            rows: Column values per filing; ``sentiment`` is a Sentiment or None
+
+        Returns:
+            New filing ID per row, or None where the row conflicted
+        """
+        if not rows:
+            return []
+        ids = [f"filing_{uuid.uuid4().hex[:12]}" for _ in rows]
+        if self.is_memory_mode():
+            return list(ids)
+
+        values = [
+            {
+                **row,
+                "id": row_id,
+                "sentiment": row["sentiment"].model_dump() if row.get("sentiment") else None,
+            }
+            for row_id, row in zip(ids, rows, strict=True)
+        ]
+        stmt = (
+            insert(DartFilingModel).values(values).on_conflict_do_nothing().returning(DartFilingModel.id)
         )
+        inserted = set((await self.session.execute(stmt)).scalars())
+        await self.session.commit()
+        return [row_id if row_id in inserted else None for row_id in ids]
 
 
 async def get_dart_repo(session: AsyncSession) -> DartRepository:
@@ -229,7 +408,7 @@ async def get_dart_repo(session: AsyncSession) -> DartRepository:
     
     Args:
         session: SQLAlchemy async session
-        
+
     Returns:
         DartRepository instance
     """
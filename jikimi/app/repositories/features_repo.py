@@ -0,0 +1,104 @@
+"""Feature store repository (per-company, per-day prediction features)."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import CompanyDailyFeaturesModel
+from app.repositories.base import BaseRepository
+from app.schemas.prediction import DailyFeatures
+from app.services.feature_store import aggregate_daily
+
+
+class FeaturesRepository(BaseRepository):
+    """Repository for feature-store rows maintained by database triggers."""
+
+    async def fetch_daily_features(
+        self,
+        company_id: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[DailyFeatures]:
+        """Fetch feature rows for the UTC days touching ``[start, end)``.
+
+        This is a single range scan on the ``(company_id, day)`` primary key.
+
+        Args:
+            company_id: Company identifier
+            start: Window start (its whole UTC day is included)
+            end: Window end (exclusive)
+
+        Returns:
+            Feature rows ordered by day ascending
+        """
+        if self.is_memory_mode():
+            return await self._fetch_daily_features_memory(company_id, start, end)
+
+        start_day = start.astimezone(UTC).date()
+        end_day = end.astimezone(UTC).date()
+
+        query = (
+            select(CompanyDailyFeaturesModel)
+            .where(
+                CompanyDailyFeaturesModel.company_id == company_id,
+                CompanyDailyFeaturesModel.day >= start_day,
+                CompanyDailyFeaturesModel.day <= end_day,
+            )
+            .order_by(CompanyDailyFeaturesModel.day.asc())
+        )
+        result = await self.session.execute(query)
+
+        return [
+            DailyFeatures(
+                company_id=row.company_id,
+                day=row.day,
+                news_count=row.news_count,
+                news_positive=row.news_positive,
+                news_negative=row.news_negative,
+                news_neutral=row.news_neutral,
+                news_scored=row.news_scored,
+                news_score_sum=row.news_score_sum,
+                news_score_hours_sum=row.news_score_hours_sum,
+                news_hours_sum=row.news_hours_sum,
+                blind_count=row.blind_count,
+                blind_engagement=row.blind_engagement,
+                blind_positive=row.blind_positive,
+                naver_forum_count=row.naver_forum_count,
+                naver_forum_engagement=row.naver_forum_engagement,
+                filings_count=row.filings_count,
+                last_filed_at=row.last_filed_at,
+            )
+            for row in result.scalars().all()
+        ]
+
+    async def _fetch_daily_features_memory(
+        self,
+        company_id: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[DailyFeatures]:
+        """In-memory implementation of fetch_daily_features."""
+        from app.repositories.dart_repo import DartRepository
+        from app.repositories.news_repo import NewsRepository
+        from app.repositories.social_repo import SocialRepository
+
+        news, _ = await NewsRepository(self.session).fetch_news(company_id, start, end)
+        social = SocialRepository(self.session)
+        blind, _ = await social.fetch_social(company_id, "blind", start, end)
+        naver_forum, _ = await social.fetch_social(company_id, "naver_forum", start, end)
+        filings, _ = await DartRepository(self.session).fetch_filings(company_id, start, end)
+
+        return aggregate_daily(company_id, news, blind, naver_forum, filings)
+
+
+async def get_features_repo(session: AsyncSession) -> FeaturesRepository:
+    """Factory function for FeaturesRepository.
+
+    Args:
+        session: SQLAlchemy async session
+
+    Returns:
+        FeaturesRepository instance
+    """
+    return FeaturesRepository(session)
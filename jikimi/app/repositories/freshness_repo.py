@@ -0,0 +1,174 @@
+"""Freshness repository (cheap validators for HTTP caching)."""
+
+from datetime import datetime
+from typing import NamedTuple
+
+from sqlalchemy import func, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    BlindDeptDailyModel,
+    DartFilingModel,
+    NewsArticleModel,
+    PriceCandleModel,
+    SentimentRollupModel,
+    SocialPostModel,
+)
+from app.repositories.base import BaseRepository
+from app.schemas.intelligence import TimelineSource
+from app.schemas.sentiment_series import SentimentBucket, SentimentSource
+
+
+class Freshness(NamedTuple):
+    """Stand-in for the rows behind a response; it changes whenever they do.
+
+    Every insert and update stamps ``updated_at`` with the wall-clock time of
+    the write (``clock_timestamp()``), so an insert or update raises
+    ``last_modified`` and a delete lowers ``rows``.
+    """
+
+    rows: int
+    last_modified: datetime | None
+    tail: datetime | None = None
+
+
+class FreshnessRepository(BaseRepository):
+    """Repository computing validators without reading the rows themselves.
+
+    In memory mode every method returns None (callers fall back to hashing
+    the response body).
+    """
+
+    async def source_freshness(
+        self, company_id: str, sources: list[TimelineSource]
+    ) -> Freshness | None:
+        """Row count and latest ``updated_at`` over a company's items.
+
+        One statement; each source is an index-only scan of its
+        ``(company_id[, platform], updated_at)`` index.
+
+        Args:
+            company_id: Company identifier
+            sources: Sources to cover
+
+        Returns:
+            Freshness over all the sources' rows of the company
+        """
+        if self.is_memory_mode() or not sources:
+            return None
+
+        parts = []
+        if "news" in sources:
+            parts.append(
+                select(func.count().label("n"), func.max(NewsArticleModel.updated_at).label("m"))
+                .where(NewsArticleModel.company_id == company_id)
+            )
+        for platform in ("blind", "naver_forum"):
+            if platform in sources:
+                parts.append(
+                    select(func.count().label("n"), func.max(SocialPostModel.updated_at).label("m"))
+                    .where(
+                        SocialPostModel.company_id == company_id,
+                        SocialPostModel.platform == platform,
+                    )
+                )
+        if "dart" in sources:
+            parts.append(
+                select(func.count().label("n"), func.max(DartFilingModel.updated_at).label("m"))
+                .where(DartFilingModel.company_id == company_id)
+            )
+        per_source = union_all(*parts).subquery() if len(parts) > 1 else parts[0].subquery()
+        query = select(func.coalesce(func.sum(per_source.c.n), 0), func.max(per_source.c.m))
+        count, last_modified = (await self.session.execute(query)).one()
+        return Freshness(rows=int(count), last_modified=last_modified)
+
+    async def prices_freshness(
+        self, company_id: str, interval: str, adjust: str
+    ) -> Freshness | None:
+        """Candle count, tail timestamp and the tail candle's ``updated_at``.
+
+        The tail is the candle that changes intraday; older candles only
+        change when the series is reloaded, which changes the count or tail.
+
+        Args:
+            company_id: Company identifier
+            interval: Candle interval
+            adjust: Price adjustment type
+
+        Returns:
+            Freshness of the stored candles
+        """
+        if self.is_memory_mode():
+            return None
+
+        filters = (
+            PriceCandleModel.company_id == company_id,
+            PriceCandleModel.interval == interval,
+            PriceCandleModel.adjust_type == adjust,
+        )
+        tail_updated = (
+            select(PriceCandleModel.updated_at)
+            .where(*filters)
+            .order_by(PriceCandleModel.timestamp.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        query = select(
+            func.count(), func.max(PriceCandleModel.timestamp), tail_updated
+        ).where(*filters)
+        count, tail, last_modified = (await self.session.execute(query)).one()
+        return Freshness(rows=count, last_modified=last_modified, tail=tail)
+
+    async def rollup_freshness(
+        self, company_id: str, bucket: SentimentBucket, sources: list[SentimentSource]
+    ) -> Freshness | None:
+        """Row count and latest ``updated_at`` of a company's sentiment rollups.
+
+        Args:
+            company_id: Company identifier
+            bucket: Bucket width
+            sources: Sources to cover
+
+        Returns:
+            Freshness of the rollup rows
+        """
+        if self.is_memory_mode():
+            return None
+
+        query = select(func.count(), func.max(SentimentRollupModel.updated_at)).where(
+            SentimentRollupModel.company_id == company_id,
+            SentimentRollupModel.bucket == bucket,
+            SentimentRollupModel.source.in_(sources),
+        )
+        count, last_modified = (await self.session.execute(query)).one()
+        return Freshness(rows=count, last_modified=last_modified)
+
+    async def blind_dept_freshness(self, company_id: str) -> Freshness | None:
+        """Row count and latest ``updated_at`` of a company's department rollups.
+
+        Args:
+            company_id: Company identifier
+
+        Returns:
+            Freshness of the rollup rows
+        """
+        if self.is_memory_mode():
+            return None
+
+        query = select(func.count(), func.max(BlindDeptDailyModel.updated_at)).where(
+            BlindDeptDailyModel.company_id == company_id
+        )
+        count, last_modified = (await self.session.execute(query)).one()
+        return Freshness(rows=count, last_modified=last_modified)
+
+
+async def get_freshness_repo(session: AsyncSession) -> FreshnessRepository:
+    """Factory function for FreshnessRepository.
+
+    Args:
+        session: SQLAlchemy async session
+
+    Returns:
+        FreshnessRepository instance
+    """
+    return FreshnessRepository(session)
@@ -2,21 +2,39 @@
 
 import uuid
 from datetime import datetime, timedelta
+from typing import Any, NamedTuple
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, func, null, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.errors import NotFoundError
 from app.models import NewsArticleModel
 from app.repositories.base import BaseRepository
-from app.schemas.common import Sentiment
+from app.schemas.common import Sentiment, SentimentFilter
 from app.schemas.intelligence import Article
+from app.utils.hashing import article_key
 from app.utils.pagination import decode_cursor, encode_cursor
 from app.utils.time import now_utc
 
 
+class TitleRow(NamedTuple):
+    """What the story index needs from a stored article."""
+
+    id: str
+    company_id: str
+    title: str
+    published_at: datetime
+    story_id: str | None
+    sentiment: Sentiment | None
+
+
 class NewsRepository(BaseRepository):
     """Repository for news articles."""
     
+    # Columns identifying the same article across crawler runs (unique per company)
+    natural_key: tuple[str, ...] = ("dedupe_hash",)
+
     async def fetch_news(
         self,
         company_id: str,
@@ -25,9 +43,17 @@ class NewsRepository(BaseRepository):
         limit: int = 50,
         cursor: str | None = None,
         sources: list[str] | None = None,
+        collapse: bool = False,
+        sentiment_filter: SentimentFilter | None = None,
     ) -> tuple[list[Article], str | None]:
         """Fetch news articles for a company.
         
+        With ``collapse`` each near-duplicate story (see
+        ``app.services.story_index``) is returned once, as its latest
+        article within the filters, with ``story_size`` set to the number of
+        matching articles in the story. Rows without a ``story_id`` are their
+        own story.
+
         Args:
             company_id: Company identifier
             start: Start timestamp (inclusive)
@@ -35,25 +61,45 @@ class NewsRepository(BaseRepository):
             limit: Maximum number of results
             cursor: Pagination cursor
             sources: Filter by news sources
-            
+            collapse: One article per story
+            sentiment_filter: Sentiment label/score/confidence conditions
+
         Returns:
             Tuple of (articles, next_cursor)
         """
         if self.is_memory_mode():
-            return await self._fetch_news_memory(company_id, start, end, limit, cursor, sources)
-        
-        # Build query
-        query = select(NewsArticleModel).where(NewsArticleModel.company_id == company_id)
+            return await self._fetch_news_memory(
+                company_id, start, end, limit, cursor, sources, collapse, sentiment_filter
+            )
         
-        # Apply time range filters
+        # Company, time range and source filters
+        filters = [NewsArticleModel.company_id == company_id]
         if start:
-            query = query.where(NewsArticleModel.published_at >= start)
+            filters.append(NewsArticleModel.published_at >= start)
         if end:
-            query = query.where(NewsArticleModel.published_at < end)
-        
-        # Apply source filter
+            filters.append(NewsArticleModel.published_at < end)
         if sources:
-            query = query.where(NewsArticleModel.source.in_(sources))
+            filters.append(NewsArticleModel.source.in_(sources))
+        filters.extend(self._sentiment_clauses(NewsArticleModel, sentiment_filter))
+
+        if collapse:
+            # Rank articles within each story over the filtered rows; keep the latest
+            story = func.coalesce(NewsArticleModel.story_id, NewsArticleModel.id)
+            ranked = select(
+                NewsArticleModel.id,
+                func.row_number().over(
+                    partition_by=story,
+                    order_by=(NewsArticleModel.published_at.desc(), NewsArticleModel.id.asc()),
+                ).label("story_rank"),
+                func.count().over(partition_by=story).label("story_size"),
+            ).where(*filters).subquery()
+            query = (
+                select(NewsArticleModel, ranked.c.story_size)
+                .join(ranked, ranked.c.id == NewsArticleModel.id)
+                .where(ranked.c.story_rank == 1)
+            )
+        else:
+            query = select(NewsArticleModel, null().label("story_size")).where(*filters)
         
         # Apply keyset pagination
         cursor_dict = decode_cursor(cursor)
@@ -84,7 +130,7 @@ class NewsRepository(BaseRepository):
         # Fetch limit + 1
         query = query.limit(limit + 1)
         result = await self.session.execute(query)
-        rows = list(result.scalars().all())
+        rows = list(result.all())
         
         # Check for more results
         has_more = len(rows) > limit
@@ -102,8 +148,10 @@ class NewsRepository(BaseRepository):
                 summary=row.summary,
                 sentiment=Sentiment(**row.sentiment) if row.sentiment else None,
                 company_id=row.company_id,
+                story_id=row.story_id,
+                story_size=story_size,
             )
-            for row in rows
+            for row, story_size in rows
         ]
         
         # Generate next cursor
@@ -126,6 +174,8 @@ class NewsRepository(BaseRepository):
         limit: int,
         cursor: str | None,
         sources: list[str] | None,
+        collapse: bool = False,
+        sentiment_filter: SentimentFilter | None = None,
     ) -> tuple[list[Article], str | None]:
         """In-memory implementation of fetch_news."""
         base_time = now_utc()
@@ -155,6 +205,22 @@ class NewsRepository(BaseRepository):
         if sources:
             all_articles = [a for a in all_articles if a.source in sources]
         
+        # Filter by sentiment
+        if sentiment_filter:
+            all_articles = [a for a in all_articles if sentiment_filter.matches(a.sentiment)]
+
+        # Latest article per story (articles are already newest first)
+        if collapse:
+            stories: dict[str, Article] = {}
+            sizes: dict[str, int] = {}
+            for article in all_articles:
+                story = article.story_id or article.id
+                stories.setdefault(story, article)
+                sizes[story] = sizes.get(story, 0) + 1
+            all_articles = [
+                a.model_copy(update={"story_size": sizes[s]}) for s, a in stories.items()
+            ]
+
         # Simple offset-based pagination
         cursor_dict = decode_cursor(cursor)
         offset = cursor_dict.get("offset", 0) if cursor_dict else 0
@@ -167,6 +233,60 @@ class NewsRepository(BaseRepository):
         
         return page, next_cursor
     
+    async def fetch_latest_news(
+        self,
+        company_ids: list[str],
+        limit: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        sentiment_filter: SentimentFilter | None = None,
+    ) -> dict[str, list[Article]]:
+        """Fetch the newest articles of many companies with one LATERAL query.
+
+        Args:
+            company_ids: Company identifiers
+            limit: Maximum articles per company
+            start: Start timestamp (inclusive)
+            end: End timestamp (exclusive)
+            sentiment_filter: Sentiment label/score/confidence conditions
+
+        Returns:
+            Articles per company (newest first), every requested company present
+        """
+        latest: dict[str, list[Article]] = {company_id: [] for company_id in company_ids}
+        if not company_ids:
+            return latest
+        if self.is_memory_mode():
+            for company_id in latest:
+                latest[company_id], _ = await self._fetch_news_memory(
+                    company_id, start, end, limit, None, None, sentiment_filter=sentiment_filter
+                )
+            return latest
+
+        filters = self._sentiment_clauses(NewsArticleModel, sentiment_filter)
+        if start:
+            filters.append(NewsArticleModel.published_at >= start)
+        if end:
+            filters.append(NewsArticleModel.published_at < end)
+        query = self._latest_per_company(
+            NewsArticleModel, NewsArticleModel.published_at, company_ids, limit, filters
+        )
+        result = await self.session.execute(query)
+
+        for row in result.scalars().all():
+            latest[row.company_id].append(Article(
+                id=row.id,
+                title=row.title,
+                source=row.source,
+                url=row.url,
+                published_at=row.published_at,
+                summary=row.summary,
+                sentiment=Sentiment(**row.sentiment) if row.sentiment else None,
+                company_id=row.company_id,
+                story_id=row.story_id,
+            ))
+        return latest
+
     async def create_article(
         self,
         title: str,
@@ -176,8 +296,10 @@ class NewsRepository(BaseRepository):
         url: str | None = None,
         summary: str | None = None,
         sentiment: Sentiment | None = None,
+        dedupe_hash: str | None = None,
+        story_id: str | None = None,
     ) -> Article:
-        """Create a new news article.
+        """Create a new news article, or return the stored one with the same dedupe key.
         
         Args:
             title: Article title
@@ -187,32 +309,69 @@ class NewsRepository(BaseRepository):
             url: Article URL
             summary: Article summary
             sentiment: Pre-analyzed sentiment
-            
+            dedupe_hash: Natural key (computed with ``article_key`` if omitted)
+            story_id: Near-duplicate story the article belongs to
+
+        Returns:
+            Created (or already stored) article
+
+        Raises:
+            NotFoundError: If the conflicting stored article cannot be read back
+        """
+        dedupe_hash = dedupe_hash or article_key(url, source, title, published_at)
+        (article_id,) = await self.insert_many([{
+            "title": title,
+            "source": source,
+            "url": url,
+            "published_at": published_at,
+            "summary": summary,
+            "sentiment": sentiment,
+            "company_id": company_id,
+            "dedupe_hash": dedupe_hash,
+            "story_id": story_id,
+        }])
+        if article_id is not None:
+            return Article(
+                id=article_id,
+                title=title,
+                source=source,
+                url=url,
+                published_at=published_at,
+                summary=summary,
+                sentiment=sentiment,
+                company_id=company_id,
+                story_id=story_id,
+            )
+
+        # Lost a race with an identical insert
+        article_id = (await self.find_existing(company_id, [(dedupe_hash,)]))[(dedupe_hash,)]
+        stored = await self.get_article(company_id, article_id)
+        if stored is None:
+            raise NotFoundError(f"Article {article_id} not found")
+        return stored
+
+    async def get_article(self, company_id: str, article_id: str) -> Article | None:
+        """Fetch a single news article by ID.
+
+        Args:
+            company_id: Company identifier
+            article_id: News article ID
+
         Returns:
-            Created article
+            Article, or None if not found
         """
-        article_id = f"article_{uuid.uuid4().hex[:12]}"
-        
-        # Convert sentiment to dict
-        sentiment_dict = sentiment.model_dump() if sentiment else None
-        
-        # Create model
-        model = NewsArticleModel(
-            id=article_id,
-            title=title,
-            source=source,
-            url=url,
-            published_at=published_at,
-            summary=summary,
-            sentiment=sentiment_dict,
-            company_id=company_id,
+        if self.is_memory_mode():
+            articles, _ = await self._fetch_news_memory(company_id, None, None, 1000, None, None)
+            return next((a for a in articles if a.id == article_id), None)
+
+        query = select(NewsArticleModel).where(
+            NewsArticleModel.id == article_id,
+            NewsArticleModel.company_id == company_id,
         )
-        
-        self.session.add(model)
-        await self.session.commit()
-        await self.session.refresh(model)
-        
-        # Convert to schema
+        model = (await self.session.execute(query)).scalar_one_or_none()
+        if model is None:
+            return None
+
         return Article(
             id=model.id,
             title=model.title,
@@ -222,15 +381,119 @@ class NewsRepository(BaseRepository):
             summary=model.summary,
             sentiment=Sentiment(**model.sentiment) if model.sentiment else None,
             company_id=model.company_id,
+            story_id=model.story_id,
         )
 
+    async def recent_titles(self, since: datetime, limit: int) -> list[TitleRow]:
+        """Titles of the latest articles published since a time, oldest first.
+
+        Args:
+            since: Earliest publication time
+            limit: Maximum number of articles (the newest are kept)
+
+        Returns:
+            Articles in publication order
+        """
+        if self.is_memory_mode():
+            return []
+
+        query = (
+            select(
+                NewsArticleModel.id,
+                NewsArticleModel.company_id,
+                NewsArticleModel.title,
+                NewsArticleModel.published_at,
+                NewsArticleModel.story_id,
+                NewsArticleModel.sentiment,
+            )
+            .where(NewsArticleModel.published_at >= since)
+            .order_by(NewsArticleModel.published_at.desc(), NewsArticleModel.id.asc())
+            .limit(limit)
+        )
+        rows = (await self.session.execute(query)).all()
+        return [
+            TitleRow(
+                id=row.id,
+                company_id=row.company_id,
+                title=row.title,
+                published_at=row.published_at,
+                story_id=row.story_id,
+                sentiment=Sentiment(**row.sentiment) if row.sentiment else None,
+            )
+            for row in reversed(rows)
+        ]
+
+    async def update_sentiments(self, sentiments: dict[str, Sentiment]) -> int:
+        """Set sentiment on many rows with one ``UPDATE ... FROM (VALUES ...)``.
+
+        Args:
+            sentiments: Mapping of row ID to sentiment
+
+        Returns:
+            Number of rows updated
+        """
+        return await self._update_sentiments(NewsArticleModel, sentiments)
+
+    async def find_existing(
+        self, company_id: str, keys: list[tuple[Any, ...]]
+    ) -> dict[tuple[Any, ...], str]:
+        """Look up stored articles by ``natural_key`` in one query.
+
+        Args:
+            company_id: Company identifier
+            keys: ``natural_key`` value tuples
+
+        Returns:
+            Mapping of key to existing article ID for the keys already stored
+        """
+        if not keys or self.is_memory_mode():
+            return {}
+
+        columns = [getattr(NewsArticleModel, name) for name in self.natural_key]
+        query = select(NewsArticleModel.id, *columns).where(
+            NewsArticleModel.company_id == company_id,
+            tuple_(*columns).in_(keys),
+        )
+        result = await self.session.execute(query)
+        return {tuple(row[1:]): row[0] for row in result}
+
+    async def insert_many(self, rows: list[dict[str, Any]]) -> list[str | None]:
+        """Insert many articles with one multi-row ``INSERT ... ON CONFLICT DO NOTHING``.
+
+        Args:
+            rows: Column values per article; ``sentiment`` is a Sentiment or None
+
+        Returns:
+            New article ID per row, or None where the row conflicted
+        """
+        if not rows:
+            return []
+        ids = [f"article_{uuid.uuid4().hex[:12]}" for _ in rows]
+        if self.is_memory_mode():
+            return list(ids)
+
+        values = [
+            {
+                **row,
+                "id": row_id,
+                "sentiment": row["sentiment"].model_dump() if row.get("sentiment") else None,
+            }
+            for row_id, row in zip(ids, rows, strict=True)
+        ]
+        stmt = (
+            insert(NewsArticleModel).values(values).on_conflict_do_nothing().returning(NewsArticleModel.id)
+        )
+        inserted = set((await self.session.execute(stmt)).scalars())
+        await self.session.commit()
+        return [row_id if row_id in inserted else None for row_id in ids]
+
 
 async def get_news_repo(session: AsyncSession) -> NewsRepository:
     """Factory function for NewsRepository.
     
     Args:
         session: SQLAlchemy async session
-        
+
     Returns:
         NewsRepository instance
     """
@@ -0,0 +1,255 @@
+"""Full-text search repository over news, social posts and filings."""
+
+import math
+from datetime import datetime
+from typing import Any, Literal
+
+from sqlalchemy import String, and_, func, literal, literal_column, null, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import DartFilingModel, NewsArticleModel, SocialPostModel
+from app.repositories.base import BaseRepository
+from app.schemas.common import Sentiment
+from app.schemas.search import SearchHit, SearchType
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.text_search import bigram_tsquery, matches, words
+from app.utils.time import parse_ts, to_rfc3339
+
+SearchSort = Literal["relevance", "recent"]
+
+# Characters of the summary/content returned as the snippet
+SNIPPET_LENGTH = 200
+
+# Per type: model, time column, snippet column, source column, URL column
+_SOURCES: dict[SearchType, tuple[Any, str, str, str, str | None]] = {
+    "news": (NewsArticleModel, "published_at", "summary", "source", "url"),
+    "social": (SocialPostModel, "posted_at", "content", "platform", None),
+    "filing": (DartFilingModel, "filed_at", "summary", "filing_type", "url"),
+}
+
+
+class SearchRepository(BaseRepository):
+    """Ranked bigram full-text search across the intelligence tables."""
+
+    async def search(
+        self,
+        query: str,
+        types: list[SearchType],
+        company_id: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        sort: SearchSort = "relevance",
+    ) -> tuple[list[SearchHit], str | None]:
+        """Search titles and bodies of the given item types.
+
+        Every table is matched through its GIN-indexed ``search_vector``
+        (``korean_bigrams`` of title and body) and ranked with
+        ``ts_rank_cd``. Each table contributes at most ``limit + 1`` rows past
+        the cursor, and the merged page is ordered by
+        ``(rank DESC, time DESC, id ASC)``, or ``(time DESC, id ASC)`` for
+        ``sort="recent"``.
+
+        Args:
+            query: Search text (see ``bigram_tsquery``)
+            types: Item types to search
+            company_id: Only items of this company
+            start: Start timestamp (inclusive)
+            end: End timestamp (exclusive)
+            limit: Maximum number of results
+            cursor: Pagination cursor
+            sort: ``relevance`` or ``recent``
+
+        Returns:
+            Tuple of (hits, next_cursor)
+        """
+        tsquery_text = bigram_tsquery(query)
+        if tsquery_text is None or not types:
+            return [], None
+        if self.is_memory_mode():
+            return await self._search_memory(
+                query, types, company_id, start, end, limit, cursor, sort
+            )
+
+        after = _decode(cursor, sort)
+        tsquery = func.to_tsquery(literal_column("'simple'::regconfig"), tsquery_text)
+        selects = []
+        for typ in types:
+            model, time_name, snippet_name, source_name, url_name = _SOURCES[typ]
+            ts = getattr(model, time_name)
+            rank = func.ts_rank_cd(model.search_vector, tsquery, 1)
+            filters = [model.search_vector.op("@@")(tsquery)]
+            if company_id:
+                filters.append(model.company_id == company_id)
+            if start:
+                filters.append(ts >= start)
+            if end:
+                filters.append(ts < end)
+            if after:
+                filters.append(_after_clause(rank, ts, model.id, after, sort))
+            order = [ts.desc(), model.id.asc()]
+            if sort == "relevance":
+                order.insert(0, rank.desc())
+            selects.append(
+                select(
+                    literal(typ, String).label("type"),
+                    model.id.label("id"),
+                    model.company_id.label("company_id"),
+                    model.title.label("title"),
+                    func.left(getattr(model, snippet_name), SNIPPET_LENGTH).label("snippet"),
+                    getattr(model, source_name).label("source"),
+                    (getattr(model, url_name) if url_name else null()).label("url"),
+                    ts.label("published_at"),
+                    model.sentiment.label("sentiment"),
+                    rank.label("rank"),
+                )
+                .where(*filters)
+                .order_by(*order)
+                .limit(limit + 1)
+            )
+
+        merged = union_all(*selects).subquery()
+        order = [merged.c.published_at.desc(), merged.c.id.asc()]
+        if sort == "relevance":
+            order.insert(0, merged.c.rank.desc())
+        result = await self.session.execute(select(merged).order_by(*order).limit(limit + 1))
+        rows = list(result.mappings().all())
+
+        has_more = len(rows) > limit
+        if has_more:
+            rows = rows[:limit]
+        hits = [
+            SearchHit(
+                **{**row, "sentiment": Sentiment(**row["sentiment"]) if row["sentiment"] else None}
+            )
+            for row in rows
+        ]
+
+        next_cursor = _encode(hits[-1], sort) if has_more and hits else None
+        return hits, next_cursor
+
+    async def _search_memory(
+        self,
+        query: str,
+        types: list[SearchType],
+        company_id: str | None,
+        start: datetime | None,
+        end: datetime | None,
+        limit: int,
+        cursor: str | None,
+        sort: SearchSort,
+    ) -> tuple[list[SearchHit], str | None]:
+        """In-memory implementation of search over the fake data."""
+        from app.repositories.companies_repo import CompaniesRepository
+        from app.repositories.dart_repo import DartRepository
+        from app.repositories.news_repo import NewsRepository
+        from app.repositories.social_repo import SocialRepository
+
+        if company_id:
+            company_ids = [company_id]
+        else:
+            companies, _ = await CompaniesRepository(self.session)._search_companies_memory(
+                None, 1000, None
+            )
+            company_ids = [c.id for c in companies]
+
+        candidates: list[tuple[SearchHit, str]] = []
+        for cid in company_ids:
+            if "news" in types:
+                articles, _ = await NewsRepository(self.session)._fetch_news_memory(
+                    cid, start, end, 1000, None, None
+                )
+                candidates.extend(
+                    (SearchHit(type="news", id=a.id, company_id=cid, title=a.title,
+                               snippet=a.summary, source=a.source, url=a.url,
+                               published_at=a.published_at,
+                               sentiment=a.sentiment, rank=0.0), f"{a.title} {a.summary or ''}")
+                    for a in articles
+                )
+            if "social" in types:
+                for platform in ("blind", "naver_forum"):
+                    posts, _ = await SocialRepository(self.session)._fetch_social_memory(
+                        cid, platform, start, end, 1000, None, None
+                    )
+                    candidates.extend(
+                        (SearchHit(type="social", id=p.id, company_id=cid, title=p.title,
+                                   snippet=p.content[:SNIPPET_LENGTH], source=p.platform,
+                                   published_at=p.posted_at, sentiment=p.sentiment, rank=0.0),
+                         f"{p.title or ''} {p.content}")
+                        for p in posts
+                    )
+            if "filing" in types:
+                filings, _ = await DartRepository(self.session)._fetch_filings_memory(
+                    cid, start, end, 1000, None, None
+                )
+                candidates.extend(
+                    (SearchHit(type="filing", id=f.id, company_id=cid, title=f.title,
+                               snippet=f.summary, source=f.filing_type, url=f.url,
+                               published_at=f.filed_at,
+                               sentiment=f.sentiment, rank=0.0), f"{f.title} {f.summary or ''}")
+                    for f in filings
+                )
+
+        # Rank like ts_rank_cd normalization 1: matches / (1 + log(document length))
+        query_words = len(words(query))
+        hits = [
+            hit.model_copy(update={"rank": query_words / (1 + math.log1p(len(words(document))))})
+            for hit, document in candidates
+            if matches(query, document)
+        ]
+        hits.sort(key=lambda h: _sort_key(h.rank, h.published_at, h.id, sort))
+        after = _decode(cursor, sort)
+        if after:
+            bound = _sort_key(after.get("rank", 0.0), after["published_at"], after["id"], sort)
+            hits = [h for h in hits if _sort_key(h.rank, h.published_at, h.id, sort) > bound]
+
+        page = hits[:limit]
+        next_cursor = _encode(page[-1], sort) if len(hits) > limit else None
+        return page, next_cursor
+
+
+def _sort_key(
+    rank: float, published_at: datetime, item_id: str, sort: SearchSort
+) -> tuple[Any, ...]:
+    if sort == "recent":
+        return (-published_at.timestamp(), item_id)
+    return (-rank, -published_at.timestamp(), item_id)
+
+
+def _encode(hit: SearchHit, sort: SearchSort) -> str | None:
+    position: dict[str, Any] = {"published_at": to_rfc3339(hit.published_at), "id": hit.id}
+    if sort == "relevance":
+        position["rank"] = hit.rank
+    return encode_cursor(position)
+
+
+def _decode(cursor: str | None, sort: SearchSort) -> dict[str, Any] | None:
+    position = decode_cursor(cursor)
+    if not position or "published_at" not in position or "id" not in position:
+        return None
+    if sort == "relevance" and not isinstance(position.get("rank"), (int, float)):
+        return None
+    return {**position, "published_at": parse_ts(position["published_at"])}
+
+
+def _after_clause(rank: Any, ts: Any, item_id: Any, after: dict[str, Any], sort: SearchSort) -> Any:
+    """Rows strictly after the cursor position in the page order."""
+    later = or_(
+        ts < after["published_at"], and_(ts == after["published_at"], item_id > after["id"])
+    )
+    if sort == "recent":
+        return later
+    return or_(rank < after["rank"], and_(rank == after["rank"], later))
+
+
+async def get_search_repo(session: AsyncSession) -> SearchRepository:
+    """Factory function for SearchRepository.
+
+    Args:
+        session: SQLAlchemy async session
+
+    Returns:
+        SearchRepository instance
+    """
+    return SearchRepository(session)
@@ -0,0 +1,89 @@
+"""Sentiment cache repository (content-addressed LLM results)."""
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import SentimentCacheModel
+from app.repositories.base import BaseRepository
+from app.schemas.common import Sentiment
+
+# Backing store for memory mode (shared across sessions like the real table)
+_MEMORY_CACHE: dict[str, Sentiment] = {}
+
+
+class SentimentCacheRepository(BaseRepository):
+    """Repository for the ``sentiment_cache`` table."""
+
+    async def get_many(self, content_hashes: list[str]) -> dict[str, Sentiment]:
+        """Look up cached sentiment for several content hashes in one query.
+
+        Args:
+            content_hashes: Hashes from ``content_hash``
+
+        Returns:
+            Mapping of hash to sentiment for the hashes that are cached
+        """
+        if not content_hashes:
+            return {}
+        if self.is_memory_mode():
+            return {h: _MEMORY_CACHE[h] for h in content_hashes if h in _MEMORY_CACHE}
+
+        query = select(SentimentCacheModel.content_hash, SentimentCacheModel.sentiment).where(
+            SentimentCacheModel.content_hash.in_(content_hashes)
+        )
+        result = await self.session.execute(query)
+        return {row.content_hash: Sentiment(**row.sentiment) for row in result}
+
+    async def put_many(
+        self, entries: dict[str, tuple[str, Sentiment]], overwrite: bool = False
+    ) -> None:
+        """Store sentiment results.
+
+        The insert joins the session's open transaction and is not committed
+        here, so unrelated pending work of the caller is never committed early;
+        it is committed with the caller's own write (the scored row's INSERT or
+        UPDATE) and rolled back with it.
+
+        Args:
+            entries: Mapping of hash to (content_type, sentiment)
+            overwrite: Replace existing entries (re-scoring) instead of keeping them
+        """
+        if not entries:
+            return
+        if self.is_memory_mode():
+            for content_hash, (_, sentiment) in entries.items():
+                if overwrite:
+                    _MEMORY_CACHE[content_hash] = sentiment
+                else:
+                    _MEMORY_CACHE.setdefault(content_hash, sentiment)
+            return
+
+        stmt = insert(SentimentCacheModel).values([
+            {
+                "content_hash": content_hash,
+                "content_type": content_type,
+                "sentiment": sentiment.model_dump(),
+            }
+            for content_hash, (content_type, sentiment) in entries.items()
+        ])
+        if overwrite:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["content_hash"],
+                set_={"sentiment": stmt.excluded.sentiment, "created_at": func.now()},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=["content_hash"])
+        await self.session.execute(stmt)
+
+
+async def get_sentiment_cache_repo(session: AsyncSession) -> SentimentCacheRepository:
+    """Factory function for SentimentCacheRepository.
+
+    Args:
+        session: SQLAlchemy async session
+
+    Returns:
+        SentimentCacheRepository instance
+    """
+    return SentimentCacheRepository(session)
@@ -0,0 +1,159 @@
+"""Sentiment rollups repository (per-company, per-source, per-bucket sentiment sums).
+
+``aggregate_rollups`` is the Python mirror of the rollup triggers (used in
+memory mode and to check parity).
+"""
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import SentimentRollupModel
+from app.repositories.base import BaseRepository
+from app.schemas.common import Sentiment
+from app.schemas.sentiment_series import SentimentBucket, SentimentRollup, SentimentSource
+
+
+def bucket_start(ts: datetime, bucket: SentimentBucket) -> datetime:
+    """Start of the UTC bucket holding ``ts``, matching ``date_trunc(unit, ts, 'UTC')``."""
+    ts = ts.astimezone(UTC)
+    if bucket == "1d":
+        return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+def aggregate_rollups(
+    items: list[tuple[SentimentSource, datetime, Sentiment | None]],
+    bucket: SentimentBucket,
+) -> list[SentimentRollup]:
+    """Aggregate raw items into rollup rows, as the triggers accumulate them.
+
+    Args:
+        items: ``(source, timestamp, sentiment)`` per item
+        bucket: Bucket width
+
+    Returns:
+        Rows ordered by bucket start, then source
+    """
+    rows: dict[tuple[datetime, str], SentimentRollup] = {}
+    for source, ts, sentiment in items:
+        start = bucket_start(ts, bucket)
+        row = rows.setdefault((start, source), SentimentRollup(source=source, bucket_start=start))
+        row.item_count += 1
+        if sentiment is None:
+            continue
+        hours = ts.timestamp() / 3600
+        row.scored += 1
+        row.positive += sentiment.label == "positive"
+        row.negative += sentiment.label == "negative"
+        row.neutral += sentiment.label == "neutral"
+        row.score_sum += sentiment.score
+        row.score_hours_sum += sentiment.score * hours
+        row.hours_sum += hours
+    return [rows[key] for key in sorted(rows)]
+
+
+class SentimentRollupsRepository(BaseRepository):
+    """Repository for sentiment rollup rows maintained by database triggers."""
+
+    async def fetch_rollups(
+        self,
+        company_id: str,
+        bucket: SentimentBucket,
+        sources: list[SentimentSource],
+        start: datetime,
+        end: datetime,
+    ) -> list[SentimentRollup]:
+        """Fetch rollup rows for the buckets touching ``[start, end)``.
+
+        This is a single range scan on the ``(company_id, bucket, source,
+        bucket_start)`` primary key, one row per source and non-empty bucket.
+
+        Args:
+            company_id: Company identifier
+            bucket: Bucket width
+            sources: Sources to read
+            start: Range start (its whole bucket is included)
+            end: Range end (exclusive)
+
+        Returns:
+            Rollup rows ordered by bucket start, then source
+        """
+        if not sources:
+            return []
+        if self.is_memory_mode():
+            return await self._fetch_rollups_memory(company_id, bucket, sources, start, end)
+
+        query = (
+            select(SentimentRollupModel)
+            .where(
+                SentimentRollupModel.company_id == company_id,
+                SentimentRollupModel.bucket == bucket,
+                SentimentRollupModel.source.in_(sources),
+                SentimentRollupModel.bucket_start >= bucket_start(start, bucket),
+                SentimentRollupModel.bucket_start < end,
+            )
+            .order_by(SentimentRollupModel.bucket_start.asc(), SentimentRollupModel.source.asc())
+        )
+        result = await self.session.execute(query)
+
+        return [
+            SentimentRollup(
+                source=row.source,
+                bucket_start=row.bucket_start,
+                item_count=row.item_count,
+                scored=row.scored,
+                positive=row.positive,
+                negative=row.negative,
+                neutral=row.neutral,
+                score_sum=row.score_sum,
+                score_hours_sum=row.score_hours_sum,
+                hours_sum=row.hours_sum,
+            )
+            for row in result.scalars().all()
+        ]
+
+    async def _fetch_rollups_memory(
+        self,
+        company_id: str,
+        bucket: SentimentBucket,
+        sources: list[SentimentSource],
+        start: datetime,
+        end: datetime,
+    ) -> list[SentimentRollup]:
+        """In-memory implementation of fetch_rollups."""
+        from app.repositories.dart_repo import DartRepository
+        from app.repositories.news_repo import NewsRepository
+        from app.repositories.social_repo import SocialRepository
+
+        first = bucket_start(start, bucket)
+        items: list[tuple[SentimentSource, datetime, Any]] = []
+        if "news" in sources:
+            news, _ = await NewsRepository(self.session).fetch_news(company_id, first, end, 1000)
+            items.extend(("news", a.published_at, a.sentiment) for a in news)
+        social = SocialRepository(self.session)
+        for platform in ("blind", "naver_forum"):
+            if platform in sources:
+                posts, _ = await social.fetch_social(company_id, platform, first, end, 1000)
+                items.extend((platform, p.posted_at, p.sentiment) for p in posts)
+        if "dart" in sources:
+            filings, _ = await DartRepository(self.session).fetch_filings(
+                company_id, first, end, 1000
+            )
+            items.extend(("dart", f.filed_at, f.sentiment) for f in filings)
+
+        return aggregate_rollups(items, bucket)
+
+
+async def get_sentiment_rollups_repo(session: AsyncSession) -> SentimentRollupsRepository:
+    """Factory function for SentimentRollupsRepository.
+
+    Args:
+        session: SQLAlchemy async session
+
+    Returns:
+        SentimentRollupsRepository instance
+    """
+    return SentimentRollupsRepository(session)
@@ -0,0 +1,166 @@
+"""Snapshot loader repository: COPY-based bulk writes and the file manifest."""
+
+import json
+from typing import Any, NamedTuple
+
+from sqlalchemy import or_, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import CompanyModel, SnapshotFileModel
+from app.repositories.base import BaseRepository
+
+
+class ManifestEntry(NamedTuple):
+    """What is already loaded from one snapshot file."""
+
+    content_hash: str
+    byte_offset: int
+    records: int
+
+
+class SnapshotRepository(BaseRepository):
+    """Bulk writes for the snapshot loader.
+
+    Every method works inside the session's open transaction, so a
+    directory's rows and its manifest entries commit (or roll back) together.
+    """
+
+    async def loaded_files(self, company_id: str, paths: list[str]) -> dict[str, ManifestEntry]:
+        """Manifest entries of already-loaded files.
+
+        Args:
+            company_id: Company the files were loaded for
+            paths: Paths relative to the data directory
+
+        Returns:
+            Mapping of path to its manifest entry
+        """
+        if not paths or self.is_memory_mode():
+            return {}
+        result = await self.session.execute(
+            select(
+                SnapshotFileModel.path,
+                SnapshotFileModel.content_hash,
+                SnapshotFileModel.byte_offset,
+                SnapshotFileModel.records,
+            ).where(SnapshotFileModel.company_id == company_id, SnapshotFileModel.path.in_(paths))
+        )
+        return {
+            path: ManifestEntry(content_hash, offset, records)
+            for path, content_hash, offset, records in result.all()
+        }
+
+    async def record_files(self, company_id: str, files: dict[str, ManifestEntry]) -> None:
+        """Upsert manifest entries.
+
+        Args:
+            company_id: Company the files were loaded for
+            files: Manifest entry per path
+        """
+        if not files or self.is_memory_mode():
+            return
+        stmt = insert(SnapshotFileModel).values([
+            {
+                "company_id": company_id,
+                "path": path,
+                "content_hash": entry.content_hash,
+                "byte_offset": entry.byte_offset,
+                "records": entry.records,
+            }
+            for path, entry in files.items()
+        ])
+        await self.session.execute(stmt.on_conflict_do_update(
+            index_elements=["company_id", "path"],
+            set_={
+                "content_hash": stmt.excluded.content_hash,
+                "byte_offset": stmt.excluded.byte_offset,
+                "records": stmt.excluded.records,
+                "loaded_at": text("NOW()"),
+            },
+        ))
+
+    async def company_ids(self, names: list[str]) -> dict[str, str]:
+        """Resolve company names or IDs to IDs.
+
+        Args:
+            names: Display names (``KT``) or stock codes
+
+        Returns:
+            Mapping of each resolvable name to its company ID
+        """
+        if not names or self.is_memory_mode():
+            return {}
+        result = await self.session.execute(
+            select(CompanyModel.id, CompanyModel.name).where(
+                or_(CompanyModel.name.in_(names), CompanyModel.id.in_(names))
+            )
+        )
+        ids: dict[str, str] = {}
+        for company_id, name in result.all():
+            ids[name] = company_id
+            ids[company_id] = company_id
+        return ids
+
+    async def copy_rows(self, model: Any, rows: list[dict[str, Any]]) -> list[Any]:
+        """Load rows with ``COPY`` into a staging table, then merge.
+
+        ``COPY`` can't skip conflicting rows, so rows are copied into a temp
+        table shaped like the target and moved with one
+        ``INSERT ... SELECT ... ON CONFLICT DO NOTHING`` (dedupe hashes for
+        intelligence rows, ``(company_id, timestamp, interval, adjust_type)``
+        for candles, so stored candles are never overwritten). Row triggers on the target
+        still fire, so trigger-maintained rollups stay current.
+
+        Args:
+            model: ORM model of the target table
+            rows: Column values per row (all rows share the same keys;
+                ``sentiment`` may be a Sentiment or None)
+
+        Returns:
+            IDs of the rows inserted into the target
+        """
+        if not rows or self.is_memory_mode():
+            return []
+        table = model.__table__.name
+        stage = f"stage_{table}"
+        columns = list(rows[0])
+        records = [
+            tuple(_copy_value(name, row[name]) for name in columns)
+            for row in rows
+        ]
+
+        await self.session.execute(
+            text(f"CREATE TEMP TABLE {stage} (LIKE {table} INCLUDING DEFAULTS)")
+        )
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(stage, records=records, columns=columns)  # type: ignore[union-attr]
+
+        column_list = ", ".join(columns)
+        result = await self.session.execute(text(
+            f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {stage} "
+            f"ON CONFLICT DO NOTHING RETURNING id"
+        ))
+        inserted = list(result.scalars())
+        await self.session.execute(text(f"DROP TABLE {stage}"))
+        return inserted
+
+
+def _copy_value(name: str, value: Any) -> Any:
+    """Encode a value for binary ``COPY`` (JSONB columns take JSON text)."""
+    if name == "sentiment":
+        return json.dumps(value.model_dump()) if value is not None else None
+    return value
+
+
+async def get_snapshot_repo(session: AsyncSession) -> SnapshotRepository:
+    """Factory function for SnapshotRepository.
+
+    Args:
+        session: SQLAlchemy async session
+
+    Returns:
+        SnapshotRepository instance
+    """
+    return SnapshotRepository(session)
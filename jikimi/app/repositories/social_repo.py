@@ -2,15 +2,18 @@
 
 import uuid
 from datetime import datetime, timedelta
-from typing import Literal
+from typing import Any, Literal
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.errors import NotFoundError
 from app.models import SocialPostModel
 from app.repositories.base import BaseRepository
-from app.schemas.common import Sentiment
+from app.schemas.common import Sentiment, SentimentFilter
 from app.schemas.intelligence import SocialPost
+from app.utils.hashing import post_key
 from app.utils.pagination import decode_cursor, encode_cursor
 from app.utils.time import now_utc
 
@@ -18,6 +21,9 @@ from app.utils.time import now_utc
 class SocialRepository(BaseRepository):
     """Repository for social media posts."""
     
+    # Columns identifying the same post across crawler runs (unique per company)
+    natural_key: tuple[str, ...] = ("dedupe_hash",)
+
     async def fetch_social(
         self,
         company_id: str,
@@ -27,6 +33,7 @@ class SocialRepository(BaseRepository):
         limit: int = 50,
         cursor: str | None = None,
         dept: str | None = None,
+        sentiment_filter: SentimentFilter | None = None,
     ) -> tuple[list[SocialPost], str | None]:
         """Fetch social media posts for a company.
         
@@ -38,12 +45,15 @@ class SocialRepository(BaseRepository):
             limit: Maximum number of results
             cursor: Pagination cursor
             dept: Department filter (블라인드 only)
-            
+            sentiment_filter: Sentiment label/score/confidence conditions
+
         Returns:
             Tuple of (posts, next_cursor)
         """
         if self.is_memory_mode():
-            return await self._fetch_social_memory(company_id, platform, start, end, limit, cursor, dept)
+            return await self._fetch_social_memory(
+                company_id, platform, start, end, limit, cursor, dept, sentiment_filter
+            )
         
         # Build query
         query = select(SocialPostModel).where(
@@ -61,6 +71,9 @@ class SocialRepository(BaseRepository):
         if dept:
             query = query.where(SocialPostModel.dept == dept)
         
+        # Apply sentiment filters
+        query = query.where(*self._sentiment_clauses(SocialPostModel, sentiment_filter))
+
         # Apply keyset pagination
         cursor_dict = decode_cursor(cursor)
         if cursor_dict:
@@ -133,6 +146,7 @@ class SocialRepository(BaseRepository):
         limit: int,
         cursor: str | None,
         dept: str | None,
+        sentiment_filter: SentimentFilter | None = None,
     ) -> tuple[list[SocialPost], str | None]:
         """In-memory implementation of fetch_social."""
         base_time = now_utc()
@@ -165,6 +179,10 @@ class SocialRepository(BaseRepository):
         if dept and platform == "blind":
             all_posts = [p for p in all_posts if p.dept == dept]
         
+        # Filter by sentiment
+        if sentiment_filter:
+            all_posts = [p for p in all_posts if sentiment_filter.matches(p.sentiment)]
+
         # Simple offset-based pagination
         cursor_dict = decode_cursor(cursor)
         offset = cursor_dict.get("offset", 0) if cursor_dict else 0
@@ -177,6 +195,65 @@ class SocialRepository(BaseRepository):
         
         return page, next_cursor
     
+    async def fetch_latest_social(
+        self,
+        company_ids: list[str],
+        platform: str,
+        limit: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        sentiment_filter: SentimentFilter | None = None,
+    ) -> dict[str, list[SocialPost]]:
+        """Fetch the newest posts of many companies with one LATERAL query.
+
+        Args:
+            company_ids: Company identifiers
+            platform: Platform (blind or naver_forum)
+            limit: Maximum posts per company
+            start: Start timestamp (inclusive)
+            end: End timestamp (exclusive)
+            sentiment_filter: Sentiment label/score/confidence conditions
+
+        Returns:
+            Posts per company (newest first), every requested company present
+        """
+        latest: dict[str, list[SocialPost]] = {company_id: [] for company_id in company_ids}
+        if not company_ids:
+            return latest
+        if self.is_memory_mode():
+            for company_id in latest:
+                latest[company_id], _ = await self._fetch_social_memory(
+                    company_id, platform, start, end, limit, None, None, sentiment_filter
+                )
+            return latest
+
+        filters = [SocialPostModel.platform == platform]
+        filters.extend(self._sentiment_clauses(SocialPostModel, sentiment_filter))
+        if start:
+            filters.append(SocialPostModel.posted_at >= start)
+        if end:
+            filters.append(SocialPostModel.posted_at < end)
+        query = self._latest_per_company(
+            SocialPostModel, SocialPostModel.posted_at, company_ids, limit, filters
+        )
+        result = await self.session.execute(query)
+
+        for row in result.scalars().all():
+            latest[row.company_id].append(SocialPost(
+                id=row.id,
+                platform=row.platform,
+                title=row.title,
+                content=row.content,
+                author=row.author,
+                dept=row.dept,
+                posted_at=row.posted_at,
+                sentiment=Sentiment(**row.sentiment) if row.sentiment else None,
+                company_id=row.company_id,
+                reply_count=row.reply_count,
+                like_count=row.like_count,
+            ))
+        return latest
+
     async def create_social_post(
         self,
         platform: Literal["blind", "naver_forum"],
@@ -189,8 +266,9 @@ class SocialRepository(BaseRepository):
         reply_count: int = 0,
         like_count: int = 0,
         sentiment: Sentiment | None = None,
+        dedupe_hash: str | None = None,
     ) -> SocialPost:
-        """Create a new social media post.
+        """Create a new social media post, or return the stored one with the same dedupe key.
         
         Args:
             platform: Social platform
@@ -203,35 +281,78 @@ class SocialRepository(BaseRepository):
             reply_count: Number of replies
             like_count: Number of likes
             sentiment: Pre-analyzed sentiment
-            
+            dedupe_hash: Natural key (computed with ``post_key`` if omitted)
+
         Returns:
-            Created social post
+            Created (or already stored) social post
+
+        Raises:
+            NotFoundError: If the conflicting stored social post cannot be read back
         """
-        post_id = f"post_{uuid.uuid4().hex[:12]}"
-        
-        # Convert sentiment to dict
-        sentiment_dict = sentiment.model_dump() if sentiment else None
-        
-        # Create model
-        model = SocialPostModel(
-            id=post_id,
-            platform=platform,
-            title=title,
-            content=content,
-            author=author,
-            dept=dept,
-            posted_at=posted_at,
-            sentiment=sentiment_dict,
-            company_id=company_id,
-            reply_count=reply_count,
-            like_count=like_count,
+        dedupe_hash = dedupe_hash or post_key(platform, content, author, posted_at)
+        (post_id,) = await self.insert_many([{
+            "platform": platform,
+            "title": title,
+            "content": content,
+            "author": author,
+            "dept": dept,
+            "posted_at": posted_at,
+            "sentiment": sentiment,
+            "company_id": company_id,
+            "reply_count": reply_count,
+            "like_count": like_count,
+            "dedupe_hash": dedupe_hash,
+        }])
+        if post_id is not None:
+            return SocialPost(
+                id=post_id,
+                platform=platform,
+                title=title,
+                content=content,
+                author=author,
+                dept=dept,
+                posted_at=posted_at,
+                sentiment=sentiment,
+                company_id=company_id,
+                reply_count=reply_count,
+                like_count=like_count,
+            )
+
+        # Lost a race with an identical insert
+        post_id = (await self.find_existing(company_id, [(dedupe_hash,)]))[(dedupe_hash,)]
+        stored = await self.get_social_post(company_id, post_id)
+        if stored is None:
+            raise NotFoundError(f"Post {post_id} not found")
+        return stored
+
+    async def get_social_post(self, company_id: str, post_id: str) -> SocialPost | None:
+        """Fetch a single social post by ID.
+
+        Args:
+            company_id: Company identifier
+            post_id: Social post ID
+
+        Returns:
+            SocialPost, or None if not found
+        """
+        if self.is_memory_mode():
+            for platform in ("blind", "naver_forum"):
+                posts, _ = await self._fetch_social_memory(
+                    company_id, platform, None, None, 1000, None, None
+                )
+                for post in posts:
+                    if post.id == post_id:
+                        return post
+            return None
+
+        query = select(SocialPostModel).where(
+            SocialPostModel.id == post_id,
+            SocialPostModel.company_id == company_id,
         )
-        
-        self.session.add(model)
-        await self.session.commit()
-        await self.session.refresh(model)
-        
-        # Convert to schema
+        model = (await self.session.execute(query)).scalar_one_or_none()
+        if model is None:
+            return None
+
         return SocialPost(
             id=model.id,
             platform=model.platform,  # type: ignore
@@ -246,13 +367,77 @@ class SocialRepository(BaseRepository):
             like_count=model.like_count,
         )
 
+    async def update_sentiments(self, sentiments: dict[str, Sentiment]) -> int:
+        """Set sentiment on many rows with one ``UPDATE ... FROM (VALUES ...)``.
+
+        Args:
+            sentiments: Mapping of row ID to sentiment
+
+        Returns:
+            Number of rows updated
+        """
+        return await self._update_sentiments(SocialPostModel, sentiments)
+
+    async def find_existing(
+        self, company_id: str, keys: list[tuple[Any, ...]]
+    ) -> dict[tuple[Any, ...], str]:
+        """Look up stored posts by ``natural_key`` in one query.
+
+        Args:
+            company_id: Company identifier
+            keys: ``natural_key`` value tuples
+
+        Returns:
+            Mapping of key to existing post ID for the keys already stored
+        """
+        if not keys or self.is_memory_mode():
+            return {}
+
+        columns = [getattr(SocialPostModel, name) for name in self.natural_key]
+        query = select(SocialPostModel.id, *columns).where(
+            SocialPostModel.company_id == company_id,
+            tuple_(*columns).in_(keys),
+        )
+        result = await self.session.execute(query)
+        return {tuple(row[1:]): row[0] for row in result}
+
+    async def insert_many(self, rows: list[dict[str, Any]]) -> list[str | None]:
+        """Insert many posts with one multi-row ``INSERT ... ON CONFLICT DO NOTHING``.
+
+        Args:
+            rows: Column values per post; ``sentiment`` is a Sentiment or None
+
+        Returns:
+            New post ID per row, or None where the row conflicted
+        """
+        if not rows:
+            return []
+        ids = [f"post_{uuid.uuid4().hex[:12]}" for _ in rows]
+        if self.is_memory_mode():
+            return list(ids)
+
+        values = [
+            {
+                **row,
+                "id": row_id,
+                "sentiment": row["sentiment"].model_dump() if row.get("sentiment") else None,
+            }
+            for row_id, row in zip(ids, rows, strict=True)
+        ]
+        stmt = (
+            insert(SocialPostModel).values(values).on_conflict_do_nothing().returning(SocialPostModel.id)
+        )
+        inserted = set((await self.session.execute(stmt)).scalars())
+        await self.session.commit()
+        return [row_id if row_id in inserted else None for row_id in ids]
+
 
 async def get_social_repo(session: AsyncSession) -> SocialRepository:
     """Factory function for SocialRepository.
     
     Args:
         session: SQLAlchemy async session
-        
+
     Returns:
         SocialRepository instance
     """
@@ -0,0 +1,132 @@
+"""Trending counters repository (snapshots of the in-memory ring buffers)."""
+
+from datetime import datetime
+
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import TrendingCounterModel
+from app.repositories.base import BaseRepository
+from app.schemas.trending import TrendingSlot
+
+# Snapshot rows kept in memory mode
+_MEMORY_SLOTS: dict[tuple[str, str, datetime], TrendingSlot] = {}
+
+
+class TrendingRepository(BaseRepository):
+    """Repository for ``trending_counters`` snapshot rows."""
+
+    async def add_slots(
+        self, slots: list[TrendingSlot], minute_since: datetime, hour_since: datetime
+    ) -> int:
+        """Add slot counts to the stored rows and drop rows that fell out of the rings.
+
+        Counts are added rather than replaced, so every worker process can
+        write the mentions it recorded since its previous snapshot.
+
+        Args:
+            slots: Counts recorded since the caller's previous snapshot
+            minute_since: Oldest minute slot still in the minute ring
+            hour_since: Oldest hour slot still in the hour ring
+
+        Returns:
+            Number of slots written
+        """
+        if self.is_memory_mode():
+            expired = [
+                key for key in _MEMORY_SLOTS
+                if key[2] < (minute_since if key[1] == "minute" else hour_since)
+            ]
+            for key in expired:
+                del _MEMORY_SLOTS[key]
+            for slot in slots:
+                key = (slot.company_id, slot.resolution, slot.slot_start)
+                stored = _MEMORY_SLOTS.get(key)
+                if stored is not None:
+                    slot = slot.model_copy(update={
+                        "mentions": stored.mentions + slot.mentions,
+                        "engagement": stored.engagement + slot.engagement,
+                        "scored": stored.scored + slot.scored,
+                        "score_sum": stored.score_sum + slot.score_sum,
+                    })
+                _MEMORY_SLOTS[key] = slot
+            return len(slots)
+
+        model = TrendingCounterModel
+        await self.session.execute(
+            delete(model).where(
+                or_(
+                    (model.resolution == "minute") & (model.slot_start < minute_since),
+                    (model.resolution == "hour") & (model.slot_start < hour_since),
+                )
+            )
+        )
+        if slots:
+            stmt = insert(TrendingCounterModel).values([slot.model_dump() for slot in slots])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["company_id", "resolution", "slot_start"],
+                set_={
+                    "mentions": TrendingCounterModel.mentions + stmt.excluded.mentions,
+                    "engagement": TrendingCounterModel.engagement + stmt.excluded.engagement,
+                    "scored": TrendingCounterModel.scored + stmt.excluded.scored,
+                    "score_sum": TrendingCounterModel.score_sum + stmt.excluded.score_sum,
+                    "updated_at": func.now(),
+                },
+            )
+            await self.session.execute(stmt)
+        await self.session.commit()
+        return len(slots)
+
+    async def load_slots(self, minute_since: datetime, hour_since: datetime) -> list[TrendingSlot]:
+        """Snapshot rows still inside the rings.
+
+        Args:
+            minute_since: Oldest minute slot to load
+            hour_since: Oldest hour slot to load
+
+        Returns:
+            Slots ordered by start time
+        """
+        if self.is_memory_mode():
+            slots = [
+                s for s in _MEMORY_SLOTS.values()
+                if s.slot_start >= (minute_since if s.resolution == "minute" else hour_since)
+            ]
+            return sorted(slots, key=lambda s: s.slot_start)
+
+        model = TrendingCounterModel
+        result = await self.session.execute(
+            select(model)
+            .where(
+                or_(
+                    (model.resolution == "minute") & (model.slot_start >= minute_since),
+                    (model.resolution == "hour") & (model.slot_start >= hour_since),
+                )
+            )
+            .order_by(model.slot_start.asc())
+        )
+        return [
+            TrendingSlot(
+                company_id=row.company_id,
+                resolution=row.resolution,
+                slot_start=row.slot_start,
+                mentions=row.mentions,
+                engagement=row.engagement,
+                scored=row.scored,
+                score_sum=row.score_sum,
+            )
+            for row in result.scalars().all()
+        ]
+
+
+async def get_trending_repo(session: AsyncSession) -> TrendingRepository:
+    """Factory function for TrendingRepository.
+
+    Args:
+        session: SQLAlchemy async session
+
+    Returns:
+        TrendingRepository instance
+    """
+    return TrendingRepository(session)
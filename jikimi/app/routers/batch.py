@@ -0,0 +1,74 @@
+"""Multi-company batch read endpoints."""
+
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+
+from app.config import settings
+from app.deps import SentimentFilterParams, get_session_factory
+from app.errors import ValidationError
+from app.schemas.intelligence import BatchLatest, TimelineSource
+from app.services.latest import fetch_latest
+from app.utils.time import parse_ts
+
+router = APIRouter(prefix="/batch", tags=["batch"])
+
+
+@router.get("/latest", response_model=BatchLatest)
+async def get_batch_latest(
+    company_ids: Annotated[
+        list[str],
+        Query(description="Company identifiers (repeat the parameter or separate with commas)"),
+    ],
+    sentiment_filter: SentimentFilterParams,
+    types: Annotated[
+        list[TimelineSource] | None, Query(description="Sources to include (default all)")
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=50, description="Items per company and source")] = 5,
+    start: Annotated[str | None, Query(description="Start time (RFC3339)")] = None,
+    end: Annotated[str | None, Query(description="End time (RFC3339)")] = None,
+) -> BatchLatest:
+    """Get the newest news, posts and filings of many companies at once.
+
+    Each source is read with a single ``LATERAL`` query covering every
+    company (the sources concurrently), so a 30-company portfolio is one
+    request and one query per source instead of a request per company and
+    source.
+
+    Args:
+        company_ids: Companies to read
+        sentiment_filter: Sentiment label/score/confidence conditions
+        types: Sources to include
+        limit: Maximum items per company and source
+        start: Start timestamp (inclusive)
+        end: End timestamp (exclusive)
+
+    Returns:
+        Newest items per company, in request order
+
+    Raises:
+        ValidationError: If no or too many companies are requested
+    """
+    ids = list(dict.fromkeys(
+        c.strip() for value in company_ids for c in value.split(",") if c.strip()
+    ))
+    if not ids:
+        raise ValidationError("company_ids is required")
+    if len(ids) > settings.batch_max_companies:
+        raise ValidationError(f"At most {settings.batch_max_companies} company_ids per request")
+    start_dt: datetime | None = parse_ts(start) if start else None
+    end_dt: datetime | None = parse_ts(end) if end else None
+    session_factory = None if settings.db_dsn.startswith("memory://") else get_session_factory()
+
+    data = await fetch_latest(
+        session_factory,
+        ids,
+        sources=types,
+        limit=limit,
+        start=start_dt,
+        end=end_dt,
+        sentiment_filter=sentiment_filter,
+    )
+
+    return BatchLatest(data=data)
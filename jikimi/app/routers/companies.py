@@ -2,13 +2,16 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Path, Query, Request, Response
 
 from app.config import settings
-from app.deps import DbSession
+from app.deps import DbSession, get_session_factory
 from app.errors import NotFound
-from app.repositories.companies_repo import CompaniesRepository, get_companies_repo
 from app.schemas.company import Company, PaginatedCompanies
+from app.schemas.dashboard import CompanyDashboard, DashboardComponent
+from app.services.company_directory import find_companies, find_company
+from app.services.dashboard import component_deadlines, fetch_dashboard
+from app.services.http_cache import cached_response
 
 router = APIRouter(prefix="/companies", tags=["companies"])
 
@@ -16,7 +19,9 @@ router = APIRouter(prefix="/companies", tags=["companies"])
 @router.get("", response_model=PaginatedCompanies)
 async def search_companies(
     session: DbSession,
-    q: Annotated[str | None, Query(description="Search query")] = None,
+    q: Annotated[
+        str | None, Query(description="Name, ticker or ID (typo tolerant)", max_length=100)
+    ] = None,
     limit: Annotated[int, Query(ge=1, le=settings.max_page_size)] = 50,
     cursor: Annotated[str | None, Query(description="Pagination cursor")] = None,
 ) -> PaginatedCompanies:
@@ -24,15 +29,14 @@ async def search_companies(
     
     Args:
         session: Database session
-        q: Optional search query
+        q: Optional search query (Hangul initials such as ㅅㅅㅈㅈ also match)
         limit: Maximum results per page
         cursor: Pagination cursor
-        
+
     Returns:
         Paginated list of companies
     """
-    repo = await get_companies_repo(session)
-    companies, next_cursor = await repo.search_companies(q=q, limit=limit, cursor=cursor)
+    companies, next_cursor = await find_companies(session, q, limit, cursor)
     
     return PaginatedCompanies(data=companies, next_cursor=next_cursor)
 
@@ -41,24 +45,80 @@ async def search_companies(
 async def get_company(
     company_id: str,
     session: DbSession,
-) -> Company:
+    request: Request,
+) -> Response:
     """Get a specific company by ID.
     
     Args:
         company_id: Company identifier
         session: Database session
-        
+        request: Incoming request (cache key and conditional headers)
+
     Returns:
         Company information
-        
+
     Raises:
         NotFound: If company not found
     """
-    repo = await get_companies_repo(session)
-    company = await repo.get_company(company_id)
+    async def build() -> Company:
+        company = await find_company(session, company_id)
+
+        if company is None:
+            raise NotFound(f"Company {company_id} not found")
+
+        return company
     
+    return await cached_response(request, "company", build)
+
+
+@router.get("/{company_id}/dashboard", response_model=CompanyDashboard)
+async def get_company_dashboard(
+    company_id: Annotated[str, Path(description="Company identifier")],
+    session: DbSession,
+    include: Annotated[
+        list[DashboardComponent] | None, Query(description="Components to fetch (default all)")
+    ] = None,
+    limit: Annotated[
+        int, Query(ge=1, le=settings.max_page_size, description="Items per list")
+    ] = 20,
+    price_days: Annotated[int, Query(ge=1, le=3650, description="Days of daily candles")] = 90,
+    timeout_ms: Annotated[
+        int | None, Query(ge=1, le=60_000, description="Cap on every component's deadline")
+    ] = None,
+) -> CompanyDashboard:
+    """Get a company page's components in one request.
+
+    Company details, daily prices and the first page of news, 블라인드,
+    종토방 posts and DART filings are fetched concurrently, each on its own
+    pooled session with its own deadline. Components that miss their
+    deadline are null and listed in ``timed_out``. The company is looked up
+    first, so an unknown ID is a 404 without touching the other sources.
+
+    Args:
+        company_id: Company identifier
+        session: Database session (company lookup)
+        include: Components to fetch
+        limit: Page size of the lists
+        price_days: Days of daily candles
+        timeout_ms: Upper bound for every component deadline
+
+    Returns:
+        Company dashboard
+
+    Raises:
+        NotFound: If company not found
+    """
+    company = await find_company(session, company_id)
     if company is None:
         raise NotFound(f"Company {company_id} not found")
-    
-    return company
 
+    session_factory = None if settings.db_dsn.startswith("memory://") else get_session_factory()
+    return await fetch_dashboard(
+        session_factory,
+        company_id,
+        include=include,
+        limit=limit,
+        price_days=price_days,
+        deadlines=component_deadlines(timeout_ms / 1000 if timeout_ms else None),
+        company=company,
+    )
@@ -1,20 +1,29 @@
 """Intelligence data endpoints (news, social, filings)."""
 
-from datetime import datetime
-from typing import Annotated
+from datetime import date, datetime, timedelta
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, Path, Query, Body, status
+from fastapi import APIRouter, Body, Depends, Path, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth import parse_bearer_token
-from app.config import Settings, settings
-from app.deps import DbSession
-from app.errors import NotFoundError
-from app.repositories.companies_repo import CompaniesRepository, get_companies_repo
+from app.config import settings
+from app.deps import DbSession, SentimentFilterParams, get_session_factory
+from app.errors import NotFoundError, ValidationError
+from app.repositories.blind_depts_repo import get_blind_depts_repo
 from app.repositories.dart_repo import DartRepository, get_dart_repo
+from app.repositories.freshness_repo import Freshness, get_freshness_repo
 from app.repositories.news_repo import NewsRepository, get_news_repo
+from app.repositories.sentiment_rollups_repo import bucket_start, get_sentiment_rollups_repo
 from app.repositories.social_repo import SocialRepository, get_social_repo
+from app.schemas.blind_depts import BlindDeptReport
+from app.schemas.company import Company
 from app.schemas.intelligence import (
     Article,
+    BulkCreateArticlesRequest,
+    BulkCreateFilingsRequest,
+    BulkCreateSocialPostsRequest,
+    BulkIngestResponse,
     CreateArticleRequest,
     CreateFilingRequest,
     CreateSocialPostRequest,
@@ -22,10 +31,29 @@ from app.schemas.intelligence import (
     PaginatedArticles,
     PaginatedFilings,
     PaginatedSocialPosts,
+    PaginatedTimeline,
     SocialPost,
+    TimelineSource,
 )
-from app.services.sentiment import analyze_sentiment
-from app.utils.time import parse_ts
+from app.schemas.sentiment_series import SentimentBucket, SentimentSeries, SentimentSource
+from app.services.blind_depts import DEFAULT_WINDOWS, MAX_WINDOW_DAYS, summarize_depts, window_start
+from app.services.company_directory import find_company
+from app.services.http_cache import cached_response, invalidate_company
+from app.services.ingestion import ingest_bulk
+from app.services.sentiment import SentimentItem
+from app.services.sentiment_cache import analyze_sentiment_cached
+from app.services.sentiment_series import (
+    BUCKET_HOURS,
+    SENTIMENT_SOURCES,
+    WARMUP_HALF_LIVES,
+    build_series,
+)
+from app.services.sentiment_worker import SentimentJob, get_sentiment_worker
+from app.services.story_index import get_story_index
+from app.services.timeline import TIMELINE_SOURCES, fetch_timeline
+from app.services.trending import get_trending_counter
+from app.utils.hashing import article_key, dart_rcept_no, filing_key, post_key
+from app.utils.time import now_utc, parse_ts
 
 router = APIRouter(prefix="/companies/{company_id}", tags=["intelligence"])
 
@@ -34,159 +62,483 @@ router = APIRouter(prefix="/companies/{company_id}", tags=["intelligence"])
 async def get_news(
     company_id: Annotated[str, Path(description="Company identifier")],
     session: DbSession,
+    request: Request,
+    sentiment_filter: SentimentFilterParams,
     start: Annotated[str | None, Query(description="Start time (RFC3339)")] = None,
     end: Annotated[str | None, Query(description="End time (RFC3339)")] = None,
     limit: Annotated[int, Query(ge=1, le=settings.max_page_size)] = 50,
     cursor: Annotated[str | None, Query(description="Pagination cursor")] = None,
     sources: Annotated[list[str] | None, Query(description="Filter by sources")] = None,
-) -> PaginatedArticles:
+    collapse: Annotated[
+        Literal["story"] | None,
+        Query(description="'story': one article (the latest) per near-duplicate story"),
+    ] = None,
+) -> Response:
     """Get news articles for a company.
     
+    Served through the HTTP cache (ETag over the company's news row count
+    and latest ``updated_at``; ``If-None-Match`` gets a 304).
+
     Args:
         company_id: Company identifier
         session: Database session
+        request: Incoming request (cache key and conditional headers)
+        sentiment_filter: ``label``, ``min_score`` and ``min_confidence`` conditions
         start: Start timestamp (inclusive)
         end: End timestamp (exclusive)
         limit: Maximum results per page
         cursor: Pagination cursor
         sources: Filter by news sources
-        
+        collapse: ``story`` to return each story once, with ``story_size``
+
     Returns:
         Paginated news articles
     """
     start_dt: datetime | None = parse_ts(start) if start else None
     end_dt: datetime | None = parse_ts(end) if end else None
     
-    repo = await get_news_repo(session)
-    articles, next_cursor = await repo.fetch_news(
-        company_id=company_id,
-        start=start_dt,
-        end=end_dt,
-        limit=limit,
-        cursor=cursor,
-        sources=sources,
-    )
-    
-    return PaginatedArticles(data=articles, next_cursor=next_cursor)
+    async def build() -> PaginatedArticles:
+        repo = await get_news_repo(session)
+        articles, next_cursor = await repo.fetch_news(
+            company_id=company_id,
+            start=start_dt,
+            end=end_dt,
+            limit=limit,
+            cursor=cursor,
+            sources=sources,
+            collapse=collapse == "story",
+            sentiment_filter=sentiment_filter,
+        )
+        return PaginatedArticles(data=articles, next_cursor=next_cursor)
+    
+    async def freshness() -> Freshness | None:
+        return await (await get_freshness_repo(session)).source_freshness(company_id, ["news"])
+
+    return await cached_response(request, "news", build, freshness)
 
 
 @router.get("/blind-posts", response_model=PaginatedSocialPosts)
 async def get_blind_posts(
     company_id: Annotated[str, Path(description="Company identifier")],
     session: DbSession,
+    request: Request,
+    sentiment_filter: SentimentFilterParams,
     start: Annotated[str | None, Query(description="Start time (RFC3339)")] = None,
     end: Annotated[str | None, Query(description="End time (RFC3339)")] = None,
     limit: Annotated[int, Query(ge=1, le=settings.max_page_size)] = 50,
     cursor: Annotated[str | None, Query(description="Pagination cursor")] = None,
     dept: Annotated[str | None, Query(description="Filter by department")] = None,
-) -> PaginatedSocialPosts:
-    """Get 블라인드 posts for a company.
+) -> Response:
+    """Get 블라인드 posts for a company (through the HTTP cache).
     
     Args:
         company_id: Company identifier
         session: Database session
+        request: Incoming request (cache key and conditional headers)
+        sentiment_filter: ``label``, ``min_score`` and ``min_confidence`` conditions
         start: Start timestamp (inclusive)
         end: End timestamp (exclusive)
         limit: Maximum results per page
         cursor: Pagination cursor
         dept: Filter by department
-        
+
     Returns:
         Paginated social posts
     """
     start_dt: datetime | None = parse_ts(start) if start else None
     end_dt: datetime | None = parse_ts(end) if end else None
     
-    repo = await get_social_repo(session)
-    posts, next_cursor = await repo.fetch_social(
-        company_id=company_id,
-        platform="blind",
-        start=start_dt,
-        end=end_dt,
-        limit=limit,
-        cursor=cursor,
-        dept=dept,
-    )
+    async def build() -> PaginatedSocialPosts:
+        repo = await get_social_repo(session)
+        posts, next_cursor = await repo.fetch_social(
+            company_id=company_id,
+            platform="blind",
+            start=start_dt,
+            end=end_dt,
+            limit=limit,
+            cursor=cursor,
+            dept=dept,
+            sentiment_filter=sentiment_filter,
+        )
+        return PaginatedSocialPosts(data=posts, next_cursor=next_cursor)
+
+    async def freshness() -> Freshness | None:
+        return await (await get_freshness_repo(session)).source_freshness(company_id, ["blind"])
     
-    return PaginatedSocialPosts(data=posts, next_cursor=next_cursor)
+    return await cached_response(request, "social", build, freshness)
 
 
 @router.get("/naver-forum", response_model=PaginatedSocialPosts)
 async def get_naver_forum(
     company_id: Annotated[str, Path(description="Company identifier")],
     session: DbSession,
+    request: Request,
+    sentiment_filter: SentimentFilterParams,
     start: Annotated[str | None, Query(description="Start time (RFC3339)")] = None,
     end: Annotated[str | None, Query(description="End time (RFC3339)")] = None,
     limit: Annotated[int, Query(ge=1, le=settings.max_page_size)] = 50,
     cursor: Annotated[str | None, Query(description="Pagination cursor")] = None,
-) -> PaginatedSocialPosts:
-    """Get 네이버 종토방 posts for a company.
+) -> Response:
+    """Get 네이버 종토방 posts for a company (through the HTTP cache).
     
     Args:
         company_id: Company identifier
         session: Database session
+        request: Incoming request (cache key and conditional headers)
+        sentiment_filter: ``label``, ``min_score`` and ``min_confidence`` conditions
         start: Start timestamp (inclusive)
         end: End timestamp (exclusive)
         limit: Maximum results per page
         cursor: Pagination cursor
-        
+
     Returns:
         Paginated social posts
     """
     start_dt: datetime | None = parse_ts(start) if start else None
     end_dt: datetime | None = parse_ts(end) if end else None
     
-    repo = await get_social_repo(session)
-    posts, next_cursor = await repo.fetch_social(
-        company_id=company_id,
-        platform="naver_forum",
-        start=start_dt,
-        end=end_dt,
-        limit=limit,
-        cursor=cursor,
-    )
-    
-    return PaginatedSocialPosts(data=posts, next_cursor=next_cursor)
+    async def build() -> PaginatedSocialPosts:
+        repo = await get_social_repo(session)
+        posts, next_cursor = await repo.fetch_social(
+            company_id=company_id,
+            platform="naver_forum",
+            start=start_dt,
+            end=end_dt,
+            limit=limit,
+            cursor=cursor,
+            sentiment_filter=sentiment_filter,
+        )
+        return PaginatedSocialPosts(data=posts, next_cursor=next_cursor)
+    
+    async def freshness() -> Freshness | None:
+        repo = await get_freshness_repo(session)
+        return await repo.source_freshness(company_id, ["naver_forum"])
+
+    return await cached_response(request, "social", build, freshness)
 
 
 @router.get("/dart-filings", response_model=PaginatedFilings)
 async def get_dart_filings(
     company_id: Annotated[str, Path(description="Company identifier")],
     session: DbSession,
+    request: Request,
+    sentiment_filter: SentimentFilterParams,
     start: Annotated[str | None, Query(description="Start time (RFC3339)")] = None,
     end: Annotated[str | None, Query(description="End time (RFC3339)")] = None,
     limit: Annotated[int, Query(ge=1, le=settings.max_page_size)] = 50,
     cursor: Annotated[str | None, Query(description="Pagination cursor")] = None,
     type: Annotated[str | None, Query(description="Filter by filing type")] = None,
-) -> PaginatedFilings:
-    """Get DART filings for a company.
+) -> Response:
+    """Get DART filings for a company (through the HTTP cache).
     
     Args:
         company_id: Company identifier
         session: Database session
+        request: Incoming request (cache key and conditional headers)
+        sentiment_filter: ``label``, ``min_score`` and ``min_confidence`` conditions
         start: Start timestamp (inclusive)
         end: End timestamp (exclusive)
         limit: Maximum results per page
         cursor: Pagination cursor
         type: Filter by filing type
-        
+
     Returns:
         Paginated DART filings
     """
     start_dt: datetime | None = parse_ts(start) if start else None
     end_dt: datetime | None = parse_ts(end) if end else None
     
-    repo = await get_dart_repo(session)
-    filings, next_cursor = await repo.fetch_filings(
-        company_id=company_id,
-        start=start_dt,
-        end=end_dt,
-        limit=limit,
-        cursor=cursor,
-        typ=type,
-    )
+    async def build() -> PaginatedFilings:
+        repo = await get_dart_repo(session)
+        filings, next_cursor = await repo.fetch_filings(
+            company_id=company_id,
+            start=start_dt,
+            end=end_dt,
+            limit=limit,
+            cursor=cursor,
+            typ=type,
+            sentiment_filter=sentiment_filter,
+        )
+        return PaginatedFilings(data=filings, next_cursor=next_cursor)
+
+    async def freshness() -> Freshness | None:
+        return await (await get_freshness_repo(session)).source_freshness(company_id, ["dart"])
     
-    return PaginatedFilings(data=filings, next_cursor=next_cursor)
+    return await cached_response(request, "filings", build, freshness)
+
+
+@router.get("/timeline", response_model=PaginatedTimeline)
+async def get_timeline(
+    company_id: Annotated[str, Path(description="Company identifier")],
+    request: Request,
+    start: Annotated[str | None, Query(description="Start time (RFC3339)")] = None,
+    end: Annotated[str | None, Query(description="End time (RFC3339)")] = None,
+    limit: Annotated[int, Query(ge=1, le=settings.max_page_size)] = 50,
+    cursor: Annotated[str | None, Query(description="Pagination cursor")] = None,
+    types: Annotated[
+        list[TimelineSource] | None, Query(description="Sources to include (default all)")
+    ] = None,
+) -> Response:
+    """Get news, 블라인드, 종토방 posts and DART filings merged newest first.
+
+    The sources are read concurrently, each on its own session, and merged
+    by timestamp; the cursor keeps every source's position. Served through
+    the HTTP cache, validated against all the selected sources.
+
+    Args:
+        company_id: Company identifier
+        request: Incoming request (cache key and conditional headers)
+        start: Start timestamp (inclusive)
+        end: End timestamp (exclusive)
+        limit: Maximum results per page
+        cursor: Pagination cursor
+        types: Sources to include
+
+    Returns:
+        Paginated timeline items
+    """
+    start_dt: datetime | None = parse_ts(start) if start else None
+    end_dt: datetime | None = parse_ts(end) if end else None
+    session_factory = None if settings.db_dsn.startswith("memory://") else get_session_factory()
+    selected = list(dict.fromkeys(types)) if types else None
+
+    async def build() -> PaginatedTimeline:
+        items, next_cursor = await fetch_timeline(
+            session_factory,
+            company_id,
+            sources=selected,
+            start=start_dt,
+            end=end_dt,
+            limit=limit,
+            cursor=cursor,
+        )
+        return PaginatedTimeline(data=items, next_cursor=next_cursor)
+
+    async def freshness() -> Freshness | None:
+        if session_factory is None:
+            return None
+        async with session_factory() as session:
+            repo = await get_freshness_repo(session)
+            return await repo.source_freshness(company_id, selected or list(TIMELINE_SOURCES))
+
+    return await cached_response(request, "timeline", build, freshness)
+
+
+@router.get("/sentiment-series", response_model=SentimentSeries)
+async def get_sentiment_series(
+    company_id: Annotated[str, Path(description="Company identifier")],
+    session: DbSession,
+    request: Request,
+    bucket: Annotated[SentimentBucket, Query(description="Bucket width")] = "1d",
+    sources: Annotated[
+        list[SentimentSource] | None, Query(description="Sources to sum (default all)")
+    ] = None,
+    start: Annotated[str | None, Query(description="Start time (RFC3339)")] = None,
+    end: Annotated[str | None, Query(description="End time (RFC3339)")] = None,
+    half_life_hours: Annotated[
+        float | None, Query(gt=0, le=24 * 365, description="Half-life of the decayed score")
+    ] = None,
+) -> Response:
+    """Get a company's sentiment per hour or day.
+
+    Points come from the trigger-maintained ``sentiment_rollups`` table, so
+    a year of daily points is one primary-key range scan however many items
+    it covers. Empty buckets are included. ``decayed_score`` weighs every
+    earlier item by ``2 ** -(age / half_life_hours)``. Served through the
+    HTTP cache, validated against the rollup rows and the bucket range.
+
+    Args:
+        company_id: Company identifier
+        session: Database session
+        request: Incoming request (cache key and conditional headers)
+        bucket: ``1h`` or ``1d`` (UTC buckets)
+        sources: Sources to include
+        start: Start timestamp (default 7 days back for ``1h``, 365 for ``1d``)
+        end: End timestamp, exclusive (default now)
+        half_life_hours: Decay half-life (default from settings)
+
+    Returns:
+        Sentiment series
+
+    Raises:
+        ValidationError: If the range is empty or has too many buckets
+    """
+    end_dt = parse_ts(end) if end else now_utc()
+    start_dt = parse_ts(start) if start else end_dt - timedelta(days=7 if bucket == "1h" else 365)
+    if start_dt >= end_dt:
+        raise ValidationError("start must be before end")
+    width = timedelta(hours=BUCKET_HOURS[bucket])
+    if (end_dt - bucket_start(start_dt, bucket)) / width > settings.sentiment_series_max_points:
+        raise ValidationError(
+            f"Range has more than {settings.sentiment_series_max_points} {bucket} buckets; "
+            "narrow it or use 1d"
+        )
+
+    selected = list(dict.fromkeys(sources)) if sources else list(SENTIMENT_SOURCES)
+    half_life = half_life_hours or settings.sentiment_series_half_life_hours
+    warmup_start = start_dt - timedelta(hours=half_life * WARMUP_HALF_LIVES)
+
+    async def build() -> SentimentSeries:
+        repo = await get_sentiment_rollups_repo(session)
+        rows = await repo.fetch_rollups(company_id, bucket, selected, warmup_start, end_dt)
+        return SentimentSeries(
+            company_id=company_id,
+            bucket=bucket,
+            sources=selected,
+            half_life_hours=half_life,
+            points=build_series(rows, bucket, start_dt, end_dt, half_life),
+        )
+
+    async def freshness() -> Freshness | None:
+        repo = await get_freshness_repo(session)
+        return await repo.rollup_freshness(company_id, bucket, selected)
+
+    # Without start/end the range moves with the clock, one bucket at a time
+    vary = (bucket_start(start_dt, bucket), bucket_start(end_dt, bucket))
+    return await cached_response(request, "sentiment_series", build, freshness, vary)
+
+
+@router.get("/blind-depts", response_model=BlindDeptReport)
+async def get_blind_depts(
+    company_id: Annotated[str, Path(description="Company identifier")],
+    session: DbSession,
+    request: Request,
+    windows: Annotated[
+        list[int] | None, Query(description="Window lengths in days (default 7, 30 and 90)")
+    ] = None,
+    end: Annotated[
+        date | None, Query(description="Last day of every window (UTC, default today)")
+    ] = None,
+    min_posts: Annotated[
+        int, Query(ge=1, description="Drop departments with fewer posts in the longest window")
+    ] = 1,
+) -> Response:
+    """Get a company's 블라인드 activity per department.
+
+    Windows come from the trigger-maintained ``blind_dept_daily`` table, so
+    a report reads one row per department and day instead of every post.
+    Posts without a department are not counted. Served through the HTTP
+    cache, validated against the company's rollup rows and the report day.
+
+    Args:
+        company_id: Company identifier
+        session: Database session
+        request: Incoming request (cache key and conditional headers)
+        windows: Window lengths in days, each ending on ``end``
+        end: Report day
+        min_posts: Minimum posts in the longest window
+
+    Returns:
+        Department report
+
+    Raises:
+        ValidationError: If a window is out of range
+    """
+    selected = sorted(set(windows)) if windows else list(DEFAULT_WINDOWS)
+    if selected[0] < 1 or selected[-1] > MAX_WINDOW_DAYS:
+        raise ValidationError(f"windows must be between 1 and {MAX_WINDOW_DAYS} days")
+    end_day = end or now_utc().date()
+
+    async def build() -> BlindDeptReport:
+        repo = await get_blind_depts_repo(session)
+        rows = await repo.fetch_dept_days(company_id, window_start(selected, end_day), end_day)
+        return BlindDeptReport(
+            company_id=company_id,
+            as_of=end_day,
+            windows=selected,
+            data=summarize_depts(rows, selected, end_day, min_posts),
+        )
+
+    async def freshness() -> Freshness | None:
+        return await (await get_freshness_repo(session)).blind_dept_freshness(company_id)
+
+    return await cached_response(request, "blind_depts", build, freshness, (end_day,))
+
+
+# ========== Single-item lookups (e.g. to poll for deferred sentiment) ==========
+
+@router.get("/news/{article_id}", response_model=Article)
+async def get_news_article(
+    company_id: Annotated[str, Path(description="Company identifier")],
+    article_id: Annotated[str, Path(description="Article identifier")],
+    session: DbSession,
+) -> Article:
+    """Get a single news article.
+
+    ``sentiment`` is null while a deferred score is still pending.
+
+    Args:
+        company_id: Company identifier
+        article_id: Article identifier
+        session: Database session
+
+    Returns:
+        News article
+
+    Raises:
+        NotFoundError: If the article doesn't exist
+    """
+    repo = await get_news_repo(session)
+    article = await repo.get_article(company_id, article_id)
+    if article is None:
+        raise NotFoundError(f"Article {article_id} not found")
+    return article
+
+
+@router.get("/social/{post_id}", response_model=SocialPost)
+async def get_social_post(
+    company_id: Annotated[str, Path(description="Company identifier")],
+    post_id: Annotated[str, Path(description="Post identifier")],
+    session: DbSession,
+) -> SocialPost:
+    """Get a single social post.
+
+    ``sentiment`` is null while a deferred score is still pending.
+
+    Args:
+        company_id: Company identifier
+        post_id: Post identifier
+        session: Database session
+
+    Returns:
+        Social post
+
+    Raises:
+        NotFoundError: If the post doesn't exist
+    """
+    repo = await get_social_repo(session)
+    post = await repo.get_social_post(company_id, post_id)
+    if post is None:
+        raise NotFoundError(f"Post {post_id} not found")
+    return post
+
+
+@router.get("/dart-filings/{filing_id}", response_model=Filing)
+async def get_dart_filing(
+    company_id: Annotated[str, Path(description="Company identifier")],
+    filing_id: Annotated[str, Path(description="Filing identifier")],
+    session: DbSession,
+) -> Filing:
+    """Get a single DART filing.
+
+    ``sentiment`` is null while a deferred score is still pending.
+
+    Args:
+        company_id: Company identifier
+        filing_id: Filing identifier
+        session: Database session
+
+    Returns:
+        DART filing
+
+    Raises:
+        NotFoundError: If the filing doesn't exist
+    """
+    repo = await get_dart_repo(session)
+    filing = await repo.get_filing(company_id, filing_id)
+    if filing is None:
+        raise NotFoundError(f"Filing {filing_id} not found")
+    return filing
 
 
 # ========== POST endpoints for creating intelligence data ==========
@@ -196,26 +548,40 @@ async def create_news_article(
     company_id: Annotated[str, Path(description="Company identifier")],
     request: Annotated[CreateArticleRequest, Body()],
     session: DbSession,
+    response: Response,
+    defer_sentiment: Annotated[
+        bool, Query(description="Store now and score sentiment in the background (202)")
+    ] = False,
     token: Annotated[str | None, Depends(parse_bearer_token)] = None,
 ) -> Article:
     """Create a new news article with automatic sentiment analysis.
     
     This endpoint will:
     1. Validate that the company exists
-    2. Analyze sentiment of the article using ChatGPT
-    3. Store the article with the sentiment in the database
-    
+    2. Return the stored article (200) if the same article was already ingested
+    3. Assign the article to a near-duplicate story and analyze its sentiment
+       using ChatGPT, unless the story was already scored
+    4. Store the article with the sentiment in the database
+    
+    With ``defer_sentiment=true`` the article is stored at once with null
+    sentiment, step 3 runs in the background worker, and the response is 202
+    with a ``Location`` to poll for the final sentiment (201 with the story's
+    sentiment if it already had one).
+
     Authorization is optional. If provided, token will be validated.
     
     Args:
         company_id: Company identifier (must match request.company_id)
         request: Article creation request
         session: Database session
+        response: Response (status and Location are set when deferring)
+        defer_sentiment: Skip the inline LLM call; the row is stored with null
+            sentiment and scored by the background worker
         token: Optional bearer token for authentication
-        
+
     Returns:
         Created article with sentiment
-        
+
     Raises:
         NotFoundError: If company doesn't exist
         ValidationError: If company_id doesn't match
@@ -226,22 +592,37 @@ async def create_news_article(
         raise ValidationError("company_id in path must match company_id in body")
     
     # Validate company exists
-    companies_repo = await get_companies_repo(session)
-    company = await companies_repo.get_company(company_id)
+    company = await find_company(session, company_id)
     if company is None:
         raise NotFoundError(f"Company {company_id} not found")
     
-    # Analyze sentiment
+    # Crawler retries get the stored article back without an LLM call
+    news_repo = await get_news_repo(session)
+    dedupe_hash = article_key(request.url, request.source, request.title, request.published_at)
+    existing = await news_repo.find_existing(company_id, [(dedupe_hash,)])
+    if existing:
+        response.status_code = status.HTTP_200_OK
+        stored = await news_repo.get_article(company_id, existing[(dedupe_hash,)])
+        if stored is None:
+            raise NotFoundError(f"Article {existing[(dedupe_hash,)]} not found")
+        return stored
+
+    # Near-duplicates of a scored story reuse its sentiment; otherwise analyze
+    # inline unless deferred (cached by normalized text)
+    stories = get_story_index()
+    story = stories.assign(company_id, request.title, request.published_at)
     text = f"{request.title}\n\n{request.summary or ''}"
-    sentiment = await analyze_sentiment(
-        text=text,
-        content_type="news",
-        company_name=company.name,
-        settings=Settings(),
-    )
+    sentiment = story.sentiment
+    if sentiment is None and not defer_sentiment:
+        sentiment = await analyze_sentiment_cached(
+            session,
+            text=text,
+            content_type="news",
+            company_name=company.name,
+        )
+        stories.set_sentiment(story.story_id, sentiment)
     
     # Create article
-    news_repo = await get_news_repo(session)
     article = await news_repo.create_article(
         title=request.title,
         source=request.source,
@@ -250,8 +631,24 @@ async def create_news_article(
         url=request.url,
         summary=request.summary,
         sentiment=sentiment,
+        dedupe_hash=dedupe_hash,
+        story_id=story.story_id,
     )
-    
+    get_trending_counter().record(company_id, request.published_at, sentiment=sentiment)
+    invalidate_company(company_id)
+    
+    if sentiment is None:
+        get_sentiment_worker().enqueue(
+            SentimentJob(
+                table="news", row_id=article.id, company_id=company_id,
+                item=SentimentItem(text, "news", company.name),
+            )
+        )
+        response.status_code = status.HTTP_202_ACCEPTED
+        response.headers["Location"] = (
+            f"{settings.api_prefix}/companies/{company_id}/news/{article.id}"
+        )
+
     return article
 
 
@@ -260,26 +657,38 @@ async def create_social_post(
     company_id: Annotated[str, Path(description="Company identifier")],
     request: Annotated[CreateSocialPostRequest, Body()],
     session: DbSession,
+    response: Response,
+    defer_sentiment: Annotated[
+        bool, Query(description="Store now and score sentiment in the background (202)")
+    ] = False,
     token: Annotated[str | None, Depends(parse_bearer_token)] = None,
 ) -> SocialPost:
     """Create a new social media post with automatic sentiment analysis.
     
     This endpoint will:
     1. Validate that the company exists
-    2. Analyze sentiment of the post using ChatGPT
-    3. Store the post with the sentiment in the database
+    2. Return the stored post (200) if the same post was already ingested
+    3. Analyze sentiment of the post using ChatGPT
+    4. Store the post with the sentiment in the database
     
+    With ``defer_sentiment=true`` the post is stored at once with null
+    sentiment, step 3 runs in the background worker, and the response is 202
+    with a ``Location`` to poll for the final sentiment.
+
     Authorization is optional. If provided, token will be validated.
     
     Args:
         company_id: Company identifier (must match request.company_id)
         request: Social post creation request
         session: Database session
+        response: Response (status and Location are set when deferring)
+        defer_sentiment: Skip the inline LLM call; the row is stored with null
+            sentiment and scored by the background worker
         token: Optional bearer token for authentication
-        
+
     Returns:
         Created social post with sentiment
-        
+
     Raises:
         NotFoundError: If company doesn't exist
         ValidationError: If company_id doesn't match
@@ -290,22 +699,31 @@ async def create_social_post(
         raise ValidationError("company_id in path must match company_id in body")
     
     # Validate company exists
-    companies_repo = await get_companies_repo(session)
-    company = await companies_repo.get_company(company_id)
+    company = await find_company(session, company_id)
     if company is None:
         raise NotFoundError(f"Company {company_id} not found")
     
-    # Analyze sentiment
+    # Crawler retries get the stored post back without an LLM call
+    social_repo = await get_social_repo(session)
+    dedupe_hash = post_key(request.platform, request.content, request.author, request.posted_at)
+    existing = await social_repo.find_existing(company_id, [(dedupe_hash,)])
+    if existing:
+        response.status_code = status.HTTP_200_OK
+        stored = await social_repo.get_social_post(company_id, existing[(dedupe_hash,)])
+        if stored is None:
+            raise NotFoundError(f"Post {existing[(dedupe_hash,)]} not found")
+        return stored
+
+    # Analyze sentiment inline unless deferred (cached by normalized text)
     text = f"{request.title or ''}\n\n{request.content}"
-    sentiment = await analyze_sentiment(
+    sentiment = None if defer_sentiment else await analyze_sentiment_cached(
+        session,
         text=text,
         content_type="social",
         company_name=company.name,
-        settings=Settings(),
     )
     
     # Create social post
-    social_repo = await get_social_repo(session)
     post = await social_repo.create_social_post(
         platform=request.platform,
         content=request.content,
@@ -317,8 +735,28 @@ async def create_social_post(
         reply_count=request.reply_count,
         like_count=request.like_count,
         sentiment=sentiment,
+        dedupe_hash=dedupe_hash,
     )
-    
+    get_trending_counter().record(
+        company_id,
+        request.posted_at,
+        engagement=request.reply_count + request.like_count,
+        sentiment=sentiment,
+    )
+    invalidate_company(company_id)
+    
+    if defer_sentiment:
+        get_sentiment_worker().enqueue(
+            SentimentJob(
+                table="social", row_id=post.id, company_id=company_id,
+                item=SentimentItem(text, "social", company.name),
+            )
+        )
+        response.status_code = status.HTTP_202_ACCEPTED
+        response.headers["Location"] = (
+            f"{settings.api_prefix}/companies/{company_id}/social/{post.id}"
+        )
+
     return post
 
 
@@ -327,26 +765,38 @@ async def create_dart_filing(
     company_id: Annotated[str, Path(description="Company identifier")],
     request: Annotated[CreateFilingRequest, Body()],
     session: DbSession,
+    response: Response,
+    defer_sentiment: Annotated[
+        bool, Query(description="Store now and score sentiment in the background (202)")
+    ] = False,
     token: Annotated[str | None, Depends(parse_bearer_token)] = None,
 ) -> Filing:
     """Create a new DART filing with automatic sentiment analysis.
     
     This endpoint will:
     1. Validate that the company exists
-    2. Analyze sentiment of the filing using ChatGPT
-    3. Store the filing with the sentiment in the database
+    2. Return the stored filing (200) if the same filing was already ingested
+    3. Analyze sentiment of the filing using ChatGPT
+    4. Store the filing with the sentiment in the database
     
+    With ``defer_sentiment=true`` the filing is stored at once with null
+    sentiment, step 3 runs in the background worker, and the response is 202
+    with a ``Location`` to poll for the final sentiment.
+
     Authorization is optional. If provided, token will be validated.
     
     Args:
         company_id: Company identifier (must match request.company_id)
         request: Filing creation request
         session: Database session
+        response: Response (status and Location are set when deferring)
+        defer_sentiment: Skip the inline LLM call; the row is stored with null
+            sentiment and scored by the background worker
         token: Optional bearer token for authentication
-        
+
     Returns:
         Created filing with sentiment
-        
+
     Raises:
         NotFoundError: If company doesn't exist
         ValidationError: If company_id doesn't match
@@ -357,22 +807,32 @@ async def create_dart_filing(
         raise ValidationError("company_id in path must match company_id in body")
     
     # Validate company exists
-    companies_repo = await get_companies_repo(session)
-    company = await companies_repo.get_company(company_id)
+    company = await find_company(session, company_id)
     if company is None:
         raise NotFoundError(f"Company {company_id} not found")
     
-    # Analyze sentiment
+    # Crawler retries get the stored filing back without an LLM call
+    dart_repo = await get_dart_repo(session)
+    rcept_no = request.rcept_no or dart_rcept_no(request.url)
+    dedupe_hash = filing_key(rcept_no, request.title, request.filing_type, request.filed_at)
+    existing = await dart_repo.find_existing(company_id, [(dedupe_hash,)])
+    if existing:
+        response.status_code = status.HTTP_200_OK
+        stored = await dart_repo.get_filing(company_id, existing[(dedupe_hash,)])
+        if stored is None:
+            raise NotFoundError(f"Filing {existing[(dedupe_hash,)]} not found")
+        return stored
+
+    # Analyze sentiment inline unless deferred (cached by normalized text)
     text = f"{request.title}\n\n{request.summary or ''}"
-    sentiment = await analyze_sentiment(
+    sentiment = None if defer_sentiment else await analyze_sentiment_cached(
+        session,
         text=text,
         content_type="filing",
         company_name=company.name,
-        settings=Settings(),
     )
     
     # Create filing
-    dart_repo = await get_dart_repo(session)
     filing = await dart_repo.create_filing(
         title=request.title,
         filing_type=request.filing_type,
@@ -381,7 +841,150 @@ async def create_dart_filing(
         url=request.url,
         summary=request.summary,
         sentiment=sentiment,
+        rcept_no=rcept_no,
+        dedupe_hash=dedupe_hash,
     )
-    
+    invalidate_company(company_id)
+    
+    if defer_sentiment:
+        get_sentiment_worker().enqueue(
+            SentimentJob(
+                table="filing", row_id=filing.id, company_id=company_id,
+                item=SentimentItem(text, "filing", company.name),
+            )
+        )
+        response.status_code = status.HTTP_202_ACCEPTED
+        response.headers["Location"] = (
+            f"{settings.api_prefix}/companies/{company_id}/dart-filings/{filing.id}"
+        )
+
     return filing
 
+
+
+# ========== Bulk POST endpoints (crawler ingestion) ==========
+
+async def _bulk_company(session: AsyncSession, company_id: str) -> Company:
+    """Validate the path company once for a whole bulk request."""
+    company = await find_company(session, company_id)
+    if company is None:
+        raise NotFoundError(f"Company {company_id} not found")
+    return company
+
+
+@router.post("/news:bulk", response_model=BulkIngestResponse)
+async def create_news_articles_bulk(
+    company_id: Annotated[str, Path(description="Company identifier")],
+    request: Annotated[BulkCreateArticlesRequest, Body()],
+    session: DbSession,
+    response: Response,
+    defer_sentiment: Annotated[
+        bool, Query(description="Store now and score sentiment in the background (202)")
+    ] = False,
+    token: Annotated[str | None, Depends(parse_bearer_token)] = None,
+) -> BulkIngestResponse:
+    """Create many news articles for one company.
+
+    The company is validated once. Items repeated in the request or already
+    stored (same normalized URL, or same source, title and publication time
+    without a URL) are reported as ``duplicate`` and not scored; new items
+    are scored in LLM batches and inserted with one multi-row INSERT. Items that
+    fail validation, whose ``company_id`` differs from the path, or whose
+    sentiment could not be scored are reported as ``error`` without failing
+    the rest of the request.
+
+    Args:
+        company_id: Company identifier
+        request: Articles to create
+        session: Database session
+        response: Response (status is 202 when deferring)
+        defer_sentiment: Store with null sentiment and score in the background
+        token: Optional bearer token for authentication
+
+    Returns:
+        Per-item results
+
+    Raises:
+        NotFoundError: If company doesn't exist
+    """
+    company = await _bulk_company(session, company_id)
+    result = await ingest_bulk(session, "news", company, request.items, defer_sentiment)
+    if defer_sentiment:
+        response.status_code = status.HTTP_202_ACCEPTED
+    return result
+
+
+@router.post("/social:bulk", response_model=BulkIngestResponse)
+async def create_social_posts_bulk(
+    company_id: Annotated[str, Path(description="Company identifier")],
+    request: Annotated[BulkCreateSocialPostsRequest, Body()],
+    session: DbSession,
+    response: Response,
+    defer_sentiment: Annotated[
+        bool, Query(description="Store now and score sentiment in the background (202)")
+    ] = False,
+    token: Annotated[str | None, Depends(parse_bearer_token)] = None,
+) -> BulkIngestResponse:
+    """Create many social posts for one company.
+
+    Posts with the same platform, author, timestamp and normalized content as
+    another item or a stored post are reported as ``duplicate``; see
+    ``create_news_articles_bulk``.
+
+    Args:
+        company_id: Company identifier
+        request: Posts to create
+        session: Database session
+        response: Response (status is 202 when deferring)
+        defer_sentiment: Store with null sentiment and score in the background
+        token: Optional bearer token for authentication
+
+    Returns:
+        Per-item results
+
+    Raises:
+        NotFoundError: If company doesn't exist
+    """
+    company = await _bulk_company(session, company_id)
+    result = await ingest_bulk(session, "social", company, request.items, defer_sentiment)
+    if defer_sentiment:
+        response.status_code = status.HTTP_202_ACCEPTED
+    return result
+
+
+@router.post("/dart-filings:bulk", response_model=BulkIngestResponse)
+async def create_dart_filings_bulk(
+    company_id: Annotated[str, Path(description="Company identifier")],
+    request: Annotated[BulkCreateFilingsRequest, Body()],
+    session: DbSession,
+    response: Response,
+    defer_sentiment: Annotated[
+        bool, Query(description="Store now and score sentiment in the background (202)")
+    ] = False,
+    token: Annotated[str | None, Depends(parse_bearer_token)] = None,
+) -> BulkIngestResponse:
+    """Create many DART filings for one company.
+
+    Filings with the same DART receipt number (``rcept_no`` or the URL's
+    ``rcpNo``) as another item or a stored filing are reported as
+    ``duplicate``; see ``create_news_articles_bulk``.
+
+    Args:
+        company_id: Company identifier
+        request: Filings to create
+        session: Database session
+        response: Response (status is 202 when deferring)
+        defer_sentiment: Store with null sentiment and score in the background
+        token: Optional bearer token for authentication
+
+    Returns:
+        Per-item results
+
+    Raises:
+        NotFoundError: If company doesn't exist
+    """
+    company = await _bulk_company(session, company_id)
+    result = await ingest_bulk(session, "filing", company, request.items, defer_sentiment)
+    if defer_sentiment:
+        response.status_code = status.HTTP_202_ACCEPTED
+    return result
@@ -3,11 +3,14 @@
 from datetime import datetime
 from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Path, Query, Request, Response
 
+from app.config import settings
 from app.deps import DbSession
+from app.repositories.freshness_repo import Freshness, get_freshness_repo
 from app.repositories.prices_repo import PricesRepository, get_prices_repo
 from app.schemas.market import PriceSeries
+from app.services.http_cache import cached_response
 from app.utils.time import parse_ts
 
 router = APIRouter(prefix="/companies/{company_id}", tags=["market"])
@@ -17,6 +20,7 @@ router = APIRouter(prefix="/companies/{company_id}", tags=["market"])
 async def get_prices(
     company_id: Annotated[str, Path(description="Company identifier")],
     session: DbSession,
+    request: Request,
     start: Annotated[str | None, Query(description="Start time (RFC3339)")] = None,
     end: Annotated[str | None, Query(description="End time (RFC3339)")] = None,
     interval: Annotated[Literal["1d", "1h", "5m"], Query(description="Candle interval")] = "1d",
@@ -24,31 +28,41 @@ async def get_prices(
         Literal["none", "split", "total_return"],
         Query(description="Price adjustment type"),
     ] = "none",
-) -> PriceSeries:
+) -> Response:
     """Get historical price data for a company.
     
+    The ETag follows the stored candles' count and tail; with live prices
+    enabled it is a hash of the body instead.
+
     Args:
         company_id: Company identifier
         session: Database session
+        request: Incoming request (cache key and conditional headers)
         start: Start timestamp (inclusive)
         end: End timestamp (exclusive)
         interval: Candle interval (1d, 1h, 5m)
         adjust: Price adjustment (none, split, total_return)
-        
+
     Returns:
         Price series with OHLCV candles
     """
     start_dt: datetime | None = parse_ts(start) if start else None
     end_dt: datetime | None = parse_ts(end) if end else None
     
-    repo = await get_prices_repo(session)
-    prices = await repo.fetch_prices(
-        company_id=company_id,
-        start=start_dt,
-        end=end_dt,
-        interval=interval,
-        adjust=adjust,
-    )
+    async def build() -> PriceSeries:
+        repo = await get_prices_repo(session)
+        return await repo.fetch_prices(
+            company_id=company_id,
+            start=start_dt,
+            end=end_dt,
+            interval=interval,
+            adjust=adjust,
+        )
     
-    return prices
+    async def freshness() -> Freshness | None:
+        repo = await get_freshness_repo(session)
+        return await repo.prices_freshness(company_id, interval, adjust)
 
+    return await cached_response(
+        request, "prices", build, None if settings.use_live_prices else freshness
+    )
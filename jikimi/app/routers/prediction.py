@@ -7,10 +7,8 @@ from fastapi import APIRouter, Depends, Path
 
 from app.deps import DbSession
 from app.errors import Unprocessable
-from app.repositories.dart_repo import get_dart_repo
-from app.repositories.news_repo import get_news_repo
+from app.repositories.features_repo import get_features_repo
 from app.repositories.prices_repo import get_prices_repo
-from app.repositories.social_repo import get_social_repo
 from app.schemas.prediction import PredictRequest, PricePrediction
 from app.services.prediction import predict_price
 from app.utils.time import now_utc
@@ -26,8 +24,9 @@ async def predict_stock_price(
 ) -> PricePrediction:
     """Predict future stock price using AI.
     
-    This endpoint fetches recent market data, news, social posts, and filings,
-    then uses OpenAI to generate a price forecast with uncertainty bounds.
+    This endpoint fetches recent market data and per-day intelligence features
+    (news, social posts, filings), then uses OpenAI to generate a price forecast
+    with uncertainty bounds.
     
     Args:
         company_id: Company identifier
@@ -58,56 +57,15 @@ async def predict_stock_price(
     if not prices.candles:
         raise Unprocessable("No price history available for this company")
     
-    # Fetch news (last 30 days)
+    # Intelligence features come from the per-day feature store (last 30 days):
+    # one primary-key range scan instead of fetching raw articles and posts
     news_start = end_time - timedelta(days=30)
-    news = []
-    if request.include_features.get("news", False):
-        news_repo = await get_news_repo(session)
-        news, _ = await news_repo.fetch_news(
-            company_id=company_id,
-            start=news_start,
-            end=end_time,
-            limit=100,
-            cursor=None,
-        )
-    
-    # Fetch 블라인드 posts
-    blind = []
-    if request.include_features.get("blind", False):
-        social_repo = await get_social_repo(session)
-        blind, _ = await social_repo.fetch_social(
-            company_id=company_id,
-            platform="blind",
-            start=news_start,
-            end=end_time,
-            limit=100,
-            cursor=None,
-        )
-    
-    # Fetch 네이버 종토방 posts
-    naver_forum = []
-    if request.include_features.get("naver_forum", False):
-        social_repo = await get_social_repo(session)
-        naver_forum, _ = await social_repo.fetch_social(
-            company_id=company_id,
-            platform="naver_forum",
-            start=news_start,
-            end=end_time,
-            limit=100,
-            cursor=None,
-        )
-    
-    # Fetch DART filings
-    filings = []
-    if request.include_features.get("filings", False):
-        dart_repo = await get_dart_repo(session)
-        filings, _ = await dart_repo.fetch_filings(
-            company_id=company_id,
-            start=news_start,
-            end=end_time,
-            limit=50,
-            cursor=None,
-        )
+    features_repo = await get_features_repo(session)
+    daily_features = await features_repo.fetch_daily_features(
+        company_id=company_id,
+        start=news_start,
+        end=end_time,
+    )
     
     # Generate prediction
     prediction = await predict_price(
@@ -117,10 +75,11 @@ async def predict_stock_price(
         target=request.target,
         include_features=request.include_features,
         prices=prices,
-        news=news,
-        blind=blind,
-        naver_forum=naver_forum,
-        filings=filings,
+        news=[],
+        blind=[],
+        naver_forum=[],
+        filings=[],
+        daily_features=daily_features,
     )
     
     return prediction
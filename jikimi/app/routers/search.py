@@ -0,0 +1,79 @@
+"""Full-text search endpoint across news, social posts and filings."""
+
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+
+from app.config import settings
+from app.deps import DbSession
+from app.errors import ValidationError
+from app.repositories.search_repo import SearchSort, get_search_repo
+from app.schemas.search import PaginatedSearchHits, SearchType
+from app.utils.text_search import bigram_tsquery
+from app.utils.time import parse_ts
+
+router = APIRouter(tags=["search"])
+
+
+@router.get("/search", response_model=PaginatedSearchHits)
+async def search(
+    session: DbSession,
+    q: Annotated[
+        str,
+        Query(
+            min_length=1,
+            max_length=200,
+            description="Search text (Korean matched by character bigrams)",
+        ),
+    ],
+    types: Annotated[
+        list[SearchType] | None, Query(description="Item types to search (default: all)")
+    ] = None,
+    company_id: Annotated[str | None, Query(description="Only items of this company")] = None,
+    start: Annotated[str | None, Query(description="Start time (RFC3339)")] = None,
+    end: Annotated[str | None, Query(description="End time (RFC3339)")] = None,
+    sort: Annotated[SearchSort, Query(description="relevance or recent")] = "relevance",
+    limit: Annotated[int, Query(ge=1, le=settings.max_page_size)] = 50,
+    cursor: Annotated[str | None, Query(description="Pagination cursor")] = None,
+) -> PaginatedSearchHits:
+    """Search news, social posts and DART filings.
+
+    Every query word must appear in the title or body. Words match anywhere
+    inside longer words, so 반도체 finds 삼성반도체 and 실적 finds 실적이.
+
+    Args:
+        session: Database session
+        q: Search text
+        types: Item types to search
+        company_id: Company filter
+        start: Start timestamp (inclusive)
+        end: End timestamp (exclusive)
+        sort: Order by relevance (default) or recency
+        limit: Maximum results per page
+        cursor: Pagination cursor (valid for the same query, filters and sort)
+
+    Returns:
+        Paginated search hits
+
+    Raises:
+        ValidationError: If the query has no letters or digits
+    """
+    if bigram_tsquery(q) is None:
+        raise ValidationError("q must contain letters or digits")
+    start_dt: datetime | None = parse_ts(start) if start else None
+    end_dt: datetime | None = parse_ts(end) if end else None
+
+    repo = await get_search_repo(session)
+    hits, next_cursor = await repo.search(
+        query=q,
+        types=types or ["news", "social", "filing"],
+        company_id=company_id,
+        start=start_dt,
+        end=end_dt,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+    )
+
+    return PaginatedSearchHits(data=hits, next_cursor=next_cursor)
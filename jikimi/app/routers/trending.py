@@ -0,0 +1,71 @@
+"""Trending companies endpoint."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Query, Request, Response
+
+from app.schemas.trending import TrendingResponse, TrendingSort
+from app.services.http_cache import cached_response
+from app.services.trending import HOUR_SLOTS, MINUTE_SLOTS, get_trending_counter
+from app.utils.time import now_utc
+
+router = APIRouter(tags=["trending"])
+
+
+@router.get("/trending", response_model=TrendingResponse)
+async def get_trending(
+    request: Request,
+    sort: Annotated[
+        TrendingSort, Query(description="velocity, engagement or sentiment_shift (absolute change)")
+    ] = "velocity",
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    window_minutes: Annotated[
+        int, Query(ge=5, le=MINUTE_SLOTS, description="Recent window")
+    ] = 60,
+    baseline_hours: Annotated[
+        int,
+        Query(ge=1, le=HOUR_SLOTS - 2, description="Hours before the window to compare against"),
+    ] = 24,
+    min_mentions: Annotated[
+        int, Query(ge=1, description="Leave out companies with fewer window mentions")
+    ] = 3,
+) -> Response:
+    """Get the companies heating up right now.
+
+    Ranks every company from the in-process mention counters fed by
+    ingestion (news and 블라인드/종토방 posts), without querying the item
+    tables. ``velocity`` is how far the window's mentions exceed the
+    company's own baseline rate; ``engagement`` is the window's replies and
+    likes; ``sentiment_shift`` is the change of the mean sentiment score
+    against the baseline.
+
+    Args:
+        request: Incoming request (cache key and conditional headers)
+        sort: Ranking key
+        limit: Maximum number of companies
+        window_minutes: Recent window in minutes
+        baseline_hours: Baseline length in hours
+        min_mentions: Minimum mentions in the window
+
+    Returns:
+        Ranked companies
+    """
+    async def build() -> TrendingResponse:
+        now = now_utc()
+        ranked = get_trending_counter().rank(
+            sort=sort,
+            limit=limit,
+            window_minutes=window_minutes,
+            baseline_hours=baseline_hours,
+            min_mentions=min_mentions,
+            now=now,
+        )
+        return TrendingResponse(
+            as_of=now,
+            window_minutes=window_minutes,
+            baseline_hours=baseline_hours,
+            sort=sort,
+            data=ranked,
+        )
+
+    return await cached_response(request, "trending", build)
@@ -0,0 +1,72 @@
+"""블라인드 department analytics schemas."""
+
+from datetime import date
+
+from pydantic import BaseModel, Field
+
+
+class BlindDeptDay(BaseModel):
+    """One company/department/day row of the ``blind_dept_daily`` table."""
+
+    dept: str = Field(description="Department")
+    day: date = Field(description="UTC calendar day")
+    post_count: int = Field(default=0, description="Posts on the day")
+    reply_count: int = Field(default=0, description="Sum of reply counts")
+    like_count: int = Field(default=0, description="Sum of like counts")
+    scored: int = Field(default=0, description="Posts with sentiment")
+    positive: int = Field(default=0, description="Posts labeled positive")
+    negative: int = Field(default=0, description="Posts labeled negative")
+    neutral: int = Field(default=0, description="Posts labeled neutral")
+    score_sum: float = Field(default=0.0, description="Sum of sentiment scores")
+
+
+class BlindDeptWindow(BaseModel):
+    """A department's totals over the last ``days`` days."""
+
+    days: int = Field(description="Window length in days (ending at the report day)")
+    posts: int = Field(description="Posts in the window")
+    engagement: int = Field(description="Sum of reply_count + like_count")
+    scored: int = Field(description="Posts with sentiment")
+    positive: int = Field(description="Posts labeled positive")
+    negative: int = Field(description="Posts labeled negative")
+    neutral: int = Field(description="Posts labeled neutral")
+    mean_score: float | None = Field(description="Mean sentiment score of the scored posts")
+
+
+class BlindDeptStats(BaseModel):
+    """One department's windows and sentiment trend."""
+
+    dept: str = Field(description="Department")
+    windows: list[BlindDeptWindow] = Field(
+        description="One entry per requested window, shortest first"
+    )
+    sentiment_trend: float | None = Field(
+        description="Mean score of the shortest window minus the rest of the longest window"
+    )
+
+
+class BlindDeptReport(BaseModel):
+    """블라인드 activity of a company broken down by department."""
+
+    company_id: str = Field(description="Company identifier")
+    as_of: date = Field(description="Last day (UTC) included in every window")
+    windows: list[int] = Field(description="Window lengths in days, shortest first")
+    data: list[BlindDeptStats] = Field(
+        description="Departments, most posts in the longest window first"
+    )
+
+    model_config = {"json_schema_extra": {"example": {
+        "company_id": "005930",
+        "as_of": "2025-11-02",
+        "windows": [7, 30],
+        "data": [{
+            "dept": "경영지원",
+            "windows": [
+                {"days": 7, "posts": 14, "engagement": 212, "scored": 14, "positive": 3,
+                 "negative": 8, "neutral": 3, "mean_score": -0.21},
+                {"days": 30, "posts": 51, "engagement": 733, "scored": 50, "positive": 17,
+                 "negative": 19, "neutral": 14, "mean_score": 0.02}
+            ],
+            "sentiment_trend": -0.29
+        }]
+    }}}
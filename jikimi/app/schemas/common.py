@@ -4,11 +4,13 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
+SentimentLabel = Literal["positive", "neutral", "negative"]
+
 
 class Sentiment(BaseModel):
     """Sentiment analysis result with stock-impact score."""
     
-    label: Literal["positive", "neutral", "negative"]
+    label: SentimentLabel
     score: float = Field(ge=-1.0, le=1.0, description="Sentiment score from -1 to 1")
     confidence: float = Field(ge=0.0, le=1.0, description="Confidence level from 0 to 1")
     rationale: str | None = Field(default=None, description="Optional explanation for the sentiment")
@@ -20,3 +22,29 @@ class Sentiment(BaseModel):
         "rationale": "Strong positive indicators in company fundamentals"
     }}}
 
+
+class SentimentFilter(BaseModel):
+    """Sentiment conditions for list endpoints (``label=``, ``min_score=``, ``min_confidence=``).
+
+    Items without sentiment never match a filter with any condition set.
+    """
+
+    label: SentimentLabel | None = None
+    min_score: float | None = Field(default=None, ge=-1.0, le=1.0)
+    min_confidence: float | None = Field(default=None, ge=0.0, le=1.0)
+
+    def is_empty(self) -> bool:
+        """Whether no condition is set."""
+        return self.label is None and self.min_score is None and self.min_confidence is None
+
+    def matches(self, sentiment: Sentiment | None) -> bool:
+        """Whether ``sentiment`` meets every condition (for in-memory data)."""
+        if self.is_empty():
+            return True
+        if sentiment is None:
+            return False
+        return (
+            (self.label is None or sentiment.label == self.label)
+            and (self.min_score is None or sentiment.score >= self.min_score)
+            and (self.min_confidence is None or sentiment.confidence >= self.min_confidence)
+        )
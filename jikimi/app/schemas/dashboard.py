@@ -0,0 +1,47 @@
+"""Company dashboard schemas."""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from app.schemas.company import Company
+from app.schemas.intelligence import PaginatedArticles, PaginatedFilings, PaginatedSocialPosts
+from app.schemas.market import PriceSeries
+
+DashboardComponent = Literal["company", "prices", "news", "blind", "naver_forum", "filings"]
+
+
+class CompanyDashboard(BaseModel):
+    """Everything a company page shows, fetched in one request.
+
+    Components that were not requested, or missed their deadline, are null;
+    the latter are also listed in ``timed_out``.
+    """
+
+    company_id: str = Field(description="Company identifier")
+    company: Company | None = Field(default=None, description="Company details")
+    prices: PriceSeries | None = Field(default=None, description="Daily candles")
+    news: PaginatedArticles | None = Field(default=None, description="Latest news (first page)")
+    blind: PaginatedSocialPosts | None = Field(
+        default=None, description="Latest 블라인드 posts (first page)"
+    )
+    naver_forum: PaginatedSocialPosts | None = Field(
+        default=None, description="Latest 네이버 종토방 posts (first page)"
+    )
+    filings: PaginatedFilings | None = Field(
+        default=None, description="Latest DART filings (first page)"
+    )
+    timed_out: list[DashboardComponent] = Field(
+        default_factory=list, description="Requested components that missed their deadline"
+    )
+
+    model_config = {"json_schema_extra": {"example": {
+        "company_id": "005930",
+        "company": {"id": "005930", "name": "삼성전자", "ticker": "005930.KS", "sector": "반도체"},
+        "prices": None,
+        "news": {"data": [], "next_cursor": None},
+        "blind": {"data": [], "next_cursor": None},
+        "naver_forum": {"data": [], "next_cursor": None},
+        "filings": {"data": [], "next_cursor": None},
+        "timed_out": ["prices"]
+    }}}
@@ -1,7 +1,7 @@
 """Intelligence data schemas (news, social, filings)."""
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -19,6 +19,12 @@ class Article(BaseModel):
     summary: str | None = Field(default=None, description="Article summary")
     sentiment: Sentiment | None = Field(default=None, description="Stock-impact sentiment")
     company_id: str = Field(description="Related company ID")
+    story_id: str | None = Field(
+        default=None, description="Near-duplicate story the article belongs to"
+    )
+    story_size: int | None = Field(
+        default=None, description="Articles in the story (set with collapse=story)"
+    )
 
     model_config = {"json_schema_extra": {"example": {
         "id": "article_123",
@@ -28,7 +34,8 @@ class Article(BaseModel):
         "published_at": "2025-11-02T10:00:00Z",
         "summary": "삼성전자가 새로운 반도체 생산시설 건설을 발표했습니다.",
         "sentiment": {"label": "positive", "score": 0.8, "confidence": 0.9},
-        "company_id": "005930"
+        "company_id": "005930",
+        "story_id": "story_3f9c2a71b0de"
     }}}
 
 
@@ -73,6 +80,7 @@ class Filing(BaseModel):
     summary: str | None = Field(default=None, description="Filing summary")
     sentiment: Sentiment | None = Field(default=None, description="Stock-impact sentiment")
     company_id: str = Field(description="Related company ID")
+    rcept_no: str | None = Field(default=None, description="DART receipt number (접수번호)")
 
     model_config = {"json_schema_extra": {"example": {
         "id": "filing_789",
@@ -107,6 +115,50 @@ class PaginatedFilings(BaseModel):
     next_cursor: str | None = Field(default=None, description="Cursor for next page")
 
 
+TimelineSource = Literal["news", "blind", "naver_forum", "dart"]
+
+
+class TimelineItem(BaseModel):
+    """One entry of a company's merged intelligence timeline."""
+
+    type: TimelineSource = Field(description="Source the item comes from")
+    timestamp: datetime = Field(description="published_at, posted_at or filed_at (UTC)")
+    item: Article | SocialPost | Filing = Field(description="The article, post or filing")
+
+
+class PaginatedTimeline(BaseModel):
+    """Paginated company timeline, newest first."""
+
+    data: list[TimelineItem] = Field(description="Timeline items")
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for next page (holds each source's position)"
+    )
+
+
+class CompanyLatest(BaseModel):
+    """Newest items of one company in a multi-company batch read."""
+
+    company_id: str = Field(description="Company identifier")
+    news: list[Article] | None = Field(
+        default=None, description="Newest articles (null if not requested)"
+    )
+    blind: list[SocialPost] | None = Field(
+        default=None, description="Newest 블라인드 posts (null if not requested)"
+    )
+    naver_forum: list[SocialPost] | None = Field(
+        default=None, description="Newest 종토방 posts (null if not requested)"
+    )
+    dart: list[Filing] | None = Field(
+        default=None, description="Newest DART filings (null if not requested)"
+    )
+
+
+class BatchLatest(BaseModel):
+    """Newest items of many companies, in the requested company order."""
+
+    data: list[CompanyLatest] = Field(description="One entry per requested company")
+
+
 # ========== Request schemas for creating intelligence data ==========
 
 class CreateArticleRequest(BaseModel):
@@ -173,6 +225,11 @@ class CreateFilingRequest(BaseModel):
     url: str | None = Field(default=None, max_length=1000, description="DART filing URL")
     summary: str | None = Field(default=None, max_length=5000, description="Filing summary")
     company_id: str = Field(min_length=1, max_length=20, description="Related company ID (stock code)")
+    rcept_no: str | None = Field(
+        default=None,
+        pattern=r"^\d{14}$",
+        description="DART receipt number (접수번호); read from the URL's rcpNo if omitted",
+    )
     
     model_config = {"json_schema_extra": {"example": {
         "title": "분기보고서 (2025.09)",
@@ -183,3 +240,75 @@ class CreateFilingRequest(BaseModel):
         "company_id": "005930"
     }}}
 
+
+# ========== Bulk ingestion ==========
+
+# Upper bound on items per bulk request (keeps one INSERT under the bind-parameter limit)
+MAX_BULK_ITEMS = 1000
+
+
+class BulkCreateArticlesRequest(BaseModel):
+    """Request to create many news articles for one company."""
+
+    items: list[dict[str, Any]] = Field(
+        min_length=1,
+        max_length=MAX_BULK_ITEMS,
+        description=(
+            "Articles to create (CreateArticleRequest each; invalid items are reported per item)"
+        ),
+    )
+
+
+class BulkCreateSocialPostsRequest(BaseModel):
+    """Request to create many social posts for one company."""
+
+    items: list[dict[str, Any]] = Field(
+        min_length=1,
+        max_length=MAX_BULK_ITEMS,
+        description=(
+            "Posts to create (CreateSocialPostRequest each; invalid items are reported per item)"
+        ),
+    )
+
+
+class BulkCreateFilingsRequest(BaseModel):
+    """Request to create many DART filings for one company."""
+
+    items: list[dict[str, Any]] = Field(
+        min_length=1,
+        max_length=MAX_BULK_ITEMS,
+        description=(
+            "Filings to create (CreateFilingRequest each; invalid items are reported per item)"
+        ),
+    )
+
+
+class BulkItemResult(BaseModel):
+    """Outcome for one item of a bulk request."""
+
+    index: int = Field(description="Position of the item in the request")
+    status: Literal["created", "duplicate", "error"] = Field(description="Item outcome")
+    id: str | None = Field(
+        default=None, description="Created ID, or the existing ID for duplicates"
+    )
+    error: str | None = Field(default=None, description="Reason the item was rejected")
+
+
+class BulkIngestResponse(BaseModel):
+    """Per-item results of a bulk request."""
+
+    created: int = Field(description="Number of rows inserted")
+    duplicates: int = Field(description="Items already stored or repeated within the request")
+    failed: int = Field(description="Items rejected")
+    results: list[BulkItemResult] = Field(description="Per-item results in request order")
+
+    model_config = {"json_schema_extra": {"example": {
+        "created": 1,
+        "duplicates": 1,
+        "failed": 1,
+        "results": [
+            {"index": 0, "status": "created", "id": "article_1a2b3c4d5e6f", "error": None},
+            {"index": 1, "status": "duplicate", "id": "article_1a2b3c4d5e6f", "error": None},
+            {"index": 2, "status": "error", "id": None, "error": "company_id must match the path"}
+        ]
+    }}}
@@ -1,6 +1,6 @@
 """Price prediction schemas."""
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -92,3 +92,33 @@ class PricePrediction(BaseModel):
         "rationale_md": "Based on recent positive news and strong price momentum..."
     }}}
 
+
+
+class DailyFeatures(BaseModel):
+    """Per-company, per-day intelligence aggregates from the feature store.
+
+    The ``news_*hours_sum`` columns hold epoch-hour sums over scored articles so
+    the linear recency decay can be evaluated without the raw rows.
+    """
+
+    company_id: str = Field(description="Company identifier")
+    day: date = Field(description="UTC calendar day")
+    news_count: int = Field(default=0, description="Articles published that day")
+    news_positive: int = Field(default=0, description="Articles labeled positive")
+    news_negative: int = Field(default=0, description="Articles labeled negative")
+    news_neutral: int = Field(default=0, description="Articles labeled neutral")
+    news_scored: int = Field(default=0, description="Articles with sentiment")
+    news_score_sum: float = Field(default=0.0, description="Sum of sentiment scores")
+    news_score_hours_sum: float = Field(default=0.0, description="Sum of score * epoch hours")
+    news_hours_sum: float = Field(
+        default=0.0, description="Sum of epoch hours over scored articles"
+    )
+    blind_count: int = Field(default=0, description="블라인드 posts")
+    blind_engagement: int = Field(default=0, description="블라인드 replies + likes")
+    blind_positive: int = Field(default=0, description="블라인드 posts labeled positive")
+    naver_forum_count: int = Field(default=0, description="네이버 종토방 posts")
+    naver_forum_engagement: int = Field(default=0, description="네이버 종토방 replies + likes")
+    filings_count: int = Field(default=0, description="DART filings")
+    last_filed_at: datetime | None = Field(
+        default=None, description="Latest filing timestamp that day"
+    )
@@ -0,0 +1,45 @@
+"""Full-text search schemas."""
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from app.schemas.common import Sentiment
+
+SearchType = Literal["news", "social", "filing"]
+
+
+class SearchHit(BaseModel):
+    """One matching news article, social post or filing."""
+
+    type: SearchType = Field(description="Which table the hit comes from")
+    id: str = Field(description="Article, post or filing ID")
+    company_id: str = Field(description="Related company ID")
+    title: str | None = Field(default=None, description="Title (posts may have none)")
+    snippet: str | None = Field(default=None, description="Summary or start of the content")
+    source: str = Field(description="News source, social platform or filing type")
+    url: str | None = Field(default=None, description="Original URL")
+    published_at: datetime = Field(description="Publication, post or filing time (UTC)")
+    sentiment: Sentiment | None = Field(default=None, description="Stock-impact sentiment")
+    rank: float = Field(description="Relevance (higher is better)")
+
+    model_config = {"json_schema_extra": {"example": {
+        "type": "news",
+        "id": "article_123",
+        "company_id": "005930",
+        "title": "삼성전자, 신규 반도체 공장 건설 발표",
+        "snippet": "삼성전자가 새로운 반도체 생산시설 건설을 발표했습니다.",
+        "source": "한국경제",
+        "url": "https://example.com/article/123",
+        "published_at": "2025-11-02T10:00:00Z",
+        "sentiment": {"label": "positive", "score": 0.8, "confidence": 0.9},
+        "rank": 0.42
+    }}}
+
+
+class PaginatedSearchHits(BaseModel):
+    """Paginated search results."""
+
+    data: list[SearchHit] = Field(description="Matching items, best first")
+    next_cursor: str | None = Field(default=None, description="Cursor for next page")
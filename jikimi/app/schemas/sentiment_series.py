@@ -0,0 +1,72 @@
+"""Sentiment time-series schemas."""
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+SentimentBucket = Literal["1h", "1d"]
+SentimentSource = Literal["news", "blind", "naver_forum", "dart"]
+
+
+class SentimentRollup(BaseModel):
+    """One company/source/bucket row of the ``sentiment_rollups`` table.
+
+    ``score_hours_sum`` and ``hours_sum`` are epoch-hour sums over scored
+    items, so recency decay can be evaluated inside the bucket.
+    """
+
+    source: SentimentSource = Field(description="Item source")
+    bucket_start: datetime = Field(description="Bucket start (UTC)")
+    item_count: int = Field(default=0, description="Items in the bucket")
+    scored: int = Field(default=0, description="Items with sentiment")
+    positive: int = Field(default=0, description="Items labeled positive")
+    negative: int = Field(default=0, description="Items labeled negative")
+    neutral: int = Field(default=0, description="Items labeled neutral")
+    score_sum: float = Field(default=0.0, description="Sum of sentiment scores")
+    score_hours_sum: float = Field(default=0.0, description="Sum of score * epoch hours")
+    hours_sum: float = Field(default=0.0, description="Sum of epoch hours over scored items")
+
+
+class SentimentPoint(BaseModel):
+    """Sentiment of one time bucket, summed over the requested sources."""
+
+    bucket_start: datetime = Field(description="Bucket start (UTC)")
+    count: int = Field(description="Items in the bucket")
+    scored: int = Field(description="Items with sentiment")
+    positive: int = Field(description="Items labeled positive")
+    negative: int = Field(description="Items labeled negative")
+    neutral: int = Field(description="Items labeled neutral")
+    mean_score: float | None = Field(description="Mean score of the bucket's scored items")
+    decayed_score: float | None = Field(
+        description="Exponentially decayed mean score of all items up to the bucket end"
+    )
+
+
+class SentimentSeries(BaseModel):
+    """Sentiment index of a company over time."""
+
+    company_id: str = Field(description="Company identifier")
+    bucket: SentimentBucket = Field(description="Bucket width")
+    sources: list[SentimentSource] = Field(description="Sources summed into each point")
+    half_life_hours: float = Field(description="Half-life of the decayed score")
+    points: list[SentimentPoint] = Field(
+        description="One point per bucket, oldest first (empty buckets included)"
+    )
+
+    model_config = {"json_schema_extra": {"example": {
+        "company_id": "005930",
+        "bucket": "1d",
+        "sources": ["news", "blind"],
+        "half_life_hours": 72.0,
+        "points": [{
+            "bucket_start": "2025-11-01T00:00:00Z",
+            "count": 12,
+            "scored": 11,
+            "positive": 6,
+            "negative": 2,
+            "neutral": 3,
+            "mean_score": 0.31,
+            "decayed_score": 0.27
+        }]
+    }}}
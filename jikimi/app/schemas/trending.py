@@ -0,0 +1,70 @@
+"""Trending company schemas."""
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+TrendingSort = Literal["velocity", "engagement", "sentiment_shift"]
+TrendingResolution = Literal["minute", "hour"]
+
+
+class TrendingSlot(BaseModel):
+    """One ring-buffer slot of a company's counters (a ``trending_counters`` row)."""
+
+    company_id: str = Field(description="Company identifier")
+    resolution: TrendingResolution = Field(description="Slot width")
+    slot_start: datetime = Field(description="Slot start (UTC)")
+    mentions: int = Field(description="News articles and posts in the slot")
+    engagement: int = Field(description="Sum of reply_count + like_count")
+    scored: int = Field(description="Mentions with sentiment")
+    score_sum: float = Field(description="Sum of sentiment scores")
+
+
+class TrendingCompany(BaseModel):
+    """A company's recent activity against its own baseline."""
+
+    company_id: str = Field(description="Company identifier")
+    mentions: int = Field(description="News articles and posts in the window")
+    expected_mentions: float = Field(
+        description="Mentions the baseline rate predicts for the window"
+    )
+    velocity: float = Field(
+        description=(
+            "(mentions - expected) / sqrt(expected + 1): "
+            "how far above its usual rate the company is"
+        )
+    )
+    engagement: int = Field(description="Replies and likes of the window's posts")
+    sentiment: float | None = Field(description="Mean sentiment score in the window")
+    baseline_sentiment: float | None = Field(
+        description="Mean sentiment score over the baseline hours"
+    )
+    sentiment_shift: float | None = Field(description="sentiment - baseline_sentiment")
+
+
+class TrendingResponse(BaseModel):
+    """Companies ranked by recent activity."""
+
+    as_of: datetime = Field(description="Time the ranking was computed")
+    window_minutes: int = Field(description="Recent window")
+    baseline_hours: int = Field(description="Hours before the window used as the baseline")
+    sort: TrendingSort = Field(description="Ranking key")
+    data: list[TrendingCompany] = Field(description="Companies, highest ranked first")
+
+    model_config = {"json_schema_extra": {"example": {
+        "as_of": "2025-11-03T05:12:00Z",
+        "window_minutes": 60,
+        "baseline_hours": 24,
+        "sort": "velocity",
+        "data": [{
+            "company_id": "005930",
+            "mentions": 48,
+            "expected_mentions": 9.5,
+            "velocity": 11.9,
+            "engagement": 1320,
+            "sentiment": 0.41,
+            "baseline_sentiment": 0.12,
+            "sentiment_shift": 0.29
+        }]
+    }}}
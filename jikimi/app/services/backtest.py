@@ -0,0 +1,427 @@
+"""Offline backtesting of the prediction pipeline over historical snapshots."""
+
+import asyncio
+import json
+import math
+import time
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Protocol
+
+from app.schemas.intelligence import Article, Filing, SocialPost
+from app.schemas.market import PriceSeries
+from app.schemas.prediction import PricePrediction
+from app.services.llm_gateway import LLMGateway
+from app.services.prediction import _assemble_features, predict_price
+from app.utils.time import to_rfc3339
+
+# Windows mirror the live /predict-price router so backtests see the same inputs
+PRICE_LOOKBACK_DAYS = 90
+INTEL_LOOKBACK_DAYS = 30
+INTEL_LIMIT = 100
+FILINGS_LIMIT = 50
+
+
+@dataclass
+class Snapshot:
+    """Point-in-time view of a company's data as it was known at ``as_of``."""
+
+    company_id: str
+    ticker: str | None
+    as_of: datetime
+    prices: PriceSeries
+    news: list[Article]
+    blind: list[SocialPost]
+    naver_forum: list[SocialPost]
+    filings: list[Filing]
+
+
+@dataclass
+class CompanyHistory:
+    """Full history for one company, sliced into snapshots without lookahead.
+
+    All lists are kept sorted ascending by timestamp so a snapshot is a pair of
+    binary searches per source instead of a scan.
+    """
+
+    company_id: str
+    ticker: str | None
+    prices: PriceSeries
+    news: list[Article] = field(default_factory=list)
+    blind: list[SocialPost] = field(default_factory=list)
+    naver_forum: list[SocialPost] = field(default_factory=list)
+    filings: list[Filing] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.prices.candles.sort(key=lambda c: c.t)
+        self.news.sort(key=lambda a: a.published_at)
+        self.blind.sort(key=lambda p: p.posted_at)
+        self.naver_forum.sort(key=lambda p: p.posted_at)
+        self.filings.sort(key=lambda f: f.filed_at)
+        self._candle_ts = [c.t for c in self.prices.candles]
+        self._news_ts = [a.published_at for a in self.news]
+        self._blind_ts = [p.posted_at for p in self.blind]
+        self._forum_ts = [p.posted_at for p in self.naver_forum]
+        self._filing_ts = [f.filed_at for f in self.filings]
+
+    def snapshot(self, as_of: datetime) -> Snapshot:
+        """Build the snapshot visible at ``as_of`` (strictly earlier timestamps only).
+
+        Args:
+            as_of: Snapshot time
+
+        Returns:
+            Snapshot with the same windows and limits as the live router
+        """
+        price_start = as_of - timedelta(days=PRICE_LOOKBACK_DAYS)
+        intel_start = as_of - timedelta(days=INTEL_LOOKBACK_DAYS)
+
+        lo, hi = bisect_left(self._candle_ts, price_start), bisect_left(self._candle_ts, as_of)
+        prices = PriceSeries(company=self.prices.company, candles=self.prices.candles[lo:hi])
+
+        return Snapshot(
+            company_id=self.company_id,
+            ticker=self.ticker,
+            as_of=as_of,
+            prices=prices,
+            news=_latest(self.news, self._news_ts, intel_start, as_of, INTEL_LIMIT),
+            blind=_latest(self.blind, self._blind_ts, intel_start, as_of, INTEL_LIMIT),
+            naver_forum=_latest(self.naver_forum, self._forum_ts, intel_start, as_of, INTEL_LIMIT),
+            filings=_latest(self.filings, self._filing_ts, intel_start, as_of, FILINGS_LIMIT),
+        )
+
+    def realized_return(self, as_of: datetime, horizon_days: int) -> float | None:
+        """Return realized between the last close before ``as_of`` and the horizon close.
+
+        Args:
+            as_of: Snapshot time
+            horizon_days: Prediction horizon
+
+        Returns:
+            Realized return, or None if either side of the window has no candle
+        """
+        ref_idx = bisect_left(self._candle_ts, as_of) - 1
+        end_idx = bisect_left(self._candle_ts, as_of + timedelta(days=horizon_days)) - 1
+        if ref_idx < 0 or end_idx <= ref_idx:
+            return None
+
+        ref_close = self.prices.candles[ref_idx].c
+        return (self.prices.candles[end_idx].c - ref_close) / ref_close if ref_close else None
+
+
+def _latest(
+    items: list[Any], ts: list[datetime], start: datetime, end: datetime, limit: int
+) -> list[Any]:
+    """Return up to ``limit`` items in ``[start, end)``, newest first (router order)."""
+    lo, hi = bisect_left(ts, start), bisect_left(ts, end)
+    return items[max(lo, hi - limit):hi][::-1]
+
+
+class Predictor(Protocol):
+    """Pluggable predictor producing a horizon return from a snapshot.
+
+    Implementations must be picklable so they can be shipped to worker processes.
+    """
+
+    name: str
+
+    def predict(self, snapshot: Snapshot, features: dict[str, Any], horizon_days: int) -> float:
+        """Predict the return over ``horizon_days`` from ``snapshot``."""
+        ...
+
+
+class MomentumPredictor:
+    """Local baseline model: drift from mean daily return plus a news sentiment tilt."""
+
+    name = "momentum"
+
+    def __init__(self, sentiment_weight: float = 0.01) -> None:
+        self.sentiment_weight = sentiment_weight
+
+    def predict(self, snapshot: Snapshot, features: dict[str, Any], horizon_days: int) -> float:
+        drift = float(features.get("returns_mean", 0.0)) * horizon_days
+        tilt = float(features.get("news_weighted_sentiment", 0.0)) * self.sentiment_weight
+        return drift + tilt
+
+
+class ReplayPredictor:
+    """Replays predictions recorded by a previous run (see ``write_recording``)."""
+
+    name = "replay"
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = str(path)
+        self._responses: dict[tuple[str, str], float] = {}
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    key = (row["company_id"], row["as_of"])
+                    self._responses[key] = float(row["predicted_return"])
+
+    def predict(self, snapshot: Snapshot, features: dict[str, Any], horizon_days: int) -> float:
+        key = (snapshot.company_id, to_rfc3339(snapshot.as_of))
+        if key not in self._responses:
+            raise KeyError(f"No recorded response for {key[0]} at {key[1]}")
+        return self._responses[key]
+
+
+class LLMPredictor:
+    """Runs the production ``predict_price`` call against OpenAI.
+
+    Each process keeps one event loop and one gateway (with its connection
+    pool and rate limits) for all of its predictions; they are created on the
+    first call, left out when pickled, and released by ``close()``.
+    """
+
+    name = "llm"
+
+    def __init__(self, include_features: dict[str, bool]) -> None:
+        self.include_features = include_features
+        self._runner: asyncio.Runner | None = None
+        self._gateway: LLMGateway | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"include_features": self.include_features}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.include_features = state["include_features"]
+        self._runner = None
+        self._gateway = None
+
+    def predict(self, snapshot: Snapshot, features: dict[str, Any], horizon_days: int) -> float:
+        if self._runner is None:
+            self._runner = asyncio.Runner()
+        prediction = self._runner.run(self._predict(snapshot, horizon_days))
+        current = prediction.current_price or 0.0
+        last = prediction.predicted_series[-1] if prediction.predicted_series else None
+        if last is None or last.price is None or current <= 0:
+            raise ValueError("Prediction has no usable horizon price")
+        return last.price / current - 1.0
+
+    async def _predict(self, snapshot: Snapshot, horizon_days: int) -> PricePrediction:
+        # Built inside the runner's loop, which its client stays bound to
+        if self._gateway is None:
+            self._gateway = LLMGateway.from_settings()
+        return await predict_price(
+            company_id=snapshot.company_id,
+            ticker=snapshot.ticker,
+            horizon_days=horizon_days,
+            target="return",
+            include_features=self.include_features,
+            prices=snapshot.prices,
+            news=snapshot.news,
+            blind=snapshot.blind,
+            naver_forum=snapshot.naver_forum,
+            filings=snapshot.filings,
+            gateway=self._gateway,
+        )
+
+    def close(self) -> None:
+        """Close the gateway and the event loop (recreated if predicting again)."""
+        if self._runner is None:
+            return
+        if self._gateway is not None:
+            self._runner.run(self._gateway.aclose())
+            self._gateway = None
+        self._runner.close()
+        self._runner = None
+
+
+@dataclass
+class BacktestStep:
+    """Outcome of one (company, as_of) evaluation."""
+
+    company_id: str
+    as_of: datetime
+    predicted_return: float | None
+    realized_return: float | None
+    feature_seconds: float
+    predict_seconds: float
+    error: str | None = None
+
+
+@dataclass
+class BacktestReport:
+    """Aggregated backtest results with error metrics and timing."""
+
+    predictor: str
+    steps: list[BacktestStep]
+    wall_seconds: float
+
+    @property
+    def scored(self) -> list[BacktestStep]:
+        """Steps with both a prediction and a realized return."""
+        return [
+            s for s in self.steps
+            if s.error is None and s.predicted_return is not None and s.realized_return is not None
+        ]
+
+    def summary(self) -> dict[str, Any]:
+        """Summarize error metrics, per-step runtime and throughput.
+
+        Returns:
+            JSON-serializable summary dictionary
+        """
+        scored = self.scored
+        errors = [s.predicted_return - s.realized_return for s in scored]  # type: ignore[operator]
+        hits = sum(
+            1 for s in scored
+            if (s.predicted_return or 0.0) * (s.realized_return or 0.0) > 0
+        )
+        n = len(self.steps)
+
+        return {
+            "predictor": self.predictor,
+            "steps": n,
+            "scored": len(scored),
+            "errors": sum(1 for s in self.steps if s.error is not None),
+            "mae": sum(abs(e) for e in errors) / len(errors) if errors else None,
+            "rmse": math.sqrt(sum(e * e for e in errors) / len(errors)) if errors else None,
+            "directional_accuracy": hits / len(scored) if scored else None,
+            "feature_ms_mean": 1000 * sum(s.feature_seconds for s in self.steps) / n if n else 0.0,
+            "predict_ms_mean": 1000 * sum(s.predict_seconds for s in self.steps) / n if n else 0.0,
+            "wall_seconds": self.wall_seconds,
+            "throughput_per_sec": n / self.wall_seconds if self.wall_seconds > 0 else 0.0,
+        }
+
+
+def _run_company(
+    history: CompanyHistory,
+    as_of_dates: list[datetime],
+    predictor: Predictor,
+    horizon_days: int,
+    include: dict[str, bool],
+) -> list[BacktestStep]:
+    """Evaluate every date for one company (runs inside a worker process)."""
+    steps = []
+    for as_of in as_of_dates:
+        snapshot = history.snapshot(as_of)
+        if len(snapshot.prices.candles) < 2:
+            continue
+
+        t0 = time.perf_counter()
+        features = _assemble_features(
+            snapshot.prices,
+            snapshot.news,
+            snapshot.blind,
+            snapshot.naver_forum,
+            snapshot.filings,
+            include,
+            as_of=as_of,
+        )
+        t1 = time.perf_counter()
+
+        predicted: float | None = None
+        error: str | None = None
+        try:
+            predicted = predictor.predict(snapshot, features, horizon_days)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        t2 = time.perf_counter()
+
+        steps.append(
+            BacktestStep(
+                company_id=history.company_id,
+                as_of=as_of,
+                predicted_return=predicted,
+                realized_return=history.realized_return(as_of, horizon_days),
+                feature_seconds=t1 - t0,
+                predict_seconds=t2 - t1,
+                error=error,
+            )
+        )
+    return steps
+
+
+def _close(predictor: Predictor) -> None:
+    """Release what a predictor holds across predictions (``LLMPredictor.close``)."""
+    close = getattr(predictor, "close", None)
+    if close is not None:
+        close()
+
+
+def _run_worker(
+    history: CompanyHistory,
+    as_of_dates: list[datetime],
+    predictor: Predictor,
+    horizon_days: int,
+    include: dict[str, bool],
+) -> list[BacktestStep]:
+    """Evaluate one company in a worker process, then release the predictor's copy."""
+    try:
+        return _run_company(history, as_of_dates, predictor, horizon_days, include)
+    finally:
+        _close(predictor)
+
+
+def run_backtest(
+    histories: list[CompanyHistory],
+    as_of_dates: list[datetime],
+    predictor: Predictor,
+    horizon_days: int = 7,
+    include: dict[str, bool] | None = None,
+    workers: int = 1,
+) -> BacktestReport:
+    """Replay every (company, date) pair through features + predictor.
+
+    Work is partitioned by company so each history is pickled to a worker once.
+
+    Args:
+        histories: Per-company histories
+        as_of_dates: Snapshot times to evaluate
+        predictor: Predictor implementation
+        horizon_days: Prediction horizon
+        include: Feature inclusion flags (defaults to all enabled)
+        workers: Process pool size; 1 runs inline
+
+    Returns:
+        BacktestReport with all steps
+    """
+    if include is None:
+        include = dict.fromkeys(("prices", "news", "blind", "naver_forum", "filings"), True)
+
+    start = time.perf_counter()
+    steps: list[BacktestStep] = []
+
+    if workers <= 1:
+        try:
+            for history in histories:
+                steps.extend(_run_company(history, as_of_dates, predictor, horizon_days, include))
+        finally:
+            _close(predictor)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_run_worker, history, as_of_dates, predictor, horizon_days, include)
+                for history in histories
+            ]
+            for future in futures:
+                steps.extend(future.result())
+
+    return BacktestReport(
+        predictor=predictor.name,
+        steps=steps,
+        wall_seconds=time.perf_counter() - start,
+    )
+
+
+def write_recording(report: BacktestReport, path: str | Path) -> None:
+    """Write predictions as JSONL so a later run can replay them with ``ReplayPredictor``.
+
+    Args:
+        report: Backtest report
+        path: Output file path
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        for step in report.steps:
+            if step.predicted_return is None:
+                continue
+            f.write(json.dumps({
+                "company_id": step.company_id,
+                "as_of": to_rfc3339(step.as_of),
+                "predicted_return": step.predicted_return,
+            }) + "\n")
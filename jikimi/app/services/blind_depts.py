@@ -0,0 +1,95 @@
+"""블라인드 department analytics from the ``blind_dept_daily`` table.
+
+``summarize_depts`` sums day rows (see ``BlindDeptsRepository``) into
+per-department windows that all end on the report day.
+"""
+
+from datetime import date, timedelta
+
+from app.schemas.blind_depts import BlindDeptDay, BlindDeptStats, BlindDeptWindow
+
+DEFAULT_WINDOWS = (7, 30, 90)
+
+MAX_WINDOW_DAYS = 365
+
+
+def summarize_depts(
+    rows: list[BlindDeptDay],
+    windows: list[int],
+    end_day: date,
+    min_posts: int = 1,
+) -> list[BlindDeptStats]:
+    """Sum department day rows into windows ending on ``end_day``.
+
+    A window of ``n`` days covers ``end_day - n + 1`` through ``end_day``.
+    The sentiment trend compares the shortest window's mean score with the
+    mean over the rest of the longest window, so it is positive when a
+    department has turned more positive recently.
+
+    Args:
+        rows: Day rows (rows outside the longest window are ignored)
+        windows: Window lengths in days, ascending and distinct
+        end_day: Last day of every window
+        min_posts: Departments with fewer posts in the longest window are dropped
+
+    Returns:
+        Departments ordered by posts in the longest window (descending), then name
+    """
+    totals: dict[str, list[BlindDeptDay]] = {}
+    for row in rows:
+        age = (end_day - row.day).days
+        if age < 0 or age >= windows[-1]:
+            continue
+        window_totals = totals.setdefault(
+            row.dept, [BlindDeptDay(dept=row.dept, day=end_day) for _ in windows]
+        )
+        for total, days in zip(window_totals, windows, strict=True):
+            if age < days:
+                _add(total, row)
+
+    stats: list[BlindDeptStats] = []
+    for dept, window_totals in totals.items():
+        longest = window_totals[-1]
+        if longest.post_count < min_posts:
+            continue
+        shortest = window_totals[0]
+        earlier = longest.scored - shortest.scored
+        trend = None
+        if len(windows) > 1 and shortest.scored > 0 and earlier > 0:
+            earlier_mean = (longest.score_sum - shortest.score_sum) / earlier
+            trend = shortest.score_sum / shortest.scored - earlier_mean
+        stats.append(BlindDeptStats(
+            dept=dept,
+            windows=[
+                BlindDeptWindow(
+                    days=days,
+                    posts=total.post_count,
+                    engagement=total.reply_count + total.like_count,
+                    scored=total.scored,
+                    positive=total.positive,
+                    negative=total.negative,
+                    neutral=total.neutral,
+                    mean_score=total.score_sum / total.scored if total.scored > 0 else None,
+                )
+                for total, days in zip(window_totals, windows, strict=True)
+            ],
+            sentiment_trend=trend,
+        ))
+    stats.sort(key=lambda s: (-s.windows[-1].posts, s.dept))
+    return stats
+
+
+def window_start(windows: list[int], end_day: date) -> date:
+    """First day of the longest window."""
+    return end_day - timedelta(days=windows[-1] - 1)
+
+
+def _add(total: BlindDeptDay, row: BlindDeptDay) -> None:
+    total.post_count += row.post_count
+    total.reply_count += row.reply_count
+    total.like_count += row.like_count
+    total.scored += row.scored
+    total.positive += row.positive
+    total.negative += row.negative
+    total.neutral += row.neutral
+    total.score_sum += row.score_sum
@@ -0,0 +1,403 @@
+"""In-process company directory for existence checks and typeahead.
+
+The company master list is a few thousand rows that change rarely, yet every
+intelligence POST looks up its company and typeahead searches on every
+keystroke. The directory holds the whole list in memory with:
+
+- a suffix trie over lowercased names, tickers and IDs (a substring match is a
+  prefix of some suffix), so ``전자`` and ``005`` resolve in O(len(q)), and a
+  plain prefix trie for the prefix boost,
+- the same trie over the names' initial consonants, so ``ㅅㅅㅈㅈ`` and mixed
+  input such as ``삼ㅅ`` find 삼성전자,
+- an inverted trigram index for typo matches, ranked like ``pg_trgm``.
+
+Results are ranked and paged exactly like ``CompaniesRepository.search_companies``.
+A background task compares the table's row count and latest ``updated_at``
+every ``settings.company_directory_refresh_seconds`` and rebuilds the
+directory when they change; readers always see one complete snapshot.
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.companies_repo import EXACT_BOOST, PREFIX_BOOST, get_companies_repo
+from app.schemas.company import Company
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.text_search import CHOSEONG, choseong, trigrams
+
+logger = logging.getLogger(__name__)
+
+# Name similarity needed for a typo match (pg_trgm's default similarity_threshold)
+MIN_SIMILARITY = 0.3
+
+_INITIALS = frozenset(CHOSEONG)
+
+
+class _Trie:
+    """Prefix trie whose nodes hold the positions of every key passing through them."""
+
+    __slots__ = ("children", "positions")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Trie] = {}
+        self.positions: set[int] = set()
+
+    def insert(self, key: str, position: int) -> None:
+        node = self
+        for ch in key:
+            node = node.children.setdefault(ch, _Trie())
+            node.positions.add(position)
+
+    def insert_suffixes(self, key: str, position: int) -> None:
+        for start in range(len(key)):
+            self.insert(key[start:], position)
+
+    def find(self, prefix: str) -> list[int]:
+        node = self
+        for ch in prefix:
+            child = node.children.get(ch)
+            if child is None:
+                return []
+            node = child
+        return list(node.positions)
+
+
+@dataclass
+class _Snapshot:
+    """One loaded company list; companies are addressed by position in ID order."""
+
+    companies: list[Company] = field(default_factory=list)
+    ids: list[str] = field(default_factory=list)
+    positions: dict[str, int] = field(default_factory=dict)
+    names: list[str] = field(default_factory=list)
+    initials: list[str] = field(default_factory=list)
+    keys: _Trie = field(default_factory=_Trie)
+    prefixes: _Trie = field(default_factory=_Trie)
+    exact: dict[str, list[int]] = field(default_factory=dict)
+    initial_keys: _Trie = field(default_factory=_Trie)
+    name_trigrams: dict[str, np.ndarray] = field(default_factory=dict)
+    ticker_trigrams: dict[str, np.ndarray] = field(default_factory=dict)
+    name_trigram_counts: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    ticker_trigram_counts: np.ndarray = field(default_factory=lambda: np.zeros(0))
+
+
+def _build(companies: list[Company]) -> _Snapshot:
+    snapshot = _Snapshot(companies=sorted(companies, key=lambda c: c.id))
+    name_index: dict[str, list[int]] = {}
+    ticker_index: dict[str, list[int]] = {}
+    name_counts, ticker_counts = [], []
+    for position, company in enumerate(snapshot.companies):
+        name = company.name.lower()
+        ticker = (company.ticker or "").lower()
+        snapshot.ids.append(company.id)
+        snapshot.positions[company.id] = position
+        snapshot.names.append(name)
+        snapshot.initials.append(choseong(name))
+        for key in {name, ticker, company.id}:
+            snapshot.keys.insert_suffixes(key, position)
+            snapshot.prefixes.insert(key, position)
+            snapshot.exact.setdefault(key, []).append(position)
+        snapshot.initial_keys.insert_suffixes(snapshot.initials[-1], position)
+        name_trigrams, ticker_trigrams = trigrams(name), trigrams(ticker)
+        for gram in name_trigrams:
+            name_index.setdefault(gram, []).append(position)
+        for gram in ticker_trigrams:
+            ticker_index.setdefault(gram, []).append(position)
+        name_counts.append(len(name_trigrams))
+        ticker_counts.append(len(ticker_trigrams))
+    snapshot.name_trigrams = {gram: np.array(p) for gram, p in name_index.items()}
+    snapshot.ticker_trigrams = {gram: np.array(p) for gram, p in ticker_index.items()}
+    snapshot.name_trigram_counts = np.array(name_counts, dtype=np.float64)
+    snapshot.ticker_trigram_counts = np.array(ticker_counts, dtype=np.float64)
+    return snapshot
+
+
+def _similarities(index: dict[str, np.ndarray], counts: np.ndarray, grams: set[str]) -> np.ndarray:
+    """Trigram similarity of every company to ``grams``, from an inverted index."""
+    shared = np.zeros(len(counts))
+    for gram in grams:
+        positions = index.get(gram)
+        if positions is not None:
+            shared[positions] += 1
+    with np.errstate(invalid="ignore"):
+        return np.nan_to_num(shared / (len(grams) + counts - shared))
+
+
+def _initials_match(q: str, name: str) -> int | None:
+    """First position where ``q`` matches ``name``.
+
+    Jamo in ``q`` match any syllable with that initial consonant.
+    """
+    for start in range(len(name) - len(q) + 1):
+        if all(
+            qc == nc or (qc in _INITIALS and choseong(nc) == qc)
+            for qc, nc in zip(q, name[start:start + len(q)], strict=True)
+        ):
+            return start
+    return None
+
+
+class CompanyDirectory:
+    """Immutable snapshots of the company list with lookup and ranked search."""
+
+    def __init__(self) -> None:
+        self._snapshot = _Snapshot()
+        self._fingerprint: tuple[int, str | None] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self.loaded = False
+        self.loads = 0
+        self.lookups = 0
+        self.searches = 0
+        self.search_seconds = 0.0
+
+    def load(
+        self, companies: list[Company], fingerprint: tuple[int, str | None] | None = None
+    ) -> None:
+        """Replace the directory contents.
+
+        Args:
+            companies: Full company list
+            fingerprint: ``CompaniesRepository.fingerprint()`` of the list
+        """
+        self._snapshot = _build(companies)
+        self._fingerprint = fingerprint
+        self.loaded = True
+        self.loads += 1
+
+    def get(self, company_id: str) -> Company | None:
+        """Get a company by ID (None if unknown)."""
+        self.lookups += 1
+        snapshot = self._snapshot
+        position = snapshot.positions.get(company_id)
+        return snapshot.companies[position] if position is not None else None
+
+    def search(
+        self, q: str | None = None, limit: int = 50, cursor: str | None = None
+    ) -> tuple[list[Company], str | None]:
+        """Search like ``CompaniesRepository.search_companies``, plus initial-consonant queries.
+
+        Args:
+            q: Name, ticker or ID fragment; Hangul initials (``ㅅㅅ``) match
+                syllables starting with them
+            limit: Maximum number of results
+            cursor: Pagination cursor from a previous page
+
+        Returns:
+            Tuple of (companies, next_cursor)
+        """
+        started = time.perf_counter()
+        snapshot = self._snapshot
+        q = (q or "").strip().lower()
+        ranks = self._rank(snapshot, q) if q else np.zeros(len(snapshot.ids))
+        matched = ~np.isnan(ranks)
+
+        # Keyset on (rank DESC, id ASC); positions follow ID order
+        after = decode_cursor(cursor) or {}
+        if after.get("id"):
+            after_rank = after.get("rank", 0.0)
+            later = np.arange(len(snapshot.ids)) >= bisect.bisect_right(snapshot.ids, after["id"])
+            matched &= (ranks < after_rank) | ((ranks == after_rank) & later)
+
+        candidates = np.flatnonzero(matched)
+        order = candidates[np.lexsort((candidates, -ranks[candidates]))][:limit + 1]
+        next_cursor = None
+        if len(order) > limit:
+            order = order[:limit]
+            last = int(order[-1])
+            position = (
+                {"rank": float(ranks[last]), "id": snapshot.ids[last]}
+                if q
+                else {"id": snapshot.ids[last]}
+            )
+            next_cursor = encode_cursor(position)
+
+        self.searches += 1
+        self.search_seconds += time.perf_counter() - started
+        return [snapshot.companies[int(i)] for i in order], next_cursor
+
+    def _rank(self, snapshot: _Snapshot, q: str) -> np.ndarray:
+        """Rank per position as ``companies_repo.search_rank`` (NaN where ``q`` doesn't match)."""
+        q_trigrams = trigrams(q)
+        name_similarity = _similarities(
+            snapshot.name_trigrams, snapshot.name_trigram_counts, q_trigrams
+        )
+        ticker_similarity = _similarities(
+            snapshot.ticker_trigrams, snapshot.ticker_trigram_counts, q_trigrams
+        )
+
+        matched = name_similarity >= MIN_SIMILARITY
+        matched[snapshot.keys.find(q)] = True
+        ranks: np.ndarray = np.maximum(name_similarity, ticker_similarity)
+        ranks[snapshot.prefixes.find(q)] += PREFIX_BOOST
+        ranks[snapshot.exact.get(q, [])] += EXACT_BOOST
+        ranks[~matched] = np.nan
+
+        if _INITIALS.intersection(q):
+            q_initials = choseong(q)
+            for position in snapshot.initial_keys.find(q_initials):
+                name = snapshot.names[position]
+                start: int | None
+                if q == q_initials:
+                    start = snapshot.initials[position].find(q)
+                else:
+                    start = _initials_match(q, name)
+                    if start is None:
+                        continue
+                rank = len(q) / len(name)
+                if start == 0:
+                    rank += PREFIX_BOOST + (EXACT_BOOST if len(q) == len(name) else 0.0)
+                ranks[position] = np.fmax(ranks[position], rank)
+
+        return ranks
+
+    async def refresh(self, session_factory: Callable[[], Any]) -> bool:
+        """Reload if the companies table changed since the last load.
+
+        Args:
+            session_factory: Factory producing async sessions
+
+        Returns:
+            Whether the directory was reloaded
+        """
+        async with session_factory() as session:
+            repo = await get_companies_repo(session)
+            fingerprint = await repo.fingerprint()
+            if self.loaded and fingerprint == self._fingerprint:
+                return False
+            companies = await repo.list_companies()
+        self.load(companies, fingerprint)
+        logger.info(f"Company directory loaded with {len(companies)} companies")
+        return True
+
+    def start(self, session_factory: Callable[[], Any], interval_seconds: float) -> None:
+        """Start refreshing in the background every ``interval_seconds``."""
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._refresh_loop(session_factory, interval_seconds),
+                name="company-directory-refresh",
+            )
+
+    async def stop(self) -> None:
+        """Stop the background refresh."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _refresh_loop(
+        self, session_factory: Callable[[], Any], interval_seconds: float
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.refresh(session_factory)
+            except Exception as e:
+                logger.warning(f"Company directory refresh failed: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Size, load count and lookup/search counters."""
+        return {
+            "loaded": self.loaded,
+            "companies": len(self._snapshot.ids),
+            "loads": self.loads,
+            "lookups": self.lookups,
+            "searches": self.searches,
+            "mean_search_us": (
+                round(self.search_seconds / self.searches * 1e6, 1) if self.searches else None
+            ),
+        }
+
+
+# Global directory instance (loaded in lifespan)
+_directory: CompanyDirectory | None = None
+
+
+async def init_company_directory(
+    session_factory: Callable[[], Any], refresh_seconds: float
+) -> CompanyDirectory:
+    """Load the shared company directory and start refreshing it.
+
+    Args:
+        session_factory: Factory producing async sessions
+        refresh_seconds: Interval between change checks
+
+    Returns:
+        Loaded company directory
+    """
+    global _directory
+    directory = CompanyDirectory()
+    await directory.refresh(session_factory)
+    directory.start(session_factory, refresh_seconds)
+    _directory = directory
+    return directory
+
+
+def get_company_directory() -> CompanyDirectory:
+    """Get the shared company directory.
+
+    Returns:
+        Company directory
+
+    Raises:
+        RuntimeError: If the directory is not loaded
+    """
+    if _directory is None:
+        raise RuntimeError("Company directory not initialized")
+    return _directory
+
+
+async def close_company_directory() -> None:
+    """Stop refreshing and drop the shared company directory."""
+    global _directory
+
+    if _directory is not None:
+        await _directory.stop()
+        _directory = None
+
+
+async def find_company(session: AsyncSession, company_id: str) -> Company | None:
+    """Get a company from the directory, or from the database when it isn't loaded.
+
+    A directory miss is checked once against the database, so a company
+    created since the last refresh is found before the next one.
+
+    Args:
+        session: Database session (used without a directory or on a miss)
+        company_id: Company identifier
+
+    Returns:
+        Company or None if not found
+    """
+    if _directory is not None:
+        company = _directory.get(company_id)
+        if company is not None:
+            return company
+    return await (await get_companies_repo(session)).get_company(company_id)
+
+
+async def find_companies(
+    session: AsyncSession, q: str | None, limit: int, cursor: str | None
+) -> tuple[list[Company], str | None]:
+    """Search the directory, or the database when it isn't loaded.
+
+    Args:
+        session: Database session (used only without a directory)
+        q: Search query
+        limit: Maximum number of results
+        cursor: Pagination cursor
+
+    Returns:
+        Tuple of (companies, next_cursor)
+    """
+    if _directory is not None:
+        return _directory.search(q, limit, cursor)
+    repo = await get_companies_repo(session)
+    return await repo.search_companies(q=q, limit=limit, cursor=cursor)
@@ -0,0 +1,157 @@
+"""Company dashboard: the components of a company page fetched in one request.
+
+Every requested component runs concurrently on its own pooled session under
+its own deadline. A component that misses its deadline is cancelled (its
+session is closed and the connection returned to the pool) and comes back
+as null, so one slow source never holds up the page.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
+from datetime import timedelta
+from typing import Any
+
+from app.config import settings
+from app.repositories.dart_repo import get_dart_repo
+from app.repositories.news_repo import get_news_repo
+from app.repositories.prices_repo import get_prices_repo
+from app.repositories.social_repo import get_social_repo
+from app.schemas.company import Company
+from app.schemas.dashboard import CompanyDashboard, DashboardComponent
+from app.schemas.intelligence import PaginatedArticles, PaginatedFilings, PaginatedSocialPosts
+from app.services.company_directory import find_company
+from app.utils.time import now_utc
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_COMPONENTS: tuple[DashboardComponent, ...] = (
+    "company", "prices", "news", "blind", "naver_forum", "filings"
+)
+
+Loader = Callable[[Any, str, int, int], Awaitable[Any]]
+
+
+async def _company(session: Any, company_id: str, limit: int, price_days: int) -> Any:
+    return await find_company(session, company_id)
+
+
+async def _prices(session: Any, company_id: str, limit: int, price_days: int) -> Any:
+    repo = await get_prices_repo(session)
+    start = now_utc() - timedelta(days=price_days)
+    return await repo.fetch_prices(company_id, start=start, interval="1d")
+
+
+async def _news(session: Any, company_id: str, limit: int, price_days: int) -> Any:
+    items, next_cursor = await (await get_news_repo(session)).fetch_news(company_id, limit=limit)
+    return PaginatedArticles(data=items, next_cursor=next_cursor)
+
+
+async def _blind(session: Any, company_id: str, limit: int, price_days: int) -> Any:
+    items, next_cursor = await (await get_social_repo(session)).fetch_social(
+        company_id, "blind", None, None, limit
+    )
+    return PaginatedSocialPosts(data=items, next_cursor=next_cursor)
+
+
+async def _naver_forum(session: Any, company_id: str, limit: int, price_days: int) -> Any:
+    items, next_cursor = await (await get_social_repo(session)).fetch_social(
+        company_id, "naver_forum", None, None, limit
+    )
+    return PaginatedSocialPosts(data=items, next_cursor=next_cursor)
+
+
+async def _filings(session: Any, company_id: str, limit: int, price_days: int) -> Any:
+    items, next_cursor = await (await get_dart_repo(session)).fetch_filings(company_id, limit=limit)
+    return PaginatedFilings(data=items, next_cursor=next_cursor)
+
+
+_LOADERS: dict[DashboardComponent, Loader] = {
+    "company": _company,
+    "prices": _prices,
+    "news": _news,
+    "blind": _blind,
+    "naver_forum": _naver_forum,
+    "filings": _filings,
+}
+
+
+def component_deadlines(timeout_seconds: float | None = None) -> dict[DashboardComponent, float]:
+    """Deadline of each component from settings, optionally capped.
+
+    Args:
+        timeout_seconds: Upper bound for every deadline (None for no cap)
+
+    Returns:
+        Seconds per component
+    """
+    deadlines: dict[DashboardComponent, float] = dict.fromkeys(
+        DASHBOARD_COMPONENTS, settings.dashboard_deadline_seconds
+    )
+    deadlines["company"] = settings.dashboard_company_deadline_seconds
+    deadlines["prices"] = settings.dashboard_prices_deadline_seconds
+    if timeout_seconds is not None:
+        deadlines = {component: min(d, timeout_seconds) for component, d in deadlines.items()}
+    return deadlines
+
+
+async def fetch_dashboard(
+    session_factory: Callable[[], Any] | None,
+    company_id: str,
+    include: list[DashboardComponent] | None = None,
+    limit: int = 20,
+    price_days: int = 90,
+    deadlines: dict[DashboardComponent, float] | None = None,
+    company: Company | None = None,
+) -> CompanyDashboard:
+    """Fetch the requested dashboard components concurrently.
+
+    Args:
+        session_factory: Factory producing async sessions, one per component
+            (None in memory mode)
+        company_id: Company identifier
+        include: Components to fetch (default all)
+        limit: Page size of the news, post and filing lists
+        price_days: Days of daily candles
+        deadlines: Seconds per component (default ``component_deadlines()``)
+        company: Company already looked up by the caller (used as the
+            ``company`` component instead of fetching it again)
+
+    Returns:
+        Dashboard with timed-out components null and listed in ``timed_out``
+
+    Raises:
+        Exception: The first error raised by a component that did not time out
+    """
+    selected = list(dict.fromkeys(include)) if include else list(DASHBOARD_COMPONENTS)
+    deadlines = deadlines or component_deadlines()
+    dashboard = CompanyDashboard(company_id=company_id)
+    if company is not None and "company" in selected:
+        dashboard.company = company
+        selected.remove("company")
+
+    async def load(component: DashboardComponent) -> Any:
+        async with session_factory() if session_factory else nullcontext(None) as session:
+            return await _LOADERS[component](session, company_id, limit, price_days)
+
+    results = await asyncio.gather(
+        *(asyncio.wait_for(load(component), deadlines[component]) for component in selected),
+        return_exceptions=True,
+    )
+
+    errors: list[BaseException] = []
+    for component, result in zip(selected, results, strict=True):
+        if isinstance(result, TimeoutError):
+            logger.warning(
+                f"Dashboard {component} for {company_id} "
+                f"missed its {deadlines[component]}s deadline"
+            )
+            dashboard.timed_out.append(component)
+        elif isinstance(result, BaseException):
+            errors.append(result)
+        else:
+            setattr(dashboard, component, result)
+    if errors:
+        raise errors[0]
+    return dashboard
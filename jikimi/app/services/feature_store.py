@@ -0,0 +1,75 @@
+"""Per-company, per-day feature aggregation (Python mirror of the feature-store triggers)."""
+
+from datetime import UTC, date, datetime
+
+from app.schemas.intelligence import Article, Filing, SocialPost
+from app.schemas.prediction import DailyFeatures
+
+
+def _day(ts: datetime) -> date:
+    """UTC calendar day of a timestamp, matching ``(ts AT TIME ZONE 'UTC')::DATE``."""
+    return ts.astimezone(UTC).date()
+
+
+def aggregate_daily(
+    company_id: str,
+    news: list[Article],
+    blind: list[SocialPost],
+    naver_forum: list[SocialPost],
+    filings: list[Filing],
+) -> list[DailyFeatures]:
+    """Aggregate raw intelligence items into feature-store rows.
+
+    Produces exactly what the ``company_daily_features`` triggers accumulate in
+    PostgreSQL. Used for in-memory mode and to check parity with the raw path.
+
+    Args:
+        company_id: Company identifier
+        news: News articles
+        blind: 블라인드 posts
+        naver_forum: 네이버 종토방 posts
+        filings: DART filings
+
+    Returns:
+        Rows ordered by day ascending
+    """
+    rows: dict[date, DailyFeatures] = {}
+
+    def row_for(ts: datetime) -> DailyFeatures:
+        day = _day(ts)
+        if day not in rows:
+            rows[day] = DailyFeatures(company_id=company_id, day=day)
+        return rows[day]
+
+    for article in news:
+        row = row_for(article.published_at)
+        row.news_count += 1
+        if article.sentiment:
+            label = article.sentiment.label
+            row.news_positive += label == "positive"
+            row.news_negative += label == "negative"
+            row.news_neutral += label == "neutral"
+            hours = article.published_at.timestamp() / 3600
+            row.news_scored += 1
+            row.news_score_sum += article.sentiment.score
+            row.news_score_hours_sum += article.sentiment.score * hours
+            row.news_hours_sum += hours
+
+    for post in blind:
+        row = row_for(post.posted_at)
+        row.blind_count += 1
+        row.blind_engagement += post.reply_count + post.like_count
+        row.blind_positive += bool(post.sentiment and post.sentiment.label == "positive")
+
+    for post in naver_forum:
+        row = row_for(post.posted_at)
+        row.naver_forum_count += 1
+        row.naver_forum_engagement += post.reply_count + post.like_count
+
+    for filing in filings:
+        row = row_for(filing.filed_at)
+        row.filings_count += 1
+        if row.last_filed_at is None or filing.filed_at > row.last_filed_at:
+            row.last_filed_at = filing.filed_at
+
+    return [rows[day] for day in sorted(rows)]
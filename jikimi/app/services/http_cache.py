@@ -0,0 +1,248 @@
+"""HTTP caching for GET endpoints: validators, conditional GET and a response cache.
+
+``cached_response`` serves a route's JSON as follows:
+
+1. A cached response younger than the route's TTL is returned as is, with
+   no database access.
+2. Otherwise the route's freshness query (a row count and latest
+   ``updated_at``, see ``FreshnessRepository``) gives the ETag. If the cached
+   body has that ETag it is reused, and if the client already has it the
+   answer is ``304`` with no body built or serialized.
+3. Otherwise the response model is built and serialized once, cached and
+   returned with ``ETag``, ``Last-Modified`` and ``Cache-Control``.
+
+Routes without a freshness query (memory mode, live prices, trending) hash
+the serialized body instead, so they still get ETags and ``304``s.
+
+Writes made in this process (API, bulk ingestion, snapshot loads, the
+sentiment worker) drop the company's entries. Writes from other processes,
+such as ``app.cli.rescore``, are picked up when the entry's TTL runs out.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, NamedTuple
+from urllib.parse import urlencode
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from app.config import settings
+from app.repositories.freshness_repo import Freshness
+
+# Default TTL (seconds) of the server-side cache and Cache-Control max-age per route
+ROUTE_TTLS: dict[str, float] = {
+    "company": 300.0,
+    "news": 30.0,
+    "social": 30.0,
+    "filings": 60.0,
+    "timeline": 30.0,
+    "prices": 60.0,
+    "sentiment_series": 60.0,
+    "blind_depts": 300.0,
+    "trending": 10.0,
+}
+
+# Bump when response schemas change so clients drop ETags of the old shape
+ETAG_VERSION = 1
+
+
+class CachedResponse(NamedTuple):
+    """One serialized response held by the response cache."""
+
+    etag: str
+    last_modified: datetime | None
+    body: bytes
+    expires_at: float
+
+
+class ResponseCache:
+    """Bounded LRU of serialized GET responses with hit-rate accounting."""
+
+    def __init__(self, maxsize: int = 5_000) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self.fresh_hits = 0
+        self.revalidated = 0
+        self.not_modified = 0
+        self.misses = 0
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return a cached response (fresh or not) and mark it most recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """Insert a response, evicting the least recently used entry if full."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str) -> int:
+        """Drop every response whose key (request path and query) starts with ``prefix``.
+
+        Args:
+            prefix: Key prefix, e.g. ``/v1/companies/005930/``
+
+        Returns:
+            Number of responses dropped
+        """
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit counts and the share of requests answered without building a body."""
+        lookups = self.fresh_hits + self.revalidated + self.not_modified + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "lookups": lookups,
+            "fresh_hits": self.fresh_hits,
+            "revalidated": self.revalidated,
+            "not_modified": self.not_modified,
+            "misses": self.misses,
+            "hit_rate": (lookups - self.misses) / lookups if lookups else None,
+        }
+
+
+# Process-wide cache instance
+_cache = ResponseCache(settings.http_cache_size)
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache.
+
+    Returns:
+        Response cache
+    """
+    return _cache
+
+
+def invalidate_company(company_id: str) -> int:
+    """Drop the cached responses of a company's endpoints (after a write).
+
+    Args:
+        company_id: Company identifier
+
+    Returns:
+        Number of responses dropped
+    """
+    return _cache.invalidate(f"{settings.api_prefix}/companies/{company_id}/")
+
+
+def route_ttl(route: str) -> float:
+    """TTL of a route: ``HTTP_CACHE_TTLS`` override, else the default."""
+    return settings.http_cache_ttls.get(route, ROUTE_TTLS.get(route, 0.0))
+
+
+def cache_key(request: Request) -> str:
+    """Request path plus its query parameters in a canonical order."""
+    query = urlencode(sorted(request.query_params.multi_items()))
+    return f"{request.url.path}?{query}"
+
+
+def make_etag(key: str, parts: tuple[Any, ...]) -> str:
+    """Weak ETag over the cache key and whatever identifies the content."""
+    digest = hashlib.sha256(repr((ETAG_VERSION, key, parts)).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of ``If-None-Match`` against ``etag`` (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def _not_modified_since(if_modified_since: str | None, last_modified: datetime | None) -> bool:
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def _respond(request: Request, entry: CachedResponse, ttl: float) -> Response:
+    headers = {"ETag": entry.etag, "Cache-Control": f"public, max-age={int(ttl)}"}
+    if entry.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(entry.last_modified.astimezone(UTC), usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if _etag_matches(if_none_match, entry.etag) or (
+        if_none_match is None
+        and _not_modified_since(request.headers.get("if-modified-since"), entry.last_modified)
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+async def cached_response(
+    request: Request,
+    route: str,
+    build: Callable[[], Awaitable[BaseModel]],
+    freshness: Callable[[], Awaitable[Freshness | None]] | None = None,
+    vary: tuple[Any, ...] = (),
+) -> Response:
+    """Serve a GET route through the response cache and conditional GET.
+
+    Args:
+        request: Incoming request (path, query and conditional headers)
+        route: Route name selecting the TTL (see ``ROUTE_TTLS``)
+        build: Builds the response model (only called on a miss)
+        freshness: Cheap query that changes whenever the response would
+            (None to hash the body instead)
+        vary: Extra ETag inputs, e.g. the current day for ranges ending now
+
+    Returns:
+        200 response with the JSON body, or 304 without one
+    """
+    ttl = route_ttl(route)
+    key = cache_key(request)
+    now = time.monotonic()
+    entry = _cache.get(key) if ttl > 0 else None
+
+    if entry is not None and entry.expires_at > now:
+        _cache.fresh_hits += 1
+        return _respond(request, entry, ttl)
+
+    current = await freshness() if freshness is not None else None
+    etag = None
+    if current is not None:
+        etag = make_etag(key, (tuple(current), vary))
+        if entry is not None and entry.etag == etag:
+            entry = entry._replace(expires_at=now + ttl)
+            _cache.put(key, entry)
+            _cache.revalidated += 1
+            return _respond(request, entry, ttl)
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            _cache.not_modified += 1
+            return _respond(request, CachedResponse(etag, current.last_modified, b"", now), ttl)
+
+    model = await build()
+    body = model.model_dump_json(by_alias=True).encode()
+    entry = CachedResponse(
+        etag=etag or make_etag(key, (hashlib.sha256(body).hexdigest(), vary)),
+        last_modified=current.last_modified if current is not None else None,
+        body=body,
+        expires_at=now + ttl,
+    )
+    if ttl > 0:
+        _cache.put(key, entry)
+    _cache.misses += 1
+    return _respond(request, entry, ttl)
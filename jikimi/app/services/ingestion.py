@@ -0,0 +1,245 @@
+"""Bulk ingestion of news, social posts and filings for one company."""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.errors import AppError
+from app.schemas.common import Sentiment
+from app.schemas.company import Company
+from app.schemas.intelligence import (
+    BulkIngestResponse,
+    BulkItemResult,
+    CreateArticleRequest,
+    CreateFilingRequest,
+    CreateSocialPostRequest,
+)
+from app.services.http_cache import invalidate_company
+from app.services.sentiment import SentimentItem
+from app.services.sentiment_cache import analyze_sentiments_cached
+from app.services.sentiment_worker import (
+    REPO_FACTORIES,
+    SentimentJob,
+    TargetTable,
+    get_sentiment_worker,
+)
+from app.services.story_index import StoryMatch, get_story_index
+from app.services.trending import get_trending_counter
+from app.utils.hashing import article_key, dart_rcept_no, filing_key, post_key
+
+CreateRequest = CreateArticleRequest | CreateSocialPostRequest | CreateFilingRequest
+
+
+@dataclass(frozen=True)
+class IngestRow:
+    """Column values and sentiment input for one item to insert."""
+
+    values: dict[str, Any]
+    item: SentimentItem
+
+
+def article_row(request: CreateArticleRequest, company_name: str) -> IngestRow:
+    """Build the ``news_articles`` row for an article request."""
+    dedupe_hash = article_key(request.url, request.source, request.title, request.published_at)
+    return IngestRow(
+        values={**request.model_dump(), "dedupe_hash": dedupe_hash},
+        item=SentimentItem(f"{request.title}\n\n{request.summary or ''}", "news", company_name),
+    )
+
+
+def social_row(request: CreateSocialPostRequest, company_name: str) -> IngestRow:
+    """Build the ``social_posts`` row for a post request."""
+    dedupe_hash = post_key(request.platform, request.content, request.author, request.posted_at)
+    return IngestRow(
+        values={**request.model_dump(), "dedupe_hash": dedupe_hash},
+        item=SentimentItem(f"{request.title or ''}\n\n{request.content}", "social", company_name),
+    )
+
+
+def filing_row(request: CreateFilingRequest, company_name: str) -> IngestRow:
+    """Build the ``dart_filings`` row for a filing request."""
+    rcept_no = request.rcept_no or dart_rcept_no(request.url)
+    dedupe_hash = filing_key(rcept_no, request.title, request.filing_type, request.filed_at)
+    return IngestRow(
+        values={**request.model_dump(), "rcept_no": rcept_no, "dedupe_hash": dedupe_hash},
+        item=SentimentItem(f"{request.title}\n\n{request.summary or ''}", "filing", company_name),
+    )
+
+
+_REQUEST_MODELS: dict[TargetTable, type[CreateRequest]] = {
+    "news": CreateArticleRequest,
+    "social": CreateSocialPostRequest,
+    "filing": CreateFilingRequest,
+}
+
+
+def _validation_message(error: ValidationError) -> str:
+    """Flatten a validation error into one ``field: message`` line per problem."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc']) or 'item'}: {e['msg']}"
+        for e in error.errors()
+    )
+
+
+_ROW_BUILDERS: dict[TargetTable, Callable[[Any, str], IngestRow]] = {
+    "news": article_row,
+    "social": social_row,
+    "filing": filing_row,
+}
+
+
+async def ingest_bulk(
+    session: AsyncSession,
+    table: TargetTable,
+    company: Company,
+    requests: Sequence[CreateRequest | dict[str, Any]],
+    defer_sentiment: bool = False,
+) -> BulkIngestResponse:
+    """Store many items for one company with one query per step.
+
+    Items are deduplicated by their ``dedupe_hash`` (see ``app.utils.hashing``),
+    first within the request and then against stored rows (one lookup), so
+    retried items cost no LLM call. New articles are assigned to near-duplicate
+    stories (``app.services.story_index``): a story already scored lends its
+    sentiment, and otherwise only its first new article is scored. Sentiment for
+    the remaining items goes through the cache in LLM batches, and rows are
+    written with one multi-row ``INSERT ... ON CONFLICT DO NOTHING``. Rows that
+    lose a race with a concurrent insert are reported as duplicates.
+
+    Every item gets its own status: raw items failing validation, and items
+    whose sentiment could not be scored (the whole story for articles), are
+    reported as ``error`` and not stored while the rest go through.
+
+    Args:
+        session: Database session
+        table: Target table
+        company: Company the items belong to (already validated)
+        requests: Items to create (request models, or raw dicts validated
+            one at a time)
+        defer_sentiment: Insert with null sentiment and queue rows for the
+            background worker instead of scoring inline (articles of an
+            already-scored story still get its sentiment)
+
+    Returns:
+        Per-item results in request order
+    """
+    repo = await REPO_FACTORIES[table](session)
+    results: list[BulkItemResult | None] = [None] * len(requests)
+    rows: dict[tuple[Any, ...], IngestRow] = {}
+    first_index: dict[tuple[Any, ...], int] = {}
+    repeats: list[tuple[int, tuple[Any, ...]]] = []
+
+    for index, raw in enumerate(requests):
+        try:
+            request = (
+                _REQUEST_MODELS[table].model_validate(raw) if isinstance(raw, dict) else raw
+            )
+        except ValidationError as e:
+            results[index] = BulkItemResult(
+                index=index, status="error", error=_validation_message(e)
+            )
+            continue
+        if request.company_id != company.id:
+            results[index] = BulkItemResult(
+                index=index, status="error", error="company_id must match the path"
+            )
+            continue
+        row = _ROW_BUILDERS[table](request, company.name)
+        key = tuple(row.values[name] for name in repo.natural_key)
+        if key in rows:
+            repeats.append((index, key))
+        else:
+            rows[key] = row
+            first_index[key] = index
+
+    ids: dict[tuple[Any, ...], str | None] = await repo.find_existing(company.id, list(rows))
+    for key, row_id in ids.items():
+        results[first_index[key]] = BulkItemResult(
+            index=first_index[key], status="duplicate", id=row_id
+        )
+
+    new_keys = [key for key in rows if key not in ids]
+    new_rows = [rows[key] for key in new_keys]
+    stories: list[StoryMatch] = []
+    if table == "news":
+        stories_index = get_story_index()
+        stories = [
+            stories_index.assign(company.id, row.values["title"], row.values["published_at"])
+            for row in new_rows
+        ]
+
+    # One scoring group per story still without sentiment (per row for other tables)
+    sentiments: list[Sentiment | None] = (
+        [story.sentiment for story in stories] or [None] * len(new_rows)
+    )
+    groups: dict[str | int, list[int]] = {}
+    for i, sentiment in enumerate(sentiments):
+        if sentiment is None:
+            groups.setdefault(stories[i].story_id if stories else i, []).append(i)
+    failed: dict[int, str] = {}
+    if groups and not defer_sentiment:
+        scored = await analyze_sentiments_cached(
+            session,
+            [new_rows[members[0]].item for members in groups.values()],
+            return_exceptions=True,
+        )
+        for (group, members), result in zip(groups.items(), scored, strict=True):
+            if isinstance(result, AppError):
+                failed.update((i, f"Sentiment scoring failed: {result.detail}") for i in members)
+                continue
+            for i in members:
+                sentiments[i] = result
+            if stories:
+                stories_index.set_sentiment(str(group), result)
+    failed_keys = {new_keys[i]: error for i, error in failed.items()}
+    for key, error in failed_keys.items():
+        results[first_index[key]] = BulkItemResult(
+            index=first_index[key], status="error", error=error
+        )
+
+    kept = [i for i in range(len(new_rows)) if i not in failed]
+    new_keys = [new_keys[i] for i in kept]
+    new_rows = [new_rows[i] for i in kept]
+    sentiments = [sentiments[i] for i in kept]
+    stories = [stories[i] for i in kept] if stories else []
+    values = [
+        {**row.values, "sentiment": sentiment}
+        for row, sentiment in zip(new_rows, sentiments, strict=True)
+    ]
+    for value, story in zip(values, stories, strict=True):
+        value["story_id"] = story.story_id
+    inserted = await repo.insert_many(values)
+    if table != "filing":
+        get_trending_counter().record_rows(
+            [value for value, row_id in zip(values, inserted, strict=True) if row_id is not None]
+        )
+    if any(row_id is not None for row_id in inserted):
+        invalidate_company(company.id)
+    for key, row, row_id, sentiment in zip(new_keys, new_rows, inserted, sentiments, strict=True):
+        ids[key] = row_id
+        index = first_index[key]
+        if row_id is None:
+            results[index] = BulkItemResult(index=index, status="duplicate")
+            continue
+        results[index] = BulkItemResult(index=index, status="created", id=row_id)
+        if sentiment is None:
+            get_sentiment_worker().enqueue(
+                SentimentJob(table=table, row_id=row_id, company_id=company.id, item=row.item)
+            )
+
+    for index, key in repeats:
+        if key in failed_keys:
+            results[index] = BulkItemResult(index=index, status="error", error=failed_keys[key])
+        else:
+            results[index] = BulkItemResult(index=index, status="duplicate", id=ids.get(key))
+
+    final = [r for r in results if r is not None]
+    return BulkIngestResponse(
+        created=sum(r.status == "created" for r in final),
+        duplicates=sum(r.status == "duplicate" for r in final),
+        failed=sum(r.status == "error" for r in final),
+        results=final,
+    )
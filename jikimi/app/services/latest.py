@@ -0,0 +1,89 @@
+"""Newest news, posts and filings of many companies at once.
+
+Each source is one ``LATERAL`` query over every requested company (see
+``BaseRepository._latest_per_company``), run concurrently on its own
+session, so a portfolio of any size costs one query per source. The sources
+are kept as separate statements (rather than one ``UNION ALL``) because
+their row shapes differ; running them in parallel keeps the latency at that
+of the slowest source, at the cost of one pooled connection each.
+"""
+
+import asyncio
+from collections.abc import Callable
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any
+
+from app.repositories.dart_repo import get_dart_repo
+from app.repositories.news_repo import get_news_repo
+from app.repositories.social_repo import get_social_repo
+from app.schemas.common import SentimentFilter
+from app.schemas.intelligence import CompanyLatest, TimelineSource
+from app.services.timeline import TIMELINE_SOURCES
+
+
+async def _read(
+    session: Any,
+    source: TimelineSource,
+    company_ids: list[str],
+    limit: int,
+    start: datetime | None,
+    end: datetime | None,
+    sentiment_filter: SentimentFilter | None,
+) -> dict[str, list[Any]]:
+    """The newest ``limit`` items of one source per company."""
+    if source == "news":
+        news_repo = await get_news_repo(session)
+        return await news_repo.fetch_latest_news(company_ids, limit, start, end, sentiment_filter)
+    if source == "dart":
+        dart_repo = await get_dart_repo(session)
+        return await dart_repo.fetch_latest_filings(
+            company_ids, limit, start, end, sentiment_filter
+        )
+    social_repo = await get_social_repo(session)
+    return await social_repo.fetch_latest_social(
+        company_ids, source, limit, start, end, sentiment_filter
+    )
+
+
+async def fetch_latest(
+    session_factory: Callable[[], Any] | None,
+    company_ids: list[str],
+    sources: list[TimelineSource] | None = None,
+    limit: int = 5,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    sentiment_filter: SentimentFilter | None = None,
+) -> list[CompanyLatest]:
+    """Read the newest items of every source for many companies.
+
+    Args:
+        session_factory: Factory producing async sessions, one per source
+            (None in memory mode)
+        company_ids: Company identifiers (duplicates are dropped)
+        sources: Sources to include (default all)
+        limit: Maximum items per company and source
+        start: Start timestamp (inclusive)
+        end: End timestamp (exclusive)
+        sentiment_filter: Sentiment label/score/confidence conditions
+
+    Returns:
+        One entry per company in request order; unrequested sources are None
+    """
+    company_ids = list(dict.fromkeys(company_ids))
+    selected = list(dict.fromkeys(sources)) if sources else list(TIMELINE_SOURCES)
+
+    async def read(source: TimelineSource) -> dict[str, list[Any]]:
+        async with session_factory() if session_factory else nullcontext(None) as session:
+            return await _read(session, source, company_ids, limit, start, end, sentiment_filter)
+
+    results = await asyncio.gather(*(read(source) for source in selected))
+    by_source = dict(zip(selected, results, strict=True))
+
+    return [
+        CompanyLatest(
+            company_id=company_id,
+            **{source: items[company_id] for source, items in by_source.items()},
+        )
+        for company_id in company_ids
+    ]
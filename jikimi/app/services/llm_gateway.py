@@ -0,0 +1,302 @@
+"""Shared OpenAI gateway: pooled client, concurrency and token-rate limits, retries, metrics."""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
+from openai.types.chat import ChatCompletionMessageParam
+
+from app.config import settings
+from app.errors import AIProviderError
+
+logger = logging.getLogger(__name__)
+
+# Errors worth retrying: throttling, timeouts, dropped connections and 5xx
+RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+# Rough prompt-size estimate used to reserve rate-limit budget before a call
+# (Korean text tokenizes to roughly one token per 2-3 characters)
+CHARS_PER_TOKEN = 2
+COMPLETION_RESERVE_TOKENS = 512
+
+# Latency samples kept per endpoint for percentile reporting
+LATENCY_WINDOW = 1024
+
+
+class TokenBucket:
+    """Token-per-minute rate limiter shared by all callers of the gateway."""
+
+    def __init__(self, tokens_per_minute: int) -> None:
+        self.capacity = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until ``tokens`` can be spent.
+
+        Requests larger than the bucket are clamped to its capacity so they
+        wait for a full bucket instead of blocking forever. The tokens are
+        reserved under the lock (the balance may go negative) and the caller
+        sleeps until the reservation is covered after releasing it, so
+        waiters queue in arrival order without holding up each other's
+        bookkeeping.
+
+        Args:
+            tokens: Estimated tokens for the upcoming call
+        """
+        needed = min(float(tokens), self.capacity)
+        async with self._lock:
+            self._refill()
+            self._tokens -= needed
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def adjust(self, delta: int) -> None:
+        """Correct the balance once actual usage is known (positive delta refunds)."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + delta)
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters and latency samples for one logical endpoint."""
+
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_sum: float = 0.0
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return JSON-serializable metrics with latency percentiles in milliseconds."""
+        ordered = sorted(self.latencies)
+
+        def pct(p: float) -> float | None:
+            return 1000 * ordered[min(len(ordered) - 1, int(p * len(ordered)))] if ordered else None
+
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "latency_ms_mean": 1000 * self.latency_sum / self.calls if self.calls else None,
+            "latency_ms_p50": pct(0.50),
+            "latency_ms_p95": pct(0.95),
+        }
+
+
+class LLMGateway:
+    """Single entry point for chat completions.
+
+    One ``AsyncOpenAI`` client (and therefore one keep-alive HTTP connection
+    pool) is shared by every request. Calls are bounded by a global semaphore
+    and a per-endpoint semaphore, paced by a token-per-minute bucket, and
+    retried with jittered exponential backoff until a per-call deadline.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI | Any,
+        max_concurrency: int = 16,
+        endpoint_concurrency: Mapping[str, int] | None = None,
+        tokens_per_minute: int = 200_000,
+        max_retries: int = 4,
+        deadline_seconds: float = 30.0,
+        backoff_base_seconds: float = 0.5,
+        backoff_cap_seconds: float = 8.0,
+    ) -> None:
+        self.client = client
+        self.max_retries = max_retries
+        self.deadline_seconds = deadline_seconds
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_cap_seconds = backoff_cap_seconds
+        self.max_concurrency = max_concurrency
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._endpoint_limits = dict(endpoint_concurrency or {})
+        self._endpoints: dict[str, asyncio.Semaphore] = {}
+        self._bucket = TokenBucket(tokens_per_minute)
+        self._metrics: dict[str, EndpointMetrics] = {}
+
+    @classmethod
+    def from_settings(cls) -> "LLMGateway":
+        """Build a gateway (and its pooled client) from application settings."""
+        client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            timeout=settings.llm_request_timeout_seconds,
+            max_retries=0,  # Retries are handled here so they respect the deadline
+        )
+        return cls(
+            client,
+            max_concurrency=settings.llm_max_concurrency,
+            endpoint_concurrency={
+                "sentiment": settings.llm_sentiment_concurrency,
+                "prediction": settings.llm_prediction_concurrency,
+            },
+            tokens_per_minute=settings.llm_tokens_per_minute,
+            max_retries=settings.llm_max_retries,
+            deadline_seconds=settings.llm_deadline_seconds,
+        )
+
+    def _endpoint_semaphore(self, endpoint: str) -> asyncio.Semaphore:
+        if endpoint not in self._endpoints:
+            limit = self._endpoint_limits.get(endpoint, self.max_concurrency)
+            self._endpoints[endpoint] = asyncio.Semaphore(limit)
+        return self._endpoints[endpoint]
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay for a retry attempt."""
+        ceiling = min(self.backoff_cap_seconds, self.backoff_base_seconds * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+    async def complete(
+        self,
+        endpoint: str,
+        messages: list[dict[str, str]],
+        model: str | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Run a chat completion and return the message content.
+
+        Args:
+            endpoint: Logical caller name (selects the endpoint semaphore and metrics)
+            messages: Chat messages
+            model: Model name (defaults to ``settings.openai_model``)
+            **kwargs: Extra ``chat.completions.create`` arguments (response_format, ...)
+
+        Returns:
+            Message content (may be empty; callers validate it)
+
+        Raises:
+            AIProviderError: If the call fails, retries are exhausted, or the deadline passes
+        """
+        metrics = self._metrics.setdefault(endpoint, EndpointMetrics())
+        prompt_chars = sum(len(m["content"]) for m in messages)
+        estimate = prompt_chars // CHARS_PER_TOKEN + COMPLETION_RESERVE_TOKENS
+        deadline = time.monotonic() + self.deadline_seconds
+        attempt = 0
+
+        async with self._endpoint_semaphore(endpoint), self._global:
+            while True:
+                await self._bucket.acquire(estimate)
+                remaining = deadline - time.monotonic()
+                started = time.perf_counter()
+                try:
+                    if remaining <= 0:
+                        raise TimeoutError
+                    response = await asyncio.wait_for(
+                        self.client.chat.completions.create(
+                            model=model or settings.openai_model,
+                            messages=cast(list[ChatCompletionMessageParam], messages),
+                            **kwargs,
+                        ),
+                        timeout=remaining,
+                    )
+                except TimeoutError as e:
+                    metrics.errors += 1
+                    raise AIProviderError(
+                        f"LLM call for {endpoint} exceeded its "
+                        f"{self.deadline_seconds:.0f}s deadline"
+                    ) from e
+                except RETRYABLE_ERRORS as e:
+                    delay = self._backoff(attempt)
+                    if attempt >= self.max_retries or time.monotonic() + delay >= deadline:
+                        metrics.errors += 1
+                        raise AIProviderError(
+                            f"LLM call for {endpoint} failed after retries: {e}"
+                        ) from e
+                    attempt += 1
+                    metrics.retries += 1
+                    logger.warning(
+                        f"Retrying {endpoint} LLM call in {delay:.2f}s: {type(e).__name__}"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                except Exception as e:
+                    metrics.errors += 1
+                    raise AIProviderError(f"LLM call for {endpoint} failed: {e}") from e
+
+                elapsed = time.perf_counter() - started
+                metrics.calls += 1
+                metrics.latency_sum += elapsed
+                metrics.latencies.append(elapsed)
+
+                usage = getattr(response, "usage", None)
+                prompt_tokens = getattr(usage, "prompt_tokens", None)
+                completion_tokens = getattr(usage, "completion_tokens", None)
+                if isinstance(prompt_tokens, int) and isinstance(completion_tokens, int):
+                    metrics.prompt_tokens += prompt_tokens
+                    metrics.completion_tokens += completion_tokens
+                    self._bucket.adjust(estimate - prompt_tokens - completion_tokens)
+
+                return response.choices[0].message.content or ""
+
+    def metrics(self) -> dict[str, Any]:
+        """Per-endpoint call, retry, error, latency and token-usage metrics."""
+        return {endpoint: m.snapshot() for endpoint, m in sorted(self._metrics.items())}
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        close = getattr(self.client, "close", None)
+        if close is not None:
+            await close()
+
+
+# Global gateway instance (initialized in lifespan)
+_gateway: LLMGateway | None = None
+
+
+def init_gateway() -> LLMGateway:
+    """Initialize the shared LLM gateway.
+
+    Returns:
+        LLM gateway
+    """
+    global _gateway
+    _gateway = LLMGateway.from_settings()
+    return _gateway
+
+
+def get_gateway() -> LLMGateway:
+    """Get the shared LLM gateway.
+
+    Returns:
+        LLM gateway
+
+    Raises:
+        RuntimeError: If the gateway is not initialized
+    """
+    if _gateway is None:
+        raise RuntimeError("LLM gateway not initialized")
+    return _gateway
+
+
+async def close_gateway() -> None:
+    """Close the shared LLM gateway."""
+    global _gateway
+
+    if _gateway is not None:
+        await _gateway.aclose()
+        _gateway = None
@@ -0,0 +1,129 @@
+"""In-process Korean finance lexicon sentiment (no network).
+
+Used as a fast path in front of the LLM: explicit labels such as ``(긍정)``
+written into crawled posts are taken as-is, otherwise finance terms are
+counted with simple negation handling. Callers escalate to the LLM when the
+returned confidence is below ``settings.sentiment_local_min_confidence``.
+"""
+
+import math
+import re
+import unicodedata
+
+from app.schemas.common import Sentiment
+
+# Explicit labels appended by crawlers/analysts, e.g. "[Blind] 실적 무난 (긍정)"
+_MARKER_RE = re.compile(r"[(\[]\s*(긍정|중립|부정|호재|악재)\s*[)\]]")
+_MARKER_LABELS = {
+    "긍정": "positive", "호재": "positive", "중립": "neutral",
+    "부정": "negative", "악재": "negative",
+}
+_MARKER_SCORES = {"positive": 0.5, "neutral": 0.0, "negative": -0.5}
+
+# Term -> weight (positive raises the stock, negative lowers it). Longer terms
+# win over their prefixes, e.g. "적자전환" is not counted as "적자".
+_LEXICON: dict[str, float] = {
+    # positive
+    "호재": 1.0, "호실적": 1.5, "어닝서프라이즈": 1.5, "깜짝 실적": 1.5, "최대 실적": 1.5,
+    "사상 최대": 1.5,
+    "흑자전환": 1.5, "흑자 전환": 1.5, "적자 축소": 1.0, "손실 축소": 1.0, "흑자": 1.0,
+    "상승": 1.0, "급등": 1.5, "강세": 1.0, "반등": 1.0, "신고가": 1.5, "상한가": 1.5, "돌파": 1.0,
+    "증가": 0.5, "성장": 0.5, "개선": 1.0, "회복": 1.0, "호조": 1.0, "수혜": 1.0, "기대": 0.5,
+    "수주": 1.0, "계약 체결": 1.0, "공급계약": 1.0, "증설": 0.5, "신제품": 0.5, "양산": 0.5,
+    "배당 확대": 1.5, "배당 증가": 1.5, "자사주 매입": 1.5, "자사주 소각": 1.5, "무상증자": 1.0,
+    "목표가 상향": 1.5, "목표주가 상향": 1.5, "상향": 1.0, "매수": 0.5, "저평가": 1.0,
+    "undervalued": 1.0,
+    "성과급": 0.5, "↑": 1.0, "▲": 1.0,
+    # negative
+    "악재": -1.0, "어닝쇼크": -1.5, "실적 부진": -1.5, "부진": -1.0,
+    "적자전환": -1.5, "적자 전환": -1.5, "흑자 축소": -1.0, "적자": -1.0, "손실": -1.0,
+    "하락": -1.0, "급락": -1.5, "약세": -1.0, "폭락": -1.5, "신저가": -1.5, "하한가": -1.5,
+    "감소": -0.5, "둔화": -1.0, "악화": -1.0, "우려": -0.5, "리스크": -0.5, "불확실": -0.5,
+    "목표가 하향": -1.5, "목표주가 하향": -1.5, "하향": -1.0, "매도": -0.5, "고평가": -1.0,
+    "유상증자": -1.0, "감자": -1.0, "전환사채": -0.5, "소송": -1.0, "제재": -1.0, "과징금": -1.0,
+    "횡령": -2.0, "배임": -2.0, "상장폐지": -2.0, "거래정지": -2.0, "감사의견 거절": -2.0,
+    "불성실공시": -1.5,
+    "리콜": -1.0, "파업": -1.0, "구조조정": -1.0, "희망퇴직": -1.0, "연봉 동결": -0.5, "이탈": -0.5,
+    "↓": -1.0, "▼": -1.0,
+}
+_TERM_RE = re.compile("|".join(re.escape(term) for term in sorted(_LEXICON, key=len, reverse=True)))
+
+# Negation right after a term flips it ("우려 없음", "하락하지 않았다")
+_NEGATION_RE = re.compile(r"^\s*(?:\S{0,3}\s*)?(?:없|않|아니|안\s)")
+_PERCENT_RE = re.compile(r"([+\-])\s?\d+(?:\.\d+)?\s?%(?!p)")
+
+# Confidence when the text carries a single explicit label
+MARKER_CONFIDENCE = 0.95
+
+
+def _lexicon_evidence(text: str) -> tuple[float, float, list[str]]:
+    """Sum positive and negative term weights in the text."""
+    positive = negative = 0.0
+    hits: list[str] = []
+    for match in _TERM_RE.finditer(text):
+        weight = _LEXICON[match.group()]
+        if _NEGATION_RE.match(text[match.end():match.end() + 8]):
+            weight = -weight
+        if weight > 0:
+            positive += weight
+        else:
+            negative -= weight
+        hits.append(("+" if weight > 0 else "-") + match.group())
+    for match in _PERCENT_RE.finditer(text):
+        if match.group(1) == "+":
+            positive += 0.5
+        else:
+            negative += 0.5
+        hits.append(match.group().replace(" ", ""))
+    return positive, negative, hits
+
+
+def analyze_sentiment_local(text: str) -> Sentiment:
+    """Score stock-impact sentiment from explicit labels and a finance lexicon.
+
+    An explicit ``(긍정)``/``(중립)``/``(부정)`` marker gives that label with
+    ``MARKER_CONFIDENCE``; conflicting markers fall through to the lexicon.
+    Lexicon confidence grows with the amount of evidence and shrinks when
+    positive and negative terms disagree, so texts with no or mixed signals
+    come back with low confidence and should be escalated.
+
+    Args:
+        text: The text to analyze (title + content/summary)
+
+    Returns:
+        Sentiment with rationale listing the evidence used
+    """
+    text = unicodedata.normalize("NFKC", text)
+    positive, negative, hits = _lexicon_evidence(text)
+    total = positive + negative
+    net = positive - negative
+
+    labels = {_MARKER_LABELS[m] for m in _MARKER_RE.findall(text)}
+    if len(labels) == 1:
+        label = labels.pop()
+        score = _MARKER_SCORES[label]
+        if label != "neutral" and net * score > 0:
+            score += math.copysign(min(0.3, 0.1 * total), score)
+        return Sentiment(
+            label=label,
+            score=score,
+            confidence=MARKER_CONFIDENCE,
+            rationale=f"explicit label ({label})",
+        )
+
+    if total == 0:
+        return Sentiment(
+            label="neutral", score=0.0, confidence=0.2, rationale="local lexicon: no evidence"
+        )
+
+    score = max(-0.8, min(0.8, net / (total + 4)))
+    agreement = abs(net) / total
+    evidence = 1 - math.exp(-total / 1.5)
+    confidence = round(0.9 * evidence * agreement, 3)
+    label = "positive" if score >= 0.1 else "negative" if score <= -0.1 else "neutral"
+    return Sentiment(
+        label=label,
+        score=round(score, 3),
+        confidence=confidence,
+        rationale="local lexicon: " + " ".join(hits[:8]),
+    )
@@ -1,18 +1,107 @@
 """Stock price prediction service using OpenAI."""
 
 import json
-from datetime import datetime, timedelta
+from datetime import UTC, datetime
 from typing import Any
 
+import numpy as np
 from openai import AsyncOpenAI
 
 from app.config import settings
-from app.errors import SchemaViolation, Unprocessable
+from app.errors import AIProviderError, SchemaViolation, Unprocessable
 from app.schemas.intelligence import Article, Filing, SocialPost
 from app.schemas.market import PriceCandle, PriceSeries
-from app.schemas.prediction import FeatureImportance, PredictionPoint, PricePrediction
+from app.schemas.prediction import (
+    DailyFeatures,
+    FeatureImportance,
+    PredictionPoint,
+    PricePrediction,
+)
+from app.services.llm_gateway import LLMGateway, get_gateway
 from app.utils.time import now_utc, to_rfc3339
 
+# News sentiment weights decay linearly to MIN_DECAY_WEIGHT over 30 days
+SENTIMENT_DECAY_HOURS = 24 * 30
+MIN_DECAY_WEIGHT = 0.1
+
+# Sentiment labels are packed as small ints so counts are a single bincount
+_LABEL_CODES = {"positive": 0, "neutral": 1, "negative": 2}
+_UNSCORED = 3
+
+
+def _label_codes(items: list[Any]) -> np.ndarray:
+    """Sentiment label code per article or post (``_UNSCORED`` when absent)."""
+    return np.fromiter(
+        (_LABEL_CODES[item.sentiment.label] if item.sentiment else _UNSCORED for item in items),
+        dtype=np.int8,
+        count=len(items),
+    )
+
+
+def _news_columns(news: list[Article]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Label code, score and publication timestamp per article, from one pass over the list.
+
+    Unscored articles get ``_UNSCORED`` and a score of 0.
+    """
+    labels: list[int] = []
+    scores: list[float] = []
+    published: list[float] = []
+    for article in news:
+        published.append(article.published_at.timestamp())
+        if article.sentiment:
+            labels.append(_LABEL_CODES[article.sentiment.label])
+            scores.append(article.sentiment.score)
+        else:
+            labels.append(_UNSCORED)
+            scores.append(0.0)
+    return (
+        np.array(labels, dtype=np.int8),
+        np.array(scores, dtype=np.float64),
+        np.array(published, dtype=np.float64),
+    )
+
+
+def _engagement(posts: list[SocialPost]) -> np.ndarray:
+    """Replies plus likes per post as an int64 array."""
+    return np.fromiter(
+        (p.reply_count + p.like_count for p in posts), dtype=np.int64, count=len(posts)
+    )
+
+
+def _price_features(candles: list[PriceCandle]) -> dict[str, Any]:
+    """Compute return, volatility, momentum and volume features.
+
+    Args:
+        candles: Most recent candles, oldest first
+
+    Returns:
+        Price feature dictionary
+    """
+    features: dict[str, Any] = {}
+    n = len(candles)
+    close = np.array([c.c for c in candles], dtype=np.float64)
+    volume = np.array([c.v for c in candles], dtype=np.float64)
+
+    if n >= 2:
+        returns = np.diff(close) / close[:-1]
+
+        # Return buckets (population standard deviation)
+        features["returns_mean"] = float(returns.mean())
+        features["returns_volatility"] = float(returns.std())
+
+        # Momentum
+        if n >= 10:
+            features["momentum_10d"] = float((close[-1] - close[-10]) / close[-10])
+
+    # Volume trend
+    recent_volume = float(volume[-5:].sum()) / 5 if n >= 5 else 0.0
+    older_volume = float(volume[-10:-5].sum()) / 5 if n >= 10 else recent_volume
+    features["volume_trend"] = (
+        (recent_volume - older_volume) / older_volume if older_volume > 0 else 0.0
+    )
+
+    return features
+
 
 def _assemble_features(
     prices: PriceSeries,
@@ -21,6 +110,8 @@ def _assemble_features(
     naver_forum: list[SocialPost],
     filings: list[Filing],
     include: dict[str, bool],
+    as_of: datetime | None = None,
+    daily: list[DailyFeatures] | None = None,
 ) -> dict[str, Any]:
     """Assemble feature dictionary for prediction model.
     
@@ -29,6 +120,10 @@ def _assemble_features(
     - Event counts by sentiment polarity with recency decay
     - Social momentum indicators
     
+    Each source is walked once to extract its NumPy columns (label codes,
+    scores, timestamps, engagement) and every feature is then a vectorized
+    reduction over them, instead of one Python generator per feature.
+
     Args:
         prices: Historical price series
         news: News articles
@@ -36,75 +131,60 @@ def _assemble_features(
         naver_forum: 네이버 종토방 posts
         filings: DART filings
         include: Feature inclusion flags
-        
+        as_of: Reference time for recency features (defaults to now; backtests
+            pass the snapshot time so decay weights never look ahead)
+        daily: Optional feature-store rows; when given, intelligence features are
+            derived from them and the raw news/post/filing lists are ignored
+
     Returns:
         Feature dictionary
     """
     features: dict[str, Any] = {}
+    now = as_of or now_utc()
     
     # Price-based features
     if include.get("prices", False) and prices.candles:
-        candles = prices.candles[-30:]  # Last 30 periods
-        
-        if len(candles) >= 2:
-            # Calculate returns
-            returns = []
-            for i in range(1, len(candles)):
-                ret = (candles[i].c - candles[i - 1].c) / candles[i - 1].c
-                returns.append(ret)
-            
-            # Return buckets
-            features["returns_mean"] = sum(returns) / len(returns) if returns else 0.0
-            features["returns_volatility"] = (
-                sum((r - features["returns_mean"]) ** 2 for r in returns) / len(returns)
-            ) ** 0.5 if returns else 0.0
-            
-            # Momentum
-            if len(candles) >= 10:
-                recent_return = (candles[-1].c - candles[-10].c) / candles[-10].c
-                features["momentum_10d"] = recent_return
-        
-        # Volume trend
-        recent_volume = sum(c.v for c in candles[-5:]) / 5 if len(candles) >= 5 else 0
-        older_volume = sum(c.v for c in candles[-10:-5]) / 5 if len(candles) >= 10 else recent_volume
-        features["volume_trend"] = (recent_volume - older_volume) / older_volume if older_volume > 0 else 0.0
+        features.update(_price_features(prices.candles[-30:]))  # Last 30 periods
     
+    if daily is not None:
+        features.update(_features_from_daily(daily, include, now))
+        return features
+
+    now_ts = now.timestamp()
+
     # News sentiment features
     if include.get("news", False):
-        positive_count = sum(1 for a in news if a.sentiment and a.sentiment.label == "positive")
-        negative_count = sum(1 for a in news if a.sentiment and a.sentiment.label == "negative")
-        neutral_count = sum(1 for a in news if a.sentiment and a.sentiment.label == "neutral")
+        labels, scores, published = _news_columns(news)
+        counts = np.bincount(labels, minlength=4)
         
-        features["news_positive_count"] = positive_count
-        features["news_negative_count"] = negative_count
-        features["news_neutral_count"] = neutral_count
+        features["news_positive_count"] = int(counts[_LABEL_CODES["positive"]])
+        features["news_negative_count"] = int(counts[_LABEL_CODES["negative"]])
+        features["news_neutral_count"] = int(counts[_LABEL_CODES["neutral"]])
         features["news_total_count"] = len(news)
         
         # Weighted sentiment score with recency decay
-        now = now_utc()
-        weighted_sentiment = 0.0
-        total_weight = 0.0
-        for article in news:
-            if article.sentiment:
-                hours_old = (now - article.published_at).total_seconds() / 3600
-                weight = max(0.1, 1.0 - (hours_old / (24 * 30)))  # Decay over 30 days
-                weighted_sentiment += article.sentiment.score * weight
-                total_weight += weight
-        
-        features["news_weighted_sentiment"] = weighted_sentiment / total_weight if total_weight > 0 else 0.0
+        scored = labels != _UNSCORED
+        scores, published = scores[scored], published[scored]
+        hours_old = (now_ts - published) / 3600
+        weights = np.maximum(MIN_DECAY_WEIGHT, 1.0 - hours_old / SENTIMENT_DECAY_HOURS)
+        total_weight = float(weights.sum())
+        features["news_weighted_sentiment"] = (
+            float(np.dot(scores, weights)) / total_weight if total_weight > 0 else 0.0
+        )
     
     # 블라인드 features
     if include.get("blind", False):
+        labels = _label_codes(blind)
         features["blind_post_count"] = len(blind)
-        features["blind_engagement"] = sum(p.reply_count + p.like_count for p in blind)
+        features["blind_engagement"] = int(_engagement(blind).sum())
         
-        positive_blind = sum(1 for p in blind if p.sentiment and p.sentiment.label == "positive")
+        positive_blind = int(np.count_nonzero(labels == _LABEL_CODES["positive"]))
         features["blind_positive_ratio"] = positive_blind / len(blind) if blind else 0.0
     
     # 네이버 종토방 features
     if include.get("naver_forum", False):
         features["naver_forum_post_count"] = len(naver_forum)
-        features["naver_forum_engagement"] = sum(p.reply_count + p.like_count for p in naver_forum)
+        features["naver_forum_engagement"] = int(_engagement(naver_forum).sum())
     
     # DART filings features
     if include.get("filings", False):
@@ -113,12 +193,92 @@ def _assemble_features(
         # Recent filing indicator
         if filings:
             most_recent = max(f.filed_at for f in filings)
-            days_since_filing = (now_utc() - most_recent).days
+            days_since_filing = (now - most_recent).days
             features["days_since_last_filing"] = days_since_filing
     
     return features
 
 
+def _features_from_daily(
+    rows: list[DailyFeatures],
+    include: dict[str, bool],
+    now: datetime,
+) -> dict[str, Any]:
+    """Derive intelligence features from per-day feature-store rows.
+
+    Produces the same keys as the raw-list path. The decay-weighted news score
+    is exact for days that lie entirely on one side of the decay floor (the
+    weight is linear in the timestamp there, so per-day sums suffice); only the
+    single day straddling the floor falls back to that day's mean timestamp.
+
+    Args:
+        rows: Feature-store rows for the lookback window
+        include: Feature inclusion flags
+        now: Reference time for recency features
+
+    Returns:
+        Feature dictionary (intelligence features only)
+    """
+    features: dict[str, Any] = {}
+
+    if include.get("news", False):
+        features["news_positive_count"] = sum(r.news_positive for r in rows)
+        features["news_negative_count"] = sum(r.news_negative for r in rows)
+        features["news_neutral_count"] = sum(r.news_neutral for r in rows)
+        features["news_total_count"] = sum(r.news_count for r in rows)
+
+        now_hours = now.timestamp() / 3600
+        floor_age = (1.0 - MIN_DECAY_WEIGHT) * SENTIMENT_DECAY_HOURS
+        weighted_sentiment = 0.0
+        total_weight = 0.0
+        for row in rows:
+            if row.news_scored <= 0:
+                continue
+            midnight = datetime(row.day.year, row.day.month, row.day.day, tzinfo=UTC)
+            day_start = midnight.timestamp() / 3600
+            if now_hours - day_start <= floor_age:
+                # Linear region: sum_i (1 - (now - t_i) / D) * s_i expands into stored sums
+                base = 1.0 - now_hours / SENTIMENT_DECAY_HOURS
+                total_weight += row.news_scored * base + row.news_hours_sum / SENTIMENT_DECAY_HOURS
+                weighted_sentiment += (
+                    row.news_score_sum * base + row.news_score_hours_sum / SENTIMENT_DECAY_HOURS
+                )
+            else:
+                if now_hours - (day_start + 24) >= floor_age:
+                    weight = MIN_DECAY_WEIGHT
+                else:
+                    mean_age = now_hours - row.news_hours_sum / row.news_scored
+                    weight = max(MIN_DECAY_WEIGHT, 1.0 - mean_age / SENTIMENT_DECAY_HOURS)
+                total_weight += row.news_scored * weight
+                weighted_sentiment += row.news_score_sum * weight
+
+        features["news_weighted_sentiment"] = (
+            weighted_sentiment / total_weight if total_weight > 0 else 0.0
+        )
+
+    if include.get("blind", False):
+        blind_count = sum(r.blind_count for r in rows)
+        features["blind_post_count"] = blind_count
+        features["blind_engagement"] = sum(r.blind_engagement for r in rows)
+        features["blind_positive_ratio"] = (
+            sum(r.blind_positive for r in rows) / blind_count if blind_count else 0.0
+        )
+
+    if include.get("naver_forum", False):
+        features["naver_forum_post_count"] = sum(r.naver_forum_count for r in rows)
+        features["naver_forum_engagement"] = sum(r.naver_forum_engagement for r in rows)
+
+    if include.get("filings", False):
+        features["filings_count"] = sum(r.filings_count for r in rows)
+        filed = [
+            r.last_filed_at for r in rows if r.filings_count > 0 and r.last_filed_at is not None
+        ]
+        if filed:
+            features["days_since_last_filing"] = (now - max(filed)).days
+
+    return features
+
+
 def _to_prediction(
     company_id: str,
     ticker: str | None,
@@ -140,7 +300,7 @@ def _to_prediction(
         series: Predicted time series data
         rationale: Prediction rationale
         feature_importance: Optional feature importance scores
-        
+
     Returns:
         PricePrediction schema
     """
@@ -217,6 +377,8 @@ async def predict_price(
     naver_forum: list[SocialPost],
     filings: list[Filing],
     openai_client: AsyncOpenAI | None = None,
+    daily_features: list[DailyFeatures] | None = None,
+    gateway: LLMGateway | None = None,
 ) -> PricePrediction:
     """Generate price prediction using OpenAI with structured output.
     
@@ -231,20 +393,27 @@ async def predict_price(
         blind: 블라인드 posts
         naver_forum: 네이버 종토방 posts
         filings: DART filings
-        openai_client: Optional OpenAI client (for testing)
-        
+        openai_client: Optional OpenAI client (for testing); wrapped in a
+            private gateway instead of using the shared one
+        daily_features: Optional feature-store rows used instead of the raw
+            news/post/filing lists for intelligence features
+        gateway: LLM gateway (defaults to the shared one from the app lifespan)
+
     Returns:
         PricePrediction with forecasted series and rationale
-        
+
     Raises:
         Unprocessable: If no price history available
         SchemaViolation: If OpenAI response doesn't match schema
+        AIProviderError: If the OpenAI call fails after retries
     """
     if not prices.candles:
         raise Unprocessable("No price history available for prediction")
     
     # Assemble features
-    features = _assemble_features(prices, news, blind, naver_forum, filings, include_features)
+    features = _assemble_features(
+        prices, news, blind, naver_forum, filings, include_features, daily=daily_features
+    )
     
     # Get current price
     current_price = prices.candles[-1].c if prices.candles else 0.0
@@ -322,13 +491,13 @@ Provide predictions with uncertainty bounds and a detailed rationale explaining:
         "additionalProperties": False,
     }
     
-    # Create OpenAI client if not provided
-    if openai_client is None:
-        openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
+    if gateway is None:
+        gateway = LLMGateway(openai_client) if openai_client is not None else get_gateway()
     
     try:
         # Call OpenAI with structured output
-        response = await openai_client.chat.completions.create(
+        content = await gateway.complete(
+            "prediction",
             model=settings.openai_model,
             messages=[
                 {"role": "system", "content": "You are a financial analyst providing structured price predictions."},
@@ -345,7 +514,6 @@ Provide predictions with uncertainty bounds and a detailed rationale explaining:
         )
         
         # Parse response
-        content = response.choices[0].message.content
         if not content:
             raise SchemaViolation("Empty response from OpenAI")
         
@@ -362,11 +530,13 @@ Provide predictions with uncertainty bounds and a detailed rationale explaining:
             rationale=result["rationale"],
             feature_importance=result.get("feature_importance"),
         )
-        
+
     except json.JSONDecodeError as e:
         raise SchemaViolation(f"Failed to parse OpenAI response: {e}") from e
     except KeyError as e:
         raise SchemaViolation(f"Missing required field in OpenAI response: {e}") from e
+    except AIProviderError:
+        raise
     except Exception as e:
         raise SchemaViolation(f"Error generating prediction: {e}") from e
 
@@ -0,0 +1,272 @@
+"""Re-score stored sentiment after a prompt or model change.
+
+Rows are streamed per table in primary-key (keyset) order, scored page by page
+with bounded concurrency through the LLM gateway, and written back with one
+``UPDATE ... FROM (VALUES ...)`` per page. Progress is checkpointed as the
+highest ID below which every page is written, so a crashed run resumes without
+re-scoring finished pages.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import CompanyModel, DartFilingModel, NewsArticleModel, SocialPostModel
+from app.repositories.dart_repo import get_dart_repo
+from app.repositories.news_repo import get_news_repo
+from app.repositories.social_repo import get_social_repo
+from app.schemas.common import Sentiment
+from app.services.llm_gateway import LLMGateway
+from app.services.sentiment import SentimentItem
+from app.services.sentiment_cache import analyze_sentiments_cached, rescore_sentiments
+from app.services.sentiment_worker import TargetTable
+
+
+@dataclass(frozen=True)
+class RescoreSource:
+    """How to read and write one intelligence table."""
+
+    model: Any
+    title: Any
+    body: Any
+    repo_factory: Callable[[AsyncSession], Any]
+
+
+SOURCES: dict[TargetTable, RescoreSource] = {
+    "news": RescoreSource(
+        NewsArticleModel, NewsArticleModel.title, NewsArticleModel.summary, get_news_repo
+    ),
+    "social": RescoreSource(
+        SocialPostModel, SocialPostModel.title, SocialPostModel.content, get_social_repo
+    ),
+    "filing": RescoreSource(
+        DartFilingModel, DartFilingModel.title, DartFilingModel.summary, get_dart_repo
+    ),
+}
+
+
+@dataclass
+class RescoreProgress:
+    """Row counts and timing for throughput and ETA reporting."""
+
+    total: int = 0
+    done: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current counts, rows per second and estimated seconds remaining."""
+        elapsed = time.monotonic() - self.started
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        remaining = max(self.total - self.done, 0)
+        return {
+            "done": self.done,
+            "total": self.total,
+            "elapsed_seconds": round(elapsed, 1),
+            "rows_per_second": round(rate, 2),
+            "eta_seconds": round(remaining / rate, 1) if rate > 0 else None,
+        }
+
+
+class Checkpoint:
+    """Per-table resume position stored as JSON, replaced atomically on save."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.state: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            self.state = json.loads(self.path.read_text())
+
+    def after_id(self, table: TargetTable) -> str | None:
+        """Last ID below which every row of ``table`` is written."""
+        return self.state.get(table, {}).get("after_id")
+
+    def is_complete(self, table: TargetTable) -> bool:
+        """Whether ``table`` was fully re-scored."""
+        return bool(self.state.get(table, {}).get("complete"))
+
+    def advance(self, table: TargetTable, after_id: str, rows: int) -> None:
+        """Record that every row up to ``after_id`` is written."""
+        entry = self.state.setdefault(table, {"rows": 0})
+        entry["after_id"] = after_id
+        entry["rows"] = entry.get("rows", 0) + rows
+        self._save()
+
+    def complete(self, table: TargetTable) -> None:
+        """Mark ``table`` as finished."""
+        self.state.setdefault(table, {"rows": 0})["complete"] = True
+        self._save()
+
+    def _save(self) -> None:
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(self.state, indent=2))
+        os.replace(tmp, self.path)
+
+
+async def count_rows(
+    session: AsyncSession,
+    table: TargetTable,
+    after_id: str | None = None,
+    only_missing: bool = False,
+) -> int:
+    """Count rows left to re-score (for the ETA).
+
+    Args:
+        session: Database session
+        table: Table to count
+        after_id: Resume position
+        only_missing: Count only rows with null sentiment
+
+    Returns:
+        Number of rows
+    """
+    model = SOURCES[table].model
+    query = select(func.count()).select_from(model)
+    if after_id is not None:
+        query = query.where(model.id > after_id)
+    if only_missing:
+        query = query.where(model.sentiment.is_(None))
+    return (await session.execute(query)).scalar_one()
+
+
+async def stream_pages(
+    session: AsyncSession,
+    table: TargetTable,
+    after_id: str | None = None,
+    page_size: int = 200,
+    only_missing: bool = False,
+) -> AsyncIterator[list[tuple[str, SentimentItem]]]:
+    """Yield ``(row_id, SentimentItem)`` pages in primary-key order.
+
+    Each page is one indexed keyset query (``id > last_id ORDER BY id LIMIT n``),
+    so the cost per page stays flat however far into the table the scan is.
+
+    Args:
+        session: Database session used for reading
+        table: Table to scan
+        after_id: Start after this ID (exclusive)
+        page_size: Rows per page
+        only_missing: Only rows with null sentiment
+
+    Yields:
+        Pages of row IDs with the text to score
+    """
+    source = SOURCES[table]
+    model = source.model
+    while True:
+        query = (
+            select(model.id, source.title, source.body, CompanyModel.name)
+            .outerjoin(CompanyModel, CompanyModel.id == model.company_id)
+            .order_by(model.id)
+            .limit(page_size)
+        )
+        if after_id is not None:
+            query = query.where(model.id > after_id)
+        if only_missing:
+            query = query.where(model.sentiment.is_(None))
+        rows = (await session.execute(query)).all()
+        if not rows:
+            return
+        yield [
+            (row_id, SentimentItem(f"{title or ''}\n\n{body or ''}", table, company_name))
+            for row_id, title, body, company_name in rows
+        ]
+        after_id = rows[-1][0]
+
+
+async def rescore_table(
+    session_factory: Callable[[], Any],
+    table: TargetTable,
+    checkpoint: Checkpoint,
+    progress: RescoreProgress,
+    page_size: int = 200,
+    concurrency: int = 4,
+    only_missing: bool = False,
+    gateway: LLMGateway | None = None,
+) -> int:
+    """Re-score one table from its checkpoint to the end.
+
+    A reader streams pages into a bounded queue and ``concurrency`` writers
+    score and update them. Pages finish out of order, so the checkpoint only
+    advances over the contiguous prefix of finished pages.
+
+    Args:
+        session_factory: Factory producing async sessions
+        table: Table to re-score
+        checkpoint: Resume state (updated as pages finish)
+        progress: Counters for throughput reporting
+        page_size: Rows per page (and per UPDATE)
+        concurrency: Pages scored at once
+        only_missing: Backfill rows with null sentiment only, reusing cached
+            results; otherwise every row is re-scored and the cache refreshed
+        gateway: LLM gateway (defaults to the shared one)
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        AIProviderError: If scoring fails after the gateway's retries (the
+            checkpoint keeps every page finished before the failure)
+    """
+    queue: asyncio.Queue[tuple[int, list[tuple[str, SentimentItem]]] | None] = asyncio.Queue(
+        maxsize=concurrency
+    )
+    finished: dict[int, tuple[str, int]] = {}
+    next_page = 0
+    written = 0
+
+    async def read() -> None:
+        async with session_factory() as session:
+            page_no = 0
+            pages = stream_pages(
+                session, table, checkpoint.after_id(table), page_size, only_missing
+            )
+            async for page in pages:
+                await queue.put((page_no, page))
+                page_no += 1
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def write() -> None:
+        nonlocal next_page, written
+        while (entry := await queue.get()) is not None:
+            page_no, page = entry
+            items = [item for _, item in page]
+            async with session_factory() as session:
+                if only_missing:
+                    sentiments = await analyze_sentiments_cached(session, items, gateway=gateway)
+                else:
+                    sentiments = await rescore_sentiments(session, items, gateway=gateway)
+                updates: dict[str, Sentiment] = {
+                    row_id: s for (row_id, _), s in zip(page, sentiments, strict=True)
+                }
+                repo = await SOURCES[table].repo_factory(session)
+                await repo.update_sentiments(updates)
+
+            written += len(page)
+            progress.done += len(page)
+            finished[page_no] = (page[-1][0], len(page))
+            while next_page in finished:
+                last_id, rows = finished.pop(next_page)
+                checkpoint.advance(table, last_id, rows)
+                next_page += 1
+
+    tasks = [asyncio.create_task(read())]
+    tasks += [asyncio.create_task(write()) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    checkpoint.complete(table)
+    return written
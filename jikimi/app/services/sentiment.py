@@ -1,13 +1,17 @@
 """Sentiment analysis utilities using OpenAI."""
 
+import asyncio
 import json
-from typing import Literal
+from dataclasses import dataclass
+from typing import Any, Literal, overload
 
-from openai import AsyncOpenAI
-
-from app.config import Settings
-from app.errors import SchemaViolation, AIProviderError
+from app.config import settings
+from app.errors import AIProviderError, AppError, SchemaViolation
 from app.schemas.common import Sentiment
+from app.services.llm_gateway import CHARS_PER_TOKEN, LLMGateway, get_gateway
+
+# Rough output budget per item in a batch response (label, scores, short rationale)
+BATCH_ITEM_OUTPUT_TOKENS = 80
 
 
 def normalize_sentiment(raw: dict[str, float | str]) -> Sentiment:
@@ -18,10 +22,10 @@ def normalize_sentiment(raw: dict[str, float | str]) -> Sentiment:
     
     Args:
         raw: Raw sentiment dictionary with label, score, confidence
-        
+
     Returns:
         Validated Sentiment schema
-        
+
     Raises:
         SchemaViolation: If sentiment data is invalid
     """
@@ -58,7 +62,7 @@ async def analyze_sentiment(
     text: str,
     content_type: Literal["news", "social", "filing"],
     company_name: str | None = None,
-    settings: Settings | None = None,
+    gateway: LLMGateway | None = None,
 ) -> Sentiment:
     """Analyze sentiment of text using OpenAI with structured output.
     
@@ -70,19 +74,17 @@ async def analyze_sentiment(
         text: The text to analyze (title + content/summary)
         content_type: Type of content being analyzed
         company_name: Optional company name for context
-        settings: App settings (for OpenAI API key)
-        
+        gateway: LLM gateway (defaults to the shared one from the app lifespan)
+
     Returns:
         Sentiment analysis result
-        
+
     Raises:
         AIProviderError: If OpenAI API call fails
         SchemaViolation: If response doesn't match expected schema
     """
-    if settings is None:
-        settings = Settings()
-    
-    client = AsyncOpenAI(api_key=settings.openai_api_key)
+    if gateway is None:
+        gateway = get_gateway()
     
     # Build context-aware prompt
     context_map = {
@@ -143,7 +145,8 @@ Be conservative with extreme scores. Most content should be in the -0.3 to +0.3
     }
     
     try:
-        response = await client.chat.completions.create(
+        content = await gateway.complete(
+            "sentiment",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -160,7 +163,6 @@ Be conservative with extreme scores. Most content should be in the -0.3 to +0.3
             temperature=0.3,  # Lower temperature for more consistent analysis
         )
         
-        content = response.choices[0].message.content
         if not content:
             raise SchemaViolation("Empty response from OpenAI")
         
@@ -168,11 +170,266 @@ Be conservative with extreme scores. Most content should be in the -0.3 to +0.3
         
         # Normalize and validate
         return normalize_sentiment(result)
-        
+
     except json.JSONDecodeError as e:
         raise SchemaViolation(f"Failed to parse OpenAI response: {e}") from e
     except KeyError as e:
         raise SchemaViolation(f"Missing required field in OpenAI response: {e}") from e
+    except AIProviderError:
+        raise
     except Exception as e:
         raise AIProviderError(f"Error analyzing sentiment: {e}") from e
 
+
+
+@dataclass(frozen=True)
+class SentimentItem:
+    """One text to score with ``analyze_sentiment_batch``."""
+
+    text: str
+    content_type: Literal["news", "social", "filing"]
+    company_name: str | None = None
+
+
+BATCH_SYSTEM_PROMPT = """You are a financial sentiment analyst specialized in Korean stock markets.
+You will receive a JSON array of items. Each item has an "index", a "type" (news article,
+social media post from employees or investors, or regulatory filing (DART)), an optional
+"company" and the "text". Judge each item independently for its likely impact on that
+company's stock price.
+
+Focus on:
+- Material business developments (earnings, products, partnerships, leadership changes)
+- Market perception and investor sentiment
+- Regulatory or legal implications
+- Competitive positioning
+
+Return exactly one result per input item, echoing its "index", with:
+- label: "positive" (likely to increase stock price), "neutral" (no significant impact),
+  or "negative" (likely to decrease stock price)
+- score: numeric score from -1.0 (most negative) to +1.0 (most positive)
+- confidence: your confidence in this assessment from 0.0 to 1.0
+- rationale: brief explanation (keep it concise)
+
+Be conservative with extreme scores. Most content should be in the -0.3 to +0.3 range
+unless there's clear material impact."""
+
+BATCH_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "index": {"type": "integer"},
+                    "label": {"type": "string", "enum": ["positive", "neutral", "negative"]},
+                    "score": {"type": "number"},
+                    "confidence": {"type": "number"},
+                    "rationale": {"type": "string"},
+                },
+                "required": ["index", "label", "score", "confidence", "rationale"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["results"],
+    "additionalProperties": False,
+}
+
+def _item_tokens(item: SentimentItem) -> int:
+    """Estimated prompt + output tokens one item adds to a batch."""
+    return len(item.text) // CHARS_PER_TOKEN + BATCH_ITEM_OUTPUT_TOKENS
+
+
+def pack_batches(items: list[SentimentItem], max_tokens: int, max_items: int) -> list[list[int]]:
+    """Greedily pack item indices into batches under a token budget.
+
+    An item larger than the budget gets a batch of its own.
+
+    Args:
+        items: Items to score
+        max_tokens: Estimated token budget per batch
+        max_items: Maximum items per batch
+
+    Returns:
+        Batches of indices into ``items``, in input order
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    used = 0
+    for i, item in enumerate(items):
+        cost = _item_tokens(item)
+        if current and (used + cost > max_tokens or len(current) >= max_items):
+            batches.append(current)
+            current, used = [], 0
+        current.append(i)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _parse_batch(content: str, size: int) -> list[Sentiment]:
+    """Map a batch response back to input positions.
+
+    Args:
+        content: Raw JSON response
+        size: Number of items that were sent
+
+    Returns:
+        Sentiments ordered like the request
+
+    Raises:
+        SchemaViolation: If the response is not valid JSON or does not contain
+            exactly one well-formed result for every index
+    """
+    try:
+        results = json.loads(content)["results"]
+        by_index: dict[int, Sentiment] = {}
+        for raw in results:
+            index = int(raw["index"])
+            if not 0 <= index < size or index in by_index:
+                raise SchemaViolation(f"Unexpected or duplicate index {index} in batch response")
+            by_index[index] = normalize_sentiment(raw)
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        raise SchemaViolation(f"Malformed batch response: {e}") from e
+
+    if len(by_index) != size:
+        raise SchemaViolation(f"Batch response has {len(by_index)} results for {size} items")
+    return [by_index[i] for i in range(size)]
+
+
+async def _score_batch(
+    gateway: LLMGateway, items: list[SentimentItem]
+) -> list[Sentiment | AppError]:
+    """Score one batch, splitting it in half and retrying if the output is malformed.
+
+    A failed call yields its error in place of each of its items, so the rest
+    of the batch keeps its results.
+    """
+    try:
+        if len(items) == 1:
+            item = items[0]
+            return [await analyze_sentiment(
+                item.text, item.content_type, item.company_name, gateway=gateway
+            )]
+
+        payload: list[dict[str, Any]] = [
+            {
+                "index": i,
+                "type": item.content_type,
+                "company": item.company_name,
+                "text": item.text,
+            }
+            for i, item in enumerate(items)
+        ]
+        content = await gateway.complete(
+            "sentiment",
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": json.dumps(payload, ensure_ascii=False)},
+            ],
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "sentiment_batch",
+                    "strict": True,
+                    "schema": BATCH_RESPONSE_SCHEMA,
+                },
+            },
+            temperature=0.3,
+        )
+    except (AIProviderError, SchemaViolation) as e:
+        return [e] * len(items)
+    try:
+        return list(_parse_batch(content, len(items)))
+    except SchemaViolation:
+        mid = len(items) // 2
+        left, right = await asyncio.gather(
+            _score_batch(gateway, items[:mid]),
+            _score_batch(gateway, items[mid:]),
+        )
+        return left + right
+
+
+@overload
+async def analyze_sentiment_batch(
+    items: list[SentimentItem],
+    gateway: LLMGateway | None = None,
+    max_tokens: int | None = None,
+    max_items: int | None = None,
+    return_exceptions: Literal[False] = False,
+) -> list[Sentiment]: ...
+
+
+@overload
+async def analyze_sentiment_batch(
+    items: list[SentimentItem],
+    gateway: LLMGateway | None = None,
+    max_tokens: int | None = None,
+    max_items: int | None = None,
+    *,
+    return_exceptions: Literal[True],
+) -> list[Sentiment | AppError]: ...
+
+
+async def analyze_sentiment_batch(
+    items: list[SentimentItem],
+    gateway: LLMGateway | None = None,
+    max_tokens: int | None = None,
+    max_items: int | None = None,
+    return_exceptions: bool = False,
+) -> list[Sentiment] | list[Sentiment | AppError]:
+    """Analyze many texts with one structured-output request per batch.
+
+    Items are packed into batches under a token budget and scored with an
+    array schema; results are mapped back by index. A batch whose output is
+    malformed (missing, duplicate or invalid entries) is split in half and
+    retried, down to single-item calls. Batches run concurrently, bounded by
+    the gateway's sentiment semaphore. A failed call only fails the items it
+    carried.
+
+    Args:
+        items: Items to score
+        gateway: LLM gateway (defaults to the shared one from the app lifespan)
+        max_tokens: Estimated token budget per batch (defaults to settings)
+        max_items: Maximum items per batch (defaults to settings)
+        return_exceptions: Return each failed item's error in its place
+            instead of raising the first one
+
+    Returns:
+        Sentiments (or errors) in the same order as ``items``
+
+    Raises:
+        AIProviderError: If an OpenAI call fails (unless ``return_exceptions``)
+        SchemaViolation: If a single-item fallback response is invalid
+            (unless ``return_exceptions``)
+    """
+    if not items:
+        return []
+    if gateway is None:
+        gateway = get_gateway()
+
+    batches = pack_batches(
+        items,
+        max_tokens or settings.sentiment_batch_max_tokens,
+        max_items or settings.sentiment_batch_size,
+    )
+    scored = await asyncio.gather(
+        *(_score_batch(gateway, [items[i] for i in batch]) for batch in batches)
+    )
+
+    by_index: dict[int, Sentiment | AppError] = {}
+    for batch, sentiments in zip(batches, scored, strict=True):
+        by_index.update(zip(batch, sentiments, strict=True))
+    results = [by_index[i] for i in range(len(items))]
+    if return_exceptions:
+        return results
+    return [_raise_failed(result) for result in results]
+
+
+def _raise_failed(result: Sentiment | AppError) -> Sentiment:
+    if isinstance(result, AppError):
+        raise result
+    return result
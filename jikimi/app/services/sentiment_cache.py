@@ -0,0 +1,312 @@
+"""Content-addressed sentiment cache in front of the LLM.
+
+Lookups go in-process LRU -> local lexicon scorer (when confident enough) ->
+``sentiment_cache`` table -> LLM. Keys are
+``content_hash(text, content_type)``, so reposts that differ only in
+whitespace, punctuation, URLs or full-width characters share one entry.
+Concurrent requests for the same key wait on a single in-flight LLM call, and
+misses from a multi-item request are scored together in LLM batches.
+"""
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Literal, overload
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.errors import AppError
+from app.repositories.sentiment_cache_repo import get_sentiment_cache_repo
+from app.schemas.common import Sentiment
+from app.services.llm_gateway import LLMGateway
+from app.services.local_sentiment import analyze_sentiment_local
+from app.services.sentiment import SentimentItem, analyze_sentiment_batch
+from app.utils.hashing import content_hash
+
+
+class SentimentCache:
+    """Bounded LRU of sentiment results with hit-rate accounting."""
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, Sentiment] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[Sentiment]] = {}
+        self.memory_hits = 0
+        self.local_hits = 0
+        self.db_hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Sentiment | None:
+        """Return a cached sentiment and mark it most recently used."""
+        sentiment = self._entries.get(key)
+        if sentiment is not None:
+            self._entries.move_to_end(key)
+        return sentiment
+
+    def put(self, key: str, sentiment: Sentiment) -> None:
+        """Insert a sentiment, evicting the least recently used entry if full."""
+        self._entries[key] = sentiment
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pending(self, key: str) -> asyncio.Future[Sentiment] | None:
+        """Future of an LLM call another request is making for ``key``, if any."""
+        return self._inflight.get(key)
+
+    def claim(self, key: str) -> asyncio.Future[Sentiment]:
+        """Mark ``key`` as being scored by the caller; others wait on the returned future."""
+        future: asyncio.Future[Sentiment] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        return future
+
+    def release(self, key: str) -> None:
+        """Forget the in-flight call for ``key`` (its future is already resolved)."""
+        self._inflight.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit counts per tier and overall hit rate (LLM calls avoided / lookups)."""
+        lookups = self.memory_hits + self.local_hits + self.db_hits + self.coalesced + self.misses
+        hits = lookups - self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "lookups": lookups,
+            "memory_hits": self.memory_hits,
+            "local_hits": self.local_hits,
+            "db_hits": self.db_hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else None,
+        }
+
+
+# Process-wide cache instance
+_cache = SentimentCache(settings.sentiment_cache_size)
+
+
+def get_sentiment_cache() -> SentimentCache:
+    """Get the process-wide sentiment cache.
+
+    Returns:
+        Sentiment cache
+    """
+    return _cache
+
+
+async def analyze_sentiment_cached(
+    session: AsyncSession,
+    text: str,
+    content_type: Literal["news", "social", "filing"],
+    company_name: str | None = None,
+    gateway: LLMGateway | None = None,
+    cache: SentimentCache | None = None,
+) -> Sentiment:
+    """Analyze sentiment, reusing any earlier result for the same normalized text.
+
+    Args:
+        session: Database session (for the table tier)
+        text: The text to analyze
+        content_type: Type of content being analyzed
+        company_name: Optional company name for context on a cache miss
+        gateway: LLM gateway (defaults to the shared one)
+        cache: Cache instance (defaults to the process-wide one)
+
+    Returns:
+        Sentiment analysis result
+
+    Raises:
+        AIProviderError: If the LLM call fails on a cache miss
+        SchemaViolation: If the LLM response doesn't match the schema
+    """
+    item = SentimentItem(text=text, content_type=content_type, company_name=company_name)
+    return (await analyze_sentiments_cached(session, [item], gateway=gateway, cache=cache))[0]
+
+
+@overload
+async def analyze_sentiments_cached(
+    session: AsyncSession,
+    items: list[SentimentItem],
+    gateway: LLMGateway | None = None,
+    cache: SentimentCache | None = None,
+    return_exceptions: Literal[False] = False,
+) -> list[Sentiment]: ...
+
+
+@overload
+async def analyze_sentiments_cached(
+    session: AsyncSession,
+    items: list[SentimentItem],
+    gateway: LLMGateway | None = None,
+    cache: SentimentCache | None = None,
+    *,
+    return_exceptions: Literal[True],
+) -> list[Sentiment | AppError]: ...
+
+
+async def analyze_sentiments_cached(
+    session: AsyncSession,
+    items: list[SentimentItem],
+    gateway: LLMGateway | None = None,
+    cache: SentimentCache | None = None,
+    return_exceptions: bool = False,
+) -> list[Sentiment] | list[Sentiment | AppError]:
+    """Analyze many items, scoring only distinct uncached texts in LLM batches.
+
+    Items the local lexicon scorer labels with at least
+    ``settings.sentiment_local_min_confidence`` never reach the LLM. Duplicates
+    within ``items`` and keys already being scored by another request are
+    coalesced. The table tier is read and written with one query
+    each, and all misses go through ``analyze_sentiment_batch``. Texts whose
+    LLM call failed are not cached, and only their items fail.
+
+    Args:
+        session: Database session (for the table tier)
+        items: Items to score
+        gateway: LLM gateway (defaults to the shared one)
+        cache: Cache instance (defaults to the process-wide one)
+        return_exceptions: Return each failed item's error in its place
+            instead of raising the first one
+
+    Returns:
+        Sentiments (or errors) in the same order as ``items``
+
+    Raises:
+        AIProviderError: If an LLM call fails (unless ``return_exceptions``)
+        SchemaViolation: If an LLM response doesn't match the schema
+            (unless ``return_exceptions``)
+    """
+    cache = cache or _cache
+    min_confidence = settings.sentiment_local_min_confidence
+    keys = [content_hash(item.text, item.content_type) for item in items]
+    first: dict[str, SentimentItem] = {}
+    occurrences: dict[str, int] = {}
+    for key, item in zip(keys, items, strict=True):
+        first.setdefault(key, item)
+        occurrences[key] = occurrences.get(key, 0) + 1
+
+    found: dict[str, Sentiment | AppError] = {}
+    waiting: dict[str, asyncio.Future[Sentiment]] = {}
+    owned: dict[str, asyncio.Future[Sentiment]] = {}
+    for key, count in occurrences.items():
+        sentiment = cache.get(key)
+        if sentiment is not None:
+            cache.memory_hits += count
+            found[key] = sentiment
+            continue
+        local = analyze_sentiment_local(first[key].text)
+        if local.confidence >= min_confidence:
+            cache.local_hits += count
+            found[key] = local
+        elif (pending := cache.pending(key)) is not None:
+            cache.coalesced += count
+            waiting[key] = pending
+        else:
+            owned[key] = cache.claim(key)
+
+    try:
+        if owned:
+            repo = await get_sentiment_cache_repo(session)
+            stored = await repo.get_many(list(owned))
+            for key, sentiment in stored.items():
+                cache.db_hits += occurrences[key]
+                found[key] = sentiment
+
+            misses = [key for key in owned if key not in stored]
+            if misses:
+                cache.misses += len(misses)
+                cache.coalesced += sum(occurrences[key] - 1 for key in misses)
+                scored = await analyze_sentiment_batch(
+                    [first[key] for key in misses], gateway=gateway, return_exceptions=True
+                )
+                found.update(zip(misses, scored, strict=True))
+                await repo.put_many({
+                    key: (first[key].content_type, result)
+                    for key in misses
+                    if isinstance(result := found[key], Sentiment)
+                })
+
+            for key, future in owned.items():
+                result = found[key]
+                if isinstance(result, Sentiment):
+                    cache.put(key, result)
+                    future.set_result(result)
+                else:
+                    future.set_exception(result)
+                    future.exception()  # Mark retrieved when nobody else was waiting
+    except BaseException as e:
+        for future in owned.values():
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # Mark retrieved when nobody else was waiting
+        raise
+    finally:
+        for key in owned:
+            cache.release(key)
+
+    for key, future in waiting.items():
+        try:
+            found[key] = await asyncio.shield(future)
+        except AppError as e:
+            found[key] = e
+
+    results = [found[key] for key in keys]
+    if return_exceptions:
+        return results
+    for result in results:
+        if isinstance(result, AppError):
+            raise result
+    return [result for result in results if isinstance(result, Sentiment)]
+
+
+async def rescore_sentiments(
+    session: AsyncSession,
+    items: list[SentimentItem],
+    gateway: LLMGateway | None = None,
+    cache: SentimentCache | None = None,
+) -> list[Sentiment]:
+    """Score items ignoring earlier results and overwrite the cache with the new ones.
+
+    Used after a prompt or model change. Confident local results are still
+    taken as-is; every other distinct text is scored by the LLM in batches and
+    replaces its entry in both cache tiers.
+
+    Args:
+        session: Database session (for the table tier)
+        items: Items to score
+        gateway: LLM gateway (defaults to the shared one)
+        cache: Cache instance (defaults to the process-wide one)
+
+    Returns:
+        Sentiments in the same order as ``items``
+
+    Raises:
+        AIProviderError: If an LLM call fails
+        SchemaViolation: If an LLM response doesn't match the schema
+    """
+    cache = cache or _cache
+    min_confidence = settings.sentiment_local_min_confidence
+    keys = [content_hash(item.text, item.content_type) for item in items]
+    first: dict[str, SentimentItem] = {}
+    for key, item in zip(keys, items, strict=True):
+        first.setdefault(key, item)
+
+    found: dict[str, Sentiment] = {}
+    for key, item in first.items():
+        local = analyze_sentiment_local(item.text)
+        if local.confidence >= min_confidence:
+            found[key] = local
+
+    misses = [key for key in first if key not in found]
+    if misses:
+        scored = await analyze_sentiment_batch([first[key] for key in misses], gateway=gateway)
+        found.update(zip(misses, scored, strict=True))
+        repo = await get_sentiment_cache_repo(session)
+        await repo.put_many(
+            {key: (first[key].content_type, found[key]) for key in misses}, overwrite=True
+        )
+        for key in misses:
+            cache.put(key, found[key])
+
+    return [found[key] for key in keys]
@@ -0,0 +1,122 @@
+"""Sentiment time series from the ``sentiment_rollups`` table.
+
+``build_series`` turns rollup rows (see ``SentimentRollupsRepository``) into
+one point per bucket with an exponentially decayed running score.
+"""
+
+import math
+from datetime import datetime, timedelta
+
+from app.repositories.sentiment_rollups_repo import bucket_start
+from app.schemas.sentiment_series import (
+    SentimentBucket,
+    SentimentPoint,
+    SentimentRollup,
+    SentimentSource,
+)
+
+SENTIMENT_SOURCES: tuple[SentimentSource, ...] = ("news", "blind", "naver_forum", "dart")
+
+BUCKET_HOURS: dict[SentimentBucket, int] = {"1h": 1, "1d": 24}
+
+# Rows before the requested start read so the first decayed score has history
+WARMUP_HALF_LIVES = 4
+
+
+def build_series(
+    rows: list[SentimentRollup],
+    bucket: SentimentBucket,
+    start: datetime,
+    end: datetime,
+    half_life_hours: float,
+) -> list[SentimentPoint]:
+    """Sum rollup rows per bucket and compute the decayed score.
+
+    The decayed score at a bucket's end is ``sum(s_i * w_i) / sum(w_i)`` with
+    ``w_i = 2 ** -(age_i / half_life)`` over every item so far. Each bucket
+    adds its sums weighted at the scored items' mean time, plus the
+    first-order term from ``score_hours_sum`` for how scores are spread
+    around it, so no raw rows are needed.
+
+    Args:
+        rows: Rollup rows (any sources, rows before ``start`` warm up the decay)
+        bucket: Bucket width
+        start: First bucket to return (floored to the bucket)
+        end: End of the range (exclusive)
+        half_life_hours: Half-life of the decayed score
+
+    Returns:
+        One point per bucket from ``start`` to ``end``, oldest first
+    """
+    width = timedelta(hours=BUCKET_HOURS[bucket])
+    rate = math.log(2) / half_life_hours
+
+    totals: dict[datetime, SentimentRollup] = {}
+    for row in rows:
+        total = totals.setdefault(
+            row.bucket_start, SentimentRollup(source=row.source, bucket_start=row.bucket_start)
+        )
+        total.item_count += row.item_count
+        total.scored += row.scored
+        total.positive += row.positive
+        total.negative += row.negative
+        total.neutral += row.neutral
+        total.score_sum += row.score_sum
+        total.score_hours_sum += row.score_hours_sum
+        total.hours_sum += row.hours_sum
+
+    first = bucket_start(start, bucket)
+    points: list[SentimentPoint] = []
+    weighted_score = 0.0
+    weight = 0.0
+    at_hours: float | None = None
+    for key in sorted(k for k in totals if k < first):
+        weighted_score, weight, at_hours = _decay_add(
+            totals[key], width, rate, weighted_score, weight, at_hours
+        )
+
+    current = first
+    while current < end:
+        found = totals.get(current)
+        if found is not None:
+            weighted_score, weight, at_hours = _decay_add(
+                found, width, rate, weighted_score, weight, at_hours
+            )
+        bucket_total = found or SentimentRollup(source="news", bucket_start=current)
+        points.append(SentimentPoint(
+            bucket_start=current,
+            count=bucket_total.item_count,
+            scored=bucket_total.scored,
+            positive=bucket_total.positive,
+            negative=bucket_total.negative,
+            neutral=bucket_total.neutral,
+            mean_score=(
+                bucket_total.score_sum / bucket_total.scored if bucket_total.scored > 0 else None
+            ),
+            decayed_score=weighted_score / weight if weight > 0 else None,
+        ))
+        current += width
+    return points
+
+
+def _decay_add(
+    row: SentimentRollup,
+    width: timedelta,
+    rate: float,
+    weighted_score: float,
+    weight: float,
+    at_hours: float | None,
+) -> tuple[float, float, float]:
+    """Decay the running sums to ``row``'s bucket end and add the bucket."""
+    end_hours = (row.bucket_start + width).timestamp() / 3600
+    if at_hours is not None:
+        factor = math.exp(-rate * (end_hours - at_hours))
+        weighted_score *= factor
+        weight *= factor
+    if row.scored > 0:
+        centroid = row.hours_sum / row.scored
+        factor = math.exp(-rate * (end_hours - centroid))
+        weight += row.scored * factor
+        drift = rate * (row.score_hours_sum - centroid * row.score_sum)
+        weighted_score += factor * (row.score_sum + drift)
+    return weighted_score, weight, end_hours
@@ -0,0 +1,224 @@
+"""Background sentiment scoring for rows inserted with ``sentiment = NULL``."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.errors import AppError
+from app.repositories.dart_repo import get_dart_repo
+from app.repositories.news_repo import get_news_repo
+from app.repositories.social_repo import get_social_repo
+from app.schemas.common import Sentiment
+from app.services.http_cache import invalidate_company
+from app.services.sentiment import SentimentItem
+from app.services.sentiment_cache import analyze_sentiments_cached
+
+logger = logging.getLogger(__name__)
+
+TargetTable = Literal["news", "social", "filing"]
+
+# Repository of each target table (shared with bulk ingestion)
+REPO_FACTORIES: dict[TargetTable, Callable[[AsyncSession], Any]] = {
+    "news": get_news_repo,
+    "social": get_social_repo,
+    "filing": get_dart_repo,
+}
+
+
+@dataclass(frozen=True)
+class SentimentJob:
+    """A stored row waiting for its sentiment."""
+
+    table: TargetTable
+    row_id: str
+    company_id: str
+    item: SentimentItem
+    attempts: int = 0
+
+
+class SentimentWorker:
+    """Drains a queue of ``SentimentJob`` in batches.
+
+    Each batch waits up to ``max_wait_seconds`` to fill to ``batch_size`` jobs,
+    scores the distinct texts through the sentiment cache (so duplicate texts
+    cost one LLM call), then writes results with one bulk UPDATE per table.
+    Rows whose scoring fails (alone, or with their whole batch) are re-queued
+    up to ``max_attempts`` times; rows that still fail keep ``sentiment = NULL``
+    and can be picked up by a later backfill.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        batch_size: int = 50,
+        max_wait_seconds: float = 0.5,
+        max_attempts: int = 3,
+    ) -> None:
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.max_attempts = max_attempts
+        self._queue: asyncio.Queue[SentimentJob] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+        self.scored = 0
+        self.failed = 0
+        self.batches = 0
+
+    def enqueue(self, job: SentimentJob) -> None:
+        """Queue a row for scoring (never blocks)."""
+        self._queue.put_nowait(job)
+
+    def start(self) -> None:
+        """Start the background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="sentiment-worker")
+
+    async def stop(self, drain_timeout: float = 10.0) -> None:
+        """Finish queued work (bounded by ``drain_timeout``) and stop the task."""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+        except TimeoutError:
+            logger.warning(f"Stopping sentiment worker with {self._queue.qsize()} jobs unscored")
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth and throughput counters."""
+        return {
+            "queued": self._queue.qsize(),
+            "batches": self.batches,
+            "scored": self.scored,
+            "failed": self.failed,
+        }
+
+    async def _next_batch(self) -> list[SentimentJob]:
+        """Wait for one job, then collect more until the batch is full or the wait expires."""
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.max_wait_seconds
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                failed = await self.process(batch)
+            except Exception:
+                logger.exception(f"Sentiment batch of {len(batch)} failed")
+                failed = batch
+            try:
+                self._retry(failed)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _retry(self, jobs: list[SentimentJob]) -> None:
+        """Re-queue failed jobs, or count them failed once out of attempts."""
+        for job in jobs:
+            if job.attempts + 1 < self.max_attempts:
+                self.enqueue(SentimentJob(
+                    job.table, job.row_id, job.company_id, job.item, job.attempts + 1
+                ))
+            else:
+                self.failed += 1
+
+    async def process(self, batch: list[SentimentJob]) -> list[SentimentJob]:
+        """Score a batch and write results back with one bulk UPDATE per table.
+
+        An item whose scoring fails does not hold back the rest of the batch.
+        Cached responses of the written rows' companies are dropped afterwards,
+        so clients stop seeing their null sentiment right away.
+
+        Args:
+            batch: Jobs to score
+
+        Returns:
+            Jobs whose item could not be scored
+        """
+        failed: list[SentimentJob] = []
+        written: list[SentimentJob] = []
+        async with self.session_factory() as session:
+            results = await analyze_sentiments_cached(
+                session, [job.item for job in batch], return_exceptions=True
+            )
+
+            by_table: dict[TargetTable, dict[str, Sentiment]] = {}
+            for job, result in zip(batch, results, strict=True):
+                if isinstance(result, AppError):
+                    logger.warning(
+                        f"Sentiment of {job.table} row {job.row_id} failed: {result.detail}"
+                    )
+                    failed.append(job)
+                    continue
+                by_table.setdefault(job.table, {})[job.row_id] = result
+                written.append(job)
+
+            for table, updates in by_table.items():
+                repo = await REPO_FACTORIES[table](session)
+                await repo.update_sentiments(updates)
+
+        for company_id in {job.company_id for job in written}:
+            invalidate_company(company_id)
+        self.batches += 1
+        self.scored += len(written)
+        return failed
+
+
+# Global worker instance (started in lifespan)
+_worker: SentimentWorker | None = None
+
+
+def init_sentiment_worker(session_factory: Callable[[], Any], **kwargs: Any) -> SentimentWorker:
+    """Create and start the shared sentiment worker.
+
+    Args:
+        session_factory: Factory producing async sessions
+        **kwargs: ``SentimentWorker`` options
+
+    Returns:
+        Running sentiment worker
+    """
+    global _worker
+    _worker = SentimentWorker(session_factory, **kwargs)
+    _worker.start()
+    return _worker
+
+
+def get_sentiment_worker() -> SentimentWorker:
+    """Get the shared sentiment worker.
+
+    Returns:
+        Sentiment worker
+
+    Raises:
+        RuntimeError: If the worker is not initialized
+    """
+    if _worker is None:
+        raise RuntimeError("Sentiment worker not initialized")
+    return _worker
+
+
+async def close_sentiment_worker() -> None:
+    """Drain and stop the shared sentiment worker."""
+    global _worker
+
+    if _worker is not None:
+        await _worker.stop()
+        _worker = None
@@ -0,0 +1,356 @@
+"""Bulk loader for the daily snapshot directories (``data/YYYY-MM-DD/*.txt``).
+
+Each directory's files are read and hashed in a worker thread, parsed, and
+written in one transaction: rows go through ``COPY`` into staging tables and are merged with
+``ON CONFLICT DO NOTHING`` on the same dedupe keys the API uses, and the
+files' hashes and byte offsets are recorded in ``snapshot_files``. On later
+runs unchanged files are skipped and files that grew by appending only have
+the new bytes parsed. Only complete lines are read: a record still being
+written is left for the next load. Directories load concurrently on separate
+sessions.
+
+Sentiment comes from the local lexicon fast path when it is confident, or
+from an already-scored near-duplicate story for news;
+other rows are stored with null sentiment for ``app.cli.rescore
+--only-missing`` to fill, so loading never waits on the LLM.
+"""
+
+import asyncio
+import hashlib
+import re
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from app.config import settings
+from app.models import DartFilingModel, NewsArticleModel, PriceCandleModel, SocialPostModel
+from app.repositories.snapshot_repo import ManifestEntry, SnapshotRepository, get_snapshot_repo
+from app.schemas.common import Sentiment
+from app.schemas.company import Company
+from app.services.http_cache import invalidate_company
+from app.services.ingestion import IngestRow, article_row, filing_row, social_row
+from app.services.local_sentiment import analyze_sentiment_local
+from app.services.sentiment_worker import SentimentJob, TargetTable
+from app.services.snapshot_parser import (
+    COLLECT_INTERVAL_SECONDS,
+    NEXT_COLLECT_FILE,
+    RECORD_FILES,
+    CandleRecord,
+    parse_dart,
+    parse_forum,
+    parse_market,
+    parse_news,
+    parse_next_collect,
+)
+from app.services.story_index import get_story_index
+from app.services.trending import get_trending_counter
+
+_DAY_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# market.txt display names for companies stored under another name
+MARKET_ALIASES = {"SKT": "SK텔레콤", "LGU+": "LG유플러스", "LG U+": "LG유플러스"}
+
+
+@dataclass(frozen=True)
+class SnapshotFile:
+    """One file read from a snapshot directory."""
+
+    path: str
+    content_hash: str
+    data: bytes
+
+
+@dataclass
+class DirectoryResult:
+    """What one snapshot directory contributed."""
+
+    directory: str
+    loaded_files: list[str] = field(default_factory=list)
+    appended_files: list[str] = field(default_factory=list)
+    unchanged_files: list[str] = field(default_factory=list)
+    records: int = 0
+    skipped_lines: int = 0
+    inserted: dict[str, int] = field(default_factory=dict)
+    unscored: list[SentimentJob] = field(default_factory=list)
+
+
+def snapshot_dirs(root: Path, since: date | None = None, until: date | None = None) -> list[Path]:
+    """List ``YYYY-MM-DD`` directories under ``root`` in date order.
+
+    Args:
+        root: Data directory
+        since: First day to include
+        until: Last day to include
+
+    Returns:
+        Matching directories (``law``, ``my`` and other names are ignored)
+    """
+    dirs = []
+    for path in sorted(root.iterdir()):
+        if not path.is_dir() or not _DAY_RE.match(path.name):
+            continue
+        day = date.fromisoformat(path.name)
+        if (since and day < since) or (until and day > until):
+            continue
+        dirs.append(path)
+    return dirs
+
+
+def read_directory(
+    root: Path, directory: Path, names: set[str] | None = None
+) -> tuple[list[SnapshotFile], str]:
+    """Read the record files of one directory and hash their bytes.
+
+    Each file is cut after its last newline, so a record (or a multi-byte
+    character) caught mid-write is neither parsed nor counted in the hash
+    and offset; it is read whole once the writer finishes the line.
+
+    Args:
+        root: Data directory (paths are stored relative to it)
+        directory: Snapshot directory
+        names: Only these file names (default: every record file)
+
+    Returns:
+        Record files present, and the text of ``news-next.txt`` ("" if absent)
+    """
+    files = []
+    for name in RECORD_FILES:
+        path = directory / name
+        if (names is not None and name not in names) or not path.is_file():
+            continue
+        data = path.read_bytes()
+        data = data[:data.rfind(b"\n") + 1]
+        files.append(SnapshotFile(
+            path=path.relative_to(root).as_posix(),
+            content_hash=hashlib.sha256(data).hexdigest(),
+            data=data,
+        ))
+    next_collect = directory / NEXT_COLLECT_FILE
+    return files, next_collect.read_text(encoding="utf-8") if next_collect.is_file() else ""
+
+
+def unread_offset(data: bytes, entry: ManifestEntry | None) -> int:
+    """Byte offset to parse ``data`` from, given what the manifest has loaded.
+
+    Returns the recorded offset when the file still starts with the loaded
+    bytes (it was appended to), and 0 when it is new, shorter, or rewritten.
+    Rewritten files are parsed in full; rows already stored dedupe away.
+
+    Args:
+        data: Current file contents
+        entry: Manifest entry for the file, if any
+
+    Returns:
+        Offset of the first unparsed byte
+    """
+    if entry is None or not 0 < entry.byte_offset <= len(data):
+        return 0
+    if hashlib.sha256(data[:entry.byte_offset]).hexdigest() != entry.content_hash:
+        return 0
+    return entry.byte_offset
+
+
+def _local_sentiment(row: IngestRow) -> Sentiment | None:
+    sentiment = analyze_sentiment_local(row.item.text)
+    return sentiment if sentiment.confidence >= settings.sentiment_local_min_confidence else None
+
+
+def _rows(rows: list[IngestRow], prefix: str) -> list[dict[str, Any]]:
+    return [
+        {
+            **row.values,
+            "id": f"{prefix}_{uuid.uuid4().hex[:12]}",
+            "sentiment": _local_sentiment(row),
+        }
+        for row in rows
+    ]
+
+
+def _assign_stories(values: list[dict[str, Any]]) -> None:
+    """Set ``story_id`` on article rows and share sentiment within each story."""
+    index = get_story_index()
+    for value in values:
+        story = index.assign(value["company_id"], value["title"], value["published_at"])
+        value["story_id"] = story.story_id
+        if value["sentiment"] is None:
+            value["sentiment"] = story.sentiment
+        else:
+            index.set_sentiment(story.story_id, value["sentiment"])
+
+
+async def _copy_intelligence(
+    repo: SnapshotRepository,
+    model: Any,
+    table: TargetTable,
+    rows: list[IngestRow],
+    prefix: str,
+    result: DirectoryResult,
+) -> None:
+    """COPY intelligence rows and note the inserted ones still needing sentiment."""
+    values = _rows(rows, prefix)
+    if table == "news":
+        _assign_stories(values)
+    inserted = set(await repo.copy_rows(model, values))
+    result.inserted[table] = len(inserted)
+    if table != "filing":
+        get_trending_counter().record_rows([value for value in values if value["id"] in inserted])
+    for company_id in {value["company_id"] for value in values if value["id"] in inserted}:
+        invalidate_company(company_id)
+    result.unscored.extend(
+        SentimentJob(table=table, row_id=value["id"], company_id=value["company_id"], item=row.item)
+        for value, row in zip(values, rows, strict=True)
+        if value["id"] in inserted and value["sentiment"] is None
+    )
+
+
+async def _candle_rows(
+    repo: SnapshotRepository, company: Company, candles: list[CandleRecord]
+) -> list[dict[str, Any]]:
+    """Daily ``price_candles`` rows for quotes whose name resolves to a company.
+
+    A quote only carries the close, so open/high/low are set to it.
+    """
+    names = {c.name for c in candles}
+    names |= {MARKET_ALIASES[c.name] for c in candles if c.name in MARKET_ALIASES}
+    ids = await repo.company_ids(sorted(names))
+    ids.setdefault(company.name, company.id)
+    rows = []
+    for candle in candles:
+        company_id = ids.get(candle.name) or ids.get(MARKET_ALIASES.get(candle.name, ""))
+        if company_id is None:
+            continue
+        rows.append({
+            "company_id": company_id,
+            "timestamp": candle.timestamp,
+            "interval": "1d",
+            "open": candle.close,
+            "high": candle.close,
+            "low": candle.close,
+            "close": candle.close,
+            "volume": candle.volume,
+            "adjust_type": "none",
+        })
+    return rows
+
+
+async def load_directory(
+    session_factory: Callable[[], Any],
+    root: Path,
+    directory: Path,
+    company: Company,
+    force: bool = False,
+    names: set[str] | None = None,
+) -> DirectoryResult:
+    """Load one snapshot directory in a single transaction.
+
+    Args:
+        session_factory: Factory producing async sessions
+        root: Data directory
+        directory: Snapshot directory (``YYYY-MM-DD``)
+        company: Company the news, forum and DART lines belong to
+        force: Parse whole files even if the manifest has them
+        names: Only these file names (the watcher passes the changed ones)
+
+    Returns:
+        Per-directory counts, plus inserted rows left without sentiment
+    """
+    day = date.fromisoformat(directory.name)
+    files, next_collect = await asyncio.to_thread(read_directory, root, directory, names)
+    result = DirectoryResult(directory=directory.name)
+
+    async with session_factory() as session:
+        repo = await get_snapshot_repo(session)
+        loaded = {} if force else await repo.loaded_files(company.id, [f.path for f in files])
+        collect_at = parse_next_collect(next_collect)
+        collected_at = (
+            collect_at - timedelta(seconds=COLLECT_INTERVAL_SECONDS) if collect_at else None
+        )
+
+        news: list[IngestRow] = []
+        posts: list[IngestRow] = []
+        filings: list[IngestRow] = []
+        candles: list[CandleRecord] = []
+        manifest: dict[str, ManifestEntry] = {}
+        for file in files:
+            entry = loaded.get(file.path)
+            if entry is not None and entry.content_hash == file.content_hash:
+                result.unchanged_files.append(file.path)
+                continue
+            offset = unread_offset(file.data, entry)
+            text = file.data[offset:].decode("utf-8", errors="replace")
+            name = file.path.rsplit("/", 1)[-1]
+            skipped: list[str] = []
+            if name in ("news.txt", "new-list.txt"):
+                articles = parse_news(text, company.id, day, collected_at, skipped)
+                parsed = [article_row(r, company.name) for r in articles]
+                news.extend(parsed)
+                count = len(parsed)
+            elif name == "forum.txt":
+                forum_posts = parse_forum(text, company.id, day, skipped)
+                parsed = [social_row(r, company.name) for r in forum_posts]
+                posts.extend(parsed)
+                count = len(parsed)
+            elif name == "dart.txt":
+                dart_filings = parse_dart(text, company.id, day, skipped)
+                parsed = [filing_row(r, company.name) for r in dart_filings]
+                filings.extend(parsed)
+                count = len(parsed)
+            else:
+                quotes = parse_market(text, day, skipped)
+                candles.extend(quotes)
+                count = len(quotes)
+            result.loaded_files.append(file.path)
+            if offset:
+                result.appended_files.append(file.path)
+            result.records += count
+            result.skipped_lines += len(skipped)
+            previous = entry.records if offset and entry is not None else 0
+            manifest[file.path] = ManifestEntry(file.content_hash, len(file.data), previous + count)
+
+        if not manifest:
+            return result
+
+        await _copy_intelligence(repo, NewsArticleModel, "news", news, "article", result)
+        await _copy_intelligence(repo, SocialPostModel, "social", posts, "post", result)
+        await _copy_intelligence(repo, DartFilingModel, "filing", filings, "filing", result)
+        candle_rows = await _candle_rows(repo, company, candles)
+        result.skipped_lines += len(candles) - len(candle_rows)
+        result.inserted["candles"] = len(await repo.copy_rows(PriceCandleModel, candle_rows))
+        await repo.record_files(company.id, manifest)
+        await session.commit()
+    return result
+
+
+async def load_snapshots(
+    session_factory: Callable[[], Any],
+    root: Path,
+    company: Company,
+    since: date | None = None,
+    until: date | None = None,
+    concurrency: int = 4,
+    force: bool = False,
+) -> list[DirectoryResult]:
+    """Load every snapshot directory under ``root``.
+
+    Args:
+        session_factory: Factory producing async sessions
+        root: Data directory
+        company: Company the snapshots belong to
+        since: First day to load
+        until: Last day to load
+        concurrency: Directories loaded at once (one connection each)
+        force: Ignore the manifest
+
+    Returns:
+        One result per directory, in date order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def load(directory: Path) -> DirectoryResult:
+        async with semaphore:
+            return await load_directory(session_factory, root, directory, company, force)
+
+    return list(await asyncio.gather(*(load(d) for d in snapshot_dirs(root, since, until))))
@@ -0,0 +1,292 @@
+"""Parsers for the daily snapshot files in ``data/YYYY-MM-DD/``.
+
+Python counterparts of ``lib/parser.ts``. Each parser turns one file's text
+into the API's create-request models (or candle records for ``market.txt``),
+so snapshot rows get the same validation and dedupe keys as API writes.
+Lines that don't match a known format are skipped, and appended to the
+``skipped`` list when the caller passes one.
+"""
+
+import html
+import re
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time
+from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qs, urlsplit
+from zoneinfo import ZoneInfo
+
+from pydantic import ValidationError
+
+from app.config import settings
+from app.schemas.intelligence import (
+    CreateArticleRequest,
+    CreateFilingRequest,
+    CreateSocialPostRequest,
+)
+from app.utils.time import parse_ts
+
+# Files loaded as records, in load order; news-next.txt only timestamps new-list.txt
+RECORD_FILES = ("news.txt", "new-list.txt", "forum.txt", "dart.txt", "market.txt")
+NEXT_COLLECT_FILE = "news-next.txt"
+
+# new-list.txt is rewritten hourly; news-next.txt holds the next collection time
+COLLECT_INTERVAL_SECONDS = 3600
+
+_LEGACY_TIME_RE = re.compile(r"\[(\d{2}):(\d{2})\]")
+_FORUM_RE = re.compile(r"^\[(?P<platform>[^\]]+)\]\s*(?P<content>.+)$")
+_MARKET_RE = re.compile(
+    r"^(?P<name>[^:]+):\s*(?P<price>[\d,]+(?:\.\d+)?)\s*\((?P<pct>[+\-]?[\d.]+)%\)"
+)
+_VOLUME_RE = re.compile(r"([\d.]+)\s*([KMB])?", re.IGNORECASE)
+_VOLUME_UNITS = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+
+# Forum tags -> social_posts.platform; other boards (Reddit, DC, ...) are not stored
+FORUM_PLATFORMS = {
+    "blind": "blind", "블라인드": "blind",
+    "종토방": "naver_forum", "naver": "naver_forum", "네이버": "naver_forum",
+}
+
+# dart.txt lines are key figures rather than receipts; typed by the same
+# keywords lib/parser.ts uses to pick them out
+_DART_TYPES = (
+    ("매출", "실적"), ("영업이익", "실적"), ("순이익", "실적"),
+    ("CAPEX", "투자"), ("인건비", "인건비"), ("자사주", "자사주"),
+)
+DART_DEFAULT_TYPE = "주요지표"
+
+
+@dataclass(frozen=True)
+class CandleRecord:
+    """One ``market.txt`` quote (a daily close with no intraday range)."""
+
+    name: str
+    timestamp: datetime
+    close: float
+    change_pct: float
+    volume: int
+
+
+def snapshot_day(day: date) -> datetime:
+    """Timestamp used for lines without a time: the day at 00:00 UTC.
+
+    This is the same day boundary the feature store buckets by, so undated
+    lines count toward the snapshot's own date.
+    """
+    return datetime.combine(day, time(0, 0), tzinfo=UTC)
+
+
+def _lines(text: str) -> list[str]:
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def _skip(skipped: list[str] | None, line: str) -> None:
+    if skipped is not None:
+        skipped.append(line)
+
+
+def unwrap_link(url: str) -> str:
+    """Return the publisher URL behind a Bing News redirect (other URLs unchanged)."""
+    url = html.unescape(url)
+    parts = urlsplit(url)
+    if parts.hostname and parts.hostname.endswith("bing.com") and "apiclick" in parts.path:
+        embedded = parse_qs(parts.query).get("url", [""])[0]
+        if embedded.startswith(("http://", "https://")):
+            return embedded
+    return url
+
+
+def _parse_pub_date(value: str, default: datetime) -> datetime:
+    try:
+        return parse_ts(value)
+    except ValueError:
+        pass
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def parse_next_collect(text: str) -> datetime | None:
+    """Parse ``news-next.txt`` (an RFC3339 time), or None if empty/invalid."""
+    try:
+        return parse_ts(text.strip())
+    except ValueError:
+        return None
+
+
+def parse_news(
+    text: str,
+    company_id: str,
+    day: date,
+    collected_at: datetime | None = None,
+    skipped: list[str] | None = None,
+) -> list[CreateArticleRequest]:
+    """Parse ``news.txt`` / ``new-list.txt`` lines.
+
+    Three layouts are recognised, as in ``parseNews``:
+
+    - ``title | url | source`` (new-list.txt), stamped with ``collected_at``
+    - ``pubDate | source | title | url``
+    - ``[HH:MM] source | title | (label)`` (time in ``settings.default_tz``;
+      the optional label becomes the summary)
+
+    Titles are HTML-unescaped and Bing redirect links unwrapped (with the
+    publisher's host as the source), so the dedupe key is the publisher URL
+    rather than a per-fetch redirect.
+
+    Args:
+        text: File contents
+        company_id: Company the snapshot belongs to
+        day: Snapshot date (directory name)
+        collected_at: When new-list.txt was fetched (defaults to the day)
+        skipped: Collects the lines that yield no article
+
+    Returns:
+        Article requests in file order
+    """
+    fallback = snapshot_day(day)
+    tz = ZoneInfo(settings.default_tz)
+    articles: list[CreateArticleRequest] = []
+    for line in _lines(text):
+        parts = [html.unescape(part.strip()) for part in line.split("|")]
+        fields: dict[str, object]
+        if len(parts) >= 3 and parts[1].startswith("http"):
+            url = unwrap_link(parts[1])
+            source = parts[2]
+            if url != parts[1]:
+                source = (urlsplit(url).hostname or source).removeprefix("www.")
+            fields = {"title": parts[0], "url": url, "source": source or "unknown",
+                      "published_at": collected_at or fallback}
+        elif len(parts) >= 4 and parts[3].startswith("http"):
+            fields = {"title": parts[2], "url": unwrap_link(parts[3]),
+                      "source": parts[1] or "unknown",
+                      "published_at": _parse_pub_date(parts[0], fallback)}
+        elif len(parts) >= 2:
+            match = _LEGACY_TIME_RE.search(parts[0])
+            published_at = fallback
+            if match:
+                hour, minute = int(match.group(1)), int(match.group(2))
+                local = datetime.combine(day, time(hour, minute), tzinfo=tz)
+                published_at = local.astimezone(UTC)
+            fields = {"title": parts[1],
+                      "source": _LEGACY_TIME_RE.sub("", parts[0]).strip() or "unknown",
+                      "published_at": published_at,
+                      "summary": parts[2] if len(parts) > 2 and parts[2] else None}
+        else:
+            _skip(skipped, line)
+            continue
+        try:
+            articles.append(CreateArticleRequest(company_id=company_id, **fields))
+        except ValidationError:
+            _skip(skipped, line)
+    return articles
+
+
+def parse_forum(
+    text: str, company_id: str, day: date, skipped: list[str] | None = None
+) -> list[CreateSocialPostRequest]:
+    """Parse ``forum.txt`` lines of the form ``[Platform] content (긍정)``.
+
+    The trailing label is kept in the content so the local sentiment fast
+    path can read it. Lines from boards without a ``social_posts`` platform
+    (see ``FORUM_PLATFORMS``) are skipped.
+
+    Args:
+        text: File contents
+        company_id: Company the snapshot belongs to
+        day: Snapshot date
+        skipped: Collects the lines that yield no post
+
+    Returns:
+        Social post requests in file order
+    """
+    posts: list[CreateSocialPostRequest] = []
+    for line in _lines(text):
+        match = _FORUM_RE.match(line)
+        platform = FORUM_PLATFORMS.get(match.group("platform").strip().lower()) if match else None
+        if match is None or platform is None:
+            _skip(skipped, line)
+            continue
+        try:
+            posts.append(CreateSocialPostRequest(
+                platform=platform,
+                content=html.unescape(match.group("content").strip()),
+                posted_at=snapshot_day(day),
+                company_id=company_id,
+            ))
+        except ValidationError:
+            _skip(skipped, line)
+    return posts
+
+
+def dart_type(line: str) -> str:
+    """Filing type for a ``dart.txt`` line, by keyword."""
+    for keyword, filing_type in _DART_TYPES:
+        if keyword in line:
+            return filing_type
+    return DART_DEFAULT_TYPE
+
+
+def parse_dart(
+    text: str, company_id: str, day: date, skipped: list[str] | None = None
+) -> list[CreateFilingRequest]:
+    """Parse ``dart.txt``: one key-figure line per filing row.
+
+    Args:
+        text: File contents
+        company_id: Company the snapshot belongs to
+        day: Snapshot date
+        skipped: Collects the lines that yield no filing
+
+    Returns:
+        Filing requests in file order
+    """
+    filings: list[CreateFilingRequest] = []
+    for line in _lines(text):
+        try:
+            filings.append(CreateFilingRequest(
+                title=line,
+                filing_type=dart_type(line),
+                filed_at=snapshot_day(day),
+                company_id=company_id,
+            ))
+        except ValidationError:
+            _skip(skipped, line)
+    return filings
+
+
+def parse_volume(value: str) -> int:
+    """Parse volumes such as ``거래량 2.1M`` or ``1,234,000``."""
+    match = _VOLUME_RE.search(value.replace(",", ""))
+    if not match:
+        return 0
+    return round(float(match.group(1)) * _VOLUME_UNITS.get((match.group(2) or "").upper(), 1))
+
+
+def parse_market(text: str, day: date, skipped: list[str] | None = None) -> list[CandleRecord]:
+    """Parse ``market.txt`` lines such as ``KT: 36,500 (+0.8%) | 거래량 2.1M``.
+
+    Args:
+        text: File contents
+        day: Snapshot date
+        skipped: Collects the lines that yield no quote
+
+    Returns:
+        One daily quote per line, keyed by display name
+    """
+    candles: list[CandleRecord] = []
+    for line in _lines(text):
+        parts = [part.strip() for part in line.split("|")]
+        match = _MARKET_RE.match(parts[0])
+        if not match:
+            _skip(skipped, line)
+            continue
+        candles.append(CandleRecord(
+            name=match.group("name").strip(),
+            timestamp=snapshot_day(day),
+            close=float(match.group("price").replace(",", "")),
+            change_pct=float(match.group("pct")),
+            volume=parse_volume(parts[1]) if len(parts) > 1 else 0,
+        ))
+    return candles
@@ -0,0 +1,287 @@
+"""Watch the snapshot data directory and ingest files as they change.
+
+Change events come from ``watchfiles`` (inotify on Linux) when it is
+installed, otherwise from polling the ``stat`` of record files in the most
+recent day directories. Changed paths are debounced into batches and loaded
+through ``load_directory`` with only those files, which parses just the bytes
+appended since the manifest's offset. Rows the local lexicon can't score are
+handed to the deferred sentiment worker when one is running.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from app.config import settings
+from app.repositories.companies_repo import get_companies_repo
+from app.schemas.company import Company
+from app.services.sentiment_worker import get_sentiment_worker
+from app.services.snapshot_loader import load_directory
+from app.services.snapshot_parser import RECORD_FILES
+
+try:
+    from watchfiles import awatch
+except ImportError:  # polling fallback
+    awatch = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+def _is_day(name: str) -> bool:
+    try:
+        date.fromisoformat(name)
+    except ValueError:
+        return False
+    return True
+
+
+def _snapshot_file(root: Path, path: Path) -> tuple[Path, str] | None:
+    """``(directory, file name)`` if ``path`` is a record file in a day directory under ``root``."""
+    if path.name not in RECORD_FILES or path.parent.parent != root or not _is_day(path.parent.name):
+        return None
+    return path.parent, path.name
+
+
+class SnapshotWatcher:
+    """Loads snapshot files shortly after they are created or modified.
+
+    A change starts a batch; the batch is flushed once no further change has
+    arrived for ``debounce_seconds`` (or after ``max_wait_seconds``), so a
+    crawler rewriting several files at once costs one transaction per day
+    directory. On start, files in the last ``recent_days`` directories are
+    checked once to catch up on changes made while the watcher was down.
+    A batch that fails is rolled back, leaving its manifest entries as they
+    were, and queued again after ``retry_seconds``.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        root: Path,
+        company_id: str,
+        debounce_seconds: float = 1.0,
+        max_wait_seconds: float = 10.0,
+        poll_interval_seconds: float = 2.0,
+        recent_days: int = 1,
+        force_polling: bool = False,
+        retry_seconds: float = 30.0,
+    ) -> None:
+        self.session_factory = session_factory
+        self.root = root.resolve()
+        self.company_id = company_id
+        self.debounce_seconds = debounce_seconds
+        self.max_wait_seconds = max_wait_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self.recent_days = recent_days
+        self.retry_seconds = retry_seconds
+        self.mode = "polling" if force_polling or awatch is None else "inotify"
+        self._changes: asyncio.Queue[tuple[Path, str, float]] = asyncio.Queue()
+        self._stop = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._company: Company | None = None
+        self.batches = 0
+        self.files_loaded = 0
+        self.rows_inserted = 0
+        self.errors = 0
+        self.last_lag_seconds: float | None = None
+
+    def start(self) -> None:
+        """Start the change source and the loader tasks."""
+        if self._tasks:
+            return
+        self._stop.clear()
+        source = self._watch() if self.mode == "inotify" else self._poll()
+        self._tasks = [
+            asyncio.create_task(source, name="snapshot-watcher-source"),
+            asyncio.create_task(self._run(), name="snapshot-watcher"),
+        ]
+
+    async def stop(self) -> None:
+        """Stop watching (a batch being loaded is cancelled and rolled back)."""
+        self._stop.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self) -> dict[str, Any]:
+        """Change source, pending changes and load counters."""
+        return {
+            "mode": self.mode,
+            "pending": self._changes.qsize(),
+            "batches": self.batches,
+            "files_loaded": self.files_loaded,
+            "rows_inserted": self.rows_inserted,
+            "errors": self.errors,
+            "last_lag_seconds": self.last_lag_seconds,
+        }
+
+    def notify(self, path: Path) -> None:
+        """Queue a changed path (ignored unless it is a snapshot record file)."""
+        target = _snapshot_file(self.root, path.resolve())
+        if target is not None:
+            self._changes.put_nowait((*target, time.monotonic()))
+
+    def recent_files(self) -> list[Path]:
+        """Record files in the last ``recent_days`` day directories (and newer)."""
+        today = datetime.now(ZoneInfo(settings.default_tz)).date()
+        cutoff = (today - timedelta(days=self.recent_days)).isoformat()
+        files: list[Path] = []
+        for directory in sorted(self.root.iterdir()):
+            if directory.is_dir() and _is_day(directory.name) and directory.name >= cutoff:
+                files.extend(
+                    directory / name for name in RECORD_FILES if (directory / name).is_file()
+                )
+        return files
+
+    async def _watch(self) -> None:
+        for path in self.recent_files():
+            self.notify(path)
+        changes: AsyncIterator[set[tuple[Any, str]]] = awatch(
+            self.root, stop_event=self._stop, debounce=50, step=50, recursive=True
+        )
+        async for batch in changes:
+            for _, changed in batch:
+                self.notify(Path(changed))
+
+    async def _poll(self) -> None:
+        """Stat recent record files each interval and queue the ones that changed.
+
+        Only the root listing and the recent day directories are touched, so
+        the cost does not grow with the number of past days kept on disk.
+        """
+        seen: dict[Path, tuple[int, int]] = {}
+        while not self._stop.is_set():
+            for path in self.recent_files():
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if seen.get(path) != signature:
+                    seen[path] = signature
+                    self.notify(path)
+            await asyncio.sleep(self.poll_interval_seconds)
+
+    async def _next_batch(self) -> tuple[dict[Path, set[str]], float]:
+        """Wait for a change, then collect more until quiet.
+
+        Returns the changed files per directory and the time of the first change.
+        """
+        directory, name, first_seen = await self._changes.get()
+        batch: dict[Path, set[str]] = {directory: {name}}
+        deadline = time.monotonic() + self.max_wait_seconds
+        while True:
+            timeout = min(self.debounce_seconds, deadline - time.monotonic())
+            if timeout <= 0:
+                break
+            try:
+                directory, name, _ = await asyncio.wait_for(self._changes.get(), timeout=timeout)
+            except TimeoutError:
+                break
+            batch.setdefault(directory, set()).add(name)
+        return batch, first_seen
+
+    async def _run(self) -> None:
+        while True:
+            batch, first_seen = await self._next_batch()
+            try:
+                await self.flush(batch)
+                self.last_lag_seconds = round(time.monotonic() - first_seen, 3)
+            except Exception:
+                self.errors += 1
+                logger.exception(
+                    f"Snapshot load of {sorted(d.name for d in batch)} failed; "
+                    f"retrying in {self.retry_seconds}s"
+                )
+                asyncio.get_running_loop().call_later(
+                    self.retry_seconds, self._requeue, batch, first_seen
+                )
+
+    def _requeue(self, batch: dict[Path, set[str]], first_seen: float) -> None:
+        """Queue the files of a failed batch again."""
+        if self._stop.is_set():
+            return
+        for directory, names in batch.items():
+            for name in names:
+                self._changes.put_nowait((directory, name, first_seen))
+
+    async def flush(self, batch: dict[Path, set[str]]) -> None:
+        """Load the changed files of each directory and queue unscored rows.
+
+        Args:
+            batch: Changed file names per day directory
+        """
+        if self._company is None:
+            async with self.session_factory() as session:
+                repo = await get_companies_repo(session)
+                self._company = await repo.get_company(self.company_id)
+            if self._company is None:
+                raise RuntimeError(f"Snapshot watcher company not found: {self.company_id}")
+
+        for directory, names in sorted(batch.items()):
+            result = await load_directory(
+                self.session_factory, self.root, directory, self._company, names=names
+            )
+            self.files_loaded += len(result.loaded_files)
+            self.rows_inserted += sum(result.inserted.values())
+            if result.unscored:
+                try:
+                    worker = get_sentiment_worker()
+                except RuntimeError:
+                    continue
+                for job in result.unscored:
+                    worker.enqueue(job)
+        self.batches += 1
+
+
+# Global watcher instance (started in lifespan when SNAPSHOT_WATCH_DIR is set)
+_watcher: SnapshotWatcher | None = None
+
+
+def init_snapshot_watcher(
+    session_factory: Callable[[], Any], root: Path, company_id: str, **kwargs: Any
+) -> SnapshotWatcher:
+    """Create and start the shared snapshot watcher.
+
+    Args:
+        session_factory: Factory producing async sessions
+        root: Data directory holding ``YYYY-MM-DD`` folders
+        company_id: Company the snapshots belong to
+        **kwargs: ``SnapshotWatcher`` options
+
+    Returns:
+        Running snapshot watcher
+    """
+    global _watcher
+    _watcher = SnapshotWatcher(session_factory, root, company_id, **kwargs)
+    _watcher.start()
+    return _watcher
+
+
+def get_snapshot_watcher() -> SnapshotWatcher:
+    """Get the shared snapshot watcher.
+
+    Returns:
+        Snapshot watcher
+
+    Raises:
+        RuntimeError: If the watcher is not running
+    """
+    if _watcher is None:
+        raise RuntimeError("Snapshot watcher not initialized")
+    return _watcher
+
+
+async def close_snapshot_watcher() -> None:
+    """Stop the shared snapshot watcher."""
+    global _watcher
+
+    if _watcher is not None:
+        await _watcher.stop()
+        _watcher = None
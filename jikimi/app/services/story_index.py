@@ -0,0 +1,321 @@
+"""Near-duplicate story index for news titles (MinHash LSH).
+
+Syndicated stories reach the crawler from several outlets with slightly
+different titles (``[속보]`` prefixes, `` - 뉴스1`` suffixes, other quote
+marks, a reworded clause). Titles are normalized and shingled into
+character bigrams, which works for Korean without a tokenizer. Each shingle set gets a MinHash
+signature, split into bands that are hashed into per-company buckets. An
+incoming article joins the most similar recent article's story among its
+bucket candidates when the estimated Jaccard similarity reaches
+``settings.story_min_similarity``; otherwise it starts a new story.
+Assignment is one small numpy pass plus a few dict lookups, well under a
+millisecond.
+
+The index lives in process memory and is rebuilt from recent rows at
+startup. It also remembers each story's sentiment, so later copies reuse the
+first copy's score instead of calling the LLM.
+"""
+
+import asyncio
+import logging
+import re
+import time
+import unicodedata
+import uuid
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+import numpy as np
+
+from app.config import settings
+from app.repositories.news_repo import get_news_repo
+from app.schemas.common import Sentiment
+from app.utils.time import now_utc
+
+logger = logging.getLogger(__name__)
+
+SHINGLE_SIZE = 2
+
+# Titles with fewer shingles are too short to tell syndication from coincidence
+MIN_SHINGLES = 8
+
+# Copies at least this similar add nothing to match against and are not indexed
+COPY_SIMILARITY = 0.9
+
+# Newest articles kept per LSH bucket, and candidates compared per assignment
+BUCKET_SIZE = 64
+MAX_CANDIDATES = 16
+
+# Articles assigned between event-loop yields while warming the index at startup
+WARM_CHUNK = 1_000
+
+# Universal hashing (a*x + b) mod p; fixed seed so signatures are stable across restarts
+_PRIME = (1 << 31) - 1
+_MAX_PERM = 256
+_rng = np.random.default_rng(0x5709)
+_A = _rng.integers(1, _PRIME, size=_MAX_PERM, dtype=np.uint64)
+_B = _rng.integers(0, _PRIME, size=_MAX_PERM, dtype=np.uint64)
+
+# Leading tags such as [속보], (종합), 【단독】 and a trailing " - 매체명" / " | 매체명"
+_TAG_RE = re.compile(r"^(?:\s*[\[(【<〈][^\])】>〉]{1,12}[\])】>〉])+")
+_OUTLET_RE = re.compile(r"\s+[-|–—]\s+[^-|–—]{1,20}$")
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def normalize_title(title: str) -> str:
+    """Title with tags, outlet suffix, punctuation and whitespace removed (lowercased, NFKC)."""
+    text = unicodedata.normalize("NFKC", title)
+    text = _TAG_RE.sub("", text)
+    text = _OUTLET_RE.sub("", text)
+    return _NON_WORD_RE.sub("", text.lower())
+
+
+def shingles(title: str) -> set[str]:
+    """Character bigrams of the normalized title."""
+    text = normalize_title(title)
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def signature(grams: set[str], num_perm: int) -> np.ndarray:
+    """MinHash signature (``num_perm`` uint64 minima) of a shingle set."""
+    hashes = np.fromiter(
+        (zlib.crc32(g.encode()) for g in grams),
+        dtype=np.uint64,
+        count=len(grams),
+    )
+    minima: np.ndarray = ((np.outer(hashes, _A[:num_perm]) + _B[:num_perm]) % _PRIME).min(axis=0)
+    return minima
+
+
+@dataclass(frozen=True)
+class StoryMatch:
+    """Story an article was assigned to."""
+
+    story_id: str
+    is_new: bool
+    similarity: float | None
+    sentiment: Sentiment | None
+
+
+@dataclass
+class _Entry:
+    company_id: str
+    story_id: str
+    published_at: datetime
+    signature: np.ndarray
+    buckets: list[tuple[str, int, bytes]]
+
+
+@dataclass
+class _Story:
+    size: int = 0
+    sentiment: Sentiment | None = None
+
+
+class StoryIndex:
+    """Incremental MinHash LSH index of recent news titles.
+
+    With 32 bands of 4 rows, pairs at Jaccard 0.5 share a bucket with
+    probability ~0.87 and at 0.6 with ~0.99. The candidates sharing the most
+    buckets are checked against the signature estimate, so the threshold is
+    what decides. Buckets keep their newest ``BUCKET_SIZE`` articles, which
+    bounds the work per assignment when one headline template recurs, and
+    the oldest articles are evicted past ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 32,
+        threshold: float = 0.5,
+        window: timedelta = timedelta(days=3),
+        max_entries: int = 50_000,
+    ) -> None:
+        if num_perm > _MAX_PERM or num_perm % bands:
+            raise ValueError(f"num_perm must be a multiple of bands and at most {_MAX_PERM}")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.window = window
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._buckets: dict[tuple[str, int, bytes], dict[int, None]] = {}
+        self._stories: dict[str, _Story] = {}
+        self._next = 0
+        self.assigned = 0
+        self.matched = 0
+        self.too_short = 0
+        self.assign_seconds = 0.0
+
+    def assign(
+        self, company_id: str, title: str, published_at: datetime, story_id: str | None = None
+    ) -> StoryMatch:
+        """Assign an article to an existing or new story and index it.
+
+        Args:
+            company_id: Company the article belongs to (stories never span companies)
+            title: Article title
+            published_at: Publication time (matches must be within ``window``)
+            story_id: Known story (used when rebuilding from stored rows; no matching)
+
+        Returns:
+            The story, whether it is new, the estimated similarity to the
+            closest earlier article, and the story's sentiment if known
+        """
+        started = time.perf_counter()
+        self.assigned += 1
+        grams = shingles(title)
+        if len(grams) < MIN_SHINGLES:
+            self.too_short += 1
+            story_id = story_id or _new_story_id()
+            story = self._stories.get(story_id)
+            self.assign_seconds += time.perf_counter() - started
+            return StoryMatch(story_id, story is None, None, story.sentiment if story else None)
+
+        sig = signature(grams, self.num_perm)
+        keys = [
+            (company_id, band, sig[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+        similarity = None
+        if story_id is None:
+            best = self._best_candidate(keys, sig, published_at)
+            if best is not None:
+                similarity, story_id = best
+        is_new = story_id is None or story_id not in self._stories
+        story_id = story_id or _new_story_id()
+        if similarity is not None:
+            self.matched += 1
+        if similarity is None or similarity < COPY_SIMILARITY:
+            self._add(_Entry(company_id, story_id, published_at, sig, keys))
+        self.assign_seconds += time.perf_counter() - started
+        return StoryMatch(story_id, is_new, similarity, self._stories[story_id].sentiment)
+
+    def _best_candidate(
+        self, keys: list[tuple[str, int, bytes]], sig: np.ndarray, published_at: datetime
+    ) -> tuple[float, str] | None:
+        collisions: dict[int, int] = {}
+        for key in keys:
+            for seq in self._buckets.get(key, ()):
+                collisions[seq] = collisions.get(seq, 0) + 1
+        if not collisions:
+            return None
+        shortlist = sorted(collisions, key=collisions.__getitem__, reverse=True)[:MAX_CANDIDATES]
+        entries = [
+            entry for entry in (self._entries[seq] for seq in shortlist)
+            if abs(entry.published_at - published_at) <= self.window
+        ]
+        if not entries:
+            return None
+        similarities = (np.stack([entry.signature for entry in entries]) == sig).mean(axis=1)
+        best = int(similarities.argmax())
+        if similarities[best] < self.threshold:
+            return None
+        return float(similarities[best]), entries[best].story_id
+
+    def _add(self, entry: _Entry) -> None:
+        seq = self._next
+        self._next += 1
+        self._entries[seq] = entry
+        for key in entry.buckets:
+            bucket = self._buckets.setdefault(key, {})
+            bucket[seq] = None
+            if len(bucket) > BUCKET_SIZE:
+                del bucket[next(iter(bucket))]
+        self._stories.setdefault(entry.story_id, _Story()).size += 1
+        while len(self._entries) > self.max_entries:
+            self._evict()
+
+    def _evict(self) -> None:
+        seq, entry = self._entries.popitem(last=False)
+        for key in entry.buckets:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            bucket.pop(seq, None)
+            if not bucket:
+                del self._buckets[key]
+        story = self._stories[entry.story_id]
+        story.size -= 1
+        if story.size <= 0:
+            del self._stories[entry.story_id]
+
+    def set_sentiment(self, story_id: str, sentiment: Sentiment) -> None:
+        """Remember a story's sentiment for later copies (the first one set wins)."""
+        story = self._stories.get(story_id)
+        if story is not None and story.sentiment is None:
+            story.sentiment = sentiment
+
+    def stats(self) -> dict[str, Any]:
+        """Index size, match rate and mean assignment time."""
+        return {
+            "entries": len(self._entries),
+            "stories": len(self._stories),
+            "max_entries": self.max_entries,
+            "assigned": self.assigned,
+            "matched": self.matched,
+            "too_short": self.too_short,
+            "match_rate": self.matched / self.assigned if self.assigned else None,
+            "mean_assign_us": (
+                round(self.assign_seconds / self.assigned * 1e6, 1) if self.assigned else None
+            ),
+        }
+
+
+def _new_story_id() -> str:
+    return f"story_{uuid.uuid4().hex[:12]}"
+
+
+# Process-wide index instance
+_index = StoryIndex(
+    threshold=settings.story_min_similarity,
+    window=timedelta(hours=settings.story_window_hours),
+    max_entries=settings.story_index_size,
+)
+
+
+def get_story_index() -> StoryIndex:
+    """Get the process-wide story index.
+
+    Returns:
+        Story index
+    """
+    return _index
+
+
+async def warm_story_index(
+    session_factory: Callable[[], Any], index: StoryIndex | None = None
+) -> int:
+    """Rebuild the index from articles published within the story window.
+
+    Stored ``story_id`` values are kept; rows stored before clustering use
+    their own ID as the story, which is what ``collapse=story`` groups them by.
+    Rows are assigned ``WARM_CHUNK`` at a time, yielding to the event loop
+    between chunks so background tasks keep running during a large warm-up.
+
+    Args:
+        session_factory: Factory producing async sessions
+        index: Index to fill (defaults to the process-wide one)
+
+    Returns:
+        Number of articles indexed
+    """
+    index = index or _index
+    async with session_factory() as session:
+        repo = await get_news_repo(session)
+        rows = await repo.recent_titles(now_utc() - index.window, index.max_entries)
+    for i, row in enumerate(rows):
+        if i and i % WARM_CHUNK == 0:
+            await asyncio.sleep(0)
+        match = index.assign(
+            row.company_id, row.title, row.published_at, story_id=row.story_id or row.id
+        )
+        if row.sentiment is not None and match.sentiment is None:
+            index.set_sentiment(match.story_id, row.sentiment)
+    logger.info(f"Story index warmed with {len(rows)} articles")
+    return len(rows)
@@ -0,0 +1,164 @@
+"""Company timeline: news, 블라인드, 종토방 and DART merged newest first.
+
+Each source is read with its own keyset query on its own session, so the
+first reads run concurrently. Every source starts with an even share of the
+page (``limit / sources`` rows) and the items are k-way merged with a
+heap on ``(timestamp DESC, source, id ASC)``. When a source's buffer runs
+out while it still has rows, only that source is read again, for as many
+rows as the page still needs, so a page reads about ``limit + sources``
+rows however the items are spread across sources.
+
+The cursor holds each source's last emitted ``(timestamp, id)`` and the
+sources known to be exhausted.
+"""
+
+import asyncio
+import heapq
+from collections.abc import Callable, Sequence
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any
+
+from app.repositories.base import BaseRepository
+from app.repositories.dart_repo import get_dart_repo
+from app.repositories.news_repo import get_news_repo
+from app.repositories.social_repo import get_social_repo
+from app.schemas.intelligence import Article, Filing, SocialPost, TimelineItem, TimelineSource
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.time import parse_ts, to_rfc3339
+
+TIMELINE_SOURCES: tuple[TimelineSource, ...] = ("news", "blind", "naver_forum", "dart")
+
+# Rows the in-memory fake data is read with (it has no keyset cursor)
+_MEMORY_ROWS = 1000
+
+Position = tuple[datetime, str]
+
+
+def _timestamp(item: Article | SocialPost | Filing) -> datetime:
+    if isinstance(item, Article):
+        return item.published_at
+    if isinstance(item, SocialPost):
+        return item.posted_at
+    return item.filed_at
+
+
+async def _read(
+    session: Any,
+    source: TimelineSource,
+    company_id: str,
+    start: datetime | None,
+    end: datetime | None,
+    after: Position | None,
+    limit: int,
+) -> tuple[Sequence[Article | SocialPost | Filing], bool]:
+    """Up to ``limit`` items of one source past ``after``, and whether more remain."""
+    memory = BaseRepository.is_memory_mode()
+    time_name = {"news": "published_at", "dart": "filed_at"}.get(source, "posted_at")
+    cursor = None
+    if after and not memory:
+        cursor = encode_cursor({time_name: to_rfc3339(after[0]), "id": after[1]})
+    size = _MEMORY_ROWS if memory else limit
+
+    items: Sequence[Article | SocialPost | Filing]
+    if source == "news":
+        news_repo = await get_news_repo(session)
+        items, next_cursor = await news_repo.fetch_news(company_id, start, end, size, cursor)
+    elif source == "dart":
+        dart_repo = await get_dart_repo(session)
+        items, next_cursor = await dart_repo.fetch_filings(company_id, start, end, size, cursor)
+    else:
+        items, next_cursor = await (await get_social_repo(session)).fetch_social(
+            company_id, source, start, end, size, cursor
+        )
+
+    if not memory:
+        return items, next_cursor is not None
+    # Fake data pages by offset; apply the keyset here instead
+    items = sorted(items, key=lambda i: (-_timestamp(i).timestamp(), i.id))
+    if after:
+        bound = (-after[0].timestamp(), after[1])
+        items = [i for i in items if (-_timestamp(i).timestamp(), i.id) > bound]
+    return items[:limit], len(items) > limit
+
+
+async def fetch_timeline(
+    session_factory: Callable[[], Any] | None,
+    company_id: str,
+    sources: list[TimelineSource] | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int = 50,
+    cursor: str | None = None,
+) -> tuple[list[TimelineItem], str | None]:
+    """Read one page of a company's merged timeline.
+
+    Args:
+        session_factory: Factory producing async sessions, one per source read
+            (None in memory mode)
+        company_id: Company identifier
+        sources: Sources to include (default all)
+        start: Start timestamp (inclusive)
+        end: End timestamp (exclusive)
+        limit: Maximum number of items
+        cursor: Pagination cursor from a previous page
+
+    Returns:
+        Tuple of (items, next_cursor)
+    """
+    state = decode_cursor(cursor) or {}
+    positions: dict[str, Position | None] = {}
+    for source, position in (state.get("positions") or {}).items():
+        positions[source] = (parse_ts(position[0]), position[1])
+    done = set(state.get("done") or ())
+    active = [s for s in (sources or TIMELINE_SOURCES) if s not in done]
+
+    async def read(source: TimelineSource, count: int) -> tuple[Sequence[Any], bool]:
+        async with session_factory() if session_factory else nullcontext(None) as s:
+            return await _read(s, source, company_id, start, end, positions.get(source), count)
+
+    share = -(-limit // len(active)) if active else 0
+    first = await asyncio.gather(*(read(source, share) for source in active))
+    buffers = {source: items for source, (items, _) in zip(active, first, strict=True)}
+    more = {source: has_more for source, (_, has_more) in zip(active, first, strict=True)}
+
+    # Heap of (newest first, source order, id) over each buffer's head
+    order = {source: i for i, source in enumerate(TIMELINE_SOURCES)}
+    heap: list[tuple[float, int, str, int]] = []
+
+    def push(source: TimelineSource, index: int) -> None:
+        item = buffers[source][index]
+        heapq.heappush(heap, (-_timestamp(item).timestamp(), order[source], item.id, index))
+
+    for source in active:
+        if buffers[source]:
+            push(source, 0)
+
+    page: list[TimelineItem] = []
+    while heap and len(page) < limit:
+        _, source_order, _, index = heapq.heappop(heap)
+        source = TIMELINE_SOURCES[source_order]
+        item = buffers[source][index]
+        page.append(TimelineItem(type=source, timestamp=_timestamp(item), item=item))
+        positions[source] = (_timestamp(item), item.id)
+        if index + 1 < len(buffers[source]):
+            push(source, index + 1)
+        elif more[source] and len(page) < limit:
+            # The next row of this source may precede every other head; read it before merging on
+            buffers[source], more[source] = await read(source, limit - len(page))
+            if buffers[source]:
+                push(source, 0)
+
+    if not heap and not any(more.values()):
+        return page, None
+    pending = {TIMELINE_SOURCES[entry[1]] for entry in heap}
+    exhausted = [s for s in active if not more[s] and s not in pending]
+    next_state = {
+        "positions": {
+            source: [to_rfc3339(position[0]), position[1]]
+            for source, position in positions.items()
+            if position is not None
+        },
+        "done": sorted(done | set(exhausted)),
+    }
+    return page, encode_cursor(next_state)
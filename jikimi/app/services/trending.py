@@ -0,0 +1,502 @@
+"""Trending companies from in-memory sliding-window mention counters.
+
+Every news article and 블라인드/종토방 post stored through the API, bulk
+ingestion or the snapshot loader is counted per company in two ring buffers:
+one slot per minute for the last hour and one per hour for the last two
+days. Each slot holds the mention count, engagement (``reply_count +
+like_count``) and the sentiment count and score sum. Slots carry the epoch
+minute/hour they hold, so a slot is reset lazily the next time it is written
+for a newer period and stale slots are masked out when ranking.
+
+All companies share dense numpy arrays, so a ranking is a few vectorized
+sums over every company plus a partition for the top ``limit``. The
+counters are snapshotted to ``trending_counters`` periodically and on
+shutdown, and restored at startup. Each worker process adds only the counts
+it recorded since its previous snapshot to the stored rows and then reloads
+the combined totals, so with several workers every process ranks by all
+mentions as of the last snapshot plus its own since then.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import numpy as np
+
+from app.repositories.trending_repo import get_trending_repo
+from app.schemas.common import Sentiment
+from app.schemas.trending import TrendingCompany, TrendingResolution, TrendingSlot, TrendingSort
+from app.utils.time import now_utc
+
+logger = logging.getLogger(__name__)
+
+MINUTE_SLOTS = 60
+HOUR_SLOTS = 48
+
+# Counter fields of one slot
+_MENTIONS, _ENGAGEMENT, _SCORED, _SCORE_SUM = range(4)
+_FIELDS = 4
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _epoch_minute(ts: datetime) -> int:
+    return int(ts.timestamp() // 60)
+
+
+def _masked_sum(counts: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Per-company field sums over the slots selected by ``mask`` (one batched matmul)."""
+    sums: np.ndarray = (mask[:, None, :].astype(np.float64) @ counts)[:, 0]
+    return sums
+
+
+class TrendingCounter:
+    """Per-company minute and hour ring buffers of mentions, engagement and sentiment."""
+
+    def __init__(self, capacity: int = 256) -> None:
+        """Initialize empty counters.
+
+        Args:
+            capacity: Companies to allocate for (grows as needed)
+        """
+        self._rows: dict[str, int] = {}
+        self._ids: list[str] = []
+        self._minutes = np.zeros((capacity, MINUTE_SLOTS, _FIELDS))
+        self._minute_keys = np.full((capacity, MINUTE_SLOTS), -1, dtype=np.int64)
+        self._hours = np.zeros((capacity, HOUR_SLOTS, _FIELDS))
+        self._hour_keys = np.full((capacity, HOUR_SLOTS), -1, dtype=np.int64)
+        # Part of each slot already added to ``trending_counters``
+        self._saved_minutes = np.zeros_like(self._minutes)
+        self._saved_hours = np.zeros_like(self._hours)
+        self.recorded = 0
+        self.dropped = 0
+        self.rankings = 0
+        self.rank_seconds = 0.0
+        self.snapshots = 0
+        self.last_snapshot_at: datetime | None = None
+
+    def _row(self, company_id: str) -> int:
+        row = self._rows.get(company_id)
+        if row is not None:
+            return row
+        row = len(self._ids)
+        if row == len(self._minutes):
+            grow = len(self._minutes)
+            minute_keys = np.full((grow, MINUTE_SLOTS), -1, dtype=np.int64)
+            hour_keys = np.full((grow, HOUR_SLOTS), -1, dtype=np.int64)
+            self._minutes = np.concatenate([self._minutes, np.zeros_like(self._minutes)])
+            self._minute_keys = np.concatenate([self._minute_keys, minute_keys])
+            self._hours = np.concatenate([self._hours, np.zeros_like(self._hours)])
+            self._hour_keys = np.concatenate([self._hour_keys, hour_keys])
+            self._saved_minutes = np.concatenate(
+                [self._saved_minutes, np.zeros_like(self._saved_minutes)]
+            )
+            self._saved_hours = np.concatenate(
+                [self._saved_hours, np.zeros_like(self._saved_hours)]
+            )
+        self._rows[company_id] = row
+        self._ids.append(company_id)
+        return row
+
+    @staticmethod
+    def _add(
+        counts: np.ndarray,
+        keys: np.ndarray,
+        saved: np.ndarray,
+        row: int,
+        key: int,
+        values: tuple[float, ...],
+    ) -> bool:
+        """Add ``values`` to the slot for period ``key``; False if the ring has moved past it."""
+        slot = key % keys.shape[1]
+        held = keys[row, slot]
+        if held > key:
+            return False
+        if held < key:
+            counts[row, slot] = 0.0
+            saved[row, slot] = 0.0
+            keys[row, slot] = key
+        counts[row, slot] += values
+        return True
+
+    def record(
+        self,
+        company_id: str,
+        ts: datetime,
+        engagement: int = 0,
+        sentiment: Sentiment | None = None,
+        now: datetime | None = None,
+    ) -> bool:
+        """Count one mention.
+
+        Args:
+            company_id: Company identifier
+            ts: Item timestamp (later than ``now`` counts as ``now``)
+            engagement: ``reply_count + like_count`` (0 for news)
+            sentiment: Item sentiment, if scored
+            now: Current time (defaults to now)
+
+        Returns:
+            Whether the mention is recent enough to be counted
+        """
+        now_minute = _epoch_minute(now or now_utc())
+        minute = min(_epoch_minute(ts), now_minute)
+        if minute // 60 <= now_minute // 60 - HOUR_SLOTS:
+            self.dropped += 1
+            return False
+        values = (
+            1.0,
+            float(engagement),
+            1.0 if sentiment else 0.0,
+            sentiment.score if sentiment else 0.0,
+        )
+        row = self._row(company_id)
+        in_minutes = minute > now_minute - MINUTE_SLOTS and self._add(
+            self._minutes, self._minute_keys, self._saved_minutes, row, minute, values
+        )
+        in_hours = self._add(
+            self._hours, self._hour_keys, self._saved_hours, row, minute // 60, values
+        )
+        if in_minutes or in_hours:
+            self.recorded += 1
+            return True
+        self.dropped += 1
+        return False
+
+    def record_rows(self, rows: list[dict[str, Any]], now: datetime | None = None) -> int:
+        """Count stored ``news_articles`` or ``social_posts`` rows.
+
+        Args:
+            rows: Column values with ``company_id``, ``published_at`` or
+                ``posted_at``, optional ``reply_count``/``like_count`` and
+                ``sentiment`` (Sentiment, dict or None)
+            now: Current time (defaults to now)
+
+        Returns:
+            Number of rows counted
+        """
+        now = now or now_utc()
+        counted = 0
+        for row in rows:
+            sentiment = row.get("sentiment")
+            if isinstance(sentiment, dict):
+                sentiment = Sentiment(**sentiment)
+            counted += self.record(
+                row["company_id"],
+                row.get("published_at") or row["posted_at"],
+                engagement=(row.get("reply_count") or 0) + (row.get("like_count") or 0),
+                sentiment=sentiment,
+                now=now,
+            )
+        return counted
+
+    def rank(
+        self,
+        sort: TrendingSort = "velocity",
+        limit: int = 20,
+        window_minutes: int = 60,
+        baseline_hours: int = 24,
+        min_mentions: int = 1,
+        now: datetime | None = None,
+    ) -> list[TrendingCompany]:
+        """Top companies by recent activity.
+
+        The window is the last ``window_minutes`` minute slots; the baseline is
+        the ``baseline_hours`` whole hours before the hour the window starts
+        in. ``velocity`` compares window mentions with the baseline rate
+        scaled to the window, ``sentiment_shift`` ranks by the absolute change
+        of the mean score.
+
+        Args:
+            sort: Ranking key
+            limit: Maximum number of companies
+            window_minutes: Recent window (1 to ``MINUTE_SLOTS``)
+            baseline_hours: Baseline length (1 to ``HOUR_SLOTS - 2``)
+            min_mentions: Companies with fewer window mentions are left out
+            now: Current time (defaults to now)
+
+        Returns:
+            Companies, highest ranked first (ties by company ID, also at the
+            ``limit`` cut-off)
+        """
+        started = time.perf_counter()
+        n = len(self._ids)
+        if n == 0:
+            return []
+        now_minute = _epoch_minute(now or now_utc())
+        minute_keys = self._minute_keys[:n]
+        recent_mask = (minute_keys > now_minute - window_minutes) & (minute_keys <= now_minute)
+        recent = _masked_sum(self._minutes[:n], recent_mask)
+        first_hour = (now_minute - window_minutes + 1) // 60
+        hour_keys = self._hour_keys[:n]
+        base_mask = (hour_keys >= first_hour - baseline_hours) & (hour_keys < first_hour)
+        base = _masked_sum(self._hours[:n], base_mask)
+
+        mentions = recent[:, _MENTIONS]
+        expected = base[:, _MENTIONS] * window_minutes / (baseline_hours * 60)
+        velocity = (mentions - expected) / np.sqrt(expected + 1.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sentiment = np.where(
+                recent[:, _SCORED] > 0, recent[:, _SCORE_SUM] / recent[:, _SCORED], np.nan
+            )
+            baseline_sentiment = np.where(
+                base[:, _SCORED] > 0, base[:, _SCORE_SUM] / base[:, _SCORED], np.nan
+            )
+        shift = sentiment - baseline_sentiment
+
+        if sort == "velocity":
+            key = velocity
+        elif sort == "engagement":
+            key = recent[:, _ENGAGEMENT]
+        else:
+            key = np.abs(shift)
+        eligible = (mentions >= max(min_mentions, 1)) & ~np.isnan(key)
+        candidates = np.flatnonzero(eligible)
+        if len(candidates) > limit:
+            # Keep every company tied with the limit-th key so IDs decide the cut
+            cutoff = np.partition(-key[candidates], limit - 1)[limit - 1]
+            candidates = candidates[-key[candidates] <= cutoff]
+        order = sorted(candidates, key=lambda i: (-key[i], self._ids[i]))[:limit]
+
+        def optional(value: float) -> float | None:
+            return None if math.isnan(value) else round(float(value), 4)
+
+        ranked = [
+            TrendingCompany(
+                company_id=self._ids[i],
+                mentions=int(mentions[i]),
+                expected_mentions=round(float(expected[i]), 2),
+                velocity=round(float(velocity[i]), 4),
+                engagement=int(recent[i, _ENGAGEMENT]),
+                sentiment=optional(sentiment[i]),
+                baseline_sentiment=optional(baseline_sentiment[i]),
+                sentiment_shift=optional(shift[i]),
+            )
+            for i in order
+        ]
+        self.rankings += 1
+        self.rank_seconds += time.perf_counter() - started
+        return ranked
+
+    def horizons(self, now: datetime | None = None) -> tuple[datetime, datetime]:
+        """Start of the oldest minute and hour slot the rings can hold at ``now``."""
+        now_minute = _epoch_minute(now or now_utc())
+        minute_since = now_minute - MINUTE_SLOTS + 1
+        hour_since = now_minute // 60 - HOUR_SLOTS + 1
+        return _EPOCH + timedelta(minutes=minute_since), _EPOCH + timedelta(hours=hour_since)
+
+    def _rings(
+        self,
+    ) -> tuple[tuple[TrendingResolution, np.ndarray, np.ndarray, np.ndarray, int], ...]:
+        return (
+            ("minute", self._minutes, self._minute_keys, self._saved_minutes, 60),
+            ("hour", self._hours, self._hour_keys, self._saved_hours, 3600),
+        )
+
+    def slots(self, now: datetime | None = None, unsaved: bool = False) -> list[TrendingSlot]:
+        """Non-empty slots still inside the rings.
+
+        Args:
+            now: Current time (defaults to now)
+            unsaved: Only the counts recorded since the last snapshot
+
+        Returns:
+            Slots with their counts
+        """
+        minute_since, hour_since = self.horizons(now)
+        result = []
+        horizons = (minute_since, hour_since)
+        rings = zip(self._rings(), horizons, strict=True)
+        for (resolution, counts, keys, saved, width), since in rings:
+            oldest = int(since.timestamp()) // width
+            n = len(self._ids)
+            live = keys[:n] >= oldest
+            if unsaved:
+                live &= (counts[:n] != saved[:n]).any(axis=2)
+            rows, columns = np.nonzero(live)
+            for row, column in zip(rows, columns, strict=True):
+                values = counts[row, column]
+                if unsaved:
+                    values = values - saved[row, column]
+                result.append(TrendingSlot(
+                    company_id=self._ids[row],
+                    resolution=resolution,
+                    slot_start=_EPOCH + timedelta(seconds=int(keys[row, column]) * width),
+                    mentions=int(values[_MENTIONS]),
+                    engagement=int(values[_ENGAGEMENT]),
+                    scored=int(values[_SCORED]),
+                    score_sum=float(values[_SCORE_SUM]),
+                ))
+        return result
+
+    def _slot(
+        self, slot: TrendingSlot
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, int, int, int] | None:
+        """Arrays, row, position and period of a slot (None if the ring has moved past it)."""
+        row = self._row(slot.company_id)
+        _, counts, keys, saved, width = self._rings()[0 if slot.resolution == "minute" else 1]
+        key = int(slot.slot_start.timestamp()) // width
+        position = key % keys.shape[1]
+        if keys[row, position] > key:
+            return None
+        return counts, keys, saved, row, position, key
+
+    def restore(self, slots: list[TrendingSlot]) -> int:
+        """Load stored slot totals, keeping counts recorded since the last snapshot.
+
+        Args:
+            slots: Slots from the ``trending_counters`` table
+
+        Returns:
+            Number of slots loaded
+        """
+        loaded = 0
+        for slot in slots:
+            target = self._slot(slot)
+            if target is None:
+                continue
+            counts, keys, saved, row, position, key = target
+            total = (slot.mentions, slot.engagement, slot.scored, slot.score_sum)
+            if keys[row, position] == key:
+                counts[row, position] += np.subtract(total, saved[row, position])
+            else:
+                keys[row, position] = key
+                counts[row, position] = total
+            saved[row, position] = total
+            loaded += 1
+        return loaded
+
+    def _unsave(self, slots: list[TrendingSlot]) -> None:
+        """Mark counts taken by a failed snapshot as unsaved again."""
+        for slot in slots:
+            target = self._slot(slot)
+            if target is None:
+                continue
+            _, keys, saved, row, position, key = target
+            if keys[row, position] == key:
+                saved[row, position] -= (
+                    slot.mentions, slot.engagement, slot.scored, slot.score_sum
+                )
+
+    async def snapshot(self, session_factory: Callable[[], Any]) -> int:
+        """Add the counts recorded since the last snapshot to ``trending_counters``.
+
+        The stored rows are then reloaded, so the counters also include what
+        other worker processes have added.
+
+        Args:
+            session_factory: Factory producing async sessions
+
+        Returns:
+            Number of slots written
+        """
+        now = now_utc()
+        horizons = self.horizons(now)
+        slots = self.slots(now, unsaved=True)
+        # Later mentions (recorded while the write is awaited) stay unsaved
+        self._saved_minutes[:] = self._minutes
+        self._saved_hours[:] = self._hours
+        async with session_factory() as session:
+            repo = await get_trending_repo(session)
+            try:
+                written = await repo.add_slots(slots, *horizons)
+            except Exception:
+                self._unsave(slots)
+                raise
+            self.restore(await repo.load_slots(*horizons))
+        self.snapshots += 1
+        self.last_snapshot_at = now
+        return written
+
+    async def load(self, session_factory: Callable[[], Any]) -> int:
+        """Restore the slots saved by the last snapshot.
+
+        Args:
+            session_factory: Factory producing async sessions
+
+        Returns:
+            Number of slots loaded
+        """
+        async with session_factory() as session:
+            slots = await (await get_trending_repo(session)).load_slots(*self.horizons())
+        return self.restore(slots)
+
+    def stats(self) -> dict[str, Any]:
+        """Tracked companies, recorded and dropped mentions, and ranking time."""
+        return {
+            "companies": len(self._ids),
+            "recorded": self.recorded,
+            "dropped": self.dropped,
+            "rankings": self.rankings,
+            "mean_rank_us": (
+                round(self.rank_seconds / self.rankings * 1e6, 1) if self.rankings else None
+            ),
+            "snapshots": self.snapshots,
+            "last_snapshot_at": self.last_snapshot_at,
+        }
+
+
+# Process-wide counters (fed by ingestion in every mode; snapshots need a database)
+_counter = TrendingCounter()
+_snapshot_task: asyncio.Task[None] | None = None
+_snapshot_factory: Callable[[], Any] | None = None
+
+
+def get_trending_counter() -> TrendingCounter:
+    """Get the process-wide trending counters.
+
+    Returns:
+        Trending counters
+    """
+    return _counter
+
+
+async def init_trending_snapshots(
+    session_factory: Callable[[], Any], interval_seconds: float
+) -> int:
+    """Restore the last snapshot and start snapshotting every ``interval_seconds``.
+
+    Args:
+        session_factory: Factory producing async sessions
+        interval_seconds: Interval between snapshots
+
+    Returns:
+        Number of slots restored
+    """
+    global _snapshot_task, _snapshot_factory
+    loaded = await _counter.load(session_factory)
+    _snapshot_factory = session_factory
+    _snapshot_task = asyncio.create_task(
+        _snapshot_loop(session_factory, interval_seconds), name="trending-snapshot"
+    )
+    logger.info(f"Trending counters restored with {loaded} slots")
+    return loaded
+
+
+async def close_trending_snapshots() -> None:
+    """Stop the snapshot loop and write a final snapshot."""
+    global _snapshot_task, _snapshot_factory
+
+    if _snapshot_task is not None:
+        _snapshot_task.cancel()
+        await asyncio.gather(_snapshot_task, return_exceptions=True)
+        _snapshot_task = None
+    if _snapshot_factory is not None:
+        try:
+            await _counter.snapshot(_snapshot_factory)
+        except Exception as e:
+            logger.warning(f"Final trending snapshot failed: {e}")
+        _snapshot_factory = None
+
+
+async def _snapshot_loop(session_factory: Callable[[], Any], interval_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await _counter.snapshot(session_factory)
+        except Exception as e:
+            logger.warning(f"Trending snapshot failed: {e}")
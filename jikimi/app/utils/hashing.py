@@ -1,7 +1,18 @@
 """Hashing utilities for tokens and sensitive data."""
 
 import hashlib
+import re
 import secrets
+import unicodedata
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from app.utils.time import to_rfc3339
+
+_URL_RE = re.compile(r"https?://\S+")
+_NON_WORD_RE = re.compile(r"[^\w]+")
+_RCEPT_NO_RE = re.compile(r"^\d{14}$")
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid")
 
 
 def hash_token(token: str) -> str:
@@ -27,3 +38,125 @@ def generate_token(length: int = 32) -> str:
     """
     return secrets.token_urlsafe(length)
 
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so trivially different copies compare equal.
+
+    Applies NFKC (full-width forms, compatibility jamo), drops URLs, replaces
+    punctuation and symbols with spaces, collapses whitespace and lowercases.
+    Hangul, Latin letters and digits are kept.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Normalized text
+    """
+    text = unicodedata.normalize("NFKC", text)
+    text = _URL_RE.sub(" ", text)
+    text = _NON_WORD_RE.sub(" ", text).replace("_", " ")
+    return " ".join(text.lower().split())
+
+
+def content_hash(text: str, content_type: str) -> str:
+    """Content address for a text: SHA-256 over its normalized form and type.
+
+    Args:
+        text: Raw text
+        content_type: Content type the text is scored as (news, social, filing)
+
+    Returns:
+        Hex-encoded hash string
+    """
+    return hash_token(f"{content_type}\n{normalize_text(text)}")
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a URL for deduplication.
+
+    Lowercases scheme and host, drops the fragment, tracking parameters
+    (``utm_*``, ``fbclid``, ``gclid``) and a trailing slash, and sorts the
+    remaining query parameters.
+
+    Args:
+        url: Raw URL
+
+    Returns:
+        Normalized URL
+    """
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(_TRACKING_PARAMS)
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+def dart_rcept_no(url: str | None) -> str | None:
+    """Extract the DART receipt number (접수번호, ``rcpNo``) from a filing URL.
+
+    Args:
+        url: DART viewer URL, e.g. ``https://dart.fss.or.kr/dsaf001/main.do?rcpNo=20251101000123``
+
+    Returns:
+        14-digit receipt number, or None if the URL doesn't carry one
+    """
+    if not url:
+        return None
+    for key, value in parse_qsl(urlsplit(url).query):
+        if key.lower() in ("rcpno", "rcept_no") and _RCEPT_NO_RE.match(value):
+            return value
+    return None
+
+
+def article_key(url: str | None, source: str, title: str, published_at: datetime) -> str:
+    """Dedupe hash for a news article: its normalized URL, else source, title and time.
+
+    Args:
+        url: Article URL
+        source: News source
+        title: Article title
+        published_at: Publication timestamp
+
+    Returns:
+        Hex-encoded hash string
+    """
+    if url:
+        return hash_token(f"url\n{normalize_url(url)}")
+    return hash_token(f"news\n{source}\n{normalize_text(title)}\n{to_rfc3339(published_at)}")
+
+
+def post_key(platform: str, content: str, author: str | None, posted_at: datetime) -> str:
+    """Dedupe hash for a social post: platform, normalized content, author and time.
+
+    Args:
+        platform: Social platform
+        content: Post content
+        author: Author identifier
+        posted_at: Post timestamp
+
+    Returns:
+        Hex-encoded hash string
+    """
+    return hash_token(
+        f"{platform}\n{author or ''}\n{to_rfc3339(posted_at)}\n{normalize_text(content)}"
+    )
+
+
+def filing_key(rcept_no: str | None, title: str, filing_type: str, filed_at: datetime) -> str:
+    """Dedupe hash for a DART filing: its receipt number, else title, type and time.
+
+    Args:
+        rcept_no: DART receipt number
+        title: Filing title
+        filing_type: Filing type code
+        filed_at: Filing timestamp
+
+    Returns:
+        Hex-encoded hash string
+    """
+    if rcept_no:
+        return hash_token(f"dart\n{rcept_no}")
+    return hash_token(f"filing\n{filing_type}\n{normalize_text(title)}\n{to_rfc3339(filed_at)}")
@@ -0,0 +1,95 @@
+"""Character n-gram text search helpers.
+
+The bigram helpers mirror the ``korean_bigrams`` SQL function in
+``db/schema.sql``: text is lowercased and split into alphanumeric words, and
+each word becomes its overlapping character bigrams (one-character words stay
+whole). Matching on bigrams finds 반도체 inside 삼성반도체 and 실적이 without a
+Korean analyzer. ``trigram_similarity`` mirrors ``pg_trgm``'s
+``similarity()`` for in-memory company search, and ``choseong`` reduces
+Hangul to initial consonants for ㅅㅅㅈㅈ-style typeahead.
+"""
+
+import re
+
+_WORD_SPLIT_RE = re.compile(r"[\W_]+")
+
+# Longest query accepted, in words (each word is one phrase in the tsquery)
+MAX_QUERY_WORDS = 10
+
+
+def words(text: str) -> list[str]:
+    """Lowercased alphanumeric runs of ``text``."""
+    return [word for word in _WORD_SPLIT_RE.split(text.lower()) if word]
+
+
+def bigrams(word: str) -> list[str]:
+    """Overlapping character bigrams of one word (the word itself if one character)."""
+    if len(word) < 2:
+        return [word]
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def bigram_tsquery(query: str) -> str | None:
+    """Build a ``to_tsquery('simple', ...)`` expression matching every query word.
+
+    Each word must appear as consecutive bigrams (``'삼성' <-> '성전' <->
+    '전자'``); a one-character word matches any bigram starting with it.
+
+    Args:
+        query: User search text
+
+    Returns:
+        tsquery text, or None if the query has no searchable characters
+    """
+    phrases = []
+    for word in words(query)[:MAX_QUERY_WORDS]:
+        if len(word) == 1:
+            phrases.append(f"'{word}':*")
+        else:
+            grams = [f"'{gram}'" for gram in bigrams(word)]
+            phrases.append(f"({' <-> '.join(grams)})" if len(grams) > 1 else grams[0])
+    return " & ".join(phrases) or None
+
+
+def matches(query: str, document: str) -> bool:
+    """Whether ``document`` matches ``bigram_tsquery(query)`` (for in-memory data)."""
+    doc_words = words(document)
+    for word in words(query)[:MAX_QUERY_WORDS]:
+        if len(word) == 1:
+            if not any(w == word or word in w[:-1] for w in doc_words):
+                return False
+        elif not any(word in w for w in doc_words):
+            return False
+    return True
+
+
+def trigrams(text: str) -> set[str]:
+    """``pg_trgm`` trigrams: each word padded with two leading spaces and one trailing."""
+    grams: set[str] = set()
+    for word in words(text):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def trigram_similarity(a: str, b: str) -> float:
+    """Shared trigrams over all trigrams, as ``pg_trgm``'s ``similarity(a, b)``."""
+    ga, gb = trigrams(a), trigrams(b)
+    if not ga or not gb:
+        return 0.0
+    return len(ga & gb) / len(ga | gb)
+
+
+# Initial consonants in syllable order (U+AC00 + (initial * 21 + medial) * 28 + final)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_HANGUL_FIRST, _HANGUL_LAST = 0xAC00, 0xD7A3
+
+
+def choseong(text: str) -> str:
+    """``text`` with each Hangul syllable replaced by its initial consonant (삼성 -> ㅅㅅ)."""
+    return "".join(
+        CHOSEONG[(ord(ch) - _HANGUL_FIRST) // 588]
+        if _HANGUL_FIRST <= ord(ch) <= _HANGUL_LAST
+        else ch
+        for ch in text
+    )
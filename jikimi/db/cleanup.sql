@@ -9,6 +9,12 @@ SET session_replication_role = replica;
 
 -- Truncate all tables (keeps schema, removes data)
 TRUNCATE TABLE espp_holdings CASCADE;
+TRUNCATE TABLE snapshot_files CASCADE;
+TRUNCATE TABLE sentiment_cache CASCADE;
+TRUNCATE TABLE company_daily_features CASCADE;
+TRUNCATE TABLE sentiment_rollups CASCADE;
+TRUNCATE TABLE blind_dept_daily CASCADE;
+TRUNCATE TABLE trending_counters CASCADE;
 TRUNCATE TABLE price_candles CASCADE;
 TRUNCATE TABLE dart_filings CASCADE;
 TRUNCATE TABLE social_posts CASCADE;
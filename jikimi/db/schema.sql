@@ -5,10 +5,31 @@
 -- Enable UUID extension (optional, if using UUIDs)
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
--- Note: Full-text search indexes use 'simple' configuration
--- This works well for Korean text as it doesn't apply language-specific
--- stemming or stop words. For advanced Korean text search, consider
--- installing additional extensions like pg_trgm for trigram matching.
+-- Trigram similarity for typo-tolerant company name search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Note: Full-text search over news, posts and filings indexes overlapping
+-- character bigrams (see korean_bigrams below), so Korean words match inside
+-- compounds and across particles without a morphological analyzer or extension.
+
+-- ============================================================================
+-- TEXT SEARCH
+-- ============================================================================
+
+-- Lowercased alphanumeric runs split into overlapping bigrams, as a 'simple'
+-- tsvector: '삼성전자 실적' -> '삼성':1 '성전':2 '전자':3 '실적':4. Bigrams of one
+-- word get consecutive positions so queries match them as a phrase (<->);
+-- one-character words are kept whole. app/utils/text_search.py builds the
+-- matching tsquery.
+CREATE OR REPLACE FUNCTION korean_bigrams(doc TEXT) RETURNS tsvector AS $$
+    SELECT to_tsvector('simple', coalesce(string_agg(
+        CASE WHEN char_length(w.word) = 1 THEN w.word ELSE substr(w.word, p.pos, 2) END,
+        ' ' ORDER BY w.word_no, p.pos
+    ), ''))
+    FROM regexp_split_to_table(lower(coalesce(doc, '')), '[^[:alnum:]]+') WITH ORDINALITY AS w(word, word_no)
+    CROSS JOIN LATERAL generate_series(1, greatest(char_length(w.word) - 1, 1)) AS p(pos)
+    WHERE w.word <> ''
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
 
 -- ============================================================================
 -- COMPANIES
@@ -24,8 +45,11 @@ CREATE TABLE companies (
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
--- Full-text search index (using 'simple' config which works well for Korean text)
-CREATE INDEX idx_companies_name ON companies USING gin(to_tsvector('simple', name));
+-- Trigram indexes for company search: substring (LIKE '%q%') and similarity (%)
+-- matches on name, ticker and ID, so typeahead and typos avoid a sequential scan
+CREATE INDEX idx_companies_name_trgm ON companies USING gin(lower(name) gin_trgm_ops);
+CREATE INDEX idx_companies_ticker_trgm ON companies USING gin(lower(ticker) gin_trgm_ops);
+CREATE INDEX idx_companies_id_trgm ON companies USING gin(id gin_trgm_ops);
 CREATE INDEX idx_companies_ticker ON companies(ticker);
 CREATE INDEX idx_companies_sector ON companies(sector);
 
@@ -47,20 +71,47 @@ CREATE TABLE news_articles (
     summary TEXT,
     content TEXT,
     sentiment JSONB,
+    sentiment_label VARCHAR(10) GENERATED ALWAYS AS (sentiment->>'label') STORED,
+    sentiment_score DOUBLE PRECISION GENERATED ALWAYS AS ((sentiment->>'score')::double precision) STORED,
+    sentiment_confidence DOUBLE PRECISION GENERATED ALWAYS AS ((sentiment->>'confidence')::double precision) STORED,
+    dedupe_hash CHAR(64),
+    story_id VARCHAR(100),
+    search_vector tsvector GENERATED ALWAYS AS (korean_bigrams(title || ' ' || coalesce(summary, ''))) STORED,
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
+-- Natural-key dedupe (crawler retries hit ON CONFLICT instead of adding rows)
+CREATE UNIQUE INDEX uq_news_articles_dedupe ON news_articles(company_id, dedupe_hash);
+
+-- Near-duplicate story lookups (collapse=story)
+CREATE INDEX idx_news_articles_story ON news_articles(company_id, story_id);
+
 -- Indexes for keyset pagination (published_at DESC, id ASC)
 CREATE INDEX idx_news_articles_company_published ON news_articles(company_id, published_at DESC, id ASC);
 CREATE INDEX idx_news_articles_source ON news_articles(source);
 CREATE INDEX idx_news_articles_published ON news_articles(published_at DESC);
 
--- Full-text search index (using 'simple' config which works well for Korean text)
-CREATE INDEX idx_news_articles_title ON news_articles USING gin(to_tsvector('simple', title));
+-- Full-text search over title and summary bigrams (GET /v1/search)
+CREATE INDEX idx_news_articles_search ON news_articles USING gin(search_vector);
+
+-- Sentiment filters (label=, min_score=, min_confidence=) on the generated columns
+CREATE INDEX idx_news_articles_company_label_published ON news_articles(company_id, sentiment_label, published_at DESC, id ASC)
+    WHERE sentiment_label IS NOT NULL;
+CREATE INDEX idx_news_articles_company_score ON news_articles(company_id, sentiment_score DESC) INCLUDE (sentiment_confidence)
+    WHERE sentiment_score IS NOT NULL;
+
+-- HTTP cache validators: count(*) and max(updated_at) per company as an index-only scan
+CREATE INDEX idx_news_articles_company_updated ON news_articles(company_id, updated_at);
 
 COMMENT ON TABLE news_articles IS 'News articles with stock-impact sentiment';
 COMMENT ON COLUMN news_articles.sentiment IS 'JSONB: {label, score, confidence, rationale}';
+COMMENT ON COLUMN news_articles.sentiment_label IS 'sentiment->>label, generated (NULL when unscored)';
+COMMENT ON COLUMN news_articles.sentiment_score IS 'sentiment->>score, generated';
+COMMENT ON COLUMN news_articles.sentiment_confidence IS 'sentiment->>confidence, generated';
+COMMENT ON COLUMN news_articles.dedupe_hash IS 'SHA-256 of normalized URL (or source+title+published_at without URL); NULL for rows loaded without one';
+COMMENT ON COLUMN news_articles.search_vector IS 'korean_bigrams(title + summary), generated';
+COMMENT ON COLUMN news_articles.story_id IS 'Near-duplicate story cluster (MinHash LSH over title bigrams); NULL rows are their own story';
 
 -- ============================================================================
 -- SOCIAL POSTS (블라인드, 네이버 종토방)
@@ -76,25 +127,47 @@ CREATE TABLE social_posts (
     dept VARCHAR(100),
     posted_at TIMESTAMPTZ NOT NULL,
     sentiment JSONB,
+    sentiment_label VARCHAR(10) GENERATED ALWAYS AS (sentiment->>'label') STORED,
+    sentiment_score DOUBLE PRECISION GENERATED ALWAYS AS ((sentiment->>'score')::double precision) STORED,
+    sentiment_confidence DOUBLE PRECISION GENERATED ALWAYS AS ((sentiment->>'confidence')::double precision) STORED,
     reply_count INTEGER NOT NULL DEFAULT 0,
     like_count INTEGER NOT NULL DEFAULT 0,
+    dedupe_hash CHAR(64),
+    search_vector tsvector GENERATED ALWAYS AS (korean_bigrams(coalesce(title, '') || ' ' || content)) STORED,
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
+-- Natural-key dedupe (crawler retries hit ON CONFLICT instead of adding rows)
+CREATE UNIQUE INDEX uq_social_posts_dedupe ON social_posts(company_id, dedupe_hash);
+
 -- Indexes for keyset pagination (posted_at DESC, id ASC)
 CREATE INDEX idx_social_posts_company_platform_posted ON social_posts(company_id, platform, posted_at DESC, id ASC);
 CREATE INDEX idx_social_posts_platform ON social_posts(platform);
 CREATE INDEX idx_social_posts_dept ON social_posts(dept) WHERE dept IS NOT NULL;
 CREATE INDEX idx_social_posts_posted ON social_posts(posted_at DESC);
 
--- Full-text search index (using 'simple' config which works well for Korean text)
-CREATE INDEX idx_social_posts_content ON social_posts USING gin(to_tsvector('simple', content));
+-- Full-text search over title and content bigrams (GET /v1/search)
+CREATE INDEX idx_social_posts_search ON social_posts USING gin(search_vector);
+
+-- Sentiment filters (label=, min_score=, min_confidence=) on the generated columns
+CREATE INDEX idx_social_posts_company_platform_label_posted ON social_posts(company_id, platform, sentiment_label, posted_at DESC, id ASC)
+    WHERE sentiment_label IS NOT NULL;
+CREATE INDEX idx_social_posts_company_platform_score ON social_posts(company_id, platform, sentiment_score DESC) INCLUDE (sentiment_confidence)
+    WHERE sentiment_score IS NOT NULL;
+
+-- HTTP cache validators: count(*) and max(updated_at) per company and platform as an index-only scan
+CREATE INDEX idx_social_posts_company_platform_updated ON social_posts(company_id, platform, updated_at);
 
 COMMENT ON TABLE social_posts IS 'Social media posts from 블라인드 and 네이버 종토방';
 COMMENT ON COLUMN social_posts.platform IS 'Platform: blind or naver_forum';
 COMMENT ON COLUMN social_posts.dept IS 'Department (블라인드 only)';
 COMMENT ON COLUMN social_posts.sentiment IS 'JSONB: {label, score, confidence, rationale}';
+COMMENT ON COLUMN social_posts.sentiment_label IS 'sentiment->>label, generated (NULL when unscored)';
+COMMENT ON COLUMN social_posts.sentiment_score IS 'sentiment->>score, generated';
+COMMENT ON COLUMN social_posts.sentiment_confidence IS 'sentiment->>confidence, generated';
+COMMENT ON COLUMN social_posts.dedupe_hash IS 'SHA-256 of platform+author+posted_at+normalized content; NULL for rows loaded without one';
+COMMENT ON COLUMN social_posts.search_vector IS 'korean_bigrams(title + content), generated';
 
 -- ============================================================================
 -- DART FILINGS
@@ -110,18 +183,45 @@ CREATE TABLE dart_filings (
     summary TEXT,
     content TEXT,
     sentiment JSONB,
+    sentiment_label VARCHAR(10) GENERATED ALWAYS AS (sentiment->>'label') STORED,
+    sentiment_score DOUBLE PRECISION GENERATED ALWAYS AS ((sentiment->>'score')::double precision) STORED,
+    sentiment_confidence DOUBLE PRECISION GENERATED ALWAYS AS ((sentiment->>'confidence')::double precision) STORED,
+    rcept_no VARCHAR(14),
+    dedupe_hash CHAR(64),
+    search_vector tsvector GENERATED ALWAYS AS (korean_bigrams(title || ' ' || coalesce(summary, ''))) STORED,
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
+-- Natural-key dedupe (crawler retries hit ON CONFLICT instead of adding rows)
+CREATE UNIQUE INDEX uq_dart_filings_dedupe ON dart_filings(company_id, dedupe_hash);
+
 -- Indexes for keyset pagination (filed_at DESC, id ASC)
 CREATE INDEX idx_dart_filings_company_filed ON dart_filings(company_id, filed_at DESC, id ASC);
 CREATE INDEX idx_dart_filings_type ON dart_filings(filing_type);
 CREATE INDEX idx_dart_filings_filed ON dart_filings(filed_at DESC);
 
+-- Full-text search over title and summary bigrams (GET /v1/search)
+CREATE INDEX idx_dart_filings_search ON dart_filings USING gin(search_vector);
+
+-- Sentiment filters (label=, min_score=, min_confidence=) on the generated columns
+CREATE INDEX idx_dart_filings_company_label_filed ON dart_filings(company_id, sentiment_label, filed_at DESC, id ASC)
+    WHERE sentiment_label IS NOT NULL;
+CREATE INDEX idx_dart_filings_company_score ON dart_filings(company_id, sentiment_score DESC) INCLUDE (sentiment_confidence)
+    WHERE sentiment_score IS NOT NULL;
+
+-- HTTP cache validators: count(*) and max(updated_at) per company as an index-only scan
+CREATE INDEX idx_dart_filings_company_updated ON dart_filings(company_id, updated_at);
+
 COMMENT ON TABLE dart_filings IS 'DART regulatory filings with sentiment analysis';
 COMMENT ON COLUMN dart_filings.filing_type IS 'Filing type (e.g., 분기보고서, 사업보고서)';
 COMMENT ON COLUMN dart_filings.sentiment IS 'JSONB: {label, score, confidence, rationale}';
+COMMENT ON COLUMN dart_filings.sentiment_label IS 'sentiment->>label, generated (NULL when unscored)';
+COMMENT ON COLUMN dart_filings.sentiment_score IS 'sentiment->>score, generated';
+COMMENT ON COLUMN dart_filings.sentiment_confidence IS 'sentiment->>confidence, generated';
+COMMENT ON COLUMN dart_filings.rcept_no IS 'DART receipt number (접수번호)';
+COMMENT ON COLUMN dart_filings.dedupe_hash IS 'SHA-256 of rcept_no (or type+title+filed_at without one); NULL for rows loaded without one';
+COMMENT ON COLUMN dart_filings.search_vector IS 'korean_bigrams(title + summary), generated';
 
 -- ============================================================================
 -- PRICE CANDLES
@@ -151,6 +251,481 @@ COMMENT ON TABLE price_candles IS 'OHLCV price data with multiple intervals';
 COMMENT ON COLUMN price_candles.interval IS 'Candle interval: 1d, 1h, 5m, 1m';
 COMMENT ON COLUMN price_candles.adjust_type IS 'Price adjustment: none, split, total_return';
 
+-- ============================================================================
+-- FEATURE STORE (per-company, per-day prediction features)
+-- ============================================================================
+
+-- Maintained incrementally by row triggers on news_articles, social_posts and
+-- dart_filings, so every insert path (API, bulk load, COPY) keeps it current.
+-- Prediction reads ~30 rows by primary key instead of fetching raw posts.
+CREATE TABLE company_daily_features (
+    company_id VARCHAR(20) NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    day DATE NOT NULL,
+    news_count INTEGER NOT NULL DEFAULT 0,
+    news_positive INTEGER NOT NULL DEFAULT 0,
+    news_negative INTEGER NOT NULL DEFAULT 0,
+    news_neutral INTEGER NOT NULL DEFAULT 0,
+    news_scored INTEGER NOT NULL DEFAULT 0,
+    news_score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    news_score_hours_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    news_hours_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    blind_count INTEGER NOT NULL DEFAULT 0,
+    blind_engagement BIGINT NOT NULL DEFAULT 0,
+    blind_positive INTEGER NOT NULL DEFAULT 0,
+    naver_forum_count INTEGER NOT NULL DEFAULT 0,
+    naver_forum_engagement BIGINT NOT NULL DEFAULT 0,
+    filings_count INTEGER NOT NULL DEFAULT 0,
+    last_filed_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (company_id, day)
+);
+
+COMMENT ON TABLE company_daily_features IS 'Per-company, per-day intelligence aggregates for prediction';
+COMMENT ON COLUMN company_daily_features.day IS 'UTC calendar day';
+COMMENT ON COLUMN company_daily_features.news_score_hours_sum IS 'Sum of sentiment score * epoch hours (for linear recency decay)';
+COMMENT ON COLUMN company_daily_features.news_hours_sum IS 'Sum of epoch hours over scored articles';
+
+-- Apply a +1/-1 news row delta
+CREATE OR REPLACE FUNCTION features_apply_news(
+    p_company_id VARCHAR, p_ts TIMESTAMPTZ, p_sentiment JSONB, p_sign INTEGER
+) RETURNS VOID AS $$
+DECLARE
+    v_label TEXT := p_sentiment->>'label';
+    v_score DOUBLE PRECISION := COALESCE((p_sentiment->>'score')::DOUBLE PRECISION, 0);
+    v_hours DOUBLE PRECISION := EXTRACT(EPOCH FROM p_ts) / 3600.0;
+    v_scored INTEGER := CASE WHEN p_sentiment IS NULL THEN 0 ELSE p_sign END;
+BEGIN
+    INSERT INTO company_daily_features AS f (
+        company_id, day, news_count, news_positive, news_negative, news_neutral,
+        news_scored, news_score_sum, news_score_hours_sum, news_hours_sum
+    ) VALUES (
+        p_company_id, (p_ts AT TIME ZONE 'UTC')::DATE, p_sign,
+        CASE WHEN v_label = 'positive' THEN p_sign ELSE 0 END,
+        CASE WHEN v_label = 'negative' THEN p_sign ELSE 0 END,
+        CASE WHEN v_label = 'neutral' THEN p_sign ELSE 0 END,
+        v_scored, v_scored * v_score, v_scored * v_score * v_hours, v_scored * v_hours
+    )
+    ON CONFLICT (company_id, day) DO UPDATE SET
+        news_count = f.news_count + EXCLUDED.news_count,
+        news_positive = f.news_positive + EXCLUDED.news_positive,
+        news_negative = f.news_negative + EXCLUDED.news_negative,
+        news_neutral = f.news_neutral + EXCLUDED.news_neutral,
+        news_scored = f.news_scored + EXCLUDED.news_scored,
+        news_score_sum = f.news_score_sum + EXCLUDED.news_score_sum,
+        news_score_hours_sum = f.news_score_hours_sum + EXCLUDED.news_score_hours_sum,
+        news_hours_sum = f.news_hours_sum + EXCLUDED.news_hours_sum,
+        updated_at = clock_timestamp();
+END;
+$$ LANGUAGE plpgsql;
+
+-- Apply a +1/-1 social post row delta
+CREATE OR REPLACE FUNCTION features_apply_social(
+    p_company_id VARCHAR, p_platform VARCHAR, p_ts TIMESTAMPTZ, p_sentiment JSONB,
+    p_engagement BIGINT, p_sign INTEGER
+) RETURNS VOID AS $$
+DECLARE
+    v_blind INTEGER := CASE WHEN p_platform = 'blind' THEN p_sign ELSE 0 END;
+    v_forum INTEGER := CASE WHEN p_platform = 'naver_forum' THEN p_sign ELSE 0 END;
+    v_positive INTEGER := CASE WHEN p_sentiment->>'label' = 'positive' THEN 1 ELSE 0 END;
+BEGIN
+    INSERT INTO company_daily_features AS f (
+        company_id, day, blind_count, blind_engagement, blind_positive,
+        naver_forum_count, naver_forum_engagement
+    ) VALUES (
+        p_company_id, (p_ts AT TIME ZONE 'UTC')::DATE,
+        v_blind, v_blind * p_engagement, v_blind * v_positive,
+        v_forum, v_forum * p_engagement
+    )
+    ON CONFLICT (company_id, day) DO UPDATE SET
+        blind_count = f.blind_count + EXCLUDED.blind_count,
+        blind_engagement = f.blind_engagement + EXCLUDED.blind_engagement,
+        blind_positive = f.blind_positive + EXCLUDED.blind_positive,
+        naver_forum_count = f.naver_forum_count + EXCLUDED.naver_forum_count,
+        naver_forum_engagement = f.naver_forum_engagement + EXCLUDED.naver_forum_engagement,
+        updated_at = clock_timestamp();
+END;
+$$ LANGUAGE plpgsql;
+
+-- Apply a +1/-1 filing row delta (last_filed_at only ever moves forward)
+CREATE OR REPLACE FUNCTION features_apply_filing(
+    p_company_id VARCHAR, p_ts TIMESTAMPTZ, p_sign INTEGER
+) RETURNS VOID AS $$
+BEGIN
+    INSERT INTO company_daily_features AS f (company_id, day, filings_count, last_filed_at)
+    VALUES (
+        p_company_id, (p_ts AT TIME ZONE 'UTC')::DATE, p_sign,
+        CASE WHEN p_sign > 0 THEN p_ts END
+    )
+    ON CONFLICT (company_id, day) DO UPDATE SET
+        filings_count = f.filings_count + EXCLUDED.filings_count,
+        last_filed_at = GREATEST(f.last_filed_at, EXCLUDED.last_filed_at),
+        updated_at = clock_timestamp();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION news_articles_features_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM features_apply_news(OLD.company_id, OLD.published_at, OLD.sentiment, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM features_apply_news(NEW.company_id, NEW.published_at, NEW.sentiment, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION social_posts_features_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM features_apply_social(
+            OLD.company_id, OLD.platform, OLD.posted_at, OLD.sentiment,
+            OLD.reply_count + OLD.like_count, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM features_apply_social(
+            NEW.company_id, NEW.platform, NEW.posted_at, NEW.sentiment,
+            NEW.reply_count + NEW.like_count, 1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION dart_filings_features_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM features_apply_filing(OLD.company_id, OLD.filed_at, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM features_apply_filing(NEW.company_id, NEW.filed_at, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER news_articles_features
+    AFTER INSERT OR DELETE OR UPDATE OF company_id, published_at, sentiment ON news_articles
+    FOR EACH ROW EXECUTE FUNCTION news_articles_features_trigger();
+
+CREATE TRIGGER social_posts_features
+    AFTER INSERT OR DELETE OR UPDATE OF company_id, platform, posted_at, sentiment, reply_count, like_count
+    ON social_posts
+    FOR EACH ROW EXECUTE FUNCTION social_posts_features_trigger();
+
+CREATE TRIGGER dart_filings_features
+    AFTER INSERT OR DELETE OR UPDATE OF company_id, filed_at ON dart_filings
+    FOR EACH ROW EXECUTE FUNCTION dart_filings_features_trigger();
+
+-- Rebuild the feature store from the raw tables (backfill / repair)
+CREATE OR REPLACE FUNCTION rebuild_company_daily_features()
+RETURNS VOID AS $$
+BEGIN
+    TRUNCATE company_daily_features;
+    PERFORM features_apply_news(company_id, published_at, sentiment, 1) FROM news_articles;
+    PERFORM features_apply_social(company_id, platform, posted_at, sentiment, reply_count + like_count, 1)
+        FROM social_posts;
+    PERFORM features_apply_filing(company_id, filed_at, 1) FROM dart_filings;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- SENTIMENT ROLLUPS (per-company, per-source, per-bucket sentiment series)
+-- ============================================================================
+
+-- Maintained incrementally by row triggers like company_daily_features, with
+-- one row per company, source and hourly or daily (UTC) bucket. A one-year
+-- daily series of one source is a ~365-row range scan on the primary key.
+CREATE TABLE sentiment_rollups (
+    company_id VARCHAR(20) NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    bucket VARCHAR(2) NOT NULL,
+    source VARCHAR(20) NOT NULL,
+    bucket_start TIMESTAMPTZ NOT NULL,
+    item_count INTEGER NOT NULL DEFAULT 0,
+    scored INTEGER NOT NULL DEFAULT 0,
+    positive INTEGER NOT NULL DEFAULT 0,
+    negative INTEGER NOT NULL DEFAULT 0,
+    neutral INTEGER NOT NULL DEFAULT 0,
+    score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    score_hours_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    hours_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (company_id, bucket, source, bucket_start),
+    CONSTRAINT check_rollup_bucket CHECK (bucket IN ('1h', '1d')),
+    CONSTRAINT check_rollup_source CHECK (source IN ('news', 'blind', 'naver_forum', 'dart'))
+);
+
+COMMENT ON TABLE sentiment_rollups IS 'Sentiment counts and score sums per company, source and time bucket';
+COMMENT ON COLUMN sentiment_rollups.bucket IS 'Bucket width: 1h or 1d (UTC days)';
+COMMENT ON COLUMN sentiment_rollups.source IS 'news, blind, naver_forum or dart';
+COMMENT ON COLUMN sentiment_rollups.score_hours_sum IS 'Sum of sentiment score * epoch hours (for recency decay)';
+COMMENT ON COLUMN sentiment_rollups.hours_sum IS 'Sum of epoch hours over scored items';
+
+-- Apply a +1/-1 row delta to the hourly and daily buckets of one source
+CREATE OR REPLACE FUNCTION sentiment_rollups_apply(
+    p_company_id VARCHAR, p_source VARCHAR, p_ts TIMESTAMPTZ, p_sentiment JSONB, p_sign INTEGER
+) RETURNS VOID AS $$
+DECLARE
+    v_label TEXT := p_sentiment->>'label';
+    v_score DOUBLE PRECISION := COALESCE((p_sentiment->>'score')::DOUBLE PRECISION, 0);
+    v_hours DOUBLE PRECISION := EXTRACT(EPOCH FROM p_ts) / 3600.0;
+    v_scored INTEGER := CASE WHEN p_sentiment IS NULL THEN 0 ELSE p_sign END;
+BEGIN
+    INSERT INTO sentiment_rollups AS r (
+        company_id, bucket, source, bucket_start, item_count, scored,
+        positive, negative, neutral, score_sum, score_hours_sum, hours_sum
+    )
+    SELECT
+        p_company_id, b.bucket, p_source, date_trunc(b.unit, p_ts, 'UTC'), p_sign, v_scored,
+        CASE WHEN v_label = 'positive' THEN p_sign ELSE 0 END,
+        CASE WHEN v_label = 'negative' THEN p_sign ELSE 0 END,
+        CASE WHEN v_label = 'neutral' THEN p_sign ELSE 0 END,
+        v_scored * v_score, v_scored * v_score * v_hours, v_scored * v_hours
+    FROM (VALUES ('1h', 'hour'), ('1d', 'day')) AS b (bucket, unit)
+    ON CONFLICT (company_id, bucket, source, bucket_start) DO UPDATE SET
+        item_count = r.item_count + EXCLUDED.item_count,
+        scored = r.scored + EXCLUDED.scored,
+        positive = r.positive + EXCLUDED.positive,
+        negative = r.negative + EXCLUDED.negative,
+        neutral = r.neutral + EXCLUDED.neutral,
+        score_sum = r.score_sum + EXCLUDED.score_sum,
+        score_hours_sum = r.score_hours_sum + EXCLUDED.score_hours_sum,
+        hours_sum = r.hours_sum + EXCLUDED.hours_sum,
+        updated_at = clock_timestamp();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION news_articles_sentiment_rollups_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM sentiment_rollups_apply(OLD.company_id, 'news', OLD.published_at, OLD.sentiment, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM sentiment_rollups_apply(NEW.company_id, 'news', NEW.published_at, NEW.sentiment, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION social_posts_sentiment_rollups_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM sentiment_rollups_apply(OLD.company_id, OLD.platform, OLD.posted_at, OLD.sentiment, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM sentiment_rollups_apply(NEW.company_id, NEW.platform, NEW.posted_at, NEW.sentiment, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION dart_filings_sentiment_rollups_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM sentiment_rollups_apply(OLD.company_id, 'dart', OLD.filed_at, OLD.sentiment, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM sentiment_rollups_apply(NEW.company_id, 'dart', NEW.filed_at, NEW.sentiment, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER news_articles_sentiment_rollups
+    AFTER INSERT OR DELETE OR UPDATE OF company_id, published_at, sentiment ON news_articles
+    FOR EACH ROW EXECUTE FUNCTION news_articles_sentiment_rollups_trigger();
+
+CREATE TRIGGER social_posts_sentiment_rollups
+    AFTER INSERT OR DELETE OR UPDATE OF company_id, platform, posted_at, sentiment ON social_posts
+    FOR EACH ROW EXECUTE FUNCTION social_posts_sentiment_rollups_trigger();
+
+CREATE TRIGGER dart_filings_sentiment_rollups
+    AFTER INSERT OR DELETE OR UPDATE OF company_id, filed_at, sentiment ON dart_filings
+    FOR EACH ROW EXECUTE FUNCTION dart_filings_sentiment_rollups_trigger();
+
+-- Rebuild the rollups from the raw tables (backfill / repair)
+CREATE OR REPLACE FUNCTION rebuild_sentiment_rollups()
+RETURNS VOID AS $$
+BEGIN
+    TRUNCATE sentiment_rollups;
+    PERFORM sentiment_rollups_apply(company_id, 'news', published_at, sentiment, 1) FROM news_articles;
+    PERFORM sentiment_rollups_apply(company_id, platform, posted_at, sentiment, 1) FROM social_posts;
+    PERFORM sentiment_rollups_apply(company_id, 'dart', filed_at, sentiment, 1) FROM dart_filings;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- BLIND DEPARTMENT ROLLUPS (per-company, per-department, per-day 블라인드 stats)
+-- ============================================================================
+
+-- Maintained by a row trigger on social_posts for 블라인드 posts with a dept,
+-- one row per company, department and UTC day. A 90-day department report
+-- is a range scan over ~90 rows per department instead of every post.
+CREATE TABLE blind_dept_daily (
+    company_id VARCHAR(20) NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    dept VARCHAR(100) NOT NULL,
+    day DATE NOT NULL,
+    post_count INTEGER NOT NULL DEFAULT 0,
+    reply_count BIGINT NOT NULL DEFAULT 0,
+    like_count BIGINT NOT NULL DEFAULT 0,
+    scored INTEGER NOT NULL DEFAULT 0,
+    positive INTEGER NOT NULL DEFAULT 0,
+    negative INTEGER NOT NULL DEFAULT 0,
+    neutral INTEGER NOT NULL DEFAULT 0,
+    score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (company_id, dept, day)
+);
+
+-- Department reports read every department of a company over a day range
+CREATE INDEX idx_blind_dept_daily_company_day ON blind_dept_daily(company_id, day);
+
+COMMENT ON TABLE blind_dept_daily IS '블라인드 post counts, engagement and sentiment per company, department and UTC day';
+COMMENT ON COLUMN blind_dept_daily.scored IS 'Posts with sentiment';
+COMMENT ON COLUMN blind_dept_daily.score_sum IS 'Sum of sentiment scores over scored posts';
+
+-- Apply a +1/-1 row delta to one department day
+CREATE OR REPLACE FUNCTION blind_dept_apply(
+    p_company_id VARCHAR, p_dept VARCHAR, p_ts TIMESTAMPTZ, p_sentiment JSONB,
+    p_replies INTEGER, p_likes INTEGER, p_sign INTEGER
+) RETURNS VOID AS $$
+DECLARE
+    v_label TEXT := p_sentiment->>'label';
+    v_scored INTEGER := CASE WHEN p_sentiment IS NULL THEN 0 ELSE p_sign END;
+BEGIN
+    INSERT INTO blind_dept_daily AS d (
+        company_id, dept, day, post_count, reply_count, like_count, scored,
+        positive, negative, neutral, score_sum
+    )
+    VALUES (
+        p_company_id, p_dept, (p_ts AT TIME ZONE 'UTC')::DATE, p_sign,
+        p_sign * p_replies, p_sign * p_likes, v_scored,
+        CASE WHEN v_label = 'positive' THEN p_sign ELSE 0 END,
+        CASE WHEN v_label = 'negative' THEN p_sign ELSE 0 END,
+        CASE WHEN v_label = 'neutral' THEN p_sign ELSE 0 END,
+        v_scored * COALESCE((p_sentiment->>'score')::DOUBLE PRECISION, 0)
+    )
+    ON CONFLICT (company_id, dept, day) DO UPDATE SET
+        post_count = d.post_count + EXCLUDED.post_count,
+        reply_count = d.reply_count + EXCLUDED.reply_count,
+        like_count = d.like_count + EXCLUDED.like_count,
+        scored = d.scored + EXCLUDED.scored,
+        positive = d.positive + EXCLUDED.positive,
+        negative = d.negative + EXCLUDED.negative,
+        neutral = d.neutral + EXCLUDED.neutral,
+        score_sum = d.score_sum + EXCLUDED.score_sum,
+        updated_at = clock_timestamp();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION social_posts_blind_dept_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.platform = 'blind' AND OLD.dept IS NOT NULL THEN
+        PERFORM blind_dept_apply(
+            OLD.company_id, OLD.dept, OLD.posted_at, OLD.sentiment, OLD.reply_count, OLD.like_count, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.platform = 'blind' AND NEW.dept IS NOT NULL THEN
+        PERFORM blind_dept_apply(
+            NEW.company_id, NEW.dept, NEW.posted_at, NEW.sentiment, NEW.reply_count, NEW.like_count, 1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER social_posts_blind_dept
+    AFTER INSERT OR DELETE OR UPDATE OF company_id, platform, dept, posted_at, sentiment, reply_count, like_count
+    ON social_posts
+    FOR EACH ROW EXECUTE FUNCTION social_posts_blind_dept_trigger();
+
+-- Rebuild the department rollups from social_posts (backfill / repair)
+CREATE OR REPLACE FUNCTION rebuild_blind_dept_daily()
+RETURNS VOID AS $$
+BEGIN
+    TRUNCATE blind_dept_daily;
+    PERFORM blind_dept_apply(company_id, dept, posted_at, sentiment, reply_count, like_count, 1)
+    FROM social_posts
+    WHERE platform = 'blind' AND dept IS NOT NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- TRENDING COUNTERS (snapshots of the in-memory mention ring buffers)
+-- ============================================================================
+
+-- app.services.trending counts mentions per company in minute and hour ring
+-- buffers; this table holds their last snapshot so a restart keeps the
+-- baseline. Rows older than the rings are deleted at each snapshot.
+CREATE TABLE trending_counters (
+    company_id VARCHAR(20) NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    resolution VARCHAR(6) NOT NULL,
+    slot_start TIMESTAMPTZ NOT NULL,
+    mentions INTEGER NOT NULL DEFAULT 0,
+    engagement BIGINT NOT NULL DEFAULT 0,
+    scored INTEGER NOT NULL DEFAULT 0,
+    score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (company_id, resolution, slot_start),
+    CONSTRAINT check_resolution CHECK (resolution IN ('minute', 'hour'))
+);
+
+-- Restore and pruning scan by resolution and time across companies
+CREATE INDEX idx_trending_counters_slot ON trending_counters(resolution, slot_start);
+
+COMMENT ON TABLE trending_counters IS 'Last snapshot of the per-company trending ring buffers';
+COMMENT ON COLUMN trending_counters.engagement IS 'Sum of reply_count + like_count of the slot''s posts';
+COMMENT ON COLUMN trending_counters.score_sum IS 'Sum of sentiment scores over the slot''s scored mentions';
+
+-- ============================================================================
+-- SENTIMENT CACHE (content-addressed LLM results)
+-- ============================================================================
+
+-- Keyed by SHA-256 of normalized text + content type (app.utils.hashing.content_hash),
+-- so reposts of the same headline are scored once across processes and restarts.
+CREATE TABLE sentiment_cache (
+    content_hash CHAR(64) PRIMARY KEY,
+    content_type VARCHAR(20) NOT NULL,
+    sentiment JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    CONSTRAINT check_content_type CHECK (content_type IN ('news', 'social', 'filing'))
+);
+
+COMMENT ON TABLE sentiment_cache IS 'Second-tier sentiment cache behind the in-process LRU';
+COMMENT ON COLUMN sentiment_cache.content_hash IS 'sha256(content_type || newline || normalized text)';
+
+-- ============================================================================
+-- SNAPSHOT FILES (bulk loader manifest)
+-- ============================================================================
+
+-- One row per data/YYYY-MM-DD/*.txt file loaded by app.cli.load_snapshots
+-- or the snapshot watcher, written in the same transaction as the file's rows.
+-- A file whose hash matches is skipped; a file that still starts with the
+-- loaded bytes only has its tail (from byte_offset) parsed.
+CREATE TABLE snapshot_files (
+    company_id VARCHAR(20) NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    content_hash CHAR(64) NOT NULL,
+    byte_offset BIGINT NOT NULL DEFAULT 0,
+    records INTEGER NOT NULL DEFAULT 0,
+    loaded_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (company_id, path)
+);
+
+COMMENT ON TABLE snapshot_files IS 'Manifest of snapshot files already loaded';
+COMMENT ON COLUMN snapshot_files.path IS 'Path relative to the data directory, e.g. 2025-10-17/news.txt';
+COMMENT ON COLUMN snapshot_files.content_hash IS 'SHA-256 of the first byte_offset bytes (everything loaded so far)';
+COMMENT ON COLUMN snapshot_files.byte_offset IS 'Bytes of the file already parsed';
+COMMENT ON COLUMN snapshot_files.records IS 'Records parsed from the file (inserted rows may be fewer after dedupe)';
+
 -- ============================================================================
 -- ESPP HOLDINGS
 -- ============================================================================
@@ -178,11 +753,13 @@ COMMENT ON COLUMN espp_holdings.lots IS 'JSONB array: [{lot_id, purchase_date, q
 -- HELPER FUNCTIONS
 -- ============================================================================
 
--- Function to update updated_at timestamp
+-- Function to update updated_at timestamp. clock_timestamp() rather than
+-- NOW() (the transaction start): an update committed after a newer insert
+-- must still raise max(updated_at), which HTTP cache validators rely on.
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
 BEGIN
-    NEW.updated_at = NOW();
+    NEW.updated_at = clock_timestamp();
     RETURN NEW;
 END;
 $$ language 'plpgsql';
@@ -255,7 +832,7 @@ COMMENT ON VIEW company_summary IS 'Companies with their latest daily closing pr
 DO $$
 BEGIN
     RAISE NOTICE 'Schema created successfully!';
-    RAISE NOTICE 'Tables: companies, news_articles, social_posts, dart_filings, price_candles, espp_holdings';
+    RAISE NOTICE 'Tables: companies, news_articles, social_posts, dart_filings, price_candles, company_daily_features, espp_holdings';
     RAISE NOTICE 'Views: latest_prices, company_summary';
     RAISE NOTICE 'Next steps:';
     RAISE NOTICE '  1. Run seed data: psql -U user -d equity -f db/seed.sql';
@@ -0,0 +1,136 @@
+"""Test offline backtesting harness."""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import app.services.backtest as backtest
+from app.schemas.common import Sentiment
+from app.schemas.intelligence import Article
+from app.schemas.market import CompanyRef, PriceCandle, PriceSeries
+from app.services.backtest import (
+    CompanyHistory,
+    LLMPredictor,
+    MomentumPredictor,
+    ReplayPredictor,
+    Snapshot,
+    run_backtest,
+    write_recording,
+)
+from app.services.llm_gateway import LLMGateway
+
+BASE = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _history() -> CompanyHistory:
+    candles = [
+        PriceCandle(
+            t=BASE + timedelta(days=i), o=100.0 + i, h=101.0 + i, l=99.0 + i, c=100.0 + i, v=1000
+        )
+        for i in range(60)
+    ]
+    news = [
+        Article(
+            id=f"a{i}",
+            title=f"news {i}",
+            source="한국경제",
+            published_at=BASE + timedelta(days=i, hours=12),
+            sentiment=Sentiment(label="positive", score=0.5, confidence=0.8),
+            company_id="005930",
+        )
+        for i in range(60)
+    ]
+    return CompanyHistory(
+        company_id="005930",
+        ticker="005930.KS",
+        prices=PriceSeries(company=CompanyRef(id="005930", ticker="005930.KS"), candles=candles),
+        news=news,
+    )
+
+
+class _SpyPredictor:
+    """Records the latest timestamp it was shown."""
+
+    name = "spy"
+
+    def __init__(self) -> None:
+        self.max_seen: list[tuple[datetime, datetime]] = []
+
+    def predict(self, snapshot: Snapshot, features: dict[str, Any], horizon_days: int) -> float:
+        times = [c.t for c in snapshot.prices.candles] + [a.published_at for a in snapshot.news]
+        latest = max(times)
+        self.max_seen.append((snapshot.as_of, latest))
+        return 0.0
+
+
+def test_snapshot_has_no_lookahead() -> None:
+    """Test that predictors only see data strictly before the snapshot time."""
+    spy = _SpyPredictor()
+    dates = [BASE + timedelta(days=d) for d in range(5, 50, 5)]
+
+    run_backtest([_history()], dates, spy, horizon_days=3)
+
+    assert len(spy.max_seen) == len(dates)
+    for as_of, latest in spy.max_seen:
+        assert latest < as_of
+
+
+def test_realized_return_and_metrics() -> None:
+    """Test realized returns and error metrics on a linear price path."""
+    history = _history()
+    as_of = BASE + timedelta(days=10)
+
+    # Last close before as_of is day 9 (109), horizon close is day 12 (112)
+    assert history.realized_return(as_of, 3) == (112.0 - 109.0) / 109.0
+    assert history.realized_return(BASE + timedelta(days=61), 3) is None
+
+    predictor = MomentumPredictor(sentiment_weight=0.0)
+    report = run_backtest([history], [as_of], predictor, horizon_days=3)
+    summary = report.summary()
+
+    assert summary["steps"] == 1
+    assert summary["scored"] == 1
+    assert summary["directional_accuracy"] == 1.0
+    assert summary["mae"] is not None
+
+
+def test_recording_replays_identically(tmp_path: Any) -> None:
+    """Test that a recorded run can be replayed with identical metrics."""
+    dates = [BASE + timedelta(days=d) for d in range(10, 40)]
+    original = run_backtest([_history()], dates, MomentumPredictor(), horizon_days=5)
+
+    path = tmp_path / "recording.jsonl"
+    write_recording(original, path)
+    replayed = run_backtest([_history()], dates, ReplayPredictor(path), horizon_days=5)
+
+    assert replayed.summary()["mae"] == original.summary()["mae"]
+    assert replayed.summary()["errors"] == 0
+
+
+def test_llm_predictor_reuses_one_gateway(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that one gateway serves every prediction of a run and is closed at the end."""
+    gateways: list[MagicMock] = []
+    used: list[object] = []
+
+    def from_settings() -> MagicMock:
+        gateway = MagicMock(aclose=AsyncMock())
+        gateways.append(gateway)
+        return gateway
+
+    async def fake_predict_price(**kwargs: Any) -> MagicMock:
+        used.append(kwargs["gateway"])
+        prediction = MagicMock(current_price=100.0)
+        prediction.predicted_series = [MagicMock(price=101.0)]
+        return prediction
+
+    monkeypatch.setattr(LLMGateway, "from_settings", from_settings)
+    monkeypatch.setattr(backtest, "predict_price", fake_predict_price)
+    dates = [BASE + timedelta(days=d) for d in (20, 30, 40)]
+
+    report = run_backtest([_history()], dates, LLMPredictor(include_features={}), horizon_days=3)
+
+    assert all(step.predicted_return is not None for step in report.steps)
+    assert len(gateways) == 1 and used == [gateways[0]] * 3
+    gateways[0].aclose.assert_awaited_once()
@@ -0,0 +1,49 @@
+"""Test multi-company batch reads."""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models import NewsArticleModel
+from app.repositories.base import BaseRepository
+from app.services.latest import fetch_latest
+
+
+def test_latest_query_is_one_lateral_statement() -> None:
+    """Test the batch query binds the ids as one array and limits per company."""
+    query = BaseRepository._latest_per_company(
+        NewsArticleModel, NewsArticleModel.published_at, ["005930", "000660"], 5, []
+    )
+    sql = str(query.compile(dialect=postgresql.dialect()))  # type: ignore[no-untyped-call]
+
+    assert "unnest(%(company_ids)s::VARCHAR[]) WITH ORDINALITY AS ids" in sql
+    assert "JOIN LATERAL" in sql
+    assert "news_articles.company_id = ids.company_id" in sql
+    assert sql.rstrip().endswith("ORDER BY ids.ord, latest.published_at DESC, latest.id ASC")
+
+
+@pytest.mark.asyncio
+async def test_fetch_latest_keeps_request_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test every requested company gets an entry, in order and without duplicates."""
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+
+    data = await fetch_latest(None, ["000660", "005930", "000660"], limit=2)
+
+    assert [entry.company_id for entry in data] == ["000660", "005930"]
+    for entry in data:
+        assert entry.news is not None and entry.blind is not None
+        assert entry.naver_forum is not None and entry.dart is not None
+        assert len(entry.news) == 2 and all(a.company_id == entry.company_id for a in entry.news)
+        assert all(p.platform == "blind" for p in entry.blind)
+        assert all(p.platform == "naver_forum" for p in entry.naver_forum)
+        assert len(entry.dart) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_latest_selected_sources(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test unrequested sources are None rather than empty."""
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+
+    [entry] = await fetch_latest(None, ["005930"], sources=["blind"], limit=3)
+
+    assert entry.blind is not None and len(entry.blind) == 3
+    assert entry.news is None and entry.naver_forum is None and entry.dart is None
@@ -0,0 +1,85 @@
+"""Test 블라인드 department rollups and window summaries."""
+
+import math
+from datetime import UTC, date, datetime, timedelta
+from typing import cast
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.blind_depts_repo import BlindDeptsRepository, aggregate_dept_days
+from app.schemas.common import Sentiment
+from app.schemas.intelligence import SocialPost
+from app.services.blind_depts import summarize_depts, window_start
+
+
+def _post(
+    i: int, dept: str | None, ts: datetime, score: float | None, platform: str = "blind"
+) -> SocialPost:
+    sentiment = None
+    if score is not None:
+        label = "positive" if score > 0 else "negative" if score < 0 else "neutral"
+        sentiment = Sentiment(label=label, score=score, confidence=0.8)
+    return SocialPost(
+        id=f"p{i}", platform=platform, content="x", dept=dept, posted_at=ts,
+        sentiment=sentiment, company_id="005930", reply_count=i, like_count=2 * i,
+    )
+
+
+def test_windows_and_trend_match_raw_posts() -> None:
+    """Test window totals and the trend equal a direct scan of the posts."""
+    end_day = date(2025, 11, 30)
+    noon = datetime(2025, 11, 30, 12, tzinfo=UTC)
+    posts = [
+        _post(1, "경영지원", noon, -0.6),
+        _post(2, "경영지원", noon - timedelta(days=3), -0.2),
+        _post(3, "경영지원", noon - timedelta(days=10), 0.4),
+        _post(4, "경영지원", noon - timedelta(days=20), None),
+        _post(5, "반도체", noon - timedelta(days=1), 0.5),
+        _post(6, "반도체", noon - timedelta(days=40), 0.9),
+        _post(7, None, noon, 0.1),
+        _post(8, "경영지원", noon, 0.3, platform="naver_forum"),
+    ]
+
+    stats = summarize_depts(aggregate_dept_days(posts), [7, 30], end_day)
+
+    assert [s.dept for s in stats] == ["경영지원", "반도체"]
+    week, month = stats[0].windows
+    assert (week.posts, month.posts) == (2, 4)
+    assert month.scored == 3 and month.negative == 2 and month.positive == 1
+    assert month.engagement == sum(3 * i for i in (1, 2, 3, 4))
+    assert week.mean_score is not None and stats[0].sentiment_trend is not None
+    assert math.isclose(week.mean_score, -0.4)
+    assert math.isclose(stats[0].sentiment_trend, -0.4 - 0.4)
+    # 반도체 has no scored posts in the rest of the month
+    assert stats[1].windows[1].posts == 1 and stats[1].sentiment_trend is None
+
+
+def test_min_posts_and_window_bounds() -> None:
+    """Test rows outside the longest window and small departments are dropped."""
+    end_day = date(2025, 11, 30)
+    start_day = window_start([3], end_day)
+    posts = [
+        _post(1, "인사", datetime(2025, 11, 28, 0, tzinfo=UTC), 0.2),
+        _post(2, "인사", datetime(2025, 11, 27, 23, tzinfo=UTC), 0.2),
+        _post(3, "연구", datetime(2025, 12, 1, tzinfo=UTC), 0.2),
+    ]
+
+    stats = summarize_depts(aggregate_dept_days(posts), [3], end_day)
+
+    assert start_day == date(2025, 11, 28)
+    assert [(s.dept, s.windows[0].posts, s.sentiment_trend) for s in stats] == [("인사", 1, None)]
+    assert summarize_depts(aggregate_dept_days(posts), [3], end_day, min_posts=2) == []
+
+
+@pytest.mark.asyncio
+async def test_memory_dept_days_cover_fake_posts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the in-memory rollups count every fake 블라인드 post with a department."""
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+    end_day = datetime.now(UTC).date()
+
+    repo = BlindDeptsRepository(cast(AsyncSession, None))
+    rows = await repo.fetch_dept_days("005930", end_day - timedelta(days=2), end_day)
+
+    assert {r.dept for r in rows} == {"경영지원"}
+    assert sum(r.post_count for r in rows) == 3
@@ -0,0 +1,60 @@
+"""Test the in-memory company directory."""
+
+import pytest
+
+from app.repositories.companies_repo import CompaniesRepository
+from app.services import company_directory
+from app.services.company_directory import CompanyDirectory, find_company
+from app.utils.text_search import choseong
+
+
+@pytest.fixture
+async def directory(monkeypatch: pytest.MonkeyPatch) -> CompanyDirectory:
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+    directory = CompanyDirectory()
+    directory.load(await CompaniesRepository(None).list_companies())  # type: ignore[arg-type]
+    return directory
+
+
+def test_choseong() -> None:
+    """Test initial-consonant extraction."""
+    assert choseong("삼성전자") == "ㅅㅅㅈㅈ"
+    assert choseong("LG화학") == "LGㅎㅎ"
+
+
+@pytest.mark.asyncio
+async def test_search_matches_repository(directory: CompanyDirectory) -> None:
+    """Test that pages and ranks equal the repository's for the same queries."""
+    repo = CompaniesRepository(None)  # type: ignore[arg-type]
+    for q in ["삼성", "lg화항", "00", "전자", None]:
+        expected, cursor = await repo.search_companies(q, limit=2)
+        page, next_cursor = directory.search(q, limit=2)
+        assert [c.id for c in page] == [c.id for c in expected]
+        assert next_cursor == cursor
+
+
+@pytest.mark.asyncio
+async def test_initial_consonant_search(directory: CompanyDirectory) -> None:
+    """Test 초성 and mixed queries plus lookups."""
+    assert [c.id for c in directory.search("ㅅㅅㅈㅈ")[0]] == ["005930"]
+    assert [c.id for c in directory.search("ㅅㅅ")[0]] == ["005930", "006400"]
+    assert [c.id for c in directory.search("삼ㅅㅈ")[0]] == ["005930"]
+    assert [c.id for c in directory.search("ㅎㅇㄴ")[0]] == ["000660"]
+    company = directory.get("051910")
+    assert company is not None and company.name == "LG화학"
+    assert directory.get("999999") is None
+
+
+@pytest.mark.asyncio
+async def test_find_company_falls_back_on_directory_miss(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a company missing from a stale directory is read from the repository."""
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+    companies = await CompaniesRepository(None).list_companies()  # type: ignore[arg-type]
+    stale = CompanyDirectory()
+    stale.load([c for c in companies if c.id != "005930"])
+    monkeypatch.setattr(company_directory, "_directory", stale)
+
+    found = await find_company(None, "005930")  # type: ignore[arg-type]
+
+    assert found is not None and found.id == "005930"
+    assert await find_company(None, "999999") is None  # type: ignore[arg-type]
@@ -0,0 +1,33 @@
+"""Test trigram company search."""
+
+import pytest
+
+from app.repositories.companies_repo import CompaniesRepository
+from app.utils.text_search import trigram_similarity
+
+
+def test_trigram_similarity_matches_pg_trgm() -> None:
+    """Test similarity values against pg_trgm's documented behaviour."""
+    assert trigram_similarity("word", "words") == pytest.approx(4 / 7)
+    assert trigram_similarity("LG화학", "lg화항") == pytest.approx(3 / 7)
+    assert trigram_similarity("", "삼성") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_memory_search_ranks_prefix_and_typos(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test ranking, typo matches and keyset paging in memory mode."""
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+    repo = CompaniesRepository(None)  # type: ignore[arg-type]
+
+    companies, cursor = await repo.search_companies("삼성", limit=1)
+    seen = [c.id for c in companies]
+    while cursor:
+        companies, cursor = await repo.search_companies("삼성", limit=1, cursor=cursor)
+        seen.extend(c.id for c in companies)
+    assert seen == ["005930", "006400"]  # both prefix matches, closer name first
+
+    companies, _ = await repo.search_companies("LG화항")
+    assert [c.id for c in companies] == ["051910"]
+
+    companies, _ = await repo.search_companies("000660")
+    assert companies[0].name == "SK하이닉스"
@@ -0,0 +1,94 @@
+"""Test the concurrent company dashboard."""
+
+import asyncio
+from typing import cast
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.errors import NotFound
+from app.routers import companies as companies_router
+from app.services import dashboard as dashboard_service
+from app.services.company_directory import find_company
+from app.services.dashboard import DASHBOARD_COMPONENTS, component_deadlines, fetch_dashboard
+
+
+@pytest.fixture(autouse=True)
+def memory_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+
+
+@pytest.mark.asyncio
+async def test_dashboard_fetches_every_component() -> None:
+    """Test all components are filled when none time out."""
+    dashboard = await fetch_dashboard(None, "005930", limit=2)
+
+    assert dashboard.company is not None and dashboard.company.id == "005930"
+    assert dashboard.prices is not None
+    assert dashboard.news is not None and dashboard.blind is not None
+    assert dashboard.naver_forum is not None
+    assert len(dashboard.news.data) == 2 and dashboard.news.next_cursor is not None
+    assert all(p.platform == "blind" for p in dashboard.blind.data)
+    assert all(p.platform == "naver_forum" for p in dashboard.naver_forum.data)
+    assert dashboard.filings is not None
+    assert dashboard.timed_out == []
+
+
+@pytest.mark.asyncio
+async def test_include_selects_components() -> None:
+    """Test components outside ``include`` are not fetched."""
+    dashboard = await fetch_dashboard(None, "005930", include=["news", "news", "filings"])
+
+    assert dashboard.news is not None and dashboard.filings is not None
+    assert dashboard.company is None and dashboard.prices is None and dashboard.blind is None
+
+
+@pytest.mark.asyncio
+async def test_slow_component_is_null_and_does_not_stall(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a component past its deadline is null while the others return."""
+    async def slow_prices(*args: object) -> None:
+        await asyncio.sleep(10)
+
+    monkeypatch.setitem(dashboard_service._LOADERS, "prices", slow_prices)
+    deadlines = dict.fromkeys(DASHBOARD_COMPONENTS, 1.0) | {"prices": 0.05}
+
+    dashboard = await asyncio.wait_for(fetch_dashboard(None, "005930", deadlines=deadlines), 2.0)
+
+    assert dashboard.prices is None
+    assert dashboard.timed_out == ["prices"]
+    assert dashboard.news is not None and dashboard.company is not None
+
+
+def test_timeout_caps_every_deadline() -> None:
+    """Test the request timeout caps the configured deadlines."""
+    capped = component_deadlines(0.2)
+    defaults = component_deadlines()
+
+    assert set(capped) == set(DASHBOARD_COMPONENTS)
+    assert all(capped[c] == min(defaults[c], 0.2) for c in DASHBOARD_COMPONENTS)
+    assert defaults["prices"] > defaults["news"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_company_is_404_before_fan_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the route checks the company first and fetches nothing for an unknown ID."""
+    fetched: list[str] = []
+
+    async def spy(*args: object, **kwargs: object) -> None:
+        fetched.append("dashboard")
+
+    monkeypatch.setattr(companies_router, "fetch_dashboard", spy)
+
+    with pytest.raises(NotFound):
+        await companies_router.get_company_dashboard("999999", None)  # type: ignore[arg-type]
+    assert fetched == []
+
+
+@pytest.mark.asyncio
+async def test_known_company_is_not_fetched_again() -> None:
+    """Test a company passed in fills its component without running the loader."""
+    company = await find_company(cast(AsyncSession, None), "005930")
+
+    dashboard = await fetch_dashboard(None, "005930", include=["company", "news"], company=company)
+
+    assert dashboard.company is company and dashboard.news is not None
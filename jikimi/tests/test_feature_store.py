@@ -0,0 +1,113 @@
+"""Test feature-store aggregation against the raw-list feature path."""
+
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from app.schemas.common import Sentiment
+from app.schemas.intelligence import Article, Filing, SocialPost
+from app.schemas.market import CompanyRef, PriceSeries
+from app.services.feature_store import aggregate_daily
+from app.services.prediction import _assemble_features
+
+NOW = datetime(2025, 11, 3, 9, 30, tzinfo=UTC)
+INCLUDE = {"news": True, "blind": True, "naver_forum": True, "filings": True}
+LABELS = ["positive", "neutral", "negative"]
+
+
+def _sentiment(i: int) -> Sentiment:
+    label = LABELS[i % 3]
+    score = {"positive": 0.6, "neutral": 0.05, "negative": -0.4}[label]
+    return Sentiment(label=label, score=score - i * 0.001, confidence=0.8)
+
+
+def _items(
+    max_age_hours: int,
+) -> tuple[list[Article], list[SocialPost], list[SocialPost], list[Filing]]:
+    news = [
+        Article(
+            id=f"a{i}",
+            title=f"뉴스 {i}",
+            source="연합뉴스",
+            published_at=NOW - timedelta(hours=(i * 37) % max_age_hours + 1),
+            sentiment=_sentiment(i) if i % 7 else None,
+            company_id="005930",
+        )
+        for i in range(60)
+    ]
+    blind = [
+        SocialPost(
+            id=f"b{i}",
+            platform="blind",
+            content=f"글 {i}",
+            posted_at=NOW - timedelta(hours=(i * 29) % max_age_hours + 1),
+            sentiment=_sentiment(i),
+            company_id="005930",
+            reply_count=i,
+            like_count=2 * i,
+        )
+        for i in range(40)
+    ]
+    forum = [
+        SocialPost(
+            id=f"n{i}",
+            platform="naver_forum",
+            content=f"토론 {i}",
+            posted_at=NOW - timedelta(hours=(i * 13) % max_age_hours + 1),
+            company_id="005930",
+            reply_count=1,
+            like_count=i,
+        )
+        for i in range(25)
+    ]
+    filings = [
+        Filing(
+            id=f"f{i}",
+            title="분기보고서",
+            filing_type="분기보고서",
+            filed_at=NOW - timedelta(days=3 * i + 2),
+            company_id="005930",
+        )
+        for i in range(4)
+    ]
+    return news, blind, forum, filings
+
+
+@pytest.mark.parametrize("max_age_hours", [24 * 20, 24 * 30])
+def test_daily_features_match_raw_features(max_age_hours: int) -> None:
+    """Test that feature-store rows reproduce the raw-list features."""
+    news, blind, forum, filings = _items(max_age_hours)
+    prices = PriceSeries(company=CompanyRef(id="005930"), candles=[])
+
+    raw = _assemble_features(prices, news, blind, forum, filings, INCLUDE, as_of=NOW)
+    daily = aggregate_daily("005930", news, blind, forum, filings)
+    from_store = _assemble_features(prices, [], [], [], [], INCLUDE, as_of=NOW, daily=daily)
+
+    assert from_store.keys() == raw.keys()
+    for key, value in raw.items():
+        if key == "news_weighted_sentiment" and max_age_hours > 24 * 27:
+            # Only the day straddling the decay floor is approximated
+            assert from_store[key] == pytest.approx(value, abs=0.01)
+        else:
+            assert from_store[key] == pytest.approx(value, rel=1e-9), key
+
+
+def test_aggregate_daily_groups_by_utc_day() -> None:
+    """Test that rows are keyed by UTC calendar day, ascending."""
+    kst = timezone(timedelta(hours=9))
+    posts = [
+        SocialPost(
+            id=f"p{i}",
+            platform="blind",
+            content="글",
+            posted_at=datetime(2025, 11, 3, 8, 0, tzinfo=kst) + timedelta(hours=i),
+            company_id="005930",
+        )
+        for i in range(2)
+    ]
+
+    rows = aggregate_daily("005930", [], posts, [], [])
+
+    # 08:00 KST is 23:00 UTC on the previous day; 09:00 KST is 00:00 UTC
+    assert [r.day.isoformat() for r in rows] == ["2025-11-02", "2025-11-03"]
+    assert [r.blind_count for r in rows] == [1, 1]
@@ -0,0 +1,68 @@
+"""Test freshness validators against PostgreSQL (set TEST_DB_DSN to run)."""
+
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from app.repositories.freshness_repo import FreshnessRepository
+from app.repositories.news_repo import NewsRepository
+from app.services.http_cache import make_etag
+
+TEST_DB_DSN = os.environ.get("TEST_DB_DSN")
+COMPANY_ID = "FRESH01"
+
+pytestmark = pytest.mark.skipif(not TEST_DB_DSN, reason="TEST_DB_DSN not set")
+
+
+@pytest.fixture
+async def engine(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[AsyncEngine]:
+    assert TEST_DB_DSN is not None
+    monkeypatch.setattr("app.config.settings.db_dsn", TEST_DB_DSN)
+    engine = create_async_engine(TEST_DB_DSN)
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("INSERT INTO companies (id, name) VALUES (:id, 'Freshness')"), {"id": COMPANY_ID}
+        )
+    yield engine
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("DELETE FROM news_articles WHERE company_id = :id"), {"id": COMPANY_ID}
+        )
+        await conn.execute(text("DELETE FROM companies WHERE id = :id"), {"id": COMPANY_ID})
+    await engine.dispose()
+
+
+async def _etag(engine: AsyncEngine) -> str:
+    async with AsyncSession(engine) as session:
+        freshness = await FreshnessRepository(session).source_freshness(COMPANY_ID, ["news"])
+    assert freshness is not None
+    return make_etag("news", tuple(freshness))
+
+
+@pytest.mark.asyncio
+async def test_update_committed_after_a_newer_insert_changes_the_etag(engine: AsyncEngine) -> None:
+    """Test that an update from a transaction older than the newest row still moves the ETag."""
+    published = datetime(2025, 11, 1, 9, tzinfo=UTC)
+    async with AsyncSession(engine) as session:
+        repo = NewsRepository(session)
+        old = await repo.create_article("기존 기사", "한경", COMPANY_ID, published)
+
+    async with engine.connect() as slow:
+        # The slow transaction starts (and NOW() is fixed) before the newer insert
+        await slow.begin()
+        await slow.execute(text("SELECT 1"))
+        await asyncio.sleep(0.05)
+        async with AsyncSession(engine) as session:
+            await NewsRepository(session).create_article("신규 기사", "한경", COMPANY_ID, published)
+        before = await _etag(engine)
+
+        correction = text("UPDATE news_articles SET summary = '정정' WHERE id = :id")
+        await slow.execute(correction, {"id": old.id})
+        await slow.commit()
+
+    assert await _etag(engine) != before
@@ -0,0 +1,114 @@
+"""Test the HTTP response cache and conditional GET."""
+
+from datetime import UTC, datetime
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.repositories.freshness_repo import Freshness
+from app.services import http_cache
+from app.services.http_cache import ResponseCache, cached_response
+
+
+class Body(BaseModel):
+    value: int
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> ResponseCache:
+    cache = ResponseCache(maxsize=10)
+    monkeypatch.setattr(http_cache, "_cache", cache)
+    monkeypatch.setattr("app.config.settings.http_cache_ttls", {})
+    return cache
+
+
+def make_client(state: dict[str, int], with_freshness: bool = True) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/companies/{company_id}/items")
+    async def items(company_id: str, request: Request) -> Response:
+        async def build() -> Body:
+            state["builds"] += 1
+            return Body(value=state["value"])
+
+        async def freshness() -> Freshness:
+            state["checks"] += 1
+            return Freshness(rows=state["value"], last_modified=datetime(2025, 11, 2, tzinfo=UTC))
+
+        return await cached_response(request, "news", build, freshness if with_freshness else None)
+
+    return TestClient(app)
+
+
+def test_fresh_hit_skips_build_and_freshness(cache: ResponseCache) -> None:
+    """Test a repeat within the TTL is served from the cache alone."""
+    state = {"builds": 0, "checks": 0, "value": 1}
+    client = make_client(state)
+
+    first = client.get("/companies/005930/items?b=2&a=1")
+    second = client.get("/companies/005930/items?a=1&b=2")
+
+    assert first.json() == second.json() == {"value": 1}
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.headers["cache-control"] == "public, max-age=30"
+    assert first.headers["last-modified"] == "Sun, 02 Nov 2025 00:00:00 GMT"
+    assert state == {"builds": 1, "checks": 1, "value": 1}
+    assert cache.stats()["fresh_hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_if_none_match_returns_304_without_building(
+    cache: ResponseCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a matching validator is answered with 304 and no body."""
+    monkeypatch.setattr("app.config.settings.http_cache_ttls", {"news": 0})
+    state = {"builds": 0, "checks": 0, "value": 1}
+    client = make_client(state)
+    etag = client.get("/companies/005930/items").headers["etag"]
+
+    response = client.get("/companies/005930/items", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert state["builds"] == 1 and state["checks"] == 2
+    assert len(cache._entries) == 0
+
+    state["value"] = 2
+    changed = client.get("/companies/005930/items", headers={"If-None-Match": etag})
+
+    assert changed.status_code == 200 and changed.json() == {"value": 2}
+    assert changed.headers["etag"] != etag
+
+
+def test_stale_entry_is_revalidated_without_building(cache: ResponseCache) -> None:
+    """Test an expired entry whose validator is unchanged is reused."""
+    state = {"builds": 0, "checks": 0, "value": 1}
+    client = make_client(state)
+    client.get("/companies/005930/items")
+    key = next(iter(cache._entries))
+    cache._entries[key] = cache._entries[key]._replace(expires_at=0.0)
+
+    response = client.get("/companies/005930/items")
+
+    assert response.json() == {"value": 1}
+    assert state["builds"] == 1 and state["checks"] == 2
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_body_hash_etag_and_invalidation(cache: ResponseCache) -> None:
+    """Test routes without a freshness query still get 304s, and writes drop entries."""
+    state = {"builds": 0, "checks": 0, "value": 1}
+    client = make_client(state, with_freshness=False)
+    etag = client.get("/companies/005930/items").headers["etag"]
+    client.get("/companies/000660/items")
+
+    assert client.get("/companies/005930/items", headers={"If-None-Match": etag}).status_code == 304
+    assert cache.invalidate("/companies/005930/") == 1
+
+    state["value"] = 2
+    response = client.get("/companies/005930/items", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200 and response.json() == {"value": 2}
+    assert state["builds"] == 3 and state["checks"] == 0
@@ -0,0 +1,208 @@
+"""Test bulk ingestion (dedupe, batched scoring, per-item status)."""
+
+import json
+from datetime import UTC, datetime, timedelta, timezone
+from typing import Any, cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.services.ingestion as ingestion
+import app.services.llm_gateway as llm_gateway
+from app.errors import AIProviderError
+from app.repositories.dart_repo import DartRepository
+from app.repositories.news_repo import NewsRepository
+from app.repositories.social_repo import SocialRepository
+from app.schemas.common import Sentiment
+from app.schemas.company import Company
+from app.schemas.intelligence import CreateArticleRequest
+from app.services.llm_gateway import LLMGateway
+from app.services.sentiment_cache import SentimentCache
+from app.services.sentiment_worker import REPO_FACTORIES
+from app.services.story_index import StoryIndex
+from app.utils.hashing import article_key, dart_rcept_no, filing_key
+
+# Memory mode never touches the session
+NO_SESSION = cast(AsyncSession, None)
+SAMSUNG = Company(id="005930", name="삼성전자")
+
+
+@pytest.fixture(autouse=True)
+def memory_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+
+
+class FakeNewsRepo:
+    """Keeps inserted rows in memory keyed like ``NewsRepository``."""
+
+    natural_key = ("dedupe_hash",)
+
+    def __init__(self, stored: dict[tuple[Any, ...], str] | None = None) -> None:
+        self.stored = dict(stored or {})
+        self.inserts: list[list[dict[str, Any]]] = []
+
+    async def find_existing(
+        self, company_id: str, keys: list[tuple[Any, ...]]
+    ) -> dict[tuple[Any, ...], str]:
+        return {key: self.stored[key] for key in keys if key in self.stored}
+
+    async def insert_many(self, rows: list[dict[str, Any]]) -> list[str | None]:
+        self.inserts.append(rows)
+        ids: list[str | None] = [f"article_{len(self.stored) + i}" for i in range(len(rows))]
+        for row, row_id in zip(rows, ids, strict=True):
+            self.stored[tuple(row[name] for name in self.natural_key)] = row_id
+        return ids
+
+
+async def _batch_reply(**kwargs: Any) -> MagicMock:
+    items = json.loads(kwargs["messages"][1]["content"])
+    completion = MagicMock()
+    completion.choices = [MagicMock()]
+    completion.choices[0].message.content = json.dumps({"results": [
+        {
+            "index": it["index"], "label": "positive", "score": 0.4,
+            "confidence": 0.8, "rationale": "",
+        }
+        for it in items
+    ]})
+    return completion
+
+
+def _article(title: str, company_id: str = "005930") -> CreateArticleRequest:
+    return CreateArticleRequest(
+        title=title, source="한국경제", published_at="2025-11-01T09:00:00Z", company_id=company_id
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_dedupes_scores_once_and_reports_per_item(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test in-batch and stored duplicates skip scoring and new rows go in one insert."""
+    stored = _article("기존 기사")
+    stored_key = article_key(None, stored.source, stored.title, stored.published_at)
+    repo = FakeNewsRepo({(stored_key,): "article_old"})
+    monkeypatch.setitem(REPO_FACTORIES, "news", AsyncMock(return_value=repo))
+    client = AsyncMock()
+    client.chat.completions.create.side_effect = _batch_reply
+    monkeypatch.setattr(llm_gateway, "_gateway", LLMGateway(client))
+    monkeypatch.setattr("app.services.sentiment_cache._cache", SentimentCache(maxsize=100))
+
+    requests = [
+        _article("벌크 신규 0"),
+        _article("벌크 신규 1"),
+        _article("벌크 신규 0"),
+        _article("기존 기사"),
+        _article("다른 회사", company_id="000660"),
+    ]
+    response = await ingestion.ingest_bulk(NO_SESSION, "news", SAMSUNG, requests)
+
+    assert [(r.status, r.id) for r in response.results] == [
+        ("created", "article_1"),
+        ("created", "article_2"),
+        ("duplicate", "article_1"),
+        ("duplicate", "article_old"),
+        ("error", None),
+    ]
+    assert (response.created, response.duplicates, response.failed) == (2, 2, 1)
+    assert client.chat.completions.create.await_count == 1
+    assert len(repo.inserts) == 1
+    assert [r["title"] for r in repo.inserts[0]] == ["벌크 신규 0", "벌크 신규 1"]
+    assert all(r["sentiment"].label == "positive" for r in repo.inserts[0])
+
+
+@pytest.mark.asyncio
+async def test_bulk_scores_one_article_per_story(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that near-duplicate articles share a story and one scored sentiment."""
+    repo = FakeNewsRepo()
+    monkeypatch.setitem(REPO_FACTORIES, "news", AsyncMock(return_value=repo))
+    client = AsyncMock()
+    client.chat.completions.create.side_effect = _batch_reply
+    monkeypatch.setattr(llm_gateway, "_gateway", LLMGateway(client))
+    monkeypatch.setattr("app.services.sentiment_cache._cache", SentimentCache(maxsize=100))
+    monkeypatch.setattr("app.services.story_index._index", StoryIndex())
+
+    requests = [
+        _article("[속보] 삼성전자, 평택 반도체 신규 라인 착공…20조 투자"),
+        _article("삼성전자 평택 반도체 신규 라인 착공 20조 투자 - 뉴스1"),
+        _article("SK하이닉스 HBM4 양산 돌입"),
+    ]
+    response = await ingestion.ingest_bulk(NO_SESSION, "news", SAMSUNG, requests)
+
+    assert response.created == 3
+    items = json.loads(client.chat.completions.create.await_args.kwargs["messages"][1]["content"])
+    assert len(items) == 2
+    rows = repo.inserts[0]
+    assert rows[0]["story_id"] == rows[1]["story_id"] != rows[2]["story_id"]
+    assert rows[0]["sentiment"] == rows[1]["sentiment"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_reports_invalid_and_unscored_items_per_item(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that an invalid item and a failed scoring call only reject their own items."""
+    repo = FakeNewsRepo()
+    monkeypatch.setitem(REPO_FACTORIES, "news", AsyncMock(return_value=repo))
+    monkeypatch.setattr("app.services.story_index._index", StoryIndex())
+
+    async def score(session: Any, items: list[Any], return_exceptions: bool = False) -> list[Any]:
+        assert return_exceptions
+        return [
+            AIProviderError("LLM unavailable") if "실패" in item.text
+            else Sentiment(label="neutral", score=0.0, confidence=0.5)
+            for item in items
+        ]
+
+    monkeypatch.setattr(ingestion, "analyze_sentiments_cached", score)
+
+    requests: list[CreateArticleRequest | dict[str, Any]] = [
+        _article("삼성전자 파운드리 수주 확대").model_dump(mode="json"),
+        {"title": "제목만 있는 기사", "company_id": "005930"},
+        _article("채점 실패 기사"),
+    ]
+    response = await ingestion.ingest_bulk(NO_SESSION, "news", SAMSUNG, requests)
+
+    assert [r.status for r in response.results] == ["created", "error", "error"]
+    assert "source" in (response.results[1].error or "")
+    assert "LLM unavailable" in (response.results[2].error or "")
+    assert (response.created, response.failed) == (1, 2)
+    assert [r["title"] for r in repo.inserts[0]] == ["삼성전자 파운드리 수주 확대"]
+
+
+@pytest.mark.asyncio
+async def test_create_returns_the_inserted_row_in_memory_mode() -> None:
+    """Test that single-row creates return the new row even where it cannot be read back."""
+    published = datetime(2025, 11, 1, 9, tzinfo=UTC)
+
+    news, social, dart = (
+        NewsRepository(NO_SESSION), SocialRepository(NO_SESSION), DartRepository(NO_SESSION)
+    )
+
+    article = await news.create_article("신규 기사", "한경", "005930", published)
+    post = await social.create_social_post("blind", "신규 글", "005930", published, dept="DS")
+    filing = await dart.create_filing("분기보고서", "A001", "005930", published)
+
+    assert article.id.startswith("article_") and article.title == "신규 기사"
+    assert post.id.startswith("post_") and post.dept == "DS"
+    assert filing.id.startswith("filing_") and filing.filed_at == published
+
+
+def test_dedupe_keys_ignore_crawler_noise() -> None:
+    """Test that URL tracking params and renamed filings map to the same key."""
+    published = datetime(2025, 11, 1, 9, tzinfo=UTC)
+    tracked = "https://News.example.com/a/1/?utm_source=naver#top"
+    assert article_key(tracked, "한경", "제목", published) == (
+        article_key("https://news.example.com/a/1", "매경", "다른 제목", published)
+    )
+    kst = published.astimezone(timezone(timedelta(hours=9)))
+    assert article_key(None, "한경", "삼성전자, 실적 발표!", published) == (
+        article_key(None, "한경", "삼성전자 실적 발표", kst)
+    )
+
+    url = "https://dart.fss.or.kr/dsaf001/main.do?rcpNo=20251101000123"
+    assert dart_rcept_no(url) == "20251101000123"
+    assert filing_key(dart_rcept_no(url), "분기보고서", "분기보고서", published) == (
+        filing_key("20251101000123", "분기보고서 (정정)", "공시정정", published)
+    )
@@ -0,0 +1,109 @@
+"""Test the shared LLM gateway (retries, deadlines, concurrency, metrics)."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from openai import APIConnectionError
+
+from app.errors import AIProviderError
+from app.services.llm_gateway import LLMGateway, TokenBucket
+
+MESSAGES = [{"role": "user", "content": "삼성전자 실적 발표"}]
+
+
+def _completion(content: str, prompt_tokens: int = 10, completion_tokens: int = 5) -> MagicMock:
+    completion = MagicMock()
+    completion.choices = [MagicMock()]
+    completion.choices[0].message.content = content
+    completion.usage.prompt_tokens = prompt_tokens
+    completion.usage.completion_tokens = completion_tokens
+    return completion
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors_then_succeeds() -> None:
+    """Test that connection errors are retried and usage is recorded."""
+    client = AsyncMock()
+    client.chat.completions.create.side_effect = [
+        APIConnectionError(request=None),  # type: ignore[arg-type]
+        APIConnectionError(request=None),  # type: ignore[arg-type]
+        _completion('{"ok": true}'),
+    ]
+    gateway = LLMGateway(client, backoff_base_seconds=0.001)
+
+    content = await gateway.complete("sentiment", MESSAGES)
+
+    assert content == '{"ok": true}'
+    metrics = gateway.metrics()["sentiment"]
+    assert metrics["calls"] == 1
+    assert metrics["retries"] == 2
+    assert metrics["errors"] == 0
+    assert (metrics["prompt_tokens"], metrics["completion_tokens"]) == (10, 5)
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries() -> None:
+    """Test that exhausted retries surface as AIProviderError."""
+    client = AsyncMock()
+    client.chat.completions.create.side_effect = APIConnectionError(request=None)  # type: ignore[arg-type]
+    gateway = LLMGateway(client, max_retries=2, backoff_base_seconds=0.001)
+
+    with pytest.raises(AIProviderError, match="failed after retries"):
+        await gateway.complete("prediction", MESSAGES)
+
+    assert client.chat.completions.create.await_count == 3
+    assert gateway.metrics()["prediction"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_slow_call() -> None:
+    """Test that a call running past the deadline is abandoned."""
+    async def slow(**kwargs: Any) -> MagicMock:
+        await asyncio.sleep(1)
+        return _completion("late")
+
+    client = AsyncMock()
+    client.chat.completions.create.side_effect = slow
+    gateway = LLMGateway(client, deadline_seconds=0.05)
+
+    with pytest.raises(AIProviderError, match="deadline"):
+        await gateway.complete("sentiment", MESSAGES)
+
+
+@pytest.mark.asyncio
+async def test_per_endpoint_concurrency_limit() -> None:
+    """Test that an endpoint never exceeds its semaphore."""
+    in_flight = peak = 0
+
+    async def tracked(**kwargs: Any) -> MagicMock:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _completion("{}")
+
+    client = AsyncMock()
+    client.chat.completions.create.side_effect = tracked
+    gateway = LLMGateway(client, max_concurrency=8, endpoint_concurrency={"prediction": 2})
+
+    await asyncio.gather(*(gateway.complete("prediction", MESSAGES) for _ in range(10)))
+
+    assert peak == 2
+    assert gateway.metrics()["prediction"]["calls"] == 10
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_outside_the_lock() -> None:
+    """Test that a caller waiting for tokens does not hold the bucket's lock."""
+    bucket = TokenBucket(tokens_per_minute=6000)
+    await bucket.acquire(6000)
+
+    waiter = asyncio.create_task(bucket.acquire(5))
+    await asyncio.sleep(0)
+
+    assert not waiter.done()
+    assert not bucket._lock.locked()
+    await asyncio.wait_for(waiter, timeout=1.0)
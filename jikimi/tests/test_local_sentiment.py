@@ -0,0 +1,76 @@
+"""Test the local lexicon sentiment fast path."""
+
+import json
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.llm_gateway import LLMGateway
+from app.services.local_sentiment import MARKER_CONFIDENCE, analyze_sentiment_local
+from app.services.sentiment import SentimentItem
+from app.services.sentiment_cache import SentimentCache, analyze_sentiments_cached
+
+# Memory mode never touches the session
+NO_SESSION = cast(AsyncSession, None)
+
+
+@pytest.fixture(autouse=True)
+def memory_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+
+
+@pytest.mark.parametrize(
+    ("text", "label"),
+    [
+        ("[Blind] 실적 무난, 배당 기대 ↑ (긍정)", "positive"),
+        ("[종토방] 단기 반등 이후 숨고르기 (중립)", "neutral"),
+        ("[DC] 성과급 축소 소식에 분위기 안좋음 [부정]", "negative"),
+    ],
+)
+def test_explicit_markers_are_trusted(text: str, label: str) -> None:
+    """Test that crawler-written labels are returned with high confidence."""
+    sentiment = analyze_sentiment_local(text)
+
+    assert sentiment.label == label
+    assert sentiment.confidence == MARKER_CONFIDENCE
+
+
+def test_lexicon_confidence_tracks_evidence_and_agreement() -> None:
+    """Test that consistent finance terms are confident and mixed or empty texts are not."""
+    strong = analyze_sentiment_local("3분기 어닝서프라이즈, 흑자전환에 자사주 소각까지 발표")
+    negated = analyze_sentiment_local("상장폐지 우려 없다는 회사 측 해명")
+    mixed = analyze_sentiment_local("매출 증가했지만 영업이익은 감소")
+    empty = analyze_sentiment_local("최대주주 변동 없음 공시")
+
+    assert strong.label == "positive" and strong.confidence >= 0.75
+    assert negated.score > -0.5
+    assert mixed.confidence < 0.3
+    assert empty.label == "neutral" and empty.confidence < 0.3
+
+
+@pytest.mark.asyncio
+async def test_only_low_confidence_items_escalate_to_llm() -> None:
+    """Test that confident local results skip the LLM batch entirely."""
+    completion = MagicMock()
+    completion.choices = [MagicMock()]
+    client = AsyncMock()
+    client.chat.completions.create.return_value = completion
+    completion.choices[0].message.content = json.dumps(
+        {"label": "neutral", "score": 0.0, "confidence": 0.6, "rationale": ""}
+    )
+    cache = SentimentCache(maxsize=100)
+    items = [
+        SentimentItem("[Blind] 경쟁사 대비 밸류에이션 매력적 (긍정)", "social"),
+        SentimentItem("[Reddit] Korea telcos undervalued thesis (긍정)", "social"),
+        SentimentItem("로컬 경로 회의록 공개", "news"),
+    ]
+
+    results = await analyze_sentiments_cached(
+        NO_SESSION, items, gateway=LLMGateway(client), cache=cache
+    )
+
+    assert [r.label for r in results] == ["positive", "positive", "neutral"]
+    assert client.chat.completions.create.await_count == 1
+    assert (cache.stats()["local_hits"], cache.stats()["misses"]) == (2, 1)
@@ -0,0 +1,143 @@
+"""Test vectorized prediction features against the original per-feature implementation."""
+
+import random
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from app.schemas.common import Sentiment
+from app.schemas.intelligence import Article, Filing, SocialPost
+from app.schemas.market import CompanyRef, PriceCandle, PriceSeries
+from app.services.prediction import _assemble_features
+
+NOW = datetime(2025, 11, 3, 9, 0, tzinfo=UTC)
+ALL = {"prices": True, "news": True, "blind": True, "naver_forum": True, "filings": True}
+
+
+def _reference_features(
+    prices: PriceSeries,
+    news: list[Article],
+    blind: list[SocialPost],
+    naver_forum: list[SocialPost],
+    filings: list[Filing],
+    now: datetime,
+) -> dict[str, Any]:
+    """Original one-generator-per-feature implementation, kept as the oracle."""
+    features: dict[str, Any] = {}
+    candles = prices.candles[-30:]
+    if candles:
+        if len(candles) >= 2:
+            returns = [
+                (candles[i].c - candles[i - 1].c) / candles[i - 1].c for i in range(1, len(candles))
+            ]
+            features["returns_mean"] = sum(returns) / len(returns)
+            features["returns_volatility"] = (
+                sum((r - features["returns_mean"]) ** 2 for r in returns) / len(returns)
+            ) ** 0.5
+            if len(candles) >= 10:
+                features["momentum_10d"] = (candles[-1].c - candles[-10].c) / candles[-10].c
+        recent_volume = sum(c.v for c in candles[-5:]) / 5 if len(candles) >= 5 else 0
+        older_volume = (
+            sum(c.v for c in candles[-10:-5]) / 5 if len(candles) >= 10 else recent_volume
+        )
+        features["volume_trend"] = (
+            (recent_volume - older_volume) / older_volume if older_volume > 0 else 0.0
+        )
+
+    labels = [a.sentiment.label for a in news if a.sentiment]
+    features["news_positive_count"] = labels.count("positive")
+    features["news_negative_count"] = labels.count("negative")
+    features["news_neutral_count"] = labels.count("neutral")
+    features["news_total_count"] = len(news)
+    weighted, total = 0.0, 0.0
+    for article in news:
+        if article.sentiment:
+            hours_old = (now - article.published_at).total_seconds() / 3600
+            weight = max(0.1, 1.0 - hours_old / (24 * 30))
+            weighted += article.sentiment.score * weight
+            total += weight
+    features["news_weighted_sentiment"] = weighted / total if total > 0 else 0.0
+
+    features["blind_post_count"] = len(blind)
+    features["blind_engagement"] = sum(p.reply_count + p.like_count for p in blind)
+    positive_blind = sum(1 for p in blind if p.sentiment and p.sentiment.label == "positive")
+    features["blind_positive_ratio"] = positive_blind / len(blind) if blind else 0.0
+
+    features["naver_forum_post_count"] = len(naver_forum)
+    features["naver_forum_engagement"] = sum(p.reply_count + p.like_count for p in naver_forum)
+
+    features["filings_count"] = len(filings)
+    if filings:
+        features["days_since_last_filing"] = (now - max(f.filed_at for f in filings)).days
+    return features
+
+
+def _random_inputs(
+    rng: random.Random, n_candles: int, n_items: int
+) -> tuple[PriceSeries, list[Article], list[SocialPost], list[SocialPost], list[Filing]]:
+    def sentiment() -> Sentiment | None:
+        if rng.random() < 0.15:
+            return None
+        label = rng.choice(["positive", "neutral", "negative"])
+        return Sentiment(label=label, score=rng.uniform(-1, 1), confidence=rng.random())
+
+    def ts() -> datetime:
+        return NOW - timedelta(seconds=rng.randint(0, 40 * 86400))
+
+    candles = [
+        PriceCandle(
+            t=NOW - timedelta(days=n_candles - i),
+            o=1.0, h=1.0, l=1.0,
+            c=rng.uniform(50_000, 90_000),
+            v=rng.randint(0, 20_000_000),
+        )
+        for i in range(n_candles)
+    ]
+    news = [
+        Article(
+            id=f"a{i}",
+            title="t",
+            source="s",
+            published_at=ts(),
+            sentiment=sentiment(),
+            company_id="x",
+        )
+        for i in range(n_items)
+    ]
+
+    def posts(platform: str) -> list[SocialPost]:
+        return [
+            SocialPost(
+                id=f"{platform}{i}", platform=platform, content="c", posted_at=ts(),
+                sentiment=sentiment(), company_id="x",
+                reply_count=rng.randint(0, 50), like_count=rng.randint(0, 500),
+            )
+            for i in range(n_items)
+        ]
+
+    filings = [
+        Filing(id=f"f{i}", title="t", filing_type="분기보고서", filed_at=ts(), company_id="x")
+        for i in range(n_items // 10)
+    ]
+    return (
+        PriceSeries(company=CompanyRef(id="x"), candles=candles),
+        news, posts("blind"), posts("naver_forum"), filings,
+    )
+
+
+@pytest.mark.parametrize(
+    ("n_candles", "n_items"), [(0, 0), (1, 1), (4, 3), (9, 20), (60, 100), (30, 1000)]
+)
+def test_vectorized_features_match_reference(n_candles: int, n_items: int) -> None:
+    """Test that the NumPy kernel reproduces the original feature values."""
+    rng = random.Random(n_candles * 1000 + n_items)
+    prices, news, blind, forum, filings = _random_inputs(rng, n_candles, n_items)
+
+    expected = _reference_features(prices, news, blind, forum, filings, NOW)
+    actual = _assemble_features(prices, news, blind, forum, filings, ALL, as_of=NOW)
+
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        assert actual[key] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+        assert type(actual[key]) is type(value) or isinstance(value, float), key
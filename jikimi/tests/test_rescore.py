@@ -0,0 +1,110 @@
+"""Test resumable sentiment re-scoring."""
+
+import json
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import app.services.llm_gateway as llm_gateway
+import app.services.rescore as rescore
+from app.errors import AIProviderError
+from app.schemas.common import Sentiment
+from app.services.llm_gateway import LLMGateway
+from app.services.rescore import Checkpoint, RescoreProgress, rescore_table
+from app.services.sentiment import SentimentItem
+
+
+@pytest.fixture(autouse=True)
+def memory_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+
+
+ROW_IDS = [f"news_{i:03d}" for i in range(10)]
+
+
+class FakeRepo:
+    """Records bulk sentiment updates; can fail on a given row."""
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.fail_on = fail_on
+        self.updated: dict[str, Sentiment] = {}
+
+    async def update_sentiments(self, sentiments: dict[str, Sentiment]) -> int:
+        if self.fail_on in sentiments:
+            raise AIProviderError("LLM call for sentiment failed")
+        self.updated.update(sentiments)
+        return len(sentiments)
+
+
+async def _fake_pages(
+    session: Any, table: str, after_id: str | None, page_size: int, only_missing: bool
+) -> Any:
+    remaining = [row_id for row_id in ROW_IDS if after_id is None or row_id > after_id]
+    for start in range(0, len(remaining), page_size):
+        page = remaining[start:start + page_size]
+        yield [(row_id, SentimentItem(f"재평가 대상 {row_id}", "news")) for row_id in page]
+
+
+@asynccontextmanager
+async def _no_session() -> Any:
+    yield None
+
+
+async def _batch_reply(**kwargs: Any) -> MagicMock:
+    items = json.loads(kwargs["messages"][1]["content"])
+    completion = MagicMock()
+    completion.choices = [MagicMock()]
+    completion.choices[0].message.content = json.dumps({"results": [
+        {"index": it["index"], "label": "neutral", "score": 0.0, "confidence": 0.6, "rationale": ""}
+        for it in items
+    ]})
+    return completion
+
+
+def _use_repo(monkeypatch: pytest.MonkeyPatch, repo: FakeRepo) -> None:
+    source = rescore.SOURCES["news"]
+    factory = AsyncMock(return_value=repo)
+    monkeypatch.setitem(
+        rescore.SOURCES,
+        "news",
+        rescore.RescoreSource(source.model, source.title, source.body, factory),
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_run_resumes_from_contiguous_checkpoint(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that a crash keeps finished pages and the next run re-scores only the rest."""
+    monkeypatch.setattr(rescore, "stream_pages", _fake_pages)
+    client = AsyncMock()
+    client.chat.completions.create.side_effect = _batch_reply
+    monkeypatch.setattr(llm_gateway, "_gateway", LLMGateway(client))
+    path = tmp_path / "checkpoint.json"
+
+    failing = FakeRepo(fail_on="news_006")
+    _use_repo(monkeypatch, failing)
+    with pytest.raises(AIProviderError):
+        await rescore_table(
+            _no_session, "news", Checkpoint(path), RescoreProgress(), page_size=2, concurrency=1
+        )
+
+    checkpoint = Checkpoint(path)
+    assert checkpoint.after_id("news") == "news_005"
+    assert not checkpoint.is_complete("news")
+    assert sorted(failing.updated) == ROW_IDS[:6]
+
+    resumed = FakeRepo()
+    _use_repo(monkeypatch, resumed)
+    progress = RescoreProgress(total=4)
+    written = await rescore_table(
+        _no_session, "news", checkpoint, progress, page_size=2, concurrency=3
+    )
+
+    assert written == 4
+    assert sorted(resumed.updated) == ROW_IDS[6:]
+    assert Checkpoint(path).is_complete("news")
+    assert progress.snapshot()["done"] == 4
@@ -0,0 +1,51 @@
+"""Test bigram full-text search."""
+
+import pytest
+
+from app.repositories.search_repo import SearchRepository
+from app.utils.text_search import bigram_tsquery, matches
+
+
+def test_bigram_tsquery_matches_inside_korean_words() -> None:
+    """Test query building and the in-memory matcher it mirrors."""
+    assert bigram_tsquery("삼성전자, 반도체!") == (
+        "('삼성' <-> '성전' <-> '전자') & ('반도' <-> '도체')"
+    )
+    assert bigram_tsquery("AI 주") == "'ai' & '주':*"
+    assert bigram_tsquery("…!?") is None
+
+    assert matches("반도체 실적", "삼성반도체, 3분기 실적이 개선")
+    assert not matches("반도체 적자", "삼성반도체, 3분기 실적이 개선")
+
+
+@pytest.mark.asyncio
+async def test_memory_search_pages_by_keyset(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that pages follow the cursor without repeats in memory mode."""
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+    repo = SearchRepository(None)  # type: ignore[arg-type]
+
+    seen: list[str] = []
+    hits, cursor = await repo.search("관련 뉴스", ["news", "filing"], company_id="005930", limit=2)
+    seen.extend(h.id for h in hits)
+    while cursor:
+        hits, cursor = await repo.search(
+            "관련 뉴스", ["news", "filing"], company_id="005930", limit=2, cursor=cursor
+        )
+        seen.extend(h.id for h in hits)
+
+    assert len(seen) == len(set(seen)) == 5
+    assert all(seen_id.startswith("article_") for seen_id in seen)
+
+
+@pytest.mark.asyncio
+async def test_memory_search_includes_social_platforms(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the default types search posts of both platforms in memory mode."""
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+    repo = SearchRepository(None)  # type: ignore[arg-type]
+
+    hits, _ = await repo.search(
+        "게시글 내용", ["news", "social", "filing"], company_id="005930", limit=50
+    )
+
+    assert {h.source for h in hits} == {"blind", "naver_forum"}
+    assert all(h.type == "social" for h in hits)
@@ -0,0 +1,147 @@
+"""Test batched multi-item sentiment scoring."""
+
+import json
+from typing import Any, cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.errors import AIProviderError
+from app.services.llm_gateway import LLMGateway
+from app.services.sentiment import SentimentItem, analyze_sentiment_batch, pack_batches
+from app.services.sentiment_cache import SentimentCache, analyze_sentiments_cached
+
+# Memory mode never touches the session
+NO_SESSION = cast(AsyncSession, None)
+
+
+@pytest.fixture(autouse=True)
+def memory_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+
+
+def _completion(payload: dict[str, Any]) -> MagicMock:
+    completion = MagicMock()
+    completion.choices = [MagicMock()]
+    completion.choices[0].message.content = json.dumps(payload)
+    return completion
+
+
+class FakeModel:
+    """Scores each item by the number in its text; can drop results to simulate bad output.
+
+    A ``poison`` text makes every batch holding it malformed and its single-item call fail.
+    """
+
+    def __init__(self, drop_when_larger_than: int | None = None, poison: str | None = None) -> None:
+        self.drop_when_larger_than = drop_when_larger_than
+        self.poison = poison
+        self.batch_sizes: list[int] = []
+
+    def score(self, text: str) -> float:
+        return int(text.split()[-1]) / 100
+
+    async def __call__(self, **kwargs: Any) -> MagicMock:
+        user = kwargs["messages"][1]["content"]
+        if kwargs["response_format"]["json_schema"]["name"] == "sentiment_analysis":
+            self.batch_sizes.append(1)
+            if self.poison is not None and self.poison in user:
+                raise RuntimeError("upstream rejected the text")
+            return _completion(
+                {"label": "neutral", "score": self.score(user), "confidence": 0.5, "rationale": ""}
+            )
+
+        items = json.loads(user)
+        self.batch_sizes.append(len(items))
+        results = [
+            {
+                "index": it["index"], "label": "neutral", "score": self.score(it["text"]),
+                "confidence": 0.5, "rationale": "",
+            }
+            for it in reversed(items)
+        ]
+        if self.drop_when_larger_than is not None and len(items) > self.drop_when_larger_than:
+            results = results[1:]
+        if any(it["text"] == self.poison for it in items):
+            results = [r for r in results if items[r["index"]]["text"] != self.poison]
+        return _completion({"results": results})
+
+
+def _gateway(model: FakeModel) -> LLMGateway:
+    client = AsyncMock()
+    client.chat.completions.create.side_effect = model.__call__
+    return LLMGateway(client)
+
+
+def _items(n: int, prefix: str = "공시") -> list[SentimentItem]:
+    return [SentimentItem(text=f"{prefix} {i}", content_type="news") for i in range(n)]
+
+
+def test_pack_batches_respects_item_and_token_limits() -> None:
+    """Test greedy packing by item count and estimated tokens."""
+    items = _items(7) + [SentimentItem(text="가" * 10_000, content_type="filing")] + _items(2)
+
+    batches = pack_batches(items, max_tokens=1_000, max_items=3)
+
+    assert batches == [[0, 1, 2], [3, 4, 5], [6], [7], [8, 9]]
+
+
+@pytest.mark.asyncio
+async def test_batch_results_mapped_back_by_index() -> None:
+    """Test that out-of-order results land on the right items with one call per batch."""
+    model = FakeModel()
+
+    results = await analyze_sentiment_batch(_items(25), gateway=_gateway(model), max_items=10)
+
+    assert [r.score for r in results] == [i / 100 for i in range(25)]
+    assert model.batch_sizes == [10, 10, 5]
+
+
+@pytest.mark.asyncio
+async def test_malformed_batch_is_split_and_retried() -> None:
+    """Test that a batch missing results is bisected until outputs are complete."""
+    model = FakeModel(drop_when_larger_than=4)
+
+    results = await analyze_sentiment_batch(_items(8), gateway=_gateway(model), max_items=8)
+
+    assert [r.score for r in results] == [i / 100 for i in range(8)]
+    assert sorted(model.batch_sizes) == [4, 4, 8]
+
+
+@pytest.mark.asyncio
+async def test_cached_batch_scores_only_distinct_misses() -> None:
+    """Test that duplicates and cached texts are excluded from the LLM batch."""
+    model = FakeModel()
+    gateway = _gateway(model)
+    cache = SentimentCache(maxsize=100)
+    await analyze_sentiments_cached(NO_SESSION, _items(2, "배치캐시"), gateway=gateway, cache=cache)
+    model.batch_sizes.clear()
+
+    items = _items(5, "배치캐시") + _items(5, "배치캐시")
+    results = await analyze_sentiments_cached(NO_SESSION, items, gateway=gateway, cache=cache)
+
+    assert [r.score for r in results] == [i / 100 for i in range(5)] * 2
+    assert model.batch_sizes == [3]
+    stats = cache.stats()
+    assert stats["memory_hits"] == 4
+    assert stats["misses"] == 2 + 3
+
+
+@pytest.mark.asyncio
+async def test_failed_item_does_not_fail_its_batch() -> None:
+    """Test that an item whose call fails is reported alone and is not cached."""
+    model = FakeModel(poison="실패 2")
+    cache = SentimentCache(maxsize=100)
+    items = _items(4, "실패")
+
+    results = await analyze_sentiments_cached(
+        NO_SESSION, items, gateway=_gateway(model), cache=cache, return_exceptions=True
+    )
+
+    scores = [r.score if not isinstance(r, Exception) else None for r in results]
+    assert scores == [0.0, 0.01, None, 0.03]
+    assert isinstance(results[2], AIProviderError)
+    assert cache.stats()["size"] == 3
+    with pytest.raises(AIProviderError):
+        await analyze_sentiment_batch(items, gateway=_gateway(FakeModel(poison="실패 2")))
@@ -0,0 +1,95 @@
+"""Test the content-addressed sentiment cache."""
+
+import asyncio
+import json
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.llm_gateway import LLMGateway
+from app.services.sentiment_cache import SentimentCache, analyze_sentiment_cached
+from app.utils.hashing import content_hash
+
+# Memory mode never touches the session
+NO_SESSION = cast(AsyncSession, None)
+
+
+@pytest.fixture(autouse=True)
+def memory_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+
+
+def _gateway() -> tuple[LLMGateway, AsyncMock]:
+    completion = MagicMock()
+    completion.choices = [MagicMock()]
+    completion.choices[0].message.content = json.dumps(
+        {"label": "positive", "score": 0.4, "confidence": 0.9, "rationale": "실적 개선"}
+    )
+    client = AsyncMock()
+    client.chat.completions.create.return_value = completion
+    return LLMGateway(client), client
+
+
+def test_content_hash_ignores_formatting() -> None:
+    """Test that whitespace, punctuation, URLs and full-width forms don't change the key."""
+    a = content_hash("[속보] 삼성전자, 3분기 영업익 10조 돌파!", "news")
+    b = content_hash("속보  삼성전자 3분기 영업익 10조 돌파 https://n.news.naver.com/x", "news")
+    c = content_hash("［속보］ 삼성전자，３분기 영업익 １０조 돌파", "news")
+
+    assert a == b == c
+    assert a != content_hash("[속보] 삼성전자, 3분기 영업익 10조 돌파!", "social")
+    assert a != content_hash("[속보] SK하이닉스, 3분기 영업익 10조 돌파!", "news")
+
+
+@pytest.mark.asyncio
+async def test_reposts_cost_one_llm_call() -> None:
+    """Test that near-identical texts are scored once and then served from cache."""
+    gateway, client = _gateway()
+    cache = SentimentCache(maxsize=100)
+    texts = [
+        "LG엔솔 북미 공장 증설 발표 (단독)",
+        "LG엔솔, 북미 공장 증설 발표 [단독]",
+        "lg엔솔 북미 공장 증설 발표 단독",
+    ]
+
+    results = [
+        await analyze_sentiment_cached(NO_SESSION, t, "social", gateway=gateway, cache=cache)
+        for t in texts
+    ]
+
+    assert client.chat.completions.create.await_count == 1
+    assert all(r == results[0] for r in results)
+    stats = cache.stats()
+    assert (stats["misses"], stats["memory_hits"]) == (1, 2)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_are_coalesced() -> None:
+    """Test that simultaneous requests for one key share a single LLM call."""
+    gateway, client = _gateway()
+    cache = SentimentCache(maxsize=100)
+
+    text = "카카오 신사업 철수 결정"
+    await asyncio.gather(*(
+        analyze_sentiment_cached(NO_SESSION, text, "news", gateway=gateway, cache=cache)
+        for _ in range(5)
+    ))
+
+    assert client.chat.completions.create.await_count == 1
+    assert cache.stats()["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_evicted_entries_fall_back_to_table_tier() -> None:
+    """Test that LRU evictions are served from the table tier, not the LLM."""
+    gateway, client = _gateway()
+    cache = SentimentCache(maxsize=1)
+
+    for text in ["현대차 리콜 발표", "기아 신차 출시", "현대차 리콜 발표"]:
+        await analyze_sentiment_cached(NO_SESSION, text, "filing", gateway=gateway, cache=cache)
+
+    assert client.chat.completions.create.await_count == 2
+    assert cache.stats()["db_hits"] == 1
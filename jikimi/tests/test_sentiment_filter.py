@@ -0,0 +1,44 @@
+"""Test sentiment filters on the list endpoints' repositories."""
+
+from typing import cast
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.dart_repo import DartRepository
+from app.repositories.news_repo import NewsRepository
+from app.repositories.social_repo import SocialRepository
+from app.schemas.common import Sentiment, SentimentFilter
+
+
+def test_filter_matches_every_condition() -> None:
+    """Test each condition is required and unscored items only pass an empty filter."""
+    sentiment = Sentiment(label="positive", score=0.4, confidence=0.8)
+
+    assert SentimentFilter().matches(None)
+    assert SentimentFilter(label="positive", min_score=0.4, min_confidence=0.8).matches(sentiment)
+    assert not SentimentFilter(label="negative").matches(sentiment)
+    assert not SentimentFilter(min_score=0.5).matches(sentiment)
+    assert not SentimentFilter(min_confidence=0.9).matches(sentiment)
+    assert not SentimentFilter(min_score=-1.0).matches(None)
+
+
+@pytest.mark.asyncio
+async def test_memory_repositories_apply_filter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test news, posts and filings are filtered by label, score and confidence."""
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+    session = cast(AsyncSession, None)
+
+    articles, _ = await NewsRepository(session).fetch_news(
+        "005930", sentiment_filter=SentimentFilter(label="positive")
+    )
+    posts, _ = await SocialRepository(session).fetch_social(
+        "005930", "blind", sentiment_filter=SentimentFilter(min_score=0.3, min_confidence=0.7)
+    )
+    filings, _ = await DartRepository(session).fetch_filings(
+        "005930", sentiment_filter=SentimentFilter(min_score=0.1)
+    )
+
+    assert articles and all(a.sentiment and a.sentiment.label == "positive" for a in articles)
+    assert len(posts) == 5
+    assert filings == []
@@ -0,0 +1,77 @@
+"""Test sentiment rollups and the decayed sentiment series."""
+
+import math
+from datetime import UTC, datetime, timedelta
+from typing import cast
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.sentiment_rollups_repo import SentimentRollupsRepository, aggregate_rollups
+from app.schemas.common import Sentiment
+from app.schemas.sentiment_series import SentimentSource
+from app.services.sentiment_series import build_series
+
+
+def _sentiment(score: float) -> Sentiment:
+    label = "positive" if score > 0 else "negative" if score < 0 else "neutral"
+    return Sentiment(label=label, score=score, confidence=0.9)
+
+
+def test_decayed_score_matches_item_level_decay() -> None:
+    """Test the rollup moments reproduce the per-item exponential decay."""
+    base = datetime(2025, 11, 1, tzinfo=UTC)
+    items: list[tuple[SentimentSource, datetime, Sentiment | None]] = [
+        ("news", base + timedelta(hours=h), _sentiment(s))
+        for h, s in [(1, 0.8), (5, -0.4), (20, 0.2), (30, 0.6), (47, -0.9), (50, 0.1)]
+    ]
+    items.append(("blind", base + timedelta(hours=10), None))
+    half_life = 72.0
+
+    rows = aggregate_rollups(items, "1d")
+    points = build_series(rows, "1d", base, base + timedelta(days=4), half_life)
+
+    assert [p.count for p in points] == [4, 2, 1, 0]
+    assert points[0].scored == 3 and points[0].positive == 2 and points[0].negative == 1
+    assert points[3].mean_score is None
+    for day, point in enumerate(points):
+        at = base + timedelta(days=day + 1)
+        weights = [
+            (s.score, 2 ** (-(at - ts).total_seconds() / 3600 / half_life))
+            for _, ts, s in items if s is not None and ts < at
+        ]
+        expected = sum(s * w for s, w in weights) / sum(w for _, w in weights)
+        assert point.decayed_score is not None
+        assert math.isclose(point.decayed_score, expected, abs_tol=2e-3)
+
+
+def test_series_warms_up_from_earlier_rows() -> None:
+    """Test rows before the start feed the decay but are not returned."""
+    base = datetime(2025, 11, 1, tzinfo=UTC)
+    rows = aggregate_rollups([("news", base - timedelta(days=2), _sentiment(1.0))], "1h")
+
+    points = build_series(rows, "1h", base, base + timedelta(hours=3), 24.0)
+
+    assert len(points) == 3
+    assert all(p.count == 0 for p in points)
+    assert all(p.decayed_score is not None and math.isclose(p.decayed_score, 1.0) for p in points)
+
+
+@pytest.mark.asyncio
+async def test_memory_rollups_cover_every_source(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the in-memory rollups count every fake item of the selected sources."""
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+    end = datetime.now(UTC) + timedelta(days=1)
+    start = end - timedelta(days=400)
+
+    repo = SentimentRollupsRepository(cast(AsyncSession, None))
+    rows = await repo.fetch_rollups(
+        "005930", "1d", ["news", "blind", "naver_forum", "dart"], start, end
+    )
+    news_only = await repo.fetch_rollups("005930", "1d", ["news"], start, end)
+
+    assert {r.source for r in rows} == {"news", "blind", "naver_forum", "dart"}
+    assert {r.source for r in news_only} == {"news"}
+    news_count = sum(r.item_count for r in rows if r.source == "news")
+    assert sum(r.item_count for r in news_only) == news_count
+    assert [r.bucket_start for r in rows] == sorted(r.bucket_start for r in rows)
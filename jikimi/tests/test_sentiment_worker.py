@@ -0,0 +1,158 @@
+"""Test the deferred sentiment worker."""
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from openai import APIConnectionError
+
+import app.services.llm_gateway as llm_gateway
+import app.services.sentiment_worker as sentiment_worker
+from app.schemas.common import Sentiment
+from app.services.llm_gateway import LLMGateway
+from app.services.sentiment import SentimentItem
+from app.services.sentiment_worker import SentimentJob, SentimentWorker, TargetTable
+
+
+@pytest.fixture(autouse=True)
+def memory_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+
+
+class FakeRepo:
+    """Records bulk sentiment updates instead of writing to PostgreSQL."""
+
+    def __init__(self) -> None:
+        self.updates: list[dict[str, Sentiment]] = []
+
+    async def update_sentiments(self, sentiments: dict[str, Sentiment]) -> int:
+        self.updates.append(dict(sentiments))
+        return len(sentiments)
+
+
+@asynccontextmanager
+async def _no_session() -> Any:
+    yield None
+
+
+async def _batch_reply(**kwargs: Any) -> MagicMock:
+    items = json.loads(kwargs["messages"][1]["content"])
+    completion = MagicMock()
+    completion.choices = [MagicMock()]
+    completion.choices[0].message.content = json.dumps({"results": [
+        {
+            "index": it["index"], "label": "negative", "score": -0.2,
+            "confidence": 0.7, "rationale": "",
+        }
+        for it in items
+    ]})
+    return completion
+
+
+@pytest.fixture
+def repos(monkeypatch: pytest.MonkeyPatch) -> dict[TargetTable, FakeRepo]:
+    fakes: dict[TargetTable, FakeRepo] = {
+        "news": FakeRepo(), "social": FakeRepo(), "filing": FakeRepo()
+    }
+    for table, fake in fakes.items():
+        monkeypatch.setitem(sentiment_worker.REPO_FACTORIES, table, AsyncMock(return_value=fake))
+    return fakes
+
+
+def _use_client(monkeypatch: pytest.MonkeyPatch, client: AsyncMock) -> None:
+    gateway = LLMGateway(client, backoff_base_seconds=0.001, max_retries=0)
+    monkeypatch.setattr(llm_gateway, "_gateway", gateway)
+
+
+@pytest.mark.asyncio
+async def test_worker_batches_coalesces_and_bulk_updates(
+    monkeypatch: pytest.MonkeyPatch, repos: dict[TargetTable, FakeRepo]
+) -> None:
+    """Test that queued rows are scored in one LLM call and updated per table."""
+    client = AsyncMock()
+    client.chat.completions.create.side_effect = _batch_reply
+    _use_client(monkeypatch, client)
+    invalidated: list[str] = []
+    monkeypatch.setattr(sentiment_worker, "invalidate_company", invalidated.append)
+
+    worker = SentimentWorker(_no_session, batch_size=50, max_wait_seconds=0.05)
+    worker.start()
+    for i in range(12):
+        table: TargetTable = "news" if i < 6 else "social"
+        item = SentimentItem(text=f"유상증자 결정 공시 {i % 6}", content_type="news")
+        worker.enqueue(
+            SentimentJob(table=table, row_id=f"{table}_{i}", company_id="005930", item=item)
+        )
+    await worker.stop()
+
+    assert client.chat.completions.create.await_count == 1
+    assert [sorted(u) for u in repos["news"].updates] == [sorted(f"news_{i}" for i in range(6))]
+    social_ids = sorted(f"social_{i}" for i in range(6, 12))
+    assert [sorted(u) for u in repos["social"].updates] == [social_ids]
+    assert worker.stats() == {"queued": 0, "batches": 1, "scored": 12, "failed": 0}
+    assert invalidated == ["005930"]
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_then_gives_up(
+    monkeypatch: pytest.MonkeyPatch, repos: dict[TargetTable, FakeRepo]
+) -> None:
+    """Test that failing batches are re-queued up to max_attempts, leaving rows unscored."""
+    client = AsyncMock()
+    client.chat.completions.create.side_effect = APIConnectionError(request=None)  # type: ignore[arg-type]
+    _use_client(monkeypatch, client)
+
+    worker = SentimentWorker(_no_session, batch_size=10, max_wait_seconds=0.01, max_attempts=3)
+    worker.start()
+    item = SentimentItem("감사의견 거절", "filing")
+    worker.enqueue(SentimentJob(table="filing", row_id="filing_1", company_id="005930", item=item))
+    await asyncio.wait_for(worker.stop(), timeout=5)
+
+    assert client.chat.completions.create.await_count == 3
+    assert repos["filing"].updates == []
+    assert worker.stats()["failed"] == 1
+
+
+def _reply_failing_on(poison: str) -> Callable[..., Awaitable[MagicMock]]:
+    """Reply like ``_batch_reply`` but drop ``poison`` from batches and reject it alone."""
+
+    async def reply(**kwargs: Any) -> MagicMock:
+        if kwargs["response_format"]["json_schema"]["name"] == "sentiment_analysis":
+            if poison in kwargs["messages"][1]["content"]:
+                raise APIConnectionError(request=None)  # type: ignore[arg-type]
+            completion = MagicMock()
+            completion.choices = [MagicMock()]
+            completion.choices[0].message.content = json.dumps(
+                {"label": "negative", "score": -0.2, "confidence": 0.7, "rationale": ""}
+            )
+            return completion
+        items = [it for it in json.loads(kwargs["messages"][1]["content"]) if it["text"] != poison]
+        return await _batch_reply(messages=[{}, {"content": json.dumps(items)}])
+
+    return reply
+
+
+@pytest.mark.asyncio
+async def test_worker_failed_item_does_not_fail_its_batch(
+    monkeypatch: pytest.MonkeyPatch, repos: dict[TargetTable, FakeRepo]
+) -> None:
+    """Test that one unscorable row is retried alone while the rest of its batch is written."""
+    client = AsyncMock()
+    client.chat.completions.create.side_effect = _reply_failing_on("거절 공시 1")
+    _use_client(monkeypatch, client)
+
+    worker = SentimentWorker(_no_session, batch_size=10, max_wait_seconds=0.05, max_attempts=2)
+    worker.start()
+    for i in range(4):
+        item = SentimentItem(text=f"거절 공시 {i}", content_type="news")
+        worker.enqueue(
+            SentimentJob(table="news", row_id=f"news_{i}", company_id="005930", item=item)
+        )
+    await asyncio.wait_for(worker.stop(), timeout=5)
+
+    assert [sorted(u) for u in repos["news"].updates] == [["news_0", "news_2", "news_3"]]
+    assert worker.stats() == {"queued": 0, "batches": 2, "scored": 3, "failed": 1}
@@ -0,0 +1,89 @@
+"""Test the snapshot loader's manifest and appended-file path."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import app.services.snapshot_loader as snapshot_loader
+from app.models import NewsArticleModel
+from app.repositories.snapshot_repo import ManifestEntry
+from app.schemas.company import Company
+from app.services.snapshot_loader import load_directory
+
+KT = Company(id="030200", name="KT")
+
+
+@pytest.fixture(autouse=True)
+def memory_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+
+
+class FakeSnapshotRepo:
+    """Keeps the manifest and copied rows in memory like ``SnapshotRepository``."""
+
+    def __init__(self) -> None:
+        self.manifest: dict[str, ManifestEntry] = {}
+        self.copied: dict[Any, list[dict[str, Any]]] = {}
+
+    async def loaded_files(self, company_id: str, paths: list[str]) -> dict[str, ManifestEntry]:
+        return {path: self.manifest[path] for path in paths if path in self.manifest}
+
+    async def record_files(self, company_id: str, files: dict[str, ManifestEntry]) -> None:
+        self.manifest.update(files)
+
+    async def company_ids(self, names: list[str]) -> dict[str, str]:
+        return {}
+
+    async def copy_rows(self, model: Any, rows: list[dict[str, Any]]) -> list[Any]:
+        self.copied.setdefault(model, []).extend(rows)
+        return [row.get("id") for row in rows]
+
+
+class FakeSession:
+    async def commit(self) -> None:
+        pass
+
+
+@asynccontextmanager
+async def _session() -> AsyncIterator[FakeSession]:
+    yield FakeSession()
+
+
+@pytest.mark.asyncio
+async def test_appended_file_loads_only_new_lines(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that a second load parses only the appended lines and counts them once."""
+    repo = FakeSnapshotRepo()
+
+    async def get_repo(session: Any) -> FakeSnapshotRepo:
+        return repo
+
+    monkeypatch.setattr(snapshot_loader, "get_snapshot_repo", get_repo)
+    day = tmp_path / "2025-11-02"
+    day.mkdir()
+    news = day / "news.txt"
+    news.write_text("[09:10] 연합뉴스 | KT 실적 발표\n형식 없는 줄\n[09:30] 한경 | KT 배당 확대\n")
+
+    first = await load_directory(_session, tmp_path, day, KT)
+
+    assert (first.records, first.skipped_lines) == (2, 1)
+    assert (first.loaded_files, first.appended_files) == (["2025-11-02/news.txt"], [])
+
+    with news.open("a", encoding="utf-8") as f:
+        f.write("[10:00] 매경 | KT 신사업 발표\n[10:20] 연합뉴스 | KT 주가 상승\n[10:40] 미완성")
+    second = await load_directory(_session, tmp_path, day, KT)
+
+    assert (second.records, second.skipped_lines) == (2, 0)
+    assert second.appended_files == ["2025-11-02/news.txt"]
+    titles = [row["title"] for row in repo.copied[NewsArticleModel]]
+    assert titles[2:] == ["KT 신사업 발표", "KT 주가 상승"]
+    assert repo.manifest["2025-11-02/news.txt"].records == 4
+
+    third = await load_directory(_session, tmp_path, day, KT)
+
+    assert third.unchanged_files == ["2025-11-02/news.txt"]
+    assert third.records == 0
@@ -0,0 +1,68 @@
+"""Test the snapshot file parsers."""
+
+from datetime import UTC, date, datetime
+
+from app.services.snapshot_parser import (
+    dart_type,
+    parse_dart,
+    parse_forum,
+    parse_market,
+    parse_news,
+    parse_volume,
+)
+
+DAY = date(2025, 10, 17)
+
+
+def test_parse_news_formats() -> None:
+    """Test legacy, pubDate and new-list lines, including Bing redirect unwrapping."""
+    text = "\n".join([
+        "[09:10] 파이낸셜뉴스 | KT, AI센터 확대… B2B 수주 확대 기대",
+        "Fri, 17 Oct 2025 02:00:00 GMT | 연합뉴스 | KT 배당 유지 | https://yna.co.kr/view/1",
+        "KT&amp;G, 외국인 순매수 | http://www.bing.com/news/apiclick.aspx?ref=FexRss&amp;"
+        "url=https%3a%2f%2fwww.newspim.com%2fnews%2fview%2f20251017000369&amp;c=1 | bing.com",
+        "not a news line",
+    ])
+    collected = datetime(2025, 10, 17, 7, 48, tzinfo=UTC)
+    legacy, dated, listed = parse_news(text, "030200", DAY, collected)
+
+    assert legacy.source == "파이낸셜뉴스"
+    assert legacy.published_at == datetime(2025, 10, 17, 0, 10, tzinfo=UTC)  # 09:10 KST
+    assert dated.source == "연합뉴스"
+    assert dated.published_at == datetime(2025, 10, 17, 2, 0, tzinfo=UTC)
+    assert listed.title == "KT&G, 외국인 순매수"
+    assert listed.url == "https://www.newspim.com/news/view/20251017000369"
+    assert listed.source == "newspim.com"
+    assert listed.published_at == collected
+
+
+def test_parse_forum_maps_platforms_and_keeps_label() -> None:
+    """Test that Blind/종토방 map to platforms and other boards are skipped."""
+    text = (
+        "[Blind] 실적 무난, 배당 기대 ↑ (긍정)\n"
+        "[종토방] 단기 반등 이후 숨고르기 (중립)\n"
+        "[Reddit] Korea telcos undervalued thesis (긍정)"
+    )
+    skipped: list[str] = []
+    posts = parse_forum(text, "030200", DAY, skipped)
+
+    assert [p.platform for p in posts] == ["blind", "naver_forum"]
+    assert skipped == ["[Reddit] Korea telcos undervalued thesis (긍정)"]
+    assert posts[0].content == "실적 무난, 배당 기대 ↑ (긍정)"
+    assert posts[0].posted_at == datetime(2025, 10, 17, tzinfo=UTC)
+
+
+def test_parse_dart_and_market() -> None:
+    """Test DART key-figure typing and market quote parsing."""
+    dart = "2025Q3 매출 6.12조(+3.1% YoY)\n자사주 보유 1.2% (변동없음)\n부채비율 142%"
+    filings = parse_dart(dart, "030200", DAY)
+    assert [f.filing_type for f in filings] == ["실적", "자사주", "주요지표"]
+    assert dart_type("5G CAPEX 8,200억 집행") == "투자"
+
+    market = "KT: 36,500 (+0.8%) | 거래량 2.1M\nLGU+: 9,850 (-0.3%) | 거래량 0.9M\nheader"
+    quotes = parse_market(market, DAY)
+    assert [(q.name, q.close, q.change_pct, q.volume) for q in quotes] == [
+        ("KT", 36500.0, 0.8, 2_100_000),
+        ("LGU+", 9850.0, -0.3, 900_000),
+    ]
+    assert parse_volume("1,234") == 1234
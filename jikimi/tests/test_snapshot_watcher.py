@@ -0,0 +1,127 @@
+"""Test incremental snapshot watching."""
+
+import asyncio
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import pytest
+
+import app.services.snapshot_watcher as snapshot_watcher
+from app.repositories.snapshot_repo import ManifestEntry
+from app.schemas.company import Company
+from app.services.snapshot_loader import DirectoryResult, read_directory, unread_offset
+from app.services.snapshot_watcher import SnapshotWatcher
+
+
+def _no_session() -> Any:
+    raise AssertionError("load_directory is patched out")
+
+
+def test_unread_offset_resumes_only_appended_files() -> None:
+    """Test that appended files resume at the offset and rewritten ones restart."""
+    loaded = b"[09:10] A | one\n"
+    entry = ManifestEntry(hashlib.sha256(loaded).hexdigest(), len(loaded), 1)
+
+    assert unread_offset(loaded + b"[10:00] B | two\n", entry) == len(loaded)
+    assert unread_offset(b"[09:10] A | changed\n", entry) == 0
+    assert unread_offset(b"short", entry) == 0
+    assert unread_offset(loaded, None) == 0
+
+
+def test_read_directory_stops_at_last_newline(tmp_path: Path) -> None:
+    """Test that a record (and a character) caught mid-write is left unread."""
+    day = tmp_path / "2025-11-02"
+    day.mkdir()
+    complete = "[09:10] 연합뉴스 | KT 실적 발표\n".encode()
+    (day / "news.txt").write_bytes(complete + "[10:00] 연합뉴스 | 배".encode()[:-1])
+
+    (news,), _ = read_directory(tmp_path, day)
+
+    assert news.data == complete
+    assert news.content_hash == hashlib.sha256(complete).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_polling_watcher_debounces_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that a burst of writes becomes one load of just the changed files."""
+    calls: list[tuple[str, set[str]]] = []
+
+    async def fake_load(
+        session_factory: Any, root: Path, directory: Path, company: Company, **kwargs: Any
+    ) -> DirectoryResult:
+        calls.append((directory.name, set(kwargs["names"])))
+        return DirectoryResult(
+            directory=directory.name, loaded_files=sorted(kwargs["names"]), inserted={"news": 1}
+        )
+
+    monkeypatch.setattr(snapshot_watcher, "load_directory", fake_load)
+    today = tmp_path / datetime.now(ZoneInfo("Asia/Seoul")).date().isoformat()
+    today.mkdir()
+    (today / "news.txt").write_text("[09:10] 연합뉴스 | KT 실적 발표\n")
+    (tmp_path / "law").mkdir()
+
+    watcher = SnapshotWatcher(
+        _no_session,
+        tmp_path,
+        "030200",
+        debounce_seconds=0.2,
+        poll_interval_seconds=0.05,
+        force_polling=True,
+    )
+    watcher._company = Company(id="030200", name="KT")
+    watcher.start()
+    try:
+        await asyncio.sleep(0.5)
+        assert calls == [(today.name, {"news.txt"})]
+
+        for i in range(3):
+            (today / "forum.txt").write_text("[Blind] 배당 기대 (긍정)\n" * (i + 1))
+            (today / "dart.txt").write_text("자사주 보유 1.2%\n" * (i + 1))
+            (tmp_path / "law" / "note.txt").write_text("ignored")
+            await asyncio.sleep(0.06)
+        await asyncio.sleep(0.5)
+    finally:
+        await watcher.stop()
+
+    assert calls[1:] == [(today.name, {"forum.txt", "dart.txt"})]
+    assert watcher.stats()["batches"] == 2
+    assert watcher.stats()["rows_inserted"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test that a batch whose load fails is queued again."""
+    calls: list[set[str]] = []
+
+    async def flaky_load(
+        session_factory: Any, root: Path, directory: Path, company: Company, **kwargs: Any
+    ) -> DirectoryResult:
+        calls.append(set(kwargs["names"]))
+        if len(calls) == 1:
+            raise ConnectionError("database unavailable")
+        return DirectoryResult(directory=directory.name, loaded_files=sorted(kwargs["names"]))
+
+    monkeypatch.setattr(snapshot_watcher, "load_directory", flaky_load)
+    today = tmp_path / datetime.now(ZoneInfo("Asia/Seoul")).date().isoformat()
+    today.mkdir()
+    (today / "news.txt").write_text("[09:10] 연합뉴스 | KT 실적 발표\n")
+
+    watcher = SnapshotWatcher(
+        _no_session, tmp_path, "030200", debounce_seconds=0.05, poll_interval_seconds=0.05,
+        force_polling=True, retry_seconds=0.1,
+    )
+    watcher._company = Company(id="030200", name="KT")
+    watcher.start()
+    try:
+        await asyncio.sleep(0.5)
+    finally:
+        await watcher.stop()
+
+    assert calls == [{"news.txt"}, {"news.txt"}]
+    assert watcher.stats()["errors"] == 1
+    assert watcher.stats()["batches"] == 1
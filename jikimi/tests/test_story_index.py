@@ -0,0 +1,46 @@
+"""Test near-duplicate story assignment."""
+
+from datetime import UTC, datetime, timedelta
+
+from app.schemas.common import Sentiment
+from app.services.story_index import StoryIndex, normalize_title
+
+PUBLISHED = datetime(2025, 11, 1, 9, tzinfo=UTC)
+
+
+def test_syndicated_titles_share_a_story() -> None:
+    """Test that outlet copies join one story and unrelated titles do not."""
+    index = StoryIndex()
+    first = index.assign(
+        "030200", "[속보] KT 소액결제 피해 \"불법 기지국 16개 더 발견…피해자 6명 추가\"", PUBLISHED
+    )
+    copy = index.assign(
+        "030200", "KT 소액결제 피해 '불법 기지국 16개 더 발견' 피해자 6명 추가 - 뉴스1", PUBLISHED
+    )
+    reworded = index.assign(
+        "030200", "KT, 소액결제 피해 불법 기지국 16개 추가 발견…피해자 6명 늘어", PUBLISHED
+    )
+    other = index.assign("030200", "KT 2분기 영업이익 4800억원…전년比 3% 감소", PUBLISHED)
+
+    assert first.is_new and first.similarity is None
+    assert copy.story_id == reworded.story_id == first.story_id
+    assert not copy.is_new and copy.similarity == 1.0
+    assert other.is_new and other.story_id != first.story_id
+    assert normalize_title("[단독](종합) KT, 실적 발표! - 중소기업신문") == "kt실적발표"
+
+
+def test_story_scope_and_sentiment_reuse() -> None:
+    """Test company and time-window scoping, short titles, and shared sentiment."""
+    index = StoryIndex(window=timedelta(hours=24))
+    title = "KT 3분기 영업이익 5382억원…전년比 16% 증가"
+    story = index.assign("030200", title, PUBLISHED)
+    sentiment = Sentiment(label="positive", score=0.6, confidence=0.9)
+    index.set_sentiment(story.story_id, sentiment)
+
+    syndicated = index.assign("030200", title + " - 뉴스1", PUBLISHED + timedelta(hours=3))
+    assert syndicated.sentiment == sentiment
+    assert index.assign("005930", title, PUBLISHED).is_new
+    assert index.assign("030200", title, PUBLISHED + timedelta(days=3)).is_new
+    assert index.assign("030200", "KT 상승", PUBLISHED).is_new
+    assert index.assign("030200", "KT 상승", PUBLISHED).is_new
+    assert index.stats()["matched"] == 1
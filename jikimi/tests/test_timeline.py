@@ -0,0 +1,29 @@
+"""Test the merged company timeline."""
+
+import pytest
+
+from app.services.timeline import fetch_timeline
+
+
+@pytest.mark.asyncio
+async def test_memory_timeline_merges_and_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test newest-first merging and composite-cursor paging without repeats."""
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+
+    full, cursor = await fetch_timeline(None, "005930", limit=200)
+    assert cursor is None
+    assert [i.timestamp for i in full] == sorted((i.timestamp for i in full), reverse=True)
+    assert {i.type for i in full} == {"news", "blind", "naver_forum", "dart"}
+
+    seen: list[tuple[str, str]] = []
+    items, cursor = await fetch_timeline(None, "005930", limit=3)
+    seen.extend((i.type, i.item.id) for i in items)
+    while cursor:
+        items, cursor = await fetch_timeline(None, "005930", limit=3, cursor=cursor)
+        seen.extend((i.type, i.item.id) for i in items)
+    # Fake data is stamped at call time, so ties across sources may swap between calls
+    assert len(seen) == len(set(seen))
+    assert set(seen) == {(i.type, i.item.id) for i in full}
+
+    news_only, _ = await fetch_timeline(None, "005930", sources=["news"], limit=200)
+    assert {i.type for i in news_only} == {"news"}
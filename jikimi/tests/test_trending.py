@@ -0,0 +1,118 @@
+"""Test the trending mention counters."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.schemas.common import Sentiment
+from app.services.trending import TrendingCounter
+
+NOW = datetime(2025, 11, 3, 5, 30, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def _fixed_now(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.services.trending.now_utc", lambda: NOW)
+
+
+def _counter() -> TrendingCounter:
+    counter = TrendingCounter(capacity=2)
+    # Steady company: 2 mentions per hour for the 24 hours before the window, 2 in it
+    for hour in range(2, 26):
+        for _ in range(2):
+            counter.record("000660", NOW - timedelta(hours=hour, minutes=10), sentiment=Sentiment(
+                label="neutral", score=0.0, confidence=0.9))
+    counter.record("000660", NOW - timedelta(minutes=5), engagement=500)
+    counter.record("000660", NOW - timedelta(minutes=6), engagement=500)
+    # Spiking company: quiet baseline, 12 positive mentions in the last hour
+    negative = Sentiment(label="negative", score=-0.5, confidence=0.9)
+    counter.record("005930", NOW - timedelta(hours=5), sentiment=negative)
+    for minute in range(12):
+        counter.record("005930", NOW - timedelta(minutes=minute * 4), engagement=10,
+                       sentiment=Sentiment(label="positive", score=0.5, confidence=0.9))
+    # A company seen only outside the window
+    counter.record("035420", NOW - timedelta(hours=3))
+    return counter
+
+
+def test_rank_by_velocity_engagement_and_shift() -> None:
+    """Test each ranking key orders companies and applies the window."""
+    counter = _counter()
+
+    by_velocity = counter.rank("velocity", now=NOW)
+    assert [c.company_id for c in by_velocity] == ["005930", "000660"]
+    assert by_velocity[0].mentions == 12
+    assert by_velocity[0].sentiment_shift == pytest.approx(1.0)
+    assert by_velocity[1].expected_mentions == pytest.approx(2.0)
+
+    assert [c.company_id for c in counter.rank("engagement", now=NOW)] == ["000660", "005930"]
+    assert [c.company_id for c in counter.rank("sentiment_shift", now=NOW)] == ["005930"]
+    assert [c.company_id for c in counter.rank("velocity", limit=1, now=NOW)] == ["005930"]
+    assert counter.rank("velocity", min_mentions=5, now=NOW)[0].company_id == "005930"
+    assert len(counter.rank("velocity", min_mentions=5, now=NOW)) == 1
+
+
+def test_rings_slide_and_drop_old_mentions() -> None:
+    """Test slots age out of the window and too-old mentions are not counted."""
+    counter = _counter()
+
+    assert not counter.record("005930", NOW - timedelta(days=3), now=NOW)
+    later = NOW + timedelta(hours=2)
+    assert counter.rank("velocity", now=later) == []
+
+
+@pytest.mark.asyncio
+async def test_snapshot_round_trip(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test saved slots restore the same ranking in a fresh counter."""
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+    counter = _counter()
+
+    written = await counter.snapshot(lambda: _NoSession())
+    restored = TrendingCounter()
+    loaded = await restored.load(lambda: _NoSession())
+
+    assert written == loaded > 0
+    assert restored.rank("velocity", now=NOW) == counter.rank("velocity", now=NOW)
+
+
+def test_limit_breaks_ties_by_company_id() -> None:
+    """Test companies tied at the limit are cut by company ID."""
+    counter = TrendingCounter()
+    for company_id in ["035420", "005930", "000270", "000660"]:
+        counter.record(company_id, NOW - timedelta(minutes=1))
+
+    ranked = counter.rank("velocity", limit=2, now=NOW)
+    assert [c.company_id for c in ranked] == ["000270", "000660"]
+
+
+@pytest.mark.asyncio
+async def test_snapshots_add_counts_across_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test each process adds only its new mentions and reads back the combined totals."""
+    monkeypatch.setattr("app.config.settings.db_dsn", "memory://")
+    monkeypatch.setattr("app.repositories.trending_repo._MEMORY_SLOTS", {})
+    first, second = TrendingCounter(), TrendingCounter()
+    first.record("005930", NOW - timedelta(minutes=1))
+    second.record("005930", NOW - timedelta(minutes=2))
+    second.record("000660", NOW - timedelta(minutes=3))
+
+    await first.snapshot(lambda: _NoSession())
+    await second.snapshot(lambda: _NoSession())
+    await first.snapshot(lambda: _NoSession())
+
+    ranked = first.rank("velocity", now=NOW)
+    assert [(c.company_id, c.mentions) for c in ranked] == [("005930", 2), ("000660", 1)]
+    first.record("005930", NOW)
+    assert first.rank("velocity", now=NOW)[0].mentions == 3
+    restored = TrendingCounter()
+    await restored.load(lambda: _NoSession())
+    assert restored.rank("velocity", now=NOW)[0].mentions == 2
+
+
+class _NoSession:
+    """Session stand-in for memory-mode repositories."""
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *args: object) -> None:
+        return None